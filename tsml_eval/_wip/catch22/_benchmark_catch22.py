@@ -0,0 +1,76 @@
+"""Benchmark the batch Catch22 kernel against the saved comparison results.
+
+Checks the features for the ItalyPowerDemand train data against the saved aeon and
+pycatch22 CSV files in this folder, then times the transform for a range of
+collection sizes. The timings are written to ``catch22_benchmark.csv``.
+"""
+
+import csv
+import os
+import time
+
+import numpy as np
+from aeon.datasets import load_gunpoint, load_italy_power_demand
+
+from tsml_eval._wip.catch22._catch22 import Catch22
+
+try:
+    import pycatch22
+except ImportError:
+    pycatch22 = None
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+X_ipd, _ = load_italy_power_demand(split="train")
+
+# the saved aeon results were generated from a list of short feature names which
+# contained "periodicity" twice, both resolved to feature 17
+aeon_saved = np.loadtxt(
+    os.path.join(path, "aeon_catch22_with_numba.csv"), delimiter=",", skiprows=1
+)
+aeon_c22 = Catch22(features=list(range(21)) + [17], replace_nans=True)
+aeon_diff = np.abs(aeon_c22.fit_transform(X_ipd) - aeon_saved).max()
+print(f"Max difference to aeon_catch22_with_numba.csv: {aeon_diff}")
+
+pycatch22_saved = np.loadtxt(
+    os.path.join(path, "pycatch22_catch22_ipd.csv"), delimiter=",", skiprows=1
+)
+c22 = Catch22(replace_nans=True)
+pycatch22_diff = np.abs(c22.fit_transform(X_ipd) - pycatch22_saved).max()
+print(f"Max difference to pycatch22_catch22_ipd.csv: {pycatch22_diff}")
+
+X_gp, _ = load_gunpoint(split="train")
+datasets = {
+    "ItalyPowerDemand": X_ipd,
+    "ItalyPowerDemand_x20": np.tile(X_ipd, (20, 1, 1)),
+    "GunPoint": X_gp,
+    "GunPoint_x10": np.tile(X_gp, (10, 1, 1)),
+}
+n_jobs_list = [1, os.cpu_count()] if os.cpu_count() > 1 else [1]
+
+# compile the numba functions before timing
+Catch22().fit_transform(X_ipd[:2])
+Catch22(n_jobs=-1).fit_transform(X_ipd[:2])
+
+rows = [["dataset", "n_cases", "n_timepoints", "implementation", "n_jobs", "seconds"]]
+for name, X in datasets.items():
+    for n_jobs in n_jobs_list:
+        start = time.perf_counter()
+        Catch22(n_jobs=n_jobs).fit_transform(X)
+        seconds = time.perf_counter() - start
+        rows.append([name, X.shape[0], X.shape[2], "aeon", n_jobs, seconds])
+        print(rows[-1])
+
+    if pycatch22 is not None:
+        start = time.perf_counter()
+        for i in range(X.shape[0]):
+            pycatch22.catch22_all(list(X[i, 0]))
+        seconds = time.perf_counter() - start
+        rows.append([name, X.shape[0], X.shape[2], "pycatch22", 1, seconds])
+        print(rows[-1])
+
+with open(os.path.join(path, "catch22_benchmark.csv"), mode="w", newline="") as file:
+    writer = csv.writer(file)
+    writer.writerows(rows)
+
+print("Finished writing data")
@@ -10,64 +10,115 @@ import math
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit
+from numba import config, get_num_threads, njit, prange, set_num_threads
 
 from aeon.transformations.collection.base import BaseCollectionTransformer
-from aeon.utils.numba.general import z_normalise_series, z_normalise_series_with_mean
-from aeon.utils.numba.stats import mean, numba_max, numba_min
+from aeon.utils.numba.general import AEON_NUMBA_STD_THRESHOLD, z_normalise_series
+from aeon.utils.numba.stats import mean, numba_max, numba_min, std
 from aeon.utils.validation import check_n_jobs
 
 feature_names = [
     "DN_HistogramMode_5",
     "DN_HistogramMode_10",
-    "SB_BinaryStats_mean_longstretch1",
-    "DN_OutlierInclude_p_001_mdrmd",
-    "DN_OutlierInclude_n_001_mdrmd",
     "CO_f1ecac",
     "CO_FirstMin_ac",
-    "SP_Summaries_welch_rect_area_5_1",
-    "SP_Summaries_welch_rect_centroid",
-    "FC_LocalSimple_mean3_stderr",
-    "CO_trev_1_num",
     "CO_HistogramAMI_even_2_5",
-    "IN_AutoMutualInfoStats_40_gaussian_fmmi",
+    "CO_trev_1_num",
     "MD_hrv_classic_pnn40",
+    "SB_BinaryStats_mean_longstretch1",
+    "SB_TransitionMatrix_3ac_sumdiagcov",
+    "PD_PeriodicityWang_th0_01",
+    "CO_Embed2_Dist_tau_d_expfit_meandiff",
+    "IN_AutoMutualInfoStats_40_gaussian_fmmi",
+    "FC_LocalSimple_mean1_tauresrat",
+    "DN_OutlierInclude_p_001_mdrmd",
+    "DN_OutlierInclude_n_001_mdrmd",
+    "SP_Summaries_welch_rect_area_5_1",
     "SB_BinaryStats_diff_longstretch0",
     "SB_MotifThree_quantile_hh",
-    "FC_LocalSimple_mean1_tauresrat",
-    "CO_Embed2_Dist_tau_d_expfit_meandiff",
-    "SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1",
     "SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1",
-    "SB_TransitionMatrix_3ac_sumdiagcov",
-    "PD_PeriodicityWang_th0_01",
+    "SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1",
+    "SP_Summaries_welch_rect_centroid",
+    "FC_LocalSimple_mean3_stderr",
 ]
 
 feature_names_short = [
     "mode_5",
     "mode_10",
-    "stretch_high",
-    "outlier_timing_pos",
-    "outlier_timing_neg",
     "acf_timescale",
     "acf_first_min",
-    "centroid_freq",
-    "low_freq_power",
-    "forecast_error",
-    "trev",
     "ami2",
-    "ami_timescale",
+    "trev",
     "high_fluctuation",
+    "stretch_high",
+    "transition_matrix",
+    "periodicity",
+    "embedding_dist",
+    "ami_timescale",
+    "whiten_timescale",
+    "outlier_timing_pos",
+    "outlier_timing_neg",
+    "centroid_freq",
     "stretch_decreasing",
     "entropy_pairs",
-    "whiten_timescale",
-    "periodicity",
-    "dfa",
     "rs_range",
-    "transition_matrix",
-    "periodicity",
+    "dfa",
+    "low_freq_power",
+    "forecast_error",
 ]
 
 
+# intermediate series values shared between features, the index is the order they
+# are computed in
+intermediate_names = [
+    "min_max",
+    "mean",
+    "std",
+    "sorted",
+    "outlier_series",
+    "fft",
+    "autocorrelation",
+]
+_MIN_MAX, _MEAN, _STD, _SORTED, _OUTLIER, _FFT, _AC = range(len(intermediate_names))
+
+# intermediates used directly by each feature, by index into the numba
+# implementations in _transform_series
+_feature_dependencies = {
+    0: (_MIN_MAX,),
+    1: (_MIN_MAX,),
+    2: (_AC,),
+    3: (),
+    4: (_MIN_MAX,),
+    5: (),
+    6: (),
+    7: (_MEAN,),
+    8: (_AC,),
+    9: (),
+    10: (_AC,),
+    11: (),
+    12: (_AC,),
+    13: (_OUTLIER,),
+    14: (_OUTLIER,),
+    15: (_FFT,),
+    16: (),
+    17: (_SORTED,),
+    18: (),
+    19: (),
+    20: (_FFT,),
+    21: (),
+    22: (_MEAN,),
+    23: (_STD,),
+}
+
+# intermediates required to compute other intermediates, the outlier series only
+# requires the mean and std if it is normalised
+_intermediate_dependencies = {
+    _OUTLIER: (_MEAN, _STD),
+    _FFT: (_MEAN,),
+    _AC: (_FFT,),
+}
+
+
 class Catch22(BaseCollectionTransformer):
     """Canonical Time-series Characteristics (Catch22).
 
@@ -82,24 +133,25 @@ class Catch22(BaseCollectionTransformer):
         list of names or indices for multiple features. If "all", all features are
         extracted.
         Valid features are as follows:
-            ["DN_HistogramMode_5", "DN_HistogramMode_10",
-            "SB_BinaryStats_diff_longstretch0", "DN_OutlierInclude_p_001_mdrmd",
-            "DN_OutlierInclude_n_001_mdrmd", "CO_f1ecac", "CO_FirstMin_ac",
-            "SP_Summaries_welch_rect_area_5_1", "SP_Summaries_welch_rect_centroid",
-            "FC_LocalSimple_mean3_stderr", "CO_trev_1_num", "CO_HistogramAMI_even_2_5",
-            "IN_AutoMutualInfoStats_40_gaussian_fmmi", "MD_hrv_classic_pnn40",
-            "SB_BinaryStats_mean_longstretch1", "SB_MotifThree_quantile_hh",
-            "FC_LocalSimple_mean1_tauresrat", "CO_Embed2_Dist_tau_d_expfit_meandiff",
-            "SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1",
+            ["DN_HistogramMode_5", "DN_HistogramMode_10", "CO_f1ecac",
+            "CO_FirstMin_ac", "CO_HistogramAMI_even_2_5", "CO_trev_1_num",
+            "MD_hrv_classic_pnn40", "SB_BinaryStats_mean_longstretch1",
+            "SB_TransitionMatrix_3ac_sumdiagcov", "PD_PeriodicityWang_th0_01",
+            "CO_Embed2_Dist_tau_d_expfit_meandiff",
+            "IN_AutoMutualInfoStats_40_gaussian_fmmi",
+            "FC_LocalSimple_mean1_tauresrat", "DN_OutlierInclude_p_001_mdrmd",
+            "DN_OutlierInclude_n_001_mdrmd", "SP_Summaries_welch_rect_area_5_1",
+            "SB_BinaryStats_diff_longstretch0", "SB_MotifThree_quantile_hh",
             "SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1",
-            "SB_TransitionMatrix_3ac_sumdiagcov", "PD_PeriodicityWang_th0_01"]
+            "SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1",
+            "SP_Summaries_welch_rect_centroid", "FC_LocalSimple_mean3_stderr"]
         Shortened:
-            ["mode_5","mode_10","stretch_high","outlier_timing_pos",
-            "outlier_timing_neg","acf_timescale","acf_first_min","centroid_freq",
-            "low_freq_power","forecast_error","trev","ami2","ami_timescale",
-            "high_fluctuation","stretch_decreasing","entropy_pairs",
-            "whiten_timescale","periodicity","dfa","rs_range",
-            "transition_matrix","periodicity"]
+            ["mode_5", "mode_10", "acf_timescale", "acf_first_min", "ami2", "trev",
+            "high_fluctuation", "stretch_high", "transition_matrix", "periodicity",
+            "embedding_dist", "ami_timescale", "whiten_timescale",
+            "outlier_timing_pos", "outlier_timing_neg", "centroid_freq",
+            "stretch_decreasing", "entropy_pairs", "rs_range", "dfa",
+            "low_freq_power", "forecast_error"]
 
     catch24 : bool, default=False
         Extract the mean and standard deviation as well as the 22 Catch22 features if
@@ -116,10 +168,12 @@ class Catch22(BaseCollectionTransformer):
         ``pycatch22`` package to be installed if True.
     n_jobs : int, default=1
         The number of jobs to run in parallel for `transform`. Requires multiple input
-        cases. ``-1`` means using all processors.
+        cases or channels. ``-1`` means using all processors. Unless
+        ``use_pycatch22`` is True, the series are processed in a single numba kernel
+        using ``n_jobs`` threads.
     parallel_backend : str, ParallelBackendBase instance or None, default=None
         Specify the parallelisation backend implementation in joblib, if None a 'prefer'
-        value of "threads" is used by default.
+        value of "threads" is used by default. Only used if ``use_pycatch22`` is True.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
 
@@ -210,8 +264,6 @@ class Catch22(BaseCollectionTransformer):
         Xt : array-like, shape = [n_cases, num_features*n_channels]
             The catch22 features for each dimension.
         """
-        n_cases = len(X)
-
         f_idx = _verify_features(self.features, self.catch24)
 
         threads_to_use = check_n_jobs(self.n_jobs)
@@ -222,159 +274,66 @@ class Catch22(BaseCollectionTransformer):
             features = [
                 pycatch22.DN_HistogramMode_5,
                 pycatch22.DN_HistogramMode_10,
-                pycatch22.SB_BinaryStats_diff_longstretch0,
-                pycatch22.DN_OutlierInclude_p_001_mdrmd,
-                pycatch22.DN_OutlierInclude_n_001_mdrmd,
                 pycatch22.CO_f1ecac,
                 pycatch22.CO_FirstMin_ac,
-                pycatch22.SP_Summaries_welch_rect_area_5_1,
-                pycatch22.SP_Summaries_welch_rect_centroid,
-                pycatch22.FC_LocalSimple_mean3_stderr,
-                pycatch22.CO_trev_1_num,
                 pycatch22.CO_HistogramAMI_even_2_5,
-                pycatch22.IN_AutoMutualInfoStats_40_gaussian_fmmi,
+                pycatch22.CO_trev_1_num,
                 pycatch22.MD_hrv_classic_pnn40,
                 pycatch22.SB_BinaryStats_mean_longstretch1,
-                pycatch22.SB_MotifThree_quantile_hh,
-                pycatch22.FC_LocalSimple_mean1_tauresrat,
-                pycatch22.CO_Embed2_Dist_tau_d_expfit_meandiff,
-                pycatch22.SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1,
-                pycatch22.SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1,
                 pycatch22.SB_TransitionMatrix_3ac_sumdiagcov,
                 pycatch22.PD_PeriodicityWang_th0_01,
-            ]
-        else:
-            features = [
-                Catch22._DN_HistogramMode_5,
-                Catch22._DN_HistogramMode_10,
-                Catch22._CO_f1ecac,
-                Catch22._CO_FirstMin_ac,
-                Catch22._CO_HistogramAMI_even_2_5,
-                Catch22._CO_trev_1_num,
-                Catch22._MD_hrv_classic_pnn40,
-                Catch22._SB_BinaryStats_mean_longstretch1,
-                Catch22._SB_TransitionMatrix_3ac_sumdiagcov,
-                Catch22._PD_PeriodicityWang_th0_01,
-                Catch22._CO_Embed2_Dist_tau_d_expfit_meandiff,
-                Catch22._IN_AutoMutualInfoStats_40_gaussian_fmmi,
-                Catch22._FC_LocalSimple_mean1_tauresrat,
-                Catch22._DN_OutlierInclude_p_001_mdrmd,
-                Catch22._DN_OutlierInclude_n_001_mdrmd,
-                Catch22._SP_Summaries_welch_rect_area_5_1,
-                Catch22._SB_BinaryStats_diff_longstretch0,
-                Catch22._SB_MotifThree_quantile_hh,
-                Catch22._SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1,
-                Catch22._SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1,
-                Catch22._SP_Summaries_welch_rect_centroid,
-                Catch22._FC_LocalSimple_mean3_stderr,
+                pycatch22.CO_Embed2_Dist_tau_d_expfit_meandiff,
+                pycatch22.IN_AutoMutualInfoStats_40_gaussian_fmmi,
+                pycatch22.FC_LocalSimple_mean1_tauresrat,
+                pycatch22.DN_OutlierInclude_p_001_mdrmd,
+                pycatch22.DN_OutlierInclude_n_001_mdrmd,
+                pycatch22.SP_Summaries_welch_rect_area_5_1,
+                pycatch22.SB_BinaryStats_diff_longstretch0,
+                pycatch22.SB_MotifThree_quantile_hh,
+                pycatch22.SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1,
+                pycatch22.SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1,
+                pycatch22.SP_Summaries_welch_rect_centroid,
+                pycatch22.FC_LocalSimple_mean3_stderr,
             ]
 
-        c22_list = Parallel(
-            n_jobs=threads_to_use, backend=self.parallel_backend, prefer="threads"
-        )(
-            delayed(
-                self._transform_case_pycatch22
-                if self.use_pycatch22
-                else self._transform_case
-            )(
-                X[i],
-                f_idx,
-                features,
+            c22 = np.array(
+                Parallel(
+                    n_jobs=threads_to_use,
+                    backend=self.parallel_backend,
+                    prefer="threads",
+                )(
+                    delayed(self._transform_case_pycatch22)(
+                        X[i],
+                        f_idx,
+                        features,
+                    )
+                    for i in range(len(X))
+                )
             )
-            for i in range(n_cases)
-        )
-
-        if self.replace_nans:
-            c22_list = np.nan_to_num(c22_list, False, 0, 0, 0)
-
-        return np.array(c22_list)
-
-    def _transform_case(self, X, f_idx, features):
-        c22 = np.zeros(len(f_idx) * len(X))
-
-        if hasattr(self, "_transform_features") and len(
-            self._transform_features
-        ) == len(c22):
-            transform_feature = self._transform_features
         else:
-            transform_feature = [True] * len(c22)
-
-        f_count = -1
-        for i, series in enumerate(X):
-            dim = i * len(f_idx)
-            outlier_series = None
-            smin = None
-            smax = None
-            smean = None
-            fft = None
-            ac = None
-            acfz = None
-
-            for n, feature in enumerate(f_idx):
-                f_count += 1
-                if not transform_feature[f_count]:
-                    continue
+            n_channels = X[0].shape[0]
+            if (
+                hasattr(self, "_transform_features")
+                and len(self._transform_features) == len(f_idx) * n_channels
+            ):
+                transform_features = np.array(self._transform_features, dtype=bool)
+            else:
+                transform_features = np.ones(len(f_idx) * n_channels, dtype=bool)
+
+            values, offsets = _flatten_collection(X)
+            c22 = _transform_collection(
+                values,
+                offsets,
+                n_channels,
+                np.array(f_idx, dtype=np.int64),
+                transform_features,
+                _required_intermediates(f_idx, transform_features, self.outlier_norm),
+                self.outlier_norm,
+                threads_to_use,
+            )
 
-                args = [series]
-
-                if feature == 0 or feature == 1 or feature == 4:
-                    if smin is None:
-                        smin = numba_min(series)
-                    if smax is None:
-                        smax = numba_max(series)
-                    args = [series, smin, smax]
-                elif feature == 7 or feature == 22:
-                    if smean is None:
-                        smean = mean(series)
-                    args = [series, smean]
-                elif feature == 13 or feature == 14:
-                    if self.outlier_norm:
-                        if smean is None:
-                            smean = mean(series)
-                        if outlier_series is None:
-                            outlier_series = z_normalise_series_with_mean(series, smean)
-                        args = [outlier_series]
-                    else:
-                        args = [series]
-                elif feature == 15 or feature == 20:
-                    if smean is None:
-                        smean = mean(series)
-                    if fft is None:
-                        nfft = int(
-                            np.power(2, np.ceil(np.log(len(series)) / np.log(2)))
-                        )
-                        fft = np.fft.fft(series - smean, n=nfft)
-                    args = [series, fft]
-                elif feature == 2:
-                    if smean is None:
-                        smean = mean(series)
-                    if fft is None:
-                        nfft = int(
-                            np.power(2, np.ceil(np.log(len(series)) / np.log(2)))
-                        )
-                        fft = np.fft.fft(series - smean, n=nfft)
-                    if ac is None:
-                        ac = _autocorr(series, fft)
-                    args = [ac]
-                elif feature == 12 or feature == 10 or feature == 8:
-                    if smean is None:
-                        smean = mean(series)
-                    if fft is None:
-                        nfft = int(
-                            np.power(2, np.ceil(np.log(len(series)) / np.log(2)))
-                        )
-                        fft = np.fft.fft(series - smean, n=nfft)
-                    if ac is None:
-                        ac = _autocorr(series, fft)
-                    if acfz is None:
-                        acfz = _ac_first_zero(ac)
-                    args = [series, acfz]
-                if feature == 22:
-                    c22[dim + n] = smean
-                elif feature == 23:
-                    c22[dim + n] = np.std(series)
-                else:
-                    c22[dim + n] = features[feature](*args)
+        if self.replace_nans:
+            c22 = np.nan_to_num(c22, False, 0, 0, 0)
 
         return c22
 
@@ -415,416 +374,643 @@ class Catch22(BaseCollectionTransformer):
     @property
     def get_features_arguments(self):
         """Return feature names for the estimators features argument."""
-        return (
-            self.features
-            if self.features != "all"
-            else (
-                feature_names + ["Mean", "StandardDeviation"]
-                if self.catch24
-                else feature_names
+        return [
+            (feature_names + ["Mean", "StandardDeviation"])[i]
+            for i in _verify_features(self.features, self.catch24)
+        ]
+
+    @property
+    def get_feature_dependencies(self):
+        """Return the intermediates computed for each selected feature.
+
+        Keys are the names from ``get_features_arguments``, values are lists of the
+        names of the intermediate series values each feature requires, including
+        the intermediates those depend on. Intermediates are computed once per
+        series and only if a selected feature requires them.
+        """
+        return {
+            name: [
+                intermediate_names[i]
+                for i in _resolve_dependencies(feature, self.outlier_norm)
+            ]
+            for name, feature in zip(
+                self.get_features_arguments,
+                _verify_features(self.features, self.catch24),
             )
+        }
+
+
+def _flatten_collection(X):
+    """Concatenate all series of a collection with the start offset of each series.
+
+    Series are ordered by case then channel, so series ``i * n_channels + j`` is
+    channel ``j`` of case ``i``. Equal length 3D arrays are flattened as a view where
+    possible.
+    """
+    if isinstance(X, np.ndarray):
+        values = np.ascontiguousarray(X, dtype=np.float64).reshape(-1)
+        offsets = np.arange(X.shape[0] * X.shape[1] + 1) * X.shape[2]
+    else:
+        values = np.concatenate([np.asarray(x, dtype=np.float64).ravel() for x in X])
+        offsets = np.zeros(len(X) * X[0].shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.repeat([x.shape[1] for x in X], X[0].shape[0]), out=offsets[1:])
+    return values, offsets
+
+
+def _required_intermediates(f_idx, transform_features, outlier_norm):
+    """Find the intermediates needed for the features transformed in each channel.
+
+    Returns a boolean array of shape (n_channels, len(intermediate_names)), the
+    features of a channel are skipped if False in ``transform_features``.
+    """
+    n_channels = len(transform_features) // len(f_idx)
+    intermediates = np.zeros((n_channels, len(intermediate_names)), dtype=bool)
+    for i in range(n_channels):
+        for n, feature in enumerate(f_idx):
+            if transform_features[i * len(f_idx) + n]:
+                for intermediate in _resolve_dependencies(feature, outlier_norm):
+                    intermediates[i, intermediate] = True
+    return intermediates
+
+
+def _resolve_dependencies(feature, outlier_norm):
+    # all intermediates reachable from the feature in the dependency graph
+    required = set()
+    to_visit = list(_feature_dependencies[feature])
+    while to_visit:
+        intermediate = to_visit.pop()
+        if intermediate in required:
+            continue
+        required.add(intermediate)
+        if intermediate == _OUTLIER and not outlier_norm:
+            continue
+        to_visit.extend(_intermediate_dependencies.get(intermediate, ()))
+    return sorted(required)
+
+
+def _transform_collection(
+    values,
+    offsets,
+    n_channels,
+    f_idx,
+    transform_features,
+    intermediates,
+    outlier_norm,
+    n_jobs,
+):
+    # the serial kernel avoids starting the numba thread pool, which is not safe to
+    # use from multiple threads or to fork from
+    if n_jobs == 1:
+        return _transform_series_batch(
+            values,
+            offsets,
+            n_channels,
+            f_idx,
+            transform_features,
+            intermediates,
+            outlier_norm,
         )
 
-    @staticmethod
-    def _DN_HistogramMode_5(X, smin, smax):
-        # Mode of z-scored distribution (5-bin histogram).
-        return _histogram_mode(X, 5, smin, smax)
-
-    @staticmethod
-    def _DN_HistogramMode_10(X, smin, smax):
-        # Mode of z-scored distribution (10-bin histogram).
-        return _histogram_mode(X, 10, smin, smax)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _SB_BinaryStats_diff_longstretch0(X):
-        # Longest period of successive incremental decreases.
-        diff_binary = np.zeros(len(X) - 1)
-        for i in range(len(X)):
-            if X[i + 1] - X[i] >= 0:
-                diff_binary[i] = 1
-
-        return _long_stretch(diff_binary, 0)
-
-    @staticmethod
-    def _DN_OutlierInclude_p_001_mdrmd(X):
-        # Time intervals between successive extreme events above the mean.
-        return _outlier_include(X)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _DN_OutlierInclude_n_001_mdrmd(X):
-        # Time intervals between successive extreme events below the mean.
-        return _outlier_include(-X)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _CO_f1ecac(X_ac):
-        # Parameter has already been transformed using _autocorr
-        # First 1/e crossing of autocorrelation function.
-        threshold = 0.36787944117144233  # 1 / np.exp(1)
-        for i in range(len(X_ac) - 2):
-            if X_ac[i + 1] < threshold:
-                m = X_ac[i + 1] - X_ac[i]
-                dy = threshold - X_ac[i]
-                dx = dy / m
-                out = np.float64(i) + dx
-                return out
-
-        return len(X_ac)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _CO_FirstMin_ac(X_ac):
-        X_ac = _compute_autocorrelations(X_ac)
-        # First minimum of autocorrelation function.
-        for i in range(1, len(X_ac) - 1):
-            if X_ac[i] < X_ac[i - 1] and X_ac[i] < X_ac[i + 1]:
-                return i
-        return len(X_ac)
-
-    @staticmethod
-    def _SP_Summaries_welch_rect_area_5_1(X, X_fft):
-        # Total power in lowest fifth of frequencies in the Fourier power spectrum.
-        return _summaries_welch_rect(X, False, X_fft)
-
-    @staticmethod
-    def _SP_Summaries_welch_rect_centroid(X, X_fft):
-        # Centroid of the Fourier power spectrum.
-        return _summaries_welch_rect(X, True, X_fft)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _FC_LocalSimple_mean3_stderr(X):
-        # Mean error from a rolling 3-sample mean forecasting.
-        if len(X) - 3 < 3:
-            return 0
-        res = _local_simple_mean(X, 3)
-        return _stddev(res, len(X) - 3)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _CO_trev_1_num(X):
-        # Time-reversibility statistic, ((x_t+1 − x_t)^3)_t.
-        y = np.zeros(len(X) - 1)
-        for i in range(len(y)):
-            y[i] = np.power(X[i + 1] - X[i], 3)
-        return np.mean(y)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _CO_HistogramAMI_even_2_5(X, smin, smax):
-        # Automutual information, m = 2, τ = 5.
-        new_min = smin - 0.1
-        new_max = smax + 0.1
-        bin_width = (new_max - new_min) / 5
-
-        histogram = np.zeros((5, 5))
-        sumx = np.zeros(5)
-        sumy = np.zeros(5)
-        v = 1.0 / (len(X) - 2)
-        for i in range(len(X) - 2):
-            idx1 = int((X[i] - new_min) / bin_width)
-            idx2 = int((X[i + 2] - new_min) / bin_width)
-
-            histogram[idx1][idx2] += v
-            sumx[idx1] += v
-            sumy[idx2] += v
+    prev_threads = get_num_threads()
+    set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+    try:
+        return _transform_series_batch_parallel(
+            values,
+            offsets,
+            n_channels,
+            f_idx,
+            transform_features,
+            intermediates,
+            outlier_norm,
+        )
+    finally:
+        set_num_threads(prev_threads)
 
-        nsum = 0
-        for i in range(5):
-            for n in range(5):
-                if histogram[i][n] > 0:
-                    nsum += histogram[i][n] * np.log(
-                        histogram[i][n] / sumx[i] / sumy[n]
-                    )
 
-        return nsum
+@njit(fastmath=True, cache=True)
+def _transform_series_batch(
+    values, offsets, n_channels, f_idx, transform_features, intermediates, outlier_norm
+):
+    n_series = offsets.shape[0] - 1
+    n_features = f_idx.shape[0]
+    c22 = np.zeros((n_series // n_channels, n_channels * n_features))
+    for s in range(n_series):
+        channel = s % n_channels
+        dim = channel * n_features
+        _transform_series(
+            values[offsets[s] : offsets[s + 1]],
+            f_idx,
+            transform_features[dim : dim + n_features],
+            intermediates[channel],
+            outlier_norm,
+            c22[s // n_channels, dim : dim + n_features],
+        )
+    return c22
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _transform_series_batch_parallel(
+    values, offsets, n_channels, f_idx, transform_features, intermediates, outlier_norm
+):
+    n_series = offsets.shape[0] - 1
+    n_features = f_idx.shape[0]
+    c22 = np.zeros((n_series // n_channels, n_channels * n_features))
+    for s in prange(n_series):
+        channel = s % n_channels
+        dim = channel * n_features
+        _transform_series(
+            values[offsets[s] : offsets[s + 1]],
+            f_idx,
+            transform_features[dim : dim + n_features],
+            intermediates[channel],
+            outlier_norm,
+            c22[s // n_channels, dim : dim + n_features],
+        )
+    return c22
 
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _IN_AutoMutualInfoStats_40_gaussian_fmmi(X_ac):
-        # First minimum of the automutual information function.
-        tau = int(min(40, np.ceil(len(X_ac) / 2)))
 
-        ami = np.zeros(len(X_ac), dtype=np.float64)
+@njit(fastmath=True, cache=True)
+def _transform_series(X, f_idx, transform_features, intermediates, outlier_norm, out):
+    # intermediates are in dependency order, each is computed once if any of the
+    # transformed features requires it
+    smin = 0.0
+    smax = 0.0
+    if intermediates[_MIN_MAX]:
+        smin = numba_min(X)
+        smax = numba_max(X)
+    smean = mean(X) if intermediates[_MEAN] else 0.0
+    sstd = std(X) if intermediates[_STD] else 0.0
+    X_sorted = np.sort(X) if intermediates[_SORTED] else np.zeros(0)
+    outlier_series = X
+    if intermediates[_OUTLIER] and outlier_norm:
+        if sstd > AEON_NUMBA_STD_THRESHOLD:
+            outlier_series = (X - smean) / sstd
+        else:
+            outlier_series = X - smean
+    X_fft = np.zeros(0, dtype=np.complex128)
+    tw = np.zeros(0, dtype=np.complex128)
+    if intermediates[_FFT]:
+        X_fft, tw = _centred_fft(X, smean)
+    ac = np.zeros(0)
+    acfz = 0
+    if intermediates[_AC]:
+        ac = _autocorr(X, X_fft, tw)
+        acfz = _ac_first_zero(ac)
+
+    for n in range(f_idx.shape[0]):
+        if not transform_features[n]:
+            continue
+        feature = f_idx[n]
+
+        if feature == 0:
+            out[n] = _DN_HistogramMode_5(X, smin, smax)
+        elif feature == 1:
+            out[n] = _DN_HistogramMode_10(X, smin, smax)
+        elif feature == 2:
+            out[n] = _CO_f1ecac(ac)
+        elif feature == 3:
+            out[n] = _CO_FirstMin_ac(X)
+        elif feature == 4:
+            out[n] = _CO_HistogramAMI_even_2_5(X, smin, smax)
+        elif feature == 5:
+            out[n] = _CO_trev_1_num(X)
+        elif feature == 6:
+            out[n] = _MD_hrv_classic_pnn40(X)
+        elif feature == 7:
+            out[n] = _SB_BinaryStats_mean_longstretch1(X, smean)
+        elif feature == 8:
+            out[n] = _SB_TransitionMatrix_3ac_sumdiagcov(X, acfz)
+        elif feature == 9:
+            out[n] = _PD_PeriodicityWang_th0_01(X)
+        elif feature == 10:
+            out[n] = _CO_Embed2_Dist_tau_d_expfit_meandiff(X, acfz)
+        elif feature == 11:
+            out[n] = _IN_AutoMutualInfoStats_40_gaussian_fmmi(X)
+        elif feature == 12:
+            out[n] = _FC_LocalSimple_mean1_tauresrat(X, acfz)
+        elif feature == 13:
+            out[n] = _DN_OutlierInclude_p_001_mdrmd(outlier_series)
+        elif feature == 14:
+            out[n] = _DN_OutlierInclude_n_001_mdrmd(outlier_series)
+        elif feature == 15:
+            out[n] = _SP_Summaries_welch_rect_area_5_1(X, X_fft)
+        elif feature == 16:
+            out[n] = _SB_BinaryStats_diff_longstretch0(X)
+        elif feature == 17:
+            out[n] = _SB_MotifThree_quantile_hh(X, X_sorted)
+        elif feature == 18:
+            out[n] = _SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1(X)
+        elif feature == 19:
+            out[n] = _SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1(X)
+        elif feature == 20:
+            out[n] = _SP_Summaries_welch_rect_centroid(X, X_fft)
+        elif feature == 21:
+            out[n] = _FC_LocalSimple_mean3_stderr(X)
+        elif feature == 22:
+            out[n] = smean
+        elif feature == 23:
+            out[n] = sstd
 
-        for i in range(tau):
-            ac = _autocorr_lag(X_ac, len(X_ac), i + 1)
-            ami[i] = -0.5 * np.log(1 - np.power(ac, 2))
-
-        for i in range(1, tau - 1):
-            if ami[i] < ami[i - 1] and ami[i] < ami[i + 1]:
-                return i
-        return tau
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _MD_hrv_classic_pnn40(X):
-        # Proportion of successive differences exceeding 0.04σ (Mietus 2002).
-        diffs = np.zeros(len(X) - 1)
-        for i in range(len(diffs)):
-            diffs[i] = np.abs(X[i + 1] - X[i]) * 1000
 
-        nsum = 0
-        for diff in diffs:
-            if diff > 40:
-                nsum += 1
-
-        return nsum / len(diffs)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _SB_BinaryStats_mean_longstretch1(X, smean):
-        # Longest period of consecutive values above the mean.
-        mean_binary = np.zeros(len(X) - 1)
-        for i in range(len(mean_binary)):
-            if X[i] - smean > 0:
-                mean_binary[i] = 1
-
-        return _long_stretch(mean_binary, 1)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _SB_MotifThree_quantile_hh(X):
-        alphabet_size = 3
-        yt = np.zeros(len(X), dtype=np.int32)
-        _sb_coarsegrain(X, 3, yt)
-        r1 = [np.zeros(len(X), np.int32) for i in range(alphabet_size)]
-        sizes_r1 = np.zeros(alphabet_size, np.int32)
-        for i in range(alphabet_size):
-            r_idx = 0
-            sizes_r1[i] = 0
-            for j in range(len(X)):
-                if yt[j] == i + 1:
-                    r1[i][r_idx] = j
-                    r_idx += 1
-                    sizes_r1[i] += 1
-
-        for i in range(alphabet_size):
-            if sizes_r1[i] != 0 and r1[i][sizes_r1[i] - 1] == len(X) - 1:
-                tmp_ar = np.zeros(sizes_r1[i], np.int32)
-                # isn't this doing the same thing?
-                for x in range(sizes_r1[i]):
-                    tmp_ar[x] = r1[i][x]
-                for y in range(sizes_r1[i] - 1):
-                    r1[i][y] = tmp_ar[y]
-                sizes_r1[i] -= 1
-
-        r2 = [
-            [np.zeros(len(X), np.int32) for j in range(alphabet_size)]
-            for i in range(alphabet_size)
-        ]
-        sizes_r2 = [np.zeros(alphabet_size, np.int32) for i in range(alphabet_size)]
-        out2 = [np.zeros(alphabet_size, np.float64) for i in range(alphabet_size)]
-
-        for i in range(alphabet_size):
-            for j in range(alphabet_size):
-                sizes_r2[i][j] = 0
-                dynamic_idx = 0
-                for k in range(sizes_r1[i]):
-                    tmp_idx = yt[r1[i][k] + 1]
-                    if tmp_idx == j + 1:
-                        r2[i][j][dynamic_idx] = r1[i][k]
-                        dynamic_idx += 1
-                        sizes_r2[i][j] += 1
-                tmp = np.float64(sizes_r2[i][j]) / (np.float64(len(X)) - 1.0)
-                out2[i][j] = tmp
-        hh = 0.0
-        for i in range(alphabet_size):
-            hh += _f_entropy(out2[i], alphabet_size)
-        return hh
-
-    @staticmethod
-    def _FC_LocalSimple_mean1_tauresrat(X, acfz):
-        # Change in correlation length after iterative differencing.
-        if len(X) < 2:
-            return 0
-        res = _local_simple_mean(X, 1)
-        mean = np.mean(res)
-
-        nfft = int(np.power(2, np.ceil(np.log(len(res)) / np.log(2))))
-        fft = np.fft.fft(res - mean, n=nfft)
-        ac = _autocorr(res, fft)
-
-        return _ac_first_zero(ac) / acfz
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _CO_Embed2_Dist_tau_d_expfit_meandiff(X, acfz):
-        # Exponential fit to successive distances in 2-d embedding space.
-        tau = acfz
-        if tau > len(X) / 10:
-            tau = int(len(X) / 10)
-        d = np.zeros(len(X) - tau - 1)
-        d_mean = 0
-        for i in range(len(d)):
-            n = np.sqrt(
-                np.power(X[i + 1] - X[i], 2) + np.power(X[i + tau] - X[i + tau + 1], 2)
-            )
-            d[i] = n
-            d_mean += n
-        d_mean /= len(d)
-        smin = np.min(d)
-        smax = np.max(d)
-        srange = smax - smin
-        std = np.std(d)
-        if std < 0.001:
-            return 0
-        num_bins = int(
-            np.ceil(
-                srange
-                / (3.5 * _stddev(d, len(d)) / np.power(len(d), 0.3333333333333333))
-            )
+@njit(fastmath=True, cache=True)
+def _DN_HistogramMode_5(X, smin, smax):
+    # Mode of z-scored distribution (5-bin histogram).
+    return _histogram_mode(X, 5, smin, smax)
+
+
+@njit(fastmath=True, cache=True)
+def _DN_HistogramMode_10(X, smin, smax):
+    # Mode of z-scored distribution (10-bin histogram).
+    return _histogram_mode(X, 10, smin, smax)
+
+
+@njit(fastmath=True, cache=True)
+def _SB_BinaryStats_diff_longstretch0(X):
+    # Longest period of successive incremental decreases.
+    diff_binary = np.zeros(len(X) - 1)
+    for i in range(len(diff_binary)):
+        if X[i + 1] - X[i] >= 0:
+            diff_binary[i] = 1
+
+    return _long_stretch(diff_binary, 0)
+
+
+@njit(fastmath=True, cache=True)
+def _DN_OutlierInclude_p_001_mdrmd(X):
+    # Time intervals between successive extreme events above the mean.
+    return _outlier_include(X)
+
+
+@njit(fastmath=True, cache=True)
+def _DN_OutlierInclude_n_001_mdrmd(X):
+    # Time intervals between successive extreme events below the mean.
+    return _outlier_include(-X)
+
+
+@njit(fastmath=True, cache=True)
+def _CO_f1ecac(X_ac):
+    # Parameter has already been transformed using _autocorr
+    # First 1/e crossing of autocorrelation function.
+    threshold = 0.36787944117144233  # 1 / np.exp(1)
+    for i in range(len(X_ac) - 2):
+        if X_ac[i + 1] < threshold:
+            m = X_ac[i + 1] - X_ac[i]
+            dy = threshold - X_ac[i]
+            dx = dy / m
+            out = np.float64(i) + dx
+            return out
+
+    return len(X_ac)
+
+
+@njit(fastmath=True, cache=True)
+def _CO_FirstMin_ac(X_ac):
+    X_ac = _compute_autocorrelations(X_ac)
+    # First minimum of autocorrelation function.
+    for i in range(1, len(X_ac) - 1):
+        if X_ac[i] < X_ac[i - 1] and X_ac[i] < X_ac[i + 1]:
+            return i
+    return len(X_ac)
+
+
+@njit(fastmath=True, cache=True)
+def _SP_Summaries_welch_rect_area_5_1(X, X_fft):
+    # Total power in lowest fifth of frequencies in the Fourier power spectrum.
+    return _summaries_welch_rect(X, False, X_fft)
+
+
+@njit(fastmath=True, cache=True)
+def _SP_Summaries_welch_rect_centroid(X, X_fft):
+    # Centroid of the Fourier power spectrum.
+    return _summaries_welch_rect(X, True, X_fft)
+
+
+@njit(fastmath=True, cache=True)
+def _FC_LocalSimple_mean3_stderr(X):
+    # Mean error from a rolling 3-sample mean forecasting.
+    if len(X) - 3 < 3:
+        return 0
+    res = _local_simple_mean(X, 3)
+    return _stddev(res, len(X) - 3)
+
+
+@njit(fastmath=True, cache=True)
+def _CO_trev_1_num(X):
+    # Time-reversibility statistic, ((x_t+1 − x_t)^3)_t.
+    y = np.zeros(len(X) - 1)
+    for i in range(len(y)):
+        y[i] = np.power(X[i + 1] - X[i], 3)
+    return np.mean(y)
+
+
+@njit(fastmath=True, cache=True)
+def _CO_HistogramAMI_even_2_5(X, smin, smax):
+    # Automutual information, m = 2, τ = 5.
+    new_min = smin - 0.1
+    new_max = smax + 0.1
+    bin_width = (new_max - new_min) / 5
+
+    histogram = np.zeros((5, 5))
+    sumx = np.zeros(5)
+    sumy = np.zeros(5)
+    v = 1.0 / (len(X) - 2)
+    for i in range(len(X) - 2):
+        idx1 = int((X[i] - new_min) / bin_width)
+        idx2 = int((X[i + 2] - new_min) / bin_width)
+
+        histogram[idx1][idx2] += v
+        sumx[idx1] += v
+        sumy[idx2] += v
+
+    nsum = 0
+    for i in range(5):
+        for n in range(5):
+            if histogram[i][n] > 0:
+                nsum += histogram[i][n] * np.log(histogram[i][n] / sumx[i] / sumy[n])
+
+    return nsum
+
+
+@njit(fastmath=True, cache=True)
+def _IN_AutoMutualInfoStats_40_gaussian_fmmi(X_ac):
+    # First minimum of the automutual information function.
+    tau = int(min(40, np.ceil(len(X_ac) / 2)))
+
+    ami = np.zeros(len(X_ac), dtype=np.float64)
+
+    for i in range(tau):
+        ac = _autocorr_lag(X_ac, len(X_ac), i + 1)
+        ami[i] = -0.5 * np.log(1 - np.power(ac, 2))
+
+    for i in range(1, tau - 1):
+        if ami[i] < ami[i - 1] and ami[i] < ami[i + 1]:
+            return i
+    return tau
+
+
+@njit(fastmath=True, cache=True)
+def _MD_hrv_classic_pnn40(X):
+    # Proportion of successive differences exceeding 0.04σ (Mietus 2002).
+    diffs = np.zeros(len(X) - 1)
+    for i in range(len(diffs)):
+        diffs[i] = np.abs(X[i + 1] - X[i]) * 1000
+
+    nsum = 0
+    for diff in diffs:
+        if diff > 40:
+            nsum += 1
+
+    return nsum / len(diffs)
+
+
+@njit(fastmath=True, cache=True)
+def _SB_BinaryStats_mean_longstretch1(X, smean):
+    # Longest period of consecutive values above the mean.
+    mean_binary = np.zeros(len(X) - 1)
+    for i in range(len(mean_binary)):
+        if X[i] - smean > 0:
+            mean_binary[i] = 1
+
+    return _long_stretch(mean_binary, 1)
+
+
+@njit(fastmath=True, cache=True)
+def _SB_MotifThree_quantile_hh(X, X_sorted):
+    alphabet_size = 3
+    yt = np.zeros(len(X), dtype=np.int32)
+    _sb_coarsegrain(X, X_sorted, 3, yt)
+    r1 = [np.zeros(len(X), np.int32) for i in range(alphabet_size)]
+    sizes_r1 = np.zeros(alphabet_size, np.int32)
+    for i in range(alphabet_size):
+        r_idx = 0
+        sizes_r1[i] = 0
+        for j in range(len(X)):
+            if yt[j] == i + 1:
+                r1[i][r_idx] = j
+                r_idx += 1
+                sizes_r1[i] += 1
+
+    for i in range(alphabet_size):
+        if sizes_r1[i] != 0 and r1[i][sizes_r1[i] - 1] == len(X) - 1:
+            tmp_ar = np.zeros(sizes_r1[i], np.int32)
+            # isn't this doing the same thing?
+            for x in range(sizes_r1[i]):
+                tmp_ar[x] = r1[i][x]
+            for y in range(sizes_r1[i] - 1):
+                r1[i][y] = tmp_ar[y]
+            sizes_r1[i] -= 1
+
+    r2 = [
+        [np.zeros(len(X), np.int32) for j in range(alphabet_size)]
+        for i in range(alphabet_size)
+    ]
+    sizes_r2 = [np.zeros(alphabet_size, np.int32) for i in range(alphabet_size)]
+    out2 = [np.zeros(alphabet_size, np.float64) for i in range(alphabet_size)]
+
+    for i in range(alphabet_size):
+        for j in range(alphabet_size):
+            sizes_r2[i][j] = 0
+            dynamic_idx = 0
+            for k in range(sizes_r1[i]):
+                tmp_idx = yt[r1[i][k] + 1]
+                if tmp_idx == j + 1:
+                    r2[i][j][dynamic_idx] = r1[i][k]
+                    dynamic_idx += 1
+                    sizes_r2[i][j] += 1
+            tmp = np.float64(sizes_r2[i][j]) / (np.float64(len(X)) - 1.0)
+            out2[i][j] = tmp
+    hh = 0.0
+    for i in range(alphabet_size):
+        hh += _f_entropy(out2[i], alphabet_size)
+    return hh
+
+
+@njit(fastmath=True, cache=True)
+def _FC_LocalSimple_mean1_tauresrat(X, acfz):
+    # Change in correlation length after iterative differencing.
+    if len(X) < 2:
+        return 0
+    res = _local_simple_mean(X, 1)
+    res_fft, tw = _centred_fft(res, mean(res))
+    ac = _autocorr(res, res_fft, tw)
+
+    return _ac_first_zero(ac) / acfz
+
+
+@njit(fastmath=True, cache=True)
+def _CO_Embed2_Dist_tau_d_expfit_meandiff(X, acfz):
+    # Exponential fit to successive distances in 2-d embedding space.
+    tau = acfz
+    if tau > len(X) / 10:
+        tau = int(len(X) / 10)
+    d = np.zeros(len(X) - tau - 1)
+    d_mean = 0
+    for i in range(len(d)):
+        n = np.sqrt(
+            np.power(X[i + 1] - X[i], 2) + np.power(X[i + tau] - X[i + tau + 1], 2)
         )
-        if num_bins == 0:
-            return 0
-        bin_width = srange / num_bins
-
-        histogram = np.zeros(num_bins, dtype=np.int32)
-        binEdges = np.zeros(num_bins + 1, dtype=np.float64)
-        for val in d:
-            idx = int((val - smin) / bin_width)
-            if idx < 0:
-                idx = 0
-            if idx >= num_bins:
-                idx = num_bins - 1
-            histogram[idx] += 1
-
-        for i in range(num_bins + 1):
-            binEdges[i] = i * bin_width + smin
-
-        histogramNormalise = np.zeros(num_bins, dtype=np.float64)
-        for i in range(len(histogramNormalise)):
-            histogramNormalise[i] = histogram[i] / len(d)
-
-        d_exp_fit = np.zeros(num_bins, dtype=np.float64)
-        for i in range(num_bins):
-            expf = np.exp(-(binEdges[i] + binEdges[i + 1]) * 0.5 / d_mean) / d_mean
-            if expf < 0:
-                expf = 0
-
-            d_exp_fit[i] = np.abs(histogramNormalise[i] - expf)
-
-        return np.mean(d_exp_fit)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1(X):
-        # Proportion of slower timescale fluctuations that scale with DFA (50%
-        # sampling).
-        cs = np.zeros(int(len(X) / 2))
-        cs[0] = X[0]
-        for i in range(1, len(cs)):
-            cs[i] = cs[i - 1] + X[i * 2]
-
-        return _fluct_prop(cs, len(X), True)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1(X):
-        # Proportion of slower timescale fluctuations that scale with linearly rescaled
-        # range fits.
-        cs = np.zeros(len(X))
-        cs[0] = X[0]
-        for i in range(1, len(X)):
-            cs[i] = cs[i - 1] + X[i]
-
-        return _fluct_prop(cs, len(X), False)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _SB_TransitionMatrix_3ac_sumdiagcov(X, acfz):
-
-        # Trace of covariance of transition matrix between symbols in 3-letter alphabet.
-        ds = np.zeros(int(((len(X) - 1) / acfz) + 1), dtype=np.float64)
-        for i in range(len(ds)):
-            ds[i] = X[i * acfz]
-        # swap to alphabet:
-        yCG = np.zeros(len(ds), dtype=np.int32)
-        _sb_coarsegrain(ds, 3, yCG)
-
-        T = np.zeros((3, 3), dtype=np.float64)
-        for i in range(len(ds) - 1):
-            T[yCG[i] - 1][yCG[i + 1] - 1] += 1
-        for i in range(3):
-            for j in range(3):
-                T[i][j] /= len(ds) - 1
-
-        column1 = np.zeros(3, dtype=np.float64)
-        column2 = np.zeros(3, dtype=np.float64)
-        column3 = np.zeros(3, dtype=np.float64)
-
-        for i in range(3):
-            column1[i] = T[i][0]
-            column2[i] = T[i][1]
-            column3[i] = T[i][2]
-        columns = np.zeros((3, 3), dtype=np.float64)
-        columns[0] = column1
-        columns[1] = column2
-        columns[2] = column3
-
-        # columns = [column1, column2, column3]
-        cov_array = np.zeros((3, 3), dtype=np.float64)
-        covTemp = 0.0
-        for i in range(3):
-            for j in range(3):
-                covTemp = _covariance(columns[i], columns[j], 3)
-                cov_array[i][j] = covTemp
-                cov_array[j][i] = covTemp
-
-        sum_of_diagonal_cov = 0.0
-        for i in range(3):
-            sum_of_diagonal_cov += cov_array[i][i]
-
-        return sum_of_diagonal_cov
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _PD_PeriodicityWang_th0_01(X):
-        # Periodicity measure of (Wang et al. 2007).
-        y_spline = _spline_fit(X)
-
-        y_sub = np.zeros(len(X))
-        for i in range(len(X)):
-            y_sub[i] = X[i] - y_spline[i]
-
-        acmax = int(np.ceil(len(X) / 3.0))
-        acf = np.zeros(acmax)
-        for tau in range(1, acmax + 1):
-            covariance = 0
-            for i in range(len(X) - tau):
-                covariance += y_sub[i] * y_sub[i + tau]
-            acf[tau - 1] = covariance / (len(X) - tau)
-
-        troughs = np.zeros(acmax, dtype=np.int32)
-        peaks = np.zeros(acmax, dtype=np.int32)
-        n_troughs = 0
-        n_peaks = 0
-        for i in range(1, acmax - 1):
-            slope_in = acf[i] - acf[i - 1]
-            slope_out = acf[i + 1] - acf[i]
-
-            if slope_in < 0 and slope_out > 0:
-                troughs[n_troughs] = i
-                n_troughs += 1
-            elif slope_in > 0 and slope_out < 0:
-                peaks[n_peaks] = i
-                n_peaks += 1
-
-        out = 0
-        for i in range(n_peaks):
-            j = -1
-            while troughs[j + 1] < peaks[i] and j + 1 < n_troughs:
-                j += 1
-
-            if j == -1 or acf[peaks[i]] - acf[troughs[j]] < 0.01 or acf[peaks[i]] < 0:
-                continue
-
-            out = peaks[i]
-            break
-
-        return out
+        d[i] = n
+        d_mean += n
+    d_mean /= len(d)
+    smin = np.min(d)
+    smax = np.max(d)
+    srange = smax - smin
+    std = np.std(d)
+    if std < 0.001:
+        return 0
+    num_bins = int(
+        np.ceil(
+            srange / (3.5 * _stddev(d, len(d)) / np.power(len(d), 0.3333333333333333))
+        )
+    )
+    if num_bins == 0:
+        return 0
+    bin_width = srange / num_bins
+
+    histogram = np.zeros(num_bins, dtype=np.int32)
+    binEdges = np.zeros(num_bins + 1, dtype=np.float64)
+    for val in d:
+        idx = int((val - smin) / bin_width)
+        if idx < 0:
+            idx = 0
+        if idx >= num_bins:
+            idx = num_bins - 1
+        histogram[idx] += 1
+
+    for i in range(num_bins + 1):
+        binEdges[i] = i * bin_width + smin
+
+    histogramNormalise = np.zeros(num_bins, dtype=np.float64)
+    for i in range(len(histogramNormalise)):
+        histogramNormalise[i] = histogram[i] / len(d)
+
+    d_exp_fit = np.zeros(num_bins, dtype=np.float64)
+    for i in range(num_bins):
+        expf = np.exp(-(binEdges[i] + binEdges[i + 1]) * 0.5 / d_mean) / d_mean
+        if expf < 0:
+            expf = 0
+
+        d_exp_fit[i] = np.abs(histogramNormalise[i] - expf)
+
+    return np.mean(d_exp_fit)
+
+
+@njit(fastmath=True, cache=True)
+def _SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1(X):
+    # Proportion of slower timescale fluctuations that scale with DFA (50%
+    # sampling).
+    cs = np.zeros(int(len(X) / 2))
+    cs[0] = X[0]
+    for i in range(1, len(cs)):
+        cs[i] = cs[i - 1] + X[i * 2]
+
+    return _fluct_prop(cs, len(X), True)
+
+
+@njit(fastmath=True, cache=True)
+def _SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1(X):
+    # Proportion of slower timescale fluctuations that scale with linearly rescaled
+    # range fits.
+    cs = np.zeros(len(X))
+    cs[0] = X[0]
+    for i in range(1, len(X)):
+        cs[i] = cs[i - 1] + X[i]
+
+    return _fluct_prop(cs, len(X), False)
+
+
+@njit(fastmath=True, cache=True)
+def _SB_TransitionMatrix_3ac_sumdiagcov(X, acfz):
+
+    # Trace of covariance of transition matrix between symbols in 3-letter alphabet.
+    ds = np.zeros(int(((len(X) - 1) / acfz) + 1), dtype=np.float64)
+    for i in range(len(ds)):
+        ds[i] = X[i * acfz]
+    # swap to alphabet:
+    yCG = np.zeros(len(ds), dtype=np.int32)
+    _sb_coarsegrain(ds, np.sort(ds), 3, yCG)
+
+    T = np.zeros((3, 3), dtype=np.float64)
+    for i in range(len(ds) - 1):
+        T[yCG[i] - 1][yCG[i + 1] - 1] += 1
+    for i in range(3):
+        for j in range(3):
+            T[i][j] /= len(ds) - 1
+
+    column1 = np.zeros(3, dtype=np.float64)
+    column2 = np.zeros(3, dtype=np.float64)
+    column3 = np.zeros(3, dtype=np.float64)
+
+    for i in range(3):
+        column1[i] = T[i][0]
+        column2[i] = T[i][1]
+        column3[i] = T[i][2]
+    columns = np.zeros((3, 3), dtype=np.float64)
+    columns[0] = column1
+    columns[1] = column2
+    columns[2] = column3
+
+    # columns = [column1, column2, column3]
+    cov_array = np.zeros((3, 3), dtype=np.float64)
+    covTemp = 0.0
+    for i in range(3):
+        for j in range(3):
+            covTemp = _covariance(columns[i], columns[j], 3)
+            cov_array[i][j] = covTemp
+            cov_array[j][i] = covTemp
+
+    sum_of_diagonal_cov = 0.0
+    for i in range(3):
+        sum_of_diagonal_cov += cov_array[i][i]
+
+    return sum_of_diagonal_cov
+
+
+@njit(fastmath=True, cache=True)
+def _PD_PeriodicityWang_th0_01(X):
+    # Periodicity measure of (Wang et al. 2007).
+    y_spline = _spline_fit(X)
+
+    y_sub = np.zeros(len(X))
+    for i in range(len(X)):
+        y_sub[i] = X[i] - y_spline[i]
+
+    acmax = int(np.ceil(len(X) / 3.0))
+    acf = np.zeros(acmax)
+    for tau in range(1, acmax + 1):
+        covariance = 0
+        for i in range(len(X) - tau):
+            covariance += y_sub[i] * y_sub[i + tau]
+        acf[tau - 1] = covariance / (len(X) - tau)
+
+    troughs = np.zeros(acmax, dtype=np.int32)
+    peaks = np.zeros(acmax, dtype=np.int32)
+    n_troughs = 0
+    n_peaks = 0
+    for i in range(1, acmax - 1):
+        slope_in = acf[i] - acf[i - 1]
+        slope_out = acf[i + 1] - acf[i]
+
+        if slope_in < 0 and slope_out > 0:
+            troughs[n_troughs] = i
+            n_troughs += 1
+        elif slope_in > 0 and slope_out < 0:
+            peaks[n_peaks] = i
+            n_peaks += 1
+
+    out = 0
+    for i in range(n_peaks):
+        j = -1
+        while troughs[j + 1] < peaks[i] and j + 1 < n_troughs:
+            j += 1
+
+        if j == -1 or acf[peaks[i]] - acf[troughs[j]] < 0.01 or acf[peaks[i]] < 0:
+            continue
+
+        out = peaks[i]
+        break
+
+    return out
 
 
 @njit(fastmath=True, cache=True)
@@ -935,17 +1121,30 @@ def _outlier_include(X):
     return np.median(medians[: trim_limit + 1])
 
 
-def _autocorr(X, X_fft):
-    ca = np.fft.ifft(_multiply_complex_arr(X_fft))
+@njit(fastmath=True, cache=True)
+def _autocorr(X, X_fft, tw):
+    # the power spectrum is real, so the real part of its forward transform is the
+    # inverse transform up to a scale which cancels in _get_acf
+    ca = _fft(X_fft * np.conj(X_fft), tw)
     return _get_acf(X, ca)
 
 
+@njit(cache=True)
+def _fft_length(n):
+    # matches the padded length previously passed to np.fft.fft, without fastmath
+    # so the rounding of the log ratio is unchanged
+    return int(np.power(2, np.ceil(np.log(n) / np.log(2))))
+
+
 @njit(fastmath=True, cache=True)
-def _multiply_complex_arr(X_fft):
-    c = np.zeros(len(X_fft), dtype=np.complex128)
-    for i, n in enumerate(X_fft):
-        c[i] = n * (n.real + 1j * -n.imag)
-    return c
+def _centred_fft(X, smean):
+    nfft = _fft_length(len(X))
+    a = np.zeros(nfft, dtype=np.complex128)
+    for i in range(len(X)):
+        a[i] = X[i] - smean
+    tw = np.zeros(nfft // 2, dtype=np.complex128)
+    _twiddles(tw, nfft // 2)
+    return _fft(a, tw), tw
 
 
 @njit(fastmath=True, cache=True)
@@ -1473,7 +1672,7 @@ def _corr(x, y, size):
 
 
 @njit(fastmath=True, cache=True)
-def _sb_coarsegrain(y, num_groups, labels):
+def _sb_coarsegrain(y, y_sorted, num_groups, labels):
     th = np.zeros((num_groups + 1), dtype=np.float64)
     ls = np.zeros((num_groups + 1), dtype=np.float64)
     # linspace
@@ -1483,7 +1682,7 @@ def _sb_coarsegrain(y, num_groups, labels):
         ls[i] = start
         start += step_size
     for i in range(num_groups + 1):
-        th[i] = _quantile(y, ls[i])
+        th[i] = _quantile(y_sorted, ls[i])
     th[0] -= 1
     for i in range(num_groups):
         for j in range(len(y)):
@@ -1492,21 +1691,20 @@ def _sb_coarsegrain(y, num_groups, labels):
 
 
 @njit(fastmath=True, cache=True)
-def _quantile(X, quant):
-    tmp = np.sort(X)
-    q = 0.5 / len(X)
+def _quantile(X_sorted, quant):
+    q = 0.5 / len(X_sorted)
     if quant < q:
-        value = tmp[0]
+        value = X_sorted[0]
         return value
     elif quant > (1 - q):
-        value = tmp[len(X) - 1]
+        value = X_sorted[len(X_sorted) - 1]
         return value
 
-    quant_idx = len(X) * quant - 0.5
+    quant_idx = len(X_sorted) * quant - 0.5
     idx_left = int(np.floor(quant_idx))
     idx_right = int(np.ceil(quant_idx))
-    value = tmp[idx_left] + (quant_idx - idx_left) * (
-        tmp[idx_right] - tmp[idx_left]
+    value = X_sorted[idx_left] + (quant_idx - idx_left) * (
+        X_sorted[idx_right] - X_sorted[idx_left]
     ) / (idx_right - idx_left)
     return value
 
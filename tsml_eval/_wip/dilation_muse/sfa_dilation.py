@@ -943,22 +943,10 @@ def _mft(
     transformed[:, 0, 1::2] = imags[:, 0 : length // 2]
 
     # 2. Other runs using MFT
-    # X2 = X.reshape(X.shape[0], X.shape[1], 1)
-    # Bugfix to allow for slices on original X like in TEASER
-    X2 = X.copy().reshape(X.shape[0], X.shape[1], 1)
-
     # compute only those indices needed and not all
     phis2 = phis[indices]
     transformed2 = transformed[:, :, indices]
-    for i in range(1, end):
-        reals = transformed2[:, i - 1, 0::2] + X2[:, i + window_size - 1] - X2[:, i - 1]
-        imags = transformed2[:, i - 1, 1::2]
-        transformed2[:, i, 0::2] = (
-            reals * phis2[:length:2] - imags * phis2[1 : (length + 1) : 2]
-        )
-        transformed2[:, i, 1::2] = (
-            reals * phis2[1 : (length + 1) : 2] + phis2[:length:2] * imags
-        )
+    _iterate_mft(X, phis2, window_size, transformed2)
 
     transformed2 = transformed2 * inverse_sqrt_win_size
 
@@ -979,6 +967,21 @@ def _mft(
         ]
 
 
+@njit(fastmath=True, cache=True)
+def _iterate_mft(X, phis, window_size, transformed):
+    # updates the coefficients of each window in place from the previous window,
+    # without allocating arrays for each window
+    for a in range(X.shape[0]):
+        for i in range(1, transformed.shape[1]):
+            for n in range(0, transformed.shape[2], 2):
+                real = (
+                    transformed[a, i - 1, n] + X[a, i + window_size - 1] - X[a, i - 1]
+                )
+                imag = transformed[a, i - 1, n + 1]
+                transformed[a, i, n] = real * phis[n] - imag * phis[n + 1]
+                transformed[a, i, n + 1] = real * phis[n + 1] + phis[n] * imag
+
+
 def _dilation(X, d, first_difference):
     padding = np.zeros((len(X), 10))
     X = np.concatenate((padding, X, padding), axis=1)
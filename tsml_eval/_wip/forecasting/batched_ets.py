@@ -0,0 +1,466 @@
+"""Batched exponential smoothing for many series and model configurations.
+
+Fits every combination of series and ETS model configuration in a single parallel
+numba kernel, using the state space equations of the ``aeon`` ETSForecaster. The
+best configuration for each series is selected by AIC and forecasts for all series
+are made in a second kernel.
+"""
+
+__maintainer__ = []
+__all__ = ["BatchedETSForecaster", "batched_ets", "ets_configurations"]
+
+import itertools
+
+import numpy as np
+from aeon.forecasting import BaseForecaster
+from aeon.forecasting._ets import (
+    ADDITIVE,
+    MULTIPLICATIVE,
+    NONE,
+    _initialise,
+    _predict_value,
+    _update_states,
+)
+from aeon.utils.validation import check_n_jobs
+from numba import config, get_num_threads, njit, prange, set_num_threads
+
+from tsml_eval.utils.ragged import RaggedCollection
+
+
+def ets_configurations(
+    error_types=(ADDITIVE, MULTIPLICATIVE),
+    trend_types=(NONE, ADDITIVE, MULTIPLICATIVE),
+    seasonality_types=(NONE, ADDITIVE, MULTIPLICATIVE),
+    alpha=(0.1,),
+    beta=(0.01,),
+    gamma=(0.01,),
+    phi=(0.99,),
+):
+    """Create the grid of ETS model configurations to select from.
+
+    Smoothing parameters for a component not in the model are set to 0 (and the
+    damping parameter to 1), duplicate configurations are removed.
+
+    Parameters
+    ----------
+    error_types : tuple of int, default=(ADDITIVE, MULTIPLICATIVE)
+        The error types, either ADDITIVE (1) or MULTIPLICATIVE (2).
+    trend_types : tuple of int, default=(NONE, ADDITIVE, MULTIPLICATIVE)
+        The trend types, either NONE (0), ADDITIVE (1) or MULTIPLICATIVE (2).
+    seasonality_types : tuple of int, default=(NONE, ADDITIVE, MULTIPLICATIVE)
+        The seasonality types, either NONE (0), ADDITIVE (1) or MULTIPLICATIVE (2).
+    alpha : tuple of float, default=(0.1,)
+        The level smoothing parameters.
+    beta : tuple of float, default=(0.01,)
+        The trend smoothing parameters.
+    gamma : tuple of float, default=(0.01,)
+        The seasonal smoothing parameters.
+    phi : tuple of float, default=(0.99,)
+        The trend damping parameters.
+
+    Returns
+    -------
+    configurations : np.ndarray
+        2D array of shape (n_configurations, 7). Each row contains the error type,
+        trend type, seasonality type, alpha, beta, gamma and phi of a configuration.
+    """
+    configurations = []
+    for e, t, s, a, b, g, p in itertools.product(
+        error_types, trend_types, seasonality_types, alpha, beta, gamma, phi
+    ):
+        if e != ADDITIVE and e != MULTIPLICATIVE:
+            raise ValueError("Error must be either additive or multiplicative")
+
+        configuration = (
+            e,
+            t,
+            s,
+            a,
+            b if t != NONE else 0.0,
+            g if s != NONE else 0.0,
+            p if t != NONE else 1.0,
+        )
+        if configuration not in configurations:
+            configurations.append(configuration)
+    return np.array(configurations, dtype=np.float64)
+
+
+def batched_ets(y, horizon=1, configurations=None, seasonal_period=1, n_jobs=1):
+    """Select an ETS model for each series by AIC and forecast the next values.
+
+    All series and configurations are fitted in one call to a parallel numba kernel,
+    rather than a Python level call per series and configuration.
+
+    Parameters
+    ----------
+    y : np.ndarray or list of np.ndarray
+        2D numpy array of shape (n_series, n_timepoints) or a list of 1D numpy arrays
+        of shape (n_timepoints_i,).
+    horizon : int, default=1
+        The number of steps ahead to forecast.
+    configurations : np.ndarray or None, default=None
+        The model configurations to select from, see ``ets_configurations``. If
+        None, ``ets_configurations()`` is used.
+    seasonal_period : int, default=1
+        Length of the seasonality period for seasonal configurations.
+    n_jobs : int, default=1
+        The number of threads used to fit the models. ``-1`` means using all
+        processors.
+
+    Returns
+    -------
+    forecasts : np.ndarray
+        2D array of shape (n_series, horizon) containing the forecasts for steps
+        1 to ``horizon`` of each series.
+    best : np.ndarray
+        The index of the configuration selected for each series.
+    aic : np.ndarray
+        2D array of shape (n_series, n_configurations) containing the AIC of each
+        fitted model. Configurations which could not be fitted have an AIC of inf.
+    """
+    X = _to_collection(y)
+    configurations = _check_configurations(configurations)
+    seasonal_period = max(seasonal_period, 1)
+
+    aic, level, trend, seasonality = _fit_configurations(
+        X, configurations, seasonal_period, n_jobs
+    )
+    best = _select_best(aic)
+    forecasts = _forecast_batch(
+        configurations,
+        best,
+        level,
+        trend,
+        seasonality,
+        X.lengths,
+        seasonal_period,
+        horizon,
+    )
+    return forecasts, best, aic
+
+
+class BatchedETSForecaster(BaseForecaster):
+    """Exponential smoothing forecaster with model selection by AIC.
+
+    Fits all model configurations to the series in a single parallel numba kernel
+    and forecasts using the configuration with the lowest AIC. Uses the state space
+    equations of the ``aeon`` ETSForecaster.
+
+    Parameters
+    ----------
+    configurations : np.ndarray or None, default=None
+        The model configurations to select from, see ``ets_configurations``. If
+        None, ``ets_configurations()`` is used.
+    seasonal_period : int, default=1
+        Length of the seasonality period for seasonal configurations.
+    horizon : int, default=1
+        The number of steps ahead to forecast. ``predict`` returns the forecasts for
+        all steps up to the horizon.
+    n_jobs : int, default=1
+        The number of threads used to fit the models. ``-1`` means using all
+        processors.
+
+    Attributes
+    ----------
+    configurations_ : np.ndarray
+        The model configurations fitted, see ``ets_configurations``.
+    aic_ : np.ndarray
+        The AIC of each fitted configuration.
+    best_configuration_ : np.ndarray
+        The configuration with the lowest AIC.
+
+    Examples
+    --------
+    >>> from aeon.datasets import load_airline
+    >>> from tsml_eval._wip.forecasting.batched_ets import BatchedETSForecaster
+    >>> y = load_airline()
+    >>> forecaster = BatchedETSForecaster(seasonal_period=12, horizon=3)
+    >>> forecaster.fit(y)
+    BatchedETSForecaster(horizon=3, seasonal_period=12)
+    >>> forecaster.predict().shape
+    (3,)
+    """
+
+    def __init__(self, configurations=None, seasonal_period=1, horizon=1, n_jobs=1):
+        self.configurations = configurations
+        self.seasonal_period = seasonal_period
+        self.n_jobs = n_jobs
+        super().__init__(horizon=horizon, axis=1)
+
+    def _fit(self, y, exog=None):
+        X = _to_collection([np.asarray(y, dtype=np.float64).ravel()])
+        self.configurations_ = _check_configurations(self.configurations)
+        self._seasonal_period = max(self.seasonal_period, 1)
+
+        aic, level, trend, seasonality = _fit_configurations(
+            X, self.configurations_, self._seasonal_period, self.n_jobs
+        )
+        best = _select_best(aic)
+
+        self.aic_ = aic[0]
+        self.best_configuration_ = self.configurations_[best[0]]
+        self._best = best
+        self._level = level
+        self._trend = trend
+        self._seasonality = seasonality
+        self._lengths = X.lengths
+        return self
+
+    def update(self, y):
+        """Update the model states with new values following the fitted series.
+
+        The states of the selected configuration are moved on through the new values
+        without refitting, the selected configuration is not changed.
+
+        Parameters
+        ----------
+        y : np.ndarray
+            The values following the last value seen in ``fit`` or ``update``.
+
+        Returns
+        -------
+        self
+            Updated BatchedETSForecaster.
+        """
+        self._check_is_fitted()
+
+        c = self._best[0]
+        self._level[0, c], self._trend[0, c] = _update_ets(
+            np.asarray(y, dtype=np.float64).ravel(),
+            self.configurations_[c],
+            self._level[0, c],
+            self._trend[0, c],
+            self._seasonality[0, c],
+            self._lengths[0],
+            self._seasonal_period,
+        )
+        self._lengths = self._lengths + len(y)
+        return self
+
+    def _predict(self, y=None, exog=None):
+        """Predict the next horizon steps ahead.
+
+        Parameters
+        ----------
+        y : np.ndarray, default = None
+            Not used, forecasts are made from the end of the series seen in ``fit``.
+            ``run_forecasting_experiment`` passes the step numbers of the test series
+            here, set the horizon to the length of the test series.
+        exog : np.ndarray, default = None
+            Not used.
+
+        Returns
+        -------
+        np.ndarray
+            The forecasts for steps 1 to ``horizon``.
+        """
+        return _forecast_batch(
+            self.configurations_,
+            self._best,
+            self._level,
+            self._trend,
+            self._seasonality,
+            self._lengths,
+            self._seasonal_period,
+            self.horizon,
+        )[0]
+
+
+def _to_collection(y):
+    if isinstance(y, np.ndarray) and y.ndim == 2:
+        return RaggedCollection.from_collection(
+            y[:, None, :].astype(np.float64, copy=False)
+        )
+    elif isinstance(y, list):
+        return RaggedCollection.from_collection(
+            [np.asarray(s, dtype=np.float64).reshape((1, -1)) for s in y]
+        )
+    else:
+        raise ValueError(
+            "y must be a 2D numpy array or a list of 1D numpy arrays, got "
+            f"{type(y)} instead."
+        )
+
+
+def _check_configurations(configurations):
+    if configurations is None:
+        return ets_configurations()
+
+    configurations = np.asarray(configurations, dtype=np.float64)
+    if configurations.ndim != 2 or configurations.shape[1] != 7:
+        raise ValueError(
+            "configurations must be a 2D array with 7 columns, see "
+            "ets_configurations."
+        )
+    return configurations
+
+
+def _fit_configurations(X, configurations, seasonal_period, n_jobs):
+    prev_threads = get_num_threads()
+    set_num_threads(min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS))
+    try:
+        return _fit_batch(X.values, X.offsets, configurations, seasonal_period)
+    finally:
+        set_num_threads(prev_threads)
+
+
+def _select_best(aic):
+    # failed fits (e.g. multiplicative models on non-positive series) have a NaN AIC
+    aic[np.isnan(aic)] = np.inf
+    best = np.argmin(aic, axis=1)
+
+    failed = np.flatnonzero(aic[np.arange(len(aic)), best] == np.inf)
+    if len(failed) > 0:
+        raise ValueError(
+            f"No ETS configuration could be fitted to the series at index "
+            f"{failed[:10].tolist()}. Series must be longer than twice the seasonal "
+            f"period."
+        )
+    return best
+
+
+@njit(cache=True, parallel=True)
+def _fit_batch(values, offsets, configurations, seasonal_period):
+    n_series = len(offsets) - 1
+    n_configurations = configurations.shape[0]
+
+    aic = np.full((n_series, n_configurations), np.inf)
+    level = np.zeros((n_series, n_configurations))
+    trend = np.zeros((n_series, n_configurations))
+    seasonality = np.zeros((n_series, n_configurations, seasonal_period))
+
+    # one task per series and configuration pair
+    for i in prange(n_series * n_configurations):
+        s = i // n_configurations
+        c = i % n_configurations
+        aic[s, c], level[s, c], trend[s, c] = _fit_ets(
+            values[offsets[s] : offsets[s + 1]],
+            configurations[c],
+            seasonal_period,
+            seasonality[s, c],
+        )
+
+    return aic, level, trend, seasonality
+
+
+@njit(cache=True)
+def _fit_ets(data, configuration, seasonal_period, seasonality_out):
+    error_type = int(configuration[0])
+    trend_type = int(configuration[1])
+    seasonality_type = int(configuration[2])
+    alpha = configuration[3]
+    beta = configuration[4]
+    gamma = configuration[5]
+    phi = configuration[6]
+
+    period = seasonal_period if seasonality_type != NONE else 1
+    n_timepoints = len(data)
+    if n_timepoints < 2 * period or n_timepoints <= seasonal_period:
+        return np.inf, 0.0, 0.0
+
+    level, trend, seasonality = _initialise(trend_type, seasonality_type, period, data)
+    trend = float(trend)
+
+    # the residuals before the seasonal period are not included in the likelihood
+    # of non-seasonal models, so the AIC of all configurations is comparable
+    lhood = 0.0
+    mul_likelihood_pt2 = 0.0
+    for t in range(n_timepoints - period):
+        fitted_value, error, level, trend, seasonality[t % period] = _update_states(
+            error_type,
+            trend_type,
+            seasonality_type,
+            level,
+            trend,
+            seasonality[t % period],
+            data[period + t],
+            alpha,
+            beta,
+            gamma,
+            phi,
+        )
+        if period + t >= seasonal_period:
+            lhood += error * error
+            mul_likelihood_pt2 += np.log(np.fabs(fitted_value))
+
+    lhood = (n_timepoints - seasonal_period) * np.log(lhood)
+    if error_type == MULTIPLICATIVE:
+        lhood += 2 * mul_likelihood_pt2
+
+    # smoothing parameters and initial states
+    n_params = 2
+    if trend_type != NONE:
+        n_params += 2
+        if phi != 1:
+            n_params += 1
+    if seasonality_type != NONE:
+        n_params += 1 + period
+
+    seasonality_out[:period] = seasonality
+    return lhood + 2 * n_params, level, trend
+
+
+@njit(cache=True)
+def _update_ets(
+    data, configuration, level, trend, seasonality, n_timepoints, seasonal_period
+):
+    seasonality_type = int(configuration[2])
+    period = seasonal_period if seasonality_type != NONE else 1
+
+    for i in range(len(data)):
+        # the seasonal state for time n + i, counted from the start of the fit
+        index = (n_timepoints - period + i) % period
+        _, _, level, trend, seasonality[index] = _update_states(
+            int(configuration[0]),
+            int(configuration[1]),
+            seasonality_type,
+            level,
+            trend,
+            seasonality[index],
+            data[i],
+            configuration[3],
+            configuration[4],
+            configuration[5],
+            configuration[6],
+        )
+
+    return level, trend
+
+
+@njit(cache=True, parallel=True)
+def _forecast_batch(
+    configurations,
+    best,
+    level,
+    trend,
+    seasonality,
+    lengths,
+    seasonal_period,
+    horizon,
+):
+    n_series = len(best)
+    forecasts = np.zeros((n_series, horizon))
+
+    for s in prange(n_series):
+        c = best[s]
+        trend_type = int(configurations[c, 1])
+        seasonality_type = int(configurations[c, 2])
+        phi = configurations[c, 6]
+        period = seasonal_period if seasonality_type != NONE else 1
+
+        phi_h = 0.0
+        for h in range(1, horizon + 1):
+            # phi + phi^2 + ... + phi^h
+            phi_h += phi**h
+            # the seasonal state for time n + h - 1, counted from the start of the fit
+            seasonal_index = (lengths[s] - period + h - 1) % period
+            forecasts[s, h - 1] = _predict_value(
+                trend_type,
+                seasonality_type,
+                level[s, c],
+                trend[s, c],
+                seasonality[s, c, seasonal_index],
+                phi_h,
+            )[0]
+
+    return forecasts
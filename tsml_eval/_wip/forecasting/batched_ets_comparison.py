@@ -0,0 +1,76 @@
+"""Compare the batched ETS engine against a per-series ETSForecaster loop.
+
+Fits every ETS configuration to a set of random series once with a Python loop over
+``aeon`` ETSForecaster and once with ``batched_ets``, checks the selected models
+forecast the same values and prints the run times.
+"""
+
+import time
+
+import numpy as np
+from aeon.forecasting import ETSForecaster
+
+from tsml_eval._wip.forecasting.batched_ets import batched_ets, ets_configurations
+
+
+def setup(n_series, n_timepoints):
+    rng = np.random.default_rng(0)
+    trend = np.linspace(1, 2, n_timepoints)
+    return [
+        10 + trend * rng.uniform(0, 1) + rng.random(n_timepoints)
+        for _ in range(n_series)
+    ]
+
+
+def per_series(y, configurations, horizon):
+    forecasts = np.zeros((len(y), horizon))
+    for i, series in enumerate(y):
+        best_likelihood = np.inf
+        for configuration in configurations:
+            error, trend, season = configuration[:3].astype(int)
+            forecaster = ETSForecaster(error, trend, season, 1, *configuration[3:])
+            forecaster.fit(series)
+
+            # all configurations have the same number of parameters, so the
+            # likelihood ranks them in the same order as the AIC
+            if forecaster.likelihood_ < best_likelihood:
+                best_likelihood = forecaster.likelihood_
+                for h in range(1, horizon + 1):
+                    forecaster.horizon = h
+                    forecasts[i, h - 1] = forecaster.predict()
+    return forecasts
+
+
+def test_batched_ets_comparison():
+    horizon = 6
+    configurations = ets_configurations(
+        trend_types=(1, 2),
+        seasonality_types=(0,),
+        alpha=(0.1, 0.3, 0.5),
+        beta=(0.01, 0.1),
+        phi=(0.9,),
+    )
+
+    # compile the numba functions before timing
+    batched_ets(setup(2, 50), horizon=horizon, configurations=configurations)
+    per_series(setup(2, 50), configurations, horizon)
+
+    for n_series in (100, 1000):
+        y = setup(n_series, 200)
+
+        start = time.time()
+        forecasts_loop = per_series(y, configurations, horizon)
+        time_loop = time.time() - start
+
+        start = time.time()
+        forecasts_batched, _, _ = batched_ets(
+            y, horizon=horizon, configurations=configurations, n_jobs=-1
+        )
+        time_batched = time.time() - start
+
+        assert np.allclose(forecasts_loop, forecasts_batched)
+        print(n_series, len(configurations), time_loop, time_batched)
+
+
+if __name__ == "__main__":
+    test_batched_ets_comparison()
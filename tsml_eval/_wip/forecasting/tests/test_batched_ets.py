@@ -0,0 +1,76 @@
+"""Test the batched ETS engine."""
+
+import numpy as np
+from aeon.datasets import load_airline
+from aeon.forecasting import ETSForecaster
+from numba import config
+
+from tsml_eval._wip.forecasting.batched_ets import (
+    BatchedETSForecaster,
+    batched_ets,
+    ets_configurations,
+)
+
+
+def test_batched_ets_matches_ets_forecaster():
+    """Test batched forecasts match the ETSForecaster for each configuration."""
+    y = np.asarray(load_airline(), dtype=np.float64)
+    configurations = ets_configurations(
+        seasonality_types=(0,), alpha=(0.3,), beta=(0.1,), phi=(0.9,)
+    )
+
+    for configuration in configurations:
+        forecasts, best, _ = batched_ets(
+            [y, y[:100]], horizon=3, configurations=configuration[None, :]
+        )
+
+        assert np.array_equal(best, [0, 0])
+        error, trend, season = configuration[:3].astype(int)
+        for h in range(1, 4):
+            forecaster = ETSForecaster(
+                error, trend, season, 1, *configuration[3:], horizon=h
+            )
+            assert np.isclose(forecasts[0, h - 1], forecaster.fit(y).predict())
+            assert np.isclose(forecasts[1, h - 1], forecaster.fit(y[:100]).predict())
+
+
+def test_batched_ets_n_jobs():
+    """Test n_jobs greater than the numba thread limit is clamped."""
+    y = np.asarray(load_airline(), dtype=np.float64)
+
+    forecasts, _, _ = batched_ets(y[None, :], horizon=3)
+    forecasts_n_jobs, _, _ = batched_ets(
+        y[None, :], horizon=3, n_jobs=config.NUMBA_NUM_THREADS + 1
+    )
+    assert np.allclose(forecasts, forecasts_n_jobs)
+
+
+def test_batched_ets_forecaster():
+    """Test the forecaster selects the configuration with the lowest AIC."""
+    y = np.asarray(load_airline(), dtype=np.float64)
+    forecaster = BatchedETSForecaster(seasonal_period=12, horizon=12)
+    forecaster.fit(y)
+
+    forecasts, best, aic = batched_ets(y[None, :], horizon=12, seasonal_period=12)
+    assert np.array_equal(forecaster.aic_, aic[0])
+    assert np.array_equal(
+        forecaster.best_configuration_, forecaster.configurations_[best[0]]
+    )
+    assert np.allclose(forecaster.predict(), forecasts[0])
+
+
+def test_batched_ets_forecaster_update():
+    """Test updating the forecaster states matches fitting on the longer series."""
+    y = np.asarray(load_airline(), dtype=np.float64)
+    configurations = ets_configurations(
+        error_types=(2,), trend_types=(1,), seasonality_types=(2,)
+    )
+
+    updated = BatchedETSForecaster(configurations=configurations, seasonal_period=12)
+    updated.fit(y[:100])
+    for i in range(100, len(y), 5):
+        updated.update(y[i : i + 5])
+
+    refit = BatchedETSForecaster(configurations=configurations, seasonal_period=12)
+    refit.fit(y)
+    assert np.allclose(updated.predict(), refit.predict())
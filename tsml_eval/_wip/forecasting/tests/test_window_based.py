@@ -0,0 +1,106 @@
+"""Test the window based forecaster."""
+
+import os
+
+import numpy as np
+from aeon.datasets import load_airline
+from aeon.forecasting import RegressionForecaster
+from sklearn.linear_model import SGDRegressor
+
+from tsml_eval._wip.forecasting.window_base import (
+    BaseWindowForecaster,
+    _window_chunks,
+    _windows,
+)
+from tsml_eval.evaluation.storage import load_forecaster_results
+from tsml_eval.experiments.experiments import run_forecasting_experiment
+from tsml_eval.experiments.tests import _FORECASTER_RESULTS_PATH
+
+
+def test_window_forecaster():
+    """Test the window forecaster matches the aeon RegressionForecaster."""
+    y = np.asarray(load_airline(), dtype=np.float64)
+
+    forecaster = BaseWindowForecaster(window=10, horizon=2).fit(y[:100])
+    aeon_forecaster = RegressionForecaster(window=10, horizon=2).fit(y[:100])
+    assert np.allclose(forecaster.predict(), aeon_forecaster.predict())
+
+    forecaster.update(y[100:120])
+    assert np.allclose(forecaster.predict(), forecaster.predict(y[:120]))
+
+
+def test_window_chunks():
+    """Test chunks contain every window of every series in order."""
+    rng = np.random.default_rng(0)
+    series = [rng.random(n) for n in (30, 7, 55)]
+
+    chunks = list(_window_chunks(series, 5, 2, 16))
+    assert all(len(X) == 16 for X, _ in chunks[:-1])
+
+    windows = [_windows(s, 5, 2) for s in series]
+    assert np.array_equal(
+        np.concatenate([X for X, _ in chunks]),
+        np.concatenate([X for X, _ in windows]),
+    )
+    assert np.array_equal(
+        np.concatenate([y for _, y in chunks]),
+        np.concatenate([y for _, y in windows]),
+    )
+
+
+def test_window_forecaster_global_chunked():
+    """Test a global model fit in chunks with partial_fit."""
+    rng = np.random.default_rng(0)
+    series = [np.cumsum(rng.normal(size=n)) for n in (300, 150, 250)]
+
+    forecaster = BaseWindowForecaster(
+        window=5,
+        regressor=SGDRegressor(shuffle=False, random_state=0),
+        chunk_size=64,
+    )
+    forecaster.fit(series)
+    assert forecaster.predict().shape == (3,)
+
+    # the same regressor trained with a single partial_fit on all windows
+    windows = [_windows(s, 5, 1) for s in series]
+    X = np.concatenate([X for X, _ in windows])
+    y = np.concatenate([y for _, y in windows])
+    regressor = SGDRegressor(shuffle=False, random_state=0).partial_fit(X, y)
+
+    assert np.allclose(forecaster.regressor_.coef_, regressor.coef_)
+    assert np.allclose(forecaster.regressor_.intercept_, regressor.intercept_)
+    assert np.allclose(
+        forecaster.predict(),
+        regressor.predict(np.stack([s[-5:] for s in series])),
+    )
+
+
+def test_window_forecaster_rolling_origin_experiment():
+    """Test the window forecaster in a rolling origin forecasting experiment."""
+    y = np.asarray(load_airline(), dtype=np.float64)
+
+    run_forecasting_experiment(
+        y[:100],
+        y[100:],
+        BaseWindowForecaster(window=10),
+        _FORECASTER_RESULTS_PATH,
+        dataset_name="Airline",
+        benchmark_time=False,
+        rolling_origin=True,
+    )
+
+    test_file = (
+        f"{_FORECASTER_RESULTS_PATH}BaseWindowForecaster/Predictions/Airline/"
+        "testResults.csv"
+    )
+    results = load_forecaster_results(test_file, verify_values=False)
+
+    # updating the window gives the same predictions as predicting from each origin
+    forecaster = BaseWindowForecaster(window=10).fit(y[:100])
+    expected = np.concatenate(
+        [forecaster.predict(y[: 100 + i]) for i in range(len(y) - 100)]
+    )
+    assert np.allclose(results.predictions, expected)
+    assert len(results.pred_times) == len(y) - 100
+
+    os.remove(test_file)
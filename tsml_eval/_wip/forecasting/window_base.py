@@ -1,49 +1,222 @@
+"""Window based forecasting through regression."""
+
 import numpy as np
-from tsml_eval._wip.forecasting.base import BaseForecaster
-from abc import ABC, abstractmethod
-from typing import final
+from aeon.forecasting import BaseForecaster
+from sklearn.base import clone
 from sklearn.linear_model import LinearRegression
+
+
 class BaseWindowForecaster(BaseForecaster):
-    def __init__(self, window, horizon=1, regressor=LinearRegression()):
+    """Forecaster reducing forecasting to regression through a sliding window.
+
+    Forms a collection of sub series of length ``window`` from the series, takes the
+    value ``horizon`` points after each sub series as the target and trains a
+    regressor on the pairs.
+
+    The windows are strided views of the series, so the (n_timepoints, window)
+    design matrix is never copied by the forecaster. If ``chunk_size`` is set and the
+    regressor has a ``partial_fit`` method, the regressor is trained on at most
+    ``chunk_size`` windows at a time, so only a chunk is ever copied by the
+    regressor. Otherwise, the view of a single series is passed to the regressor
+    in one call and multiple series are stacked into a single design matrix.
+
+    The aeon ``BaseForecaster`` only accepts a single series, so ``fit`` and
+    ``predict`` are overridden to also accept multiple series for a global model.
+
+    Parameters
+    ----------
+    window : int
+        The number of points prior to the current time point used in forecasting.
+    horizon : int, default=1
+        The number of time steps ahead to forecast.
+    regressor : object or None, default=None
+        An sklearn compatible regressor. If None, LinearRegression is used.
+    chunk_size : int or None, default=None
+        The maximum number of windows passed to the regressor ``partial_fit`` in one
+        call. If None, or the regressor has no ``partial_fit`` method, ``fit`` is
+        called once on all windows.
+    """
+
+    def __init__(self, window, horizon=1, regressor=None, chunk_size=None):
+        self.window = window
         self.regressor = regressor
-        super().__init__(horizon, window)
+        self.chunk_size = chunk_size
+        super().__init__(horizon=horizon, axis=1)
 
-    def fit(self, y, X=None):
-        """Fit forecaster to time series.
+    def fit(self, y, exog=None):
+        """Fit forecaster to one or more time series.
 
-        Split X into windows of length window and train the forecaster on each window
-        to predict the horizon ahead.
+        Split each series into windows of length window and train the regressor on
+        each window to predict the horizon ahead. Windows from multiple series train
+        a single global model.
 
         Parameters
         ----------
-        X : Time series on which to learn a forecaster
+        y : np.ndarray or list of np.ndarray
+            A 1D time series, a 2D array of shape (n_series, n_timepoints) or a list
+            of 1D time series to learn a forecaster from.
+        exog : np.ndarray, default=None
+            Not used.
 
         Returns
         -------
         self
             Fitted estimator
         """
-        # Window data
-        y2=np.lib.stride_tricks.sliding_window_view(y, window_shape=self.window)
-        # Ignore the final horizon values: need to store these for pred with empty y
-        y2=y2[:-self.horizon]
-        # Extract y
-        y=X[self.window+self.horizon-1:]
-        self.regressor.fit(X2,y)
+        if exog is not None:
+            raise NotImplementedError("Exogenous variables not yet supported")
+
+        self._fit(y)
+        self.is_fitted = True
+        return self
+
+    def _fit(self, y, exog=None):
+        self.regressor_ = (
+            LinearRegression() if self.regressor is None else clone(self.regressor)
+        )
+
+        series = self._to_series_list(y)
+        if any(len(s) < self.window + self.horizon for s in series):
+            raise ValueError(
+                "All series must have at least window + horizon time points."
+            )
+
+        if self.chunk_size is not None and hasattr(self.regressor_, "partial_fit"):
+            for X_chunk, y_chunk in _window_chunks(
+                series, self.window, self.horizon, self.chunk_size
+            ):
+                self.regressor_.partial_fit(X_chunk, y_chunk)
+        elif len(series) == 1:
+            self.regressor_.fit(*_windows(series[0], self.window, self.horizon))
+        else:
+            windows = [_windows(s, self.window, self.horizon) for s in series]
+            self.regressor_.fit(
+                np.concatenate([w[0] for w in windows]),
+                np.concatenate([w[1] for w in windows]),
+            )
+
+        # the final window of each series, used to predict when no series is given
+        self.last_ = np.stack([s[-self.window :] for s in series])
+        return self
+
+    def update(self, y):
+        """Slide the final window of a single fitted series along new values.
+
+        Parameters
+        ----------
+        y : np.ndarray
+            The values following the last value seen in ``fit`` or ``update``.
+
+        Returns
+        -------
+        self
+            Updated estimator
+        """
+        self._check_is_fitted()
+        if len(self.last_) != 1:
+            raise ValueError("update is only available for a single fitted series.")
+
+        y = np.asarray(y, dtype=np.float64).ravel()
+        self.last_ = np.concatenate((self.last_[0], y))[None, -self.window :]
         return self
 
-    def predict(self, y=None, X=None):
-        """Predict values for time series X.
+    def predict(self, y=None, exog=None):
+        """Predict the value horizon steps after the end of each series.
+
+        Parameters
+        ----------
+        y : np.ndarray, list of np.ndarray or None, default=None
+            The series to predict the value horizon steps ahead of, in any format
+            accepted by ``fit``. If None, predict for the series seen in ``fit``,
+            moved on by ``update``.
+        exog : np.ndarray, default=None
+            Not used.
 
-        NOTE: will not be able to predict the first
+        Returns
+        -------
+        np.ndarray
+            The prediction for each series.
         """
-        # TODO deal with case y =None
-        return self.regressor.predict(y[-self.window:])
+        self._check_is_fitted()
+        if exog is not None:
+            raise NotImplementedError("Exogenous variables not yet supported")
 
-    def forecast(self, y, X=None):
-        """Forecast values for time series X.
+        return self._predict(y)
 
-        NOTE: deal with horizons
+    def _predict(self, y=None, exog=None):
+        if y is None:
+            last = self.last_
+        else:
+            last = np.stack([s[-self.window :] for s in self._to_series_list(y)])
+        return self.regressor_.predict(last)
+
+    def forecast(self, y, exog=None):
+        """Fit the forecaster to y and predict the value horizon steps after it.
+
+        Parameters
+        ----------
+        y : np.ndarray or list of np.ndarray
+            The series to fit and predict, in any format accepted by ``fit``.
+        exog : np.ndarray, default=None
+            Not used.
+
+        Returns
+        -------
+        np.ndarray
+            The prediction for each series.
         """
-        self.fit(y,X)
-        return self.predict(y[:self.window])
+        self.fit(y, exog)
+        return self.predict()
+
+    @staticmethod
+    def _to_series_list(y):
+        if isinstance(y, list):
+            return [np.asarray(s, dtype=np.float64).ravel() for s in y]
+
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim == 1:
+            return [y]
+        elif y.ndim == 2:
+            return list(y)
+        else:
+            raise ValueError(
+                "y must be a 1D series, a 2D array of series or a list of 1D series."
+            )
+
+
+def _windows(series, window, horizon):
+    """Return a strided view of the windows of a series and their targets."""
+    X = np.lib.stride_tricks.sliding_window_view(series, window_shape=window)
+    # the final horizon windows have no target
+    return X[:-horizon], series[window + horizon - 1 :]
+
+
+def _window_chunks(series, window, horizon, chunk_size):
+    """Yield the windows and targets of all series in chunks of chunk_size windows.
+
+    A chunk within a single series is a view of the series, only chunks spanning
+    multiple series are copied.
+    """
+    X_parts, y_parts, size = [], [], 0
+    for s in series:
+        X, y = _windows(s, window, horizon)
+        start = 0
+        while start < len(X):
+            end = min(len(X), start + chunk_size - size)
+            X_parts.append(X[start:end])
+            y_parts.append(y[start:end])
+            size += end - start
+            start = end
+
+            if size == chunk_size:
+                yield _join_chunk(X_parts, y_parts)
+                X_parts, y_parts, size = [], [], 0
+
+    if size > 0:
+        yield _join_chunk(X_parts, y_parts)
+
+
+def _join_chunk(X_parts, y_parts):
+    if len(X_parts) == 1:
+        return X_parts[0], y_parts[0]
+    return np.concatenate(X_parts), np.concatenate(y_parts)
@@ -16,6 +16,7 @@ from aeon.transformations.base import BaseTransformer
 from joblib import Parallel, delayed
 from numba import NumbaTypeSafetyWarning, njit, types
 from numba.typed import Dict
+from scipy.sparse import csr_matrix
 from sklearn.feature_selection import f_classif
 from sklearn.preprocessing import KBinsDiscretizer
 from sklearn.tree import DecisionTreeRegressor
@@ -84,6 +85,12 @@ class SFA(BaseTransformer):
         setting to true reduces speed significantly but is required for
         automatic test.
 
+    return_sparse:       boolean, default = False
+        whether to return the bags as a scipy sparse matrix of word counts instead
+        of a list of dictionaries. The columns are the words found in the data
+        passed to fit, other words are dropped. Requires words, including bigrams
+        and pyramid levels, of less than 64 bits.
+
     n_jobs:              int, optional, default = 1
         The number of jobs to run in parallel for both `transform`.
         ``-1`` means using all processors.
@@ -92,6 +99,7 @@ class SFA(BaseTransformer):
     ----------
     words: []
     breakpoints: = []
+    vocabulary_: np.ndarray, the words of each column if return_sparse is True
     num_insts = 0
     num_atts = 0
 
@@ -130,6 +138,7 @@ class SFA(BaseTransformer):
         save_words=False,
         keep_binning_dft=False,
         return_pandas_data_series=False,
+        return_sparse=False,
         use_fallback_dft=False,
         typed_dict=False,
         n_jobs=1,
@@ -169,6 +178,7 @@ class SFA(BaseTransformer):
         self.skip_grams = skip_grams
 
         self.return_pandas_data_series = return_pandas_data_series
+        self.return_sparse = return_sparse
         self.use_fallback_dft = use_fallback_dft
         self._use_fallback_dft = (
             use_fallback_dft if word_length < window_size - offset else True
@@ -248,9 +258,22 @@ class SFA(BaseTransformer):
             self.level_bits = math.ceil(math.log2(quadrants))
             self.level_max = pow(2, self.level_bits) - 1
 
+        if self.return_sparse and self.max_bits + self.level_bits > 63:
+            raise ValueError(
+                "Sparse bags can only handle words of less than 64 bits. "
+                "ceil(log2(alphabet_size)) * word_length plus the pyramid level bits "
+                "must be less than 64. "
+                "With bi-grams or skip-grams enabled, the word length is doubled."
+            )
+
         self.n_instances, self.series_length = X.shape
         self.breakpoints = self._binning(X, y)
 
+        if self.return_sparse:
+            dfts = self.binning_dft if self.keep_binning_dft else self._mft(X)
+            _, keys, _, _ = self._bag_entries(self._create_words(dfts))
+            self.vocabulary_ = np.unique(keys)
+
         self._is_fitted = True
         return self
 
@@ -264,18 +287,25 @@ class SFA(BaseTransformer):
 
         Returns
         -------
-        List of dictionaries containing SFA words
+        List of dictionaries containing SFA words, or a sparse matrix of word counts
+        if return_sparse is True
         """
         X = X.squeeze(1)
 
+        dfts = self.binning_dft if self.keep_binning_dft else self._mft(X)
+
+        # words which fit in 64 bits are created and counted for all cases at once
+        if self.max_bits + self.level_bits <= 63:
+            words = self._create_words(dfts)
+            if self.save_words:
+                self.words = list(words)
+
+            return self._create_bags(words, sparse=self.return_sparse)
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NumbaTypeSafetyWarning)
             transform = Parallel(n_jobs=self.n_jobs, prefer="threads")(
-                delayed(self._transform_case)(
-                    X[i, :],
-                    supplied_dft=self.binning_dft[i] if self.keep_binning_dft else None,
-                )
-                for i in range(X.shape[0])
+                delayed(self._transform_case)(dfts[i]) for i in range(X.shape[0])
             )
 
         dim, words = zip(*transform)
@@ -303,12 +333,166 @@ class SFA(BaseTransformer):
 
         return bags
 
-    def _transform_case(self, X, supplied_dft=None):
-        if supplied_dft is None:
-            dfts = self._mft(X)
+    def _create_words(self, dfts):
+        # the letter of each window is the first breakpoint the coefficient is less
+        # than or equal to, letters are packed into the word from the first
+        words = np.zeros(dfts.shape[:2], dtype=np.uint64)
+        for i in range(self.word_length):
+            letters = np.argmax(
+                dfts[:, :, i, None] <= self.breakpoints[i][None, None, :], axis=2
+            )
+            words <<= np.uint64(self.letter_bits)
+            words |= letters.astype(np.uint64)
+        return words
+
+    def _bag_entries(self, words, split_levels=False):
+        # find the bag key and count of every word, bigram and skip-gram of each case.
+        # pyramid level keys are the word shifted left with the quadrant in the lower
+        # bits, or a separate quadrant array if split_levels is True (-1 for grams)
+        n_cases, n_windows = words.shape
+        windows = np.arange(n_windows)
+        level_bits = np.uint64(self.level_bits)
+
+        keep = np.ones(words.shape, dtype=bool)
+        if self.remove_repeat_words:
+            keep[:, 1:] = words[:, 1:] != words[:, :-1]
+        cases = np.broadcast_to(np.arange(n_cases)[:, None], words.shape)
+
+        if self.levels > 1:
+            # the window index used for the quadrant is moved back by half the
+            # repeated words removed directly before it
+            last_kept = np.maximum.accumulate(np.where(keep, windows, -1), axis=1)
+            previous = np.full(words.shape, -1)
+            previous[:, 1:] = last_kept[:, :-1]
+            window_ind = (windows - (windows - previous - 1) // 2)[keep]
+
+            case_entries, key_entries, quadrant_entries, count_entries = [], [], [], []
+            start = 0
+            for level in range(self.levels):
+                num_quadrants = pow(2, level)
+                quadrants = start + (window_ind + int(self.window_size / 2)) // int(
+                    self.series_length / num_quadrants
+                )
+
+                case_entries.append(cases[keep])
+                key_entries.append(
+                    words[keep]
+                    if split_levels
+                    else (words[keep] << level_bits) | quadrants.astype(np.uint64)
+                )
+                quadrant_entries.append(quadrants)
+                count_entries.append(np.full(len(quadrants), num_quadrants))
+                start += num_quadrants
         else:
-            dfts = supplied_dft
+            case_entries = [cases[keep]]
+            key_entries = [words[keep]]
+            quadrant_entries = [np.full(len(key_entries[0]), -1)]
+            count_entries = [np.ones(len(key_entries[0]), dtype=np.int64)]
+
+        gaps = []
+        if self.bigrams:
+            gaps.append(self.window_size)
+        if self.skip_grams:
+            # creates skip-grams, skipping every (s-1)-th word in-between
+            gaps.extend(s * self.window_size for s in range(2, 4))
+
+        for gap in gaps:
+            if gap >= n_windows:
+                continue
+
+            grams = (words[:, :-gap] << np.uint64(self.word_bits)) | words[:, gap:]
+            if self.levels > 1 and not split_levels:
+                grams <<= level_bits
+
+            case_entries.append(cases[:, gap:].ravel())
+            key_entries.append(grams.ravel())
+            quadrant_entries.append(np.full(grams.size, -1))
+            count_entries.append(np.ones(grams.size, dtype=np.int64))
+
+        return (
+            np.concatenate(case_entries),
+            np.concatenate(key_entries).astype(np.int64),
+            np.concatenate(quadrant_entries) if split_levels else None,
+            np.concatenate(count_entries),
+        )
+
+    def _create_bags(self, words, sparse=False):
+        n_cases = words.shape[0]
+
+        if sparse:
+            cases, keys, _, counts = self._bag_entries(words)
+
+            # words not in the fit vocabulary are dropped
+            columns = np.searchsorted(self.vocabulary_, keys)
+            found = columns < len(self.vocabulary_)
+            found[found] = self.vocabulary_[columns[found]] == keys[found]
+
+            return csr_matrix(
+                (counts[found], (cases[found], columns[found])),
+                shape=(n_cases, len(self.vocabulary_)),
+                dtype=np.uint32,
+            )
 
+        split_levels = self.typed_dict and self.levels > 1
+        cases, keys, quadrants, counts = self._bag_entries(words, split_levels)
+
+        # sum the counts of each unique key for each case
+        order = (
+            np.lexsort((quadrants, keys, cases))
+            if split_levels
+            else np.lexsort((keys, cases))
+        )
+        cases, keys, counts = cases[order], keys[order], counts[order]
+        new_entry = np.ones(len(keys), dtype=bool)
+        new_entry[1:] = (cases[1:] != cases[:-1]) | (keys[1:] != keys[:-1])
+        if split_levels:
+            quadrants = quadrants[order]
+            new_entry[1:] |= quadrants[1:] != quadrants[:-1]
+            quadrants = quadrants[new_entry]
+
+        starts = np.flatnonzero(new_entry)
+        counts = np.add.reduceat(counts, starts) if len(starts) > 0 else counts
+        cases, keys = cases[starts], keys[starts]
+        bounds = np.searchsorted(cases, np.arange(n_cases + 1))
+
+        dim = []
+        for i in range(n_cases):
+            case_keys = keys[bounds[i] : bounds[i + 1]]
+            case_counts = counts[bounds[i] : bounds[i + 1]]
+
+            if split_levels:
+                bag = Dict.empty(
+                    key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
+                )
+                SFA._fill_typed_pyramid_bag(
+                    bag, case_keys, quadrants[bounds[i] : bounds[i + 1]], case_counts
+                )
+            elif self.typed_dict:
+                bag = Dict.empty(key_type=types.int64, value_type=types.uint32)
+                SFA._fill_typed_bag(bag, case_keys, case_counts)
+            else:
+                bag = dict(zip(case_keys.tolist(), case_counts.tolist()))
+
+            dim.append(pd.Series(bag) if self.return_pandas_data_series else bag)
+
+        bags = pd.DataFrame() if self.return_pandas_data_series else [None]
+        bags[0] = dim
+
+        return bags
+
+    @staticmethod
+    @njit(cache=True)
+    def _fill_typed_bag(bag, keys, counts):
+        for i in range(len(keys)):
+            bag[keys[i]] = np.uint32(counts[i])
+
+    @staticmethod
+    @njit(cache=True)
+    def _fill_typed_pyramid_bag(bag, keys, quadrants, counts):
+        for i in range(len(keys)):
+            bag[(keys[i], quadrants[i])] = np.uint32(counts[i])
+
+    def _transform_case(self, dfts):
         if self.typed_dict:
             bag = (
                 Dict.empty(
@@ -624,40 +808,47 @@ class SFA(BaseTransformer):
 
         return dft
 
-    def _mft(self, series):
+    def _mft(self, X):
+        # sliding window dft coefficients of all cases, shape (n_cases, n_windows,
+        # n_coefficients)
         start_offset = 2 if self.norm else 0
         length = self.dft_length + start_offset + self.dft_length % 2
-        end = max(1, len(series) - self.window_size + 1)
+        end = max(1, X.shape[1] - self.window_size + 1)
 
         phis = SFA._get_phis(self.window_size, length)
-        stds = SFA._calc_incremental_mean_std(series, end, self.window_size)
-        transformed = np.zeros((end, length))
+        stds = SFA._calc_incremental_mean_std(X, end, self.window_size)
+        transformed = np.zeros((X.shape[0], end, length))
 
         # first run with dft
         if self._use_fallback_dft:
-            mft_data = self._discrete_fourier_transform(
-                series[0 : self.window_size],
-                self.dft_length,
-                self.norm,
-                self.inverse_sqrt_win_size,
-                self.lower_bounding,
-                apply_normalising_factor=False,
-                cut_start_if_norm=False,
+            mft_data = np.array(
+                [
+                    self._discrete_fourier_transform(
+                        X[i, 0 : self.window_size],
+                        self.dft_length,
+                        self.norm,
+                        self.inverse_sqrt_win_size,
+                        self.lower_bounding,
+                        apply_normalising_factor=False,
+                        cut_start_if_norm=False,
+                    )
+                    for i in range(X.shape[0])
+                ]
             )
         else:
-            X_fft = np.fft.rfft(series[: self.window_size])
+            X_fft = np.fft.rfft(X[:, : self.window_size], axis=1)
             reals = np.real(X_fft)
             imags = np.imag(X_fft)
-            mft_data = np.empty((length,), dtype=reals.dtype)
-            mft_data[0::2] = reals[: np.uint32(length / 2)]
-            mft_data[1::2] = imags[: np.uint32(length / 2)]
+            mft_data = np.empty((X.shape[0], length), dtype=reals.dtype)
+            mft_data[:, 0::2] = reals[:, : np.uint32(length / 2)]
+            mft_data[:, 1::2] = imags[:, : np.uint32(length / 2)]
 
-        transformed[0] = mft_data * self.inverse_sqrt_win_size / stds[0]
+        transformed[:, 0] = mft_data * self.inverse_sqrt_win_size / stds[:, :1]
 
         # other runs using mft
         # moved to external method to use njit
         SFA._iterate_mft(
-            series,
+            np.ascontiguousarray(X, dtype=np.float64),
             mft_data,
             phis,
             self.window_size,
@@ -667,12 +858,12 @@ class SFA(BaseTransformer):
         )
 
         if self.lower_bounding:
-            transformed[:, 1::2] = transformed[:, 1::2] * -1  # lower bounding
+            transformed[:, :, 1::2] = transformed[:, :, 1::2] * -1  # lower bounding
 
         return (
-            transformed[:, start_offset:][:, self.support]
+            transformed[:, :, start_offset:][:, :, self.support]
             if self.anova
-            else transformed[:, start_offset:]
+            else transformed[:, :, start_offset:]
         )
 
     @staticmethod
@@ -687,18 +878,20 @@ class SFA(BaseTransformer):
     @staticmethod
     @njit(fastmath=True, cache=True)
     def _iterate_mft(
-        series, mft_data, phis, window_size, stds, transformed, inverse_sqrt_win_size
+        X, mft_data, phis, window_size, stds, transformed, inverse_sqrt_win_size
     ):
-        for i in range(1, len(transformed)):
-            for n in range(0, len(mft_data), 2):
-                # only compute needed indices
-                real = mft_data[n] + series[i + window_size - 1] - series[i - 1]
-                imag = mft_data[n + 1]
-                mft_data[n] = real * phis[n] - imag * phis[n + 1]
-                mft_data[n + 1] = real * phis[n + 1] + phis[n] * imag
-
-            normalising_factor = inverse_sqrt_win_size / stds[i]
-            transformed[i] = mft_data * normalising_factor
+        for a in range(X.shape[0]):
+            series = X[a]
+            for i in range(1, transformed.shape[1]):
+                for n in range(0, mft_data.shape[1], 2):
+                    # only compute needed indices
+                    real = mft_data[a, n] + series[i + window_size - 1] - series[i - 1]
+                    imag = mft_data[a, n + 1]
+                    mft_data[a, n] = real * phis[n] - imag * phis[n + 1]
+                    mft_data[a, n + 1] = real * phis[n + 1] + phis[n] * imag
+
+                normalising_factor = inverse_sqrt_win_size / stds[a, i]
+                transformed[a, i] = mft_data[a] * normalising_factor
 
     def _shorten_bags(self, word_len):
         if self.save_words is False:
@@ -709,6 +902,12 @@ class SFA(BaseTransformer):
         if word_len > self.word_length:
             word_len = self.word_length
 
+        if self.max_bits + self.level_bits <= 63:
+            words = np.array(self.words, dtype=np.uint64) >> np.uint64(
+                (self.word_length - word_len) * self.letter_bits
+            )
+            return self._create_bags(words, sparse=False)
+
         if self.typed_dict:
             warnings.simplefilter("ignore", category=NumbaTypeSafetyWarning)
 
@@ -909,26 +1108,29 @@ class SFA(BaseTransformer):
 
     @staticmethod
     @njit(fastmath=True, cache=True)
-    def _calc_incremental_mean_std(series, end, window_size):
-        stds = np.zeros(end)
-        window = series[0:window_size]
-        series_sum = np.sum(window)
-        square_sum = np.sum(np.multiply(window, window))
-
+    def _calc_incremental_mean_std(X, end, window_size):
+        stds = np.zeros((X.shape[0], end))
         r_window_length = 1 / window_size
-        mean = series_sum * r_window_length
-        buf = math.sqrt(square_sum * r_window_length - mean * mean)
-        stds[0] = buf if buf > 1e-8 else 1
 
-        for w in range(1, end):
-            series_sum += series[w + window_size - 1] - series[w - 1]
+        for a in range(X.shape[0]):
+            series = X[a]
+            window = series[0:window_size]
+            series_sum = np.sum(window)
+            square_sum = np.sum(np.multiply(window, window))
+
             mean = series_sum * r_window_length
-            square_sum += (
-                series[w + window_size - 1] * series[w + window_size - 1]
-                - series[w - 1] * series[w - 1]
-            )
             buf = math.sqrt(square_sum * r_window_length - mean * mean)
-            stds[w] = buf if buf > 1e-8 else 1
+            stds[a, 0] = buf if buf > 1e-8 else 1
+
+            for w in range(1, end):
+                series_sum += series[w + window_size - 1] - series[w - 1]
+                mean = series_sum * r_window_length
+                square_sum += (
+                    series[w + window_size - 1] * series[w + window_size - 1]
+                    - series[w - 1] * series[w - 1]
+                )
+                buf = math.sqrt(square_sum * r_window_length - mean * mean)
+                stds[a, w] = buf if buf > 1e-8 else 1
 
         return stds
 
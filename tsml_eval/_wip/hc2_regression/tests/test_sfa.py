@@ -0,0 +1,88 @@
+"""Tests for the batched SFA transform."""
+
+import numpy as np
+import pytest
+from aeon.testing.data_generation import make_example_3d_numpy
+
+from tsml_eval._wip.hc2_regression.sfa import SFA
+
+_PARAMS = [
+    {},
+    {"levels": 2, "remove_repeat_words": True},
+    {"bigrams": True, "skip_grams": True, "norm": True},
+    {"levels": 3, "bigrams": True, "remove_repeat_words": True},
+    {"window_size": 6, "word_length": 6, "alphabet_size": 2},
+]
+
+
+def _reference_bags(sfa, X):
+    # the bag of each case found with the per window loop on a single series
+    return [
+        dict(sfa._transform_case(sfa._mft(X[i : i + 1, 0])[0])[0])
+        for i in range(len(X))
+    ]
+
+
+@pytest.mark.parametrize("params", _PARAMS)
+def test_sfa_mft(params):
+    """Test the batched MFT matches the DFT of each window."""
+    X = make_example_3d_numpy(n_cases=4, n_timepoints=40, random_state=0)[0]
+    sfa = SFA(**params).fit(X)
+    dfts = sfa._mft(X[:, 0])
+
+    window_size = sfa.window_size
+    for i in range(len(X)):
+        for j in range(dfts.shape[1]):
+            window = X[i, 0, j : j + window_size]
+            expected = (
+                sfa._discrete_fourier_transform(
+                    window,
+                    sfa.dft_length,
+                    sfa.norm,
+                    sfa.inverse_sqrt_win_size,
+                    sfa.lower_bounding,
+                )
+                if sfa._use_fallback_dft
+                else sfa._fast_fourier_transform(window)
+            )
+            assert np.allclose(dfts[i, j], expected[: dfts.shape[2]])
+
+
+@pytest.mark.parametrize("params", _PARAMS)
+@pytest.mark.parametrize("typed_dict", [False, True])
+def test_sfa_bags(params, typed_dict):
+    """Test the batched bags match the bags of each series."""
+    X = make_example_3d_numpy(n_cases=8, n_timepoints=60, random_state=0)[0]
+    sfa = SFA(typed_dict=typed_dict, **params).fit(X)
+
+    bags = sfa.transform(X)[0]
+    assert [dict(bag) for bag in bags] == _reference_bags(sfa, X)
+
+
+@pytest.mark.parametrize("params", _PARAMS)
+def test_sfa_sparse_bags(params):
+    """Test sparse bags contain the counts of the words seen in fit."""
+    X, X_new = np.split(
+        make_example_3d_numpy(n_cases=12, n_timepoints=60, random_state=0)[0], [8]
+    )
+    sfa = SFA(**params).fit(X)
+    sparse_sfa = SFA(return_sparse=True, **params).fit(X)
+
+    for data in (X, X_new):
+        bags = sparse_sfa.transform(data)
+        assert bags.shape == (len(data), len(sparse_sfa.vocabulary_))
+
+        for row, bag in zip(bags, _reference_bags(sfa, data)):
+            assert {
+                sparse_sfa.vocabulary_[column]: count
+                for column, count in zip(row.indices, row.data)
+            } == {
+                word: count
+                for word, count in bag.items()
+                if word in sparse_sfa.vocabulary_
+            }
+
+    # every word of the fit data is in the vocabulary
+    assert sparse_sfa.transform(X).sum() == sum(
+        sum(bag.values()) for bag in _reference_bags(sfa, X)
+    )
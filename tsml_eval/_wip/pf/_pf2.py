@@ -1,21 +1,18 @@
 """Proximity Forest 2.0 Classifier."""
 
+from multiprocessing.shared_memory import SharedMemory
 from typing import Any, Callable, Optional, TypedDict, Union
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit
-from numba.typed import List as NumbaList
+from numba import config, get_num_threads, njit, prange, set_num_threads
 from sklearn.utils import check_random_state
 from typing_extensions import Unpack
 
 from aeon.classification.base import BaseClassifier
 from aeon.distances.elastic._bounding_matrix import create_bounding_matrix
 from aeon.distances.elastic._lcss import lcss_distance
-from aeon.distances.pointwise._minkowski import (
-    _univariate_minkowski_distance,
-    minkowski_distance,
-)
+from aeon.distances.pointwise._minkowski import minkowski_distance
 
 
 class ProximityForest2(BaseClassifier):
@@ -44,16 +41,28 @@ class ProximityForest2(BaseClassifier):
         If `None`, the random number generator is the `RandomState` instance used
         by `np.random`.
     n_jobs : int, default = 1
-        The number of parallel jobs to run for neighbors search.
+        The number of parallel jobs to run for both `fit` and `predict`.
         ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
-        for more details. Parameter for compatibility purposes, still unimplemented.
+        for more details.
     parallel_backend : str, ParallelBackendBase instance or None, default=None
         Specify the parallelisation backend implementation in joblib, if None a 'prefer'
         value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
 
+        With the process based "loky" and "multiprocessing" backends, the training
+        data is placed once in shared memory which the workers attach to without
+        copying, and trees are returned without their node objects, only keeping
+        the array form used for prediction.
+
+    Attributes
+    ----------
+    pruning_stats_ : dict
+        The number of exemplar distance comparisons made in the split search of all
+        trees, and how many of them were pruned by LB_Kim, pruned by LB_Keogh or
+        early abandoned.
+
     Notes
     -----
     For the C++ version, see
@@ -111,35 +120,64 @@ class ProximityForest2(BaseClassifier):
     def _fit(self, X, y):
         rng = check_random_state(self.random_state)
         seeds = rng.randint(np.iinfo(np.int32).max, size=self.n_trees)
-        self.trees_ = Parallel(
-            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-        )(
-            delayed(_fit_tree)(
-                X,
-                y,
-                self.n_splitters,
-                self.max_depth,
-                self.min_samples_split,
-                check_random_state(seed),
+        cache = _FitCache(X, rng)
+        if self._n_jobs > 1 and self.parallel_backend in ("loky", "multiprocessing"):
+            self.trees_ = self._fit_trees_shared_memory(y, seeds, cache)
+        else:
+            self.trees_ = Parallel(
+                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+            )(
+                delayed(_fit_tree)(
+                    X,
+                    y,
+                    self.n_splitters,
+                    self.max_depth,
+                    self.min_samples_split,
+                    check_random_state(seed),
+                    cache,
+                )
+                for seed in seeds
             )
-            for seed in seeds
+        self.pruning_stats_ = {
+            stat: sum(tree.pruning_stats_[stat] for tree in self.trees_)
+            for stat in self.trees_[0].pruning_stats_
+        }
+        self._tree_arrays = _concatenate_tree_arrays(
+            [tree._tree_arrays for tree in self.trees_]
         )
 
-    def _predict_proba(self, X):
-        classes = list(self.classes_)
-        preds = Parallel(
-            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-        )(delayed(_predict_tree)(tree, X) for tree in self.trees_)
-        n_cases = X.shape[0]
-        votes = np.zeros((n_cases, self.n_classes_))
-        for i in range(len(preds)):
-            predictions = np.array(
-                [classes.index(class_label) for class_label in preds[i]]
+    def _fit_trees_shared_memory(self, y, seeds, cache):
+        # the series and derivatives are stacked in one shared block
+        shape = (2,) + cache.X.shape
+        shm = SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            block[0] = cache.X
+            block[1] = cache.X_deriv
+            del block
+
+            return Parallel(n_jobs=self._n_jobs, backend=self.parallel_backend)(
+                delayed(_fit_tree_shared_memory)(
+                    shm.name,
+                    shape,
+                    cache.case_sum,
+                    cache.case_sum_sq,
+                    cache.warp_penalty,
+                    y,
+                    self.n_splitters,
+                    self.max_depth,
+                    self.min_samples_split,
+                    check_random_state(seed),
+                )
+                for seed in seeds
             )
-            for j in range(n_cases):
-                votes[j, predictions[j]] += 1
-        output_probas = votes / self.n_trees
-        return output_probas
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _predict_proba(self, X):
+        votes = _route_cases(X, self._tree_arrays, vote=True, n_jobs=self._n_jobs)
+        return votes / self.n_trees
 
     def _predict(self, X):
         probas = self._predict_proba(X)
@@ -148,19 +186,84 @@ class ProximityForest2(BaseClassifier):
         return preds
 
 
-def _fit_tree(X, y, n_splitters, max_depth, min_samples_split, random_state):
+def _fit_tree(X, y, n_splitters, max_depth, min_samples_split, random_state, cache):
     clf = ProximityTree2(
         n_splitters=n_splitters,
         max_depth=max_depth,
         min_samples_split=min_samples_split,
         random_state=random_state,
     )
-    clf.fit(X, y)
-    return clf
+    return clf._fit_with_cache(X, y, cache)
+
+
+def _fit_tree_shared_memory(
+    shm_name,
+    shape,
+    case_sum,
+    case_sum_sq,
+    warp_penalty,
+    y,
+    n_splitters,
+    max_depth,
+    min_samples_split,
+    random_state,
+):
+    shm = SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        cache = _FitCache.__new__(_FitCache)
+        cache.X = block[0]
+        cache.X_deriv = block[1]
+        cache.case_sum = case_sum
+        cache.case_sum_sq = case_sum_sq
+        cache.warp_penalty = warp_penalty
+
+        clf = _fit_tree(
+            cache.X,
+            y,
+            n_splitters,
+            max_depth,
+            min_samples_split,
+            random_state,
+            cache,
+        )
+        # only return the array form, the nodes hold views of the shared block
+        del clf.root, cache, block
+        return clf
+    finally:
+        shm.close()
+
+
+class _FitCache:
+    """Read-only data shared by all trees fit on the same collection.
+
+    Holds the series and their first order derivatives, the per-case sums used to
+    get the standard deviation of any subset of cases, and the maximum warping
+    penalty for ADTW. Tree nodes refer to cases by their index in the cache.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_cases, n_timepoints)
+        The training series.
+    rng : np.random.RandomState
+        Random state used to sample pairs of series for the warping penalty.
+    """
 
+    def __init__(self, X, rng):
+        self.X = np.ascontiguousarray(X, dtype=np.float64)
+        self.X_deriv = _first_order_derivative_collection(self.X)
+        self.case_sum = self.X.sum(axis=1)
+        self.case_sum_sq = (self.X**2).sum(axis=1)
+        self.warp_penalty = _global_warp_penalty(
+            self.X, rng.randint(0, len(self.X), size=(4000, 2))
+        )
 
-def _predict_tree(tree, X):
-    return tree.predict(X)
+    def std(self, idx):
+        """Get the standard deviation of all values of the cases in idx."""
+        n_values = len(idx) * self.X.shape[1]
+        mean = self.case_sum[idx].sum() / n_values
+        var = self.case_sum_sq[idx].sum() / n_values - mean**2
+        return np.sqrt(max(var, 0.0))
 
 
 class _Node:
@@ -224,6 +327,12 @@ class ProximityTree2(BaseClassifier):
         If `None`, the random number generator is the `RandomState` instance used
         by `np.random`.
 
+    Attributes
+    ----------
+    pruning_stats_ : dict
+        The number of exemplar distance comparisons made in the split search, and
+        how many of them were pruned by LB_Kim, pruned by LB_Keogh or early abandoned.
+
     Notes
     -----
     For the C++ version, see
@@ -271,7 +380,7 @@ class ProximityTree2(BaseClassifier):
         self.random_state = random_state
         super().__init__()
 
-    def _get_parameter_value(self, X):
+    def _get_parameter_value(self, idx):
         """Generate random parameter values.
 
         For a list of distance measures, generate a dictionary
@@ -279,7 +388,8 @@ class ProximityTree2(BaseClassifier):
 
         Parameters
         ----------
-        X : np.ndarray of shape (n_cases, n_timepoints)
+        idx : np.ndarray of shape (n_cases,)
+            Index of the cases at the node in the fit cache.
 
         Returns
         -------
@@ -288,7 +398,7 @@ class ProximityTree2(BaseClassifier):
         """
         rng = check_random_state(self.random_state)
 
-        X_std = X.std()
+        X_std = self._cache.std(idx)
         param_ranges = {
             "dtw": {"window": (0, 0.25)},
             "adtw": {"window": (0, 0.25)},
@@ -303,7 +413,7 @@ class ProximityTree2(BaseClassifier):
 
         return random_params
 
-    def _get_candidate_splitter(self, X, y):
+    def _get_candidate_splitter(self, idx, y):
         """Generate candidate splitter.
 
         Takes a time series dataset and a set of parameterized
@@ -312,12 +422,10 @@ class ProximityTree2(BaseClassifier):
 
         Parameters
         ----------
-        X : np.ndarray shape (n_cases, n_timepoints)
-            The training input samples.
-        y : np.array shape (n_cases,) or (n_cases,1)
-            The labels of the training samples.
-        parameterized_distances : dictionary
-            Contains the distances and their parameters.
+        idx : np.ndarray shape (n_cases,)
+            Index of the cases at the node in the fit cache.
+        y : np.array shape (n_cases,)
+            The labels of the cases at the node.
 
         Returns
         -------
@@ -329,10 +437,9 @@ class ProximityTree2(BaseClassifier):
         # Class exemplars
         exemplars = {}
         for label in np.unique(y):
-            y_new = y[y == label]
-            X_new = X[y == label]
-            id = rng.randint(0, X_new.shape[0])
-            exemplars[y_new[id]] = X_new[id, :]
+            idx_new = idx[y == label]
+            id = rng.randint(0, idx_new.shape[0])
+            exemplars[label] = self._cache.X[idx_new[id]]
 
         # Time series transform
         transforms = ["raw", "first_derivative"]
@@ -340,7 +447,7 @@ class ProximityTree2(BaseClassifier):
         transform = transforms[t]
 
         # random parameterized distance measure
-        parameterized_distances = self._get_parameter_value(X)
+        parameterized_distances = self._get_parameter_value(idx)
         n = rng.randint(0, 3)
         dist = list(parameterized_distances.keys())[n]
         if dist == "dtw":
@@ -352,7 +459,7 @@ class ProximityTree2(BaseClassifier):
             p = rng.choice(values)
             parameterized_distances[dist]["p"] = p
             i = rng.randint(1, 101)
-            w = ((i / 100) ** 5) * self._max_warp_penalty
+            w = ((i / 100) ** 5) * self._cache.warp_penalty
             parameterized_distances[dist]["warp_penalty"] = w
 
         # Create a list of class exemplars, distance measures and transform
@@ -360,56 +467,45 @@ class ProximityTree2(BaseClassifier):
 
         return splitter
 
-    def _get_best_splitter(self, X, y):
-        """Get the splitter for a node which maximizes the gini gain."""
+    def _get_best_splitter(self, idx, y):
+        """Get the splitter for a node which maximizes the gini gain.
+
+        Returns the splitter and the index of the closest exemplar for each case.
+        """
         max_gain = float("-inf")
         best_splitter = None
+        best_assignment = None
         for _ in range(self.n_splitters):
-            splitter = self._get_candidate_splitter(X, y)
-            labels = list(splitter[0].keys())
-            measure = list(splitter[1].keys())[0]
-            transform = splitter[2]
-            if transform == "first_derivative":
-                X_trans = NumbaList()
-                for i in range(len(X)):
-                    X_trans.append(first_order_derivative(X[i]))
-                exemplars = NumbaList()
-                for i in range(len(labels)):
-                    exemplars.append(
-                        first_order_derivative(list(splitter[0].values())[i])
-                    )
-            else:
-                X_trans = X
-                exemplars = np.array(list(splitter[0].values()))
-
-            y_subs = [[] for _ in range(len(labels))]
-            for j in range(len(X_trans)):
-                min_dist = float("inf")
-                sub = None
-                for k in range(len(labels)):
-                    if measure == "dtw" or measure == "adtw":
-                        splitter[1][measure]["threshold"] = min_dist
-                    dist = distance(
-                        X_trans[j],
-                        exemplars[k],
-                        metric=measure,
-                        **splitter[1][measure],
-                    )
-                    if dist < min_dist:
-                        min_dist = dist
-                        sub = k
-                y_subs[sub].append(y[j])
-            y_subs = [np.array(ele, dtype=y.dtype) for ele in y_subs]
+            splitter = self._get_candidate_splitter(idx, y)
+            distance_id, transform_id, params, exemplars = _splitter_arrays(splitter)
+            X_trans = self._cache.X_deriv if transform_id == 1 else self._cache.X
+            upper, lower = _envelopes(exemplars, params[1])
+
+            assignment = _closest_exemplars(
+                X_trans,
+                idx,
+                exemplars,
+                upper,
+                lower,
+                distance_id,
+                params,
+                self._pruning_stats,
+            )
+            y_subs = [y[assignment == k] for k in range(len(exemplars))]
             gini_index = gini_gain(y, y_subs)
             if gini_index > max_gain:
                 max_gain = gini_index
                 best_splitter = splitter
-        return best_splitter
+                best_assignment = assignment
+        return best_splitter, best_assignment
 
-    def _build_tree(self, X, y, depth, node_id, parent_target_value=None):
-        """Build the tree recursively from the root node down to the leaf nodes."""
+    def _build_tree(self, idx, y, depth, node_id, parent_target_value=None):
+        """Build the tree recursively from the root node down to the leaf nodes.
+
+        Cases reaching a node are given by their index in the fit cache.
+        """
         # If the data reaching the node is empty
-        if len(X) == 0:
+        if len(idx) == 0:
             leaf_label = parent_target_value
             leaf_distribution = {}
             leaf = _Node(
@@ -439,7 +535,7 @@ class ProximityTree2(BaseClassifier):
             return leaf
 
         # If min sample splits is reached
-        if self.min_samples_split >= len(X):
+        if self.min_samples_split >= len(idx):
             leaf_label = target_value
             leaf = _Node(
                 node_id=node_id,
@@ -461,52 +557,20 @@ class ProximityTree2(BaseClassifier):
             return leaf
 
         # Find the best splitter
-        splitter = self._get_best_splitter(X, y)
+        splitter, assignment = self._get_best_splitter(idx, y)
 
         # Create root node
         node = _Node(node_id=node_id, _is_leaf=False, splitter=splitter)
 
         # For each exemplar split the data
         labels = list(splitter[0].keys())
-        measure = list(splitter[1].keys())[0]
-        transform = splitter[2]
-        if transform == "first_derivative":
-            X_trans = NumbaList()
-            for i in range(len(X)):
-                X_trans.append(first_order_derivative(X[i]))
-            exemplars = NumbaList()
-            for i in range(len(labels)):
-                exemplars.append(first_order_derivative(list(splitter[0].values())[i]))
-        else:
-            X_trans = X
-            exemplars = np.array(list(splitter[0].values()))
-
-        X_child = [[] for _ in labels]
-        y_child = [[] for _ in labels]
-        for i in range(len(X_trans)):
-            min_dist = np.inf
-            id = None
-            for j in range(len(labels)):
-                if measure == "dtw" or measure == "adtw":
-                    splitter[1][measure]["threshold"] = min_dist
-                dist = distance(
-                    X_trans[i],
-                    exemplars[j],
-                    metric=measure,
-                    **splitter[1][measure],
-                )
-                if dist < min_dist:
-                    min_dist = dist
-                    id = j
-            X_child[id].append(X[i])
-            y_child[id].append(y[i])
-        X_child = [np.array(ele) for ele in X_child]
-        y_child = [np.array(ele) for ele in y_child]
+        idx_child = [idx[assignment == k] for k in range(len(labels))]
+        y_child = [y[assignment == k] for k in range(len(labels))]
         # For each exemplar, create a branch
         for i in range(len(labels)):
             child_node_id = node_id + "." + str(i)
             child_node = self._build_tree(
-                X_child[i],
+                idx_child[i],
                 y_child[i],
                 depth=depth + 1,
                 node_id=child_node_id,
@@ -535,11 +599,33 @@ class ProximityTree2(BaseClassifier):
         # mode_count = counts[max_index]
         return mode_value
 
-    def _fit(self, X, y):
-        self._max_warp_penalty = _global_warp_penalty(X)
+    def _fit_with_cache(self, X, y, cache):
+        """Fit the tree using a fit cache shared by the trees of a forest.
+
+        Performs the same setup as ``fit``, then fits the tree using the given cache
+        rather than building one from X.
+        """
+        X, y, single_class = self._fit_setup(X, y)
+
+        if not single_class:
+            self._fit(X, y, cache=cache)
+
+        self.is_fitted = True
+        return self
+
+    def _fit(self, X, y, cache=None):
+        self._cache = (
+            _FitCache(X, check_random_state(self.random_state))
+            if cache is None
+            else cache
+        )
+        self._pruning_stats = np.zeros(4, dtype=np.int64)
         self.root = self._build_tree(
-            X, y, depth=0, node_id="0", parent_target_value=None
+            np.arange(len(X)), y, depth=0, node_id="0", parent_target_value=None
         )
+        del self._cache
+        self.pruning_stats_ = _pruning_stats_dict(self._pruning_stats)
+        self._tree_arrays = _flatten_trees([self.root], self.classes_)
 
     def _predict(self, X):
         probas = self._predict_proba(X)
@@ -547,56 +633,401 @@ class ProximityTree2(BaseClassifier):
         return np.array([self.classes_[pred] for pred in predictions])
 
     def _predict_proba(self, X):
-        # Get the unique class labels
-        classes = list(self.classes_)
-        class_count = len(classes)
-        probas = []
-
-        for i in range(len(X)):
-            # Classify the data point and find the leaf node
-            leaf_node = self._classify(self.root, X[i])
-
-            # Create probability distribution based on class counts in the leaf node
-            proba = np.zeros(class_count)
-            for class_label, class_proba in leaf_node.class_distribution.items():
-                proba[classes.index(class_label)] = class_proba
-            probas.append(proba)
-
-        return np.array(probas)
-
-    def _classify(self, treenode, x):
-        # Classify one data point using the proximity tree
-        if treenode._is_leaf:
-            return treenode
+        return _route_cases(X, self._tree_arrays, vote=False, n_jobs=1)
+
+
+# Array-backed splitters and trees.
+
+_DISTANCE_IDS = {"dtw": 0, "adtw": 1, "lcss": 2}
+_TRANSFORM_IDS = {"raw": 0, "first_derivative": 1}
+
+
+def _splitter_arrays(splitter):
+    """Get the distance id, transform id, parameters and exemplars of a splitter.
+
+    The parameter array contains p, window, epsilon and warp_penalty, and the
+    exemplars have the splitter transform applied.
+    """
+    measure, measure_params = list(splitter[1].items())[0]
+    transform_id = _TRANSFORM_IDS[splitter[2]]
+    params = np.array(
+        [
+            measure_params.get("p", 2.0),
+            measure_params.get("window", 1.0),
+            measure_params.get("epsilon", 1.0),
+            measure_params.get("warp_penalty", 1.0),
+        ],
+        dtype=np.float64,
+    )
+    exemplars = np.array(list(splitter[0].values()), dtype=np.float64)
+    if transform_id == 1:
+        exemplars = _first_order_derivative_collection(exemplars)
+    return _DISTANCE_IDS[measure], transform_id, params, exemplars
+
+
+def _pruning_stats_dict(stats):
+    return {
+        "n_distances": int(stats[0]),
+        "lb_kim_pruned": int(stats[1]),
+        "lb_keogh_pruned": int(stats[2]),
+        "early_abandoned": int(stats[3]),
+    }
+
+
+def _flatten_trees(roots, classes):
+    """Flatten fitted trees into contiguous arrays for compiled prediction.
+
+    Nodes from all trees are numbered breadth first. The children of node ``i`` are
+    stored in ``children[children_start[i]:children_start[i] + n_children[i]]``, and
+    the (transformed) exemplar for each child and its warping envelope are the rows of
+    ``exemplars``, ``upper`` and ``lower`` with the same index.
+
+    Parameters
+    ----------
+    roots : list of _Node
+        The root node of each tree.
+    classes : np.ndarray
+        The class labels, used to order the columns of the leaf distributions.
+
+    Returns
+    -------
+    tree_arrays : tuple of np.ndarray
+        The root node index of each tree, and for each node the leaf flag, child
+        offset, number of children, distance id, transform id, distance parameters
+        (p, window, epsilon, warp_penalty) and leaf class distribution. Followed by
+        the child node indices, the exemplar block and its envelopes.
+    """
+    class_index = {label: i for i, label in enumerate(classes)}
+    nodes = list(roots)
+    children = []
+    exemplars = []
+    upper = []
+    lower = []
+    children_start = []
+
+    n_nodes = 0
+    while n_nodes < len(nodes):
+        node = nodes[n_nodes]
+        children_start.append(len(children))
+        if not node._is_leaf:
+            _, _, params, node_exemplars = _splitter_arrays(node.splitter)
+            node_upper, node_lower = _envelopes(node_exemplars, params[1])
+            for label in node.splitter[0].keys():
+                children.append(len(nodes))
+                nodes.append(node.children[label])
+            exemplars.extend(node_exemplars)
+            upper.extend(node_upper)
+            lower.extend(node_lower)
+        n_nodes += 1
+
+    is_leaf = np.zeros(n_nodes, dtype=np.bool_)
+    n_children = np.zeros(n_nodes, dtype=np.int64)
+    distance_id = np.full(n_nodes, -1, dtype=np.int64)
+    transform_id = np.zeros(n_nodes, dtype=np.int64)
+    params = np.zeros((n_nodes, 4))
+    leaf_proba = np.zeros((n_nodes, len(classes)))
+    for i, node in enumerate(nodes):
+        if node._is_leaf:
+            is_leaf[i] = True
+            for label, proba in node.class_distribution.items():
+                leaf_proba[i, class_index[label]] = proba
         else:
-            measure = list(treenode.splitter[1].keys())[0]
-            branches = list(treenode.splitter[0].keys())
-            transform = treenode.splitter[2]
-            if transform == "first_derivative":
-                x_trans = first_order_derivative(x)
-                exemplars = NumbaList()
-                for i in range(len(list(treenode.splitter[0].values()))):
-                    exemplars.append(
-                        first_order_derivative(list(treenode.splitter[0].values())[i])
-                    )
+            n_children[i] = len(node.splitter[0])
+            distance_id[i], transform_id[i], params[i], _ = _splitter_arrays(
+                node.splitter
+            )
+
+    return (
+        np.arange(len(roots), dtype=np.int64),
+        is_leaf,
+        np.array(children_start, dtype=np.int64),
+        n_children,
+        distance_id,
+        transform_id,
+        params,
+        leaf_proba,
+        np.array(children, dtype=np.int64),
+        np.array(exemplars, dtype=np.float64),
+        np.array(upper, dtype=np.float64),
+        np.array(lower, dtype=np.float64),
+    )
+
+
+def _concatenate_tree_arrays(tree_arrays):
+    """Concatenate the arrays of separately flattened trees into a single forest."""
+    node_offset = 0
+    child_offset = 0
+    shifted = []
+    for arrays in tree_arrays:
+        arrays = list(arrays)
+        n_nodes = len(arrays[1])
+        n_children = len(arrays[8])
+        arrays[0] = arrays[0] + node_offset
+        arrays[2] = arrays[2] + child_offset
+        arrays[8] = arrays[8] + node_offset
+        shifted.append(arrays)
+        node_offset += n_nodes
+        child_offset += n_children
+    return tuple(
+        np.concatenate([arrays[i] for arrays in shifted])
+        for i in range(len(shifted[0]))
+    )
+
+
+def _route_cases(X, tree_arrays, vote, n_jobs):
+    """Route a batch of cases through flattened trees.
+
+    If ``vote`` is True, each tree adds a single vote for the most probable class in
+    the reached leaf, otherwise the leaf class distributions are summed.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    # the serial kernel avoids starting the numba thread pool, which is not safe to
+    # fork from
+    if n_jobs == 1:
+        return _predict_trees(X, *tree_arrays, vote)
+
+    prev_threads = get_num_threads()
+    set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+    try:
+        return _predict_trees_parallel(X, *tree_arrays, vote)
+    finally:
+        set_num_threads(prev_threads)
+
+
+@njit(cache=True, fastmath=True)
+def _predict_case(
+    x,
+    proba,
+    roots,
+    is_leaf,
+    children_start,
+    n_children,
+    distance_id,
+    transform_id,
+    params,
+    leaf_proba,
+    children,
+    exemplars,
+    upper,
+    lower,
+    vote,
+):
+    x_deriv = first_order_derivative_1d(x)
+    stats = np.zeros(4, dtype=np.int64)
+    for t in range(roots.shape[0]):
+        node = roots[t]
+        while not is_leaf[node]:
+            start = children_start[node]
+            end = start + n_children[node]
+            best = _closest_exemplar(
+                x_deriv if transform_id[node] == 1 else x,
+                exemplars[start:end],
+                upper[start:end],
+                lower[start:end],
+                distance_id[node],
+                params[node],
+                stats,
+            )
+            node = children[start + best]
+
+        if vote:
+            proba[np.argmax(leaf_proba[node])] += 1
+        else:
+            proba += leaf_proba[node]
+
+
+@njit(cache=True, fastmath=True)
+def _predict_trees(
+    X,
+    roots,
+    is_leaf,
+    children_start,
+    n_children,
+    distance_id,
+    transform_id,
+    params,
+    leaf_proba,
+    children,
+    exemplars,
+    upper,
+    lower,
+    vote,
+):
+    probas = np.zeros((X.shape[0], leaf_proba.shape[1]))
+    for i in range(X.shape[0]):
+        _predict_case(
+            X[i],
+            probas[i],
+            roots,
+            is_leaf,
+            children_start,
+            n_children,
+            distance_id,
+            transform_id,
+            params,
+            leaf_proba,
+            children,
+            exemplars,
+            upper,
+            lower,
+            vote,
+        )
+    return probas
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _predict_trees_parallel(
+    X,
+    roots,
+    is_leaf,
+    children_start,
+    n_children,
+    distance_id,
+    transform_id,
+    params,
+    leaf_proba,
+    children,
+    exemplars,
+    upper,
+    lower,
+    vote,
+):
+    probas = np.zeros((X.shape[0], leaf_proba.shape[1]))
+    for i in prange(X.shape[0]):
+        _predict_case(
+            X[i],
+            probas[i],
+            roots,
+            is_leaf,
+            children_start,
+            n_children,
+            distance_id,
+            transform_id,
+            params,
+            leaf_proba,
+            children,
+            exemplars,
+            upper,
+            lower,
+            vote,
+        )
+    return probas
+
+
+# Lower bounds and exemplar search.
+
+
+@njit(cache=True, fastmath=True)
+def _first_order_derivative_collection(X):
+    X_deriv = np.zeros(X.shape)
+    for i in range(X.shape[0]):
+        X_deriv[i] = first_order_derivative_1d(X[i])
+    return X_deriv
+
+
+@njit(cache=True, fastmath=True)
+def _envelopes(exemplars, window):
+    """Get the upper and lower warping envelopes of each exemplar.
+
+    The envelope radius matches the Sakoe-Chiba band used by the elastic distances
+    for equal length series.
+    """
+    n_exemplars, n_timepoints = exemplars.shape
+    radius = int(window * n_timepoints)
+    upper = np.zeros((n_exemplars, n_timepoints))
+    lower = np.zeros((n_exemplars, n_timepoints))
+    for k in range(n_exemplars):
+        for i in range(n_timepoints):
+            start = max(0, i - radius)
+            end = min(n_timepoints, i + radius + 1)
+            upper[k, i] = np.max(exemplars[k, start:end])
+            lower[k, i] = np.min(exemplars[k, start:end])
+    return upper, lower
+
+
+@njit(cache=True, fastmath=True)
+def _pointwise_cost(a, b, p):
+    # matches the univariate minkowski cost used in the elastic cost matrices
+    return (np.abs(a - b) ** p) ** (1.0 / p)
+
+
+@njit(cache=True, fastmath=True)
+def _lb_kim(x, y, p):
+    """LB_Kim lower bound using the first and last points of both series.
+
+    Any warping path of DTW or ADTW aligns the first points and the last points.
+    """
+    lb = _pointwise_cost(x[0], y[0], p)
+    if x.shape[0] > 1:
+        lb += _pointwise_cost(x[-1], y[-1], p)
+    return lb
+
+
+@njit(cache=True, fastmath=True)
+def _lb_keogh(x, upper, lower, p, threshold):
+    """LB_Keogh lower bound of x against a warping envelope, abandoned early."""
+    lb = 0.0
+    for i in range(x.shape[0]):
+        if x[i] > upper[i]:
+            lb += _pointwise_cost(x[i], upper[i], p)
+        elif x[i] < lower[i]:
+            lb += _pointwise_cost(x[i], lower[i], p)
+        if lb >= threshold:
+            break
+    return lb
+
+
+@njit(cache=True, fastmath=True)
+def _closest_exemplar(x, exemplars, upper, lower, distance_id, params, stats):
+    """Find the closest exemplar to a series.
+
+    DTW and ADTW candidates are first checked against LB_Kim and then LB_Keogh, and
+    are skipped if either bound is not lower than the best distance found so far.
+    The remaining distances are abandoned once they exceed the best distance.
+
+    ``stats`` counts the exemplar comparisons, the LB_Kim and LB_Keogh prunes and
+    the abandoned distance computations.
+    """
+    min_dist = np.inf
+    best = 0
+    for k in range(exemplars.shape[0]):
+        stats[0] += 1
+        if distance_id == 2:
+            dist = _lcss_distance(x, exemplars[k], params[1], params[2], min_dist)
+        else:
+            if _lb_kim(x, exemplars[k], params[0]) >= min_dist:
+                stats[1] += 1
+                continue
+            if _lb_keogh(x, upper[k], lower[k], params[0], min_dist) >= min_dist:
+                stats[2] += 1
+                continue
+
+            if distance_id == 0:
+                dist = _dtw_distance(
+                    x, exemplars[k], params[0], params[1], None, min_dist
+                )
             else:
-                x_trans = x
-                exemplars = np.array(list(treenode.splitter[0].values()))
-            min_dist = np.inf
-            id = None
-            for i in range(len(branches)):
-                if measure == "dtw" or measure == "adtw":
-                    treenode.splitter[1][measure]["threshold"] = min_dist
-                dist = distance(
-                    x_trans,
-                    exemplars[i],
-                    metric=measure,
-                    **treenode.splitter[1][measure],
+                dist = _adtw_distance(
+                    x, exemplars[k], params[0], params[1], None, params[3], min_dist
                 )
-                if dist < min_dist:
-                    min_dist = dist
-                    id = i
-            return self._classify(treenode.children[branches[id]], x)
+
+        if dist < min_dist:
+            min_dist = dist
+            best = k
+        elif dist == np.inf:
+            stats[3] += 1
+    return best
+
+
+@njit(cache=True, fastmath=True)
+def _closest_exemplars(X, idx, exemplars, upper, lower, distance_id, params, stats):
+    """Find the index of the closest exemplar for each series X[idx[i]]."""
+    assignment = np.zeros(idx.shape[0], dtype=np.int64)
+    for i in range(idx.shape[0]):
+        assignment[i] = _closest_exemplar(
+            X[idx[i]], exemplars, upper, lower, distance_id, params, stats
+        )
+    return assignment
 
 
 @njit(cache=True, fastmath=True)
@@ -683,12 +1114,10 @@ def gini_gain(y, y_subs) -> float:
 
 
 @njit(cache=True, fastmath=True)
-def _global_warp_penalty(X):
-    n = len(X)
-    pairs = [
-        (X[np.random.randint(0, n)], X[np.random.randint(0, n)]) for _ in range(4000)
-    ]
-    distances = np.array([minkowski_distance(pair[0], pair[1], 2) for pair in pairs])
+def _global_warp_penalty(X, pairs):
+    distances = np.zeros(pairs.shape[0])
+    for i in range(pairs.shape[0]):
+        distances[i] = minkowski_distance(X[pairs[i, 0]], X[pairs[i, 1]], 2)
     penalty = np.mean(distances)
     return penalty
 
@@ -910,7 +1339,8 @@ def _dtw_distance(
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
     threshold : float, default=np.inf
-        Threshold to stop the calculation of cost matrix.
+        The calculation is abandoned and infinity returned once every cell in a row
+        of the cost matrix exceeds the threshold.
 
     Returns
     -------
@@ -949,6 +1379,15 @@ def _dtw_distance(
     raise ValueError("x and y must be 1D or 2D")
 
 
+@njit(cache=True, fastmath=True)
+def _channel_cost(x, y, i, j, p):
+    # minkowski distance between x[:, i] and y[:, j] without allocating slices
+    cost = 0.0
+    for c in range(x.shape[0]):
+        cost += np.abs(x[c, i] - y[c, j]) ** p
+    return cost ** (1.0 / p)
+
+
 @njit(cache=True, fastmath=True)
 def _dtw_cost_matrix(
     x: np.ndarray,
@@ -961,19 +1400,20 @@ def _dtw_cost_matrix(
     y_size = y.shape[1]
     cost_matrix = np.full((x_size + 1, y_size + 1), np.inf)
     cost_matrix[0, 0] = 0.0
-    _w = np.ones_like(x)
     for i in range(x_size):
+        row_min = np.inf
         for j in range(y_size):
             if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_minkowski_distance(
-                    x[:, i], y[:, j], p, _w[:, i]
-                ) + min(
+                cost_matrix[i + 1, j + 1] = _channel_cost(x, y, i, j, p) + min(
                     cost_matrix[i, j + 1],
                     cost_matrix[i + 1, j],
                     cost_matrix[i, j],
                 )
-                if cost_matrix[i + 1, j + 1] > threshold:
-                    break
+                row_min = min(row_min, cost_matrix[i + 1, j + 1])
+        # every warping path passes through this row
+        if row_min > threshold:
+            cost_matrix[x_size, y_size] = np.inf
+            break
     return cost_matrix[1:, 1:]
 
 
@@ -1016,7 +1456,8 @@ def _adtw_distance(
     warp_penalty: float, default=1.0
         Penalty for warping. A high value will mean less warping.
     threshold: float, default=np.inf
-        The threshold to stop the calculation of cost matrix.
+        The calculation is abandoned and infinity returned once every cell in a row
+        of the cost matrix exceeds the threshold.
 
     Returns
     -------
@@ -1066,18 +1507,59 @@ def _adtw_cost_matrix(
     cost_matrix = np.full((x_size + 1, y_size + 1), np.inf)
     cost_matrix[0, 0] = 0.0
 
-    _w = np.ones_like(x)
     for i in range(x_size):
+        row_min = np.inf
         for j in range(y_size):
             if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_minkowski_distance(
-                    x[:, i], y[:, j], p, _w[:, i]
-                ) + min(
+                cost_matrix[i + 1, j + 1] = _channel_cost(x, y, i, j, p) + min(
                     cost_matrix[i, j + 1] + warp_penalty,
                     cost_matrix[i + 1, j] + warp_penalty,
                     cost_matrix[i, j],
                 )
-                if cost_matrix[i + 1, j + 1] > threshold:
-                    break
+                row_min = min(row_min, cost_matrix[i + 1, j + 1])
+        # every warping path passes through this row
+        if row_min > threshold:
+            cost_matrix[x_size, y_size] = np.inf
+            break
 
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True, fastmath=True)
+def _lcss_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: Optional[float] = None,
+    epsilon: float = 1.0,
+    threshold: float = np.inf,
+) -> float:
+    """LCSS distance between two univariate series with early abandoning.
+
+    Equal to the ``aeon`` LCSS distance, but the calculation is abandoned and
+    infinity returned once the number of matches still possible cannot bring the
+    distance below ``threshold``.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    min_size = min(x_size, y_size)
+    bounding_matrix = create_bounding_matrix(x_size, y_size, window, None)
+    cost_matrix = np.zeros((x_size + 1, y_size + 1))
+    for i in range(1, x_size + 1):
+        row_max = 0.0
+        for j in range(1, y_size + 1):
+            if bounding_matrix[i - 1, j - 1]:
+                if abs(x[i - 1] - y[j - 1]) <= epsilon:
+                    cost_matrix[i, j] = 1 + cost_matrix[i - 1, j - 1]
+                else:
+                    cost_matrix[i, j] = max(
+                        cost_matrix[i, j - 1], cost_matrix[i - 1, j]
+                    )
+                row_max = max(row_max, cost_matrix[i, j])
+        # each remaining row adds at most one match
+        if 1 - (row_max + x_size - i) / min_size > threshold:
+            return np.inf
+
+    distance = 1 - cost_matrix[x_size, y_size] / min_size
+    if distance < 0.0:
+        return 0.0
+    return distance
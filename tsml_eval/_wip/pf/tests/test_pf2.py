@@ -0,0 +1,139 @@
+"""Tests for the Proximity Forest 2.0 classifier."""
+
+import numpy as np
+import pytest
+from aeon.testing.data_generation import make_example_2d_numpy_collection
+
+from tsml_eval._wip.pf._pf2 import (
+    ProximityForest2,
+    ProximityTree2,
+    _adtw_distance,
+    _closest_exemplar,
+    _dtw_distance,
+    _envelopes,
+    distance,
+    first_order_derivative,
+)
+
+
+@pytest.mark.parametrize("distance_id", [0, 1])
+@pytest.mark.parametrize("window", [0.0, 0.1, 0.25, 1.0])
+@pytest.mark.parametrize("p", [0.5, 1.0, 2.0])
+def test_closest_exemplar_pruning(distance_id, window, p):
+    """Test the pruned closest exemplar matches a brute force search."""
+    rng = np.random.default_rng(0)
+    params = np.array([p, window, 1.0, 0.5])
+    stats = np.zeros(4, dtype=np.int64)
+
+    for _ in range(50):
+        n_exemplars = rng.integers(2, 6)
+        exemplars = np.cumsum(rng.normal(size=(n_exemplars, 30)), axis=1)
+        x = np.cumsum(rng.normal(size=30))
+        upper, lower = _envelopes(exemplars, window)
+
+        if distance_id == 0:
+            distances = [
+                _dtw_distance(x, e, p, window, None, np.inf) for e in exemplars
+            ]
+        else:
+            distances = [
+                _adtw_distance(x, e, p, window, None, params[3], np.inf)
+                for e in exemplars
+            ]
+
+        assert _closest_exemplar(
+            x, exemplars, upper, lower, distance_id, params, stats
+        ) == np.argmin(distances)
+
+    # the bounds and early abandoning are used
+    assert stats[0] > 0 and stats[1] + stats[2] + stats[3] > 0
+
+
+def _classify_recursive(node, x):
+    """Find the leaf reached by x with full distances and no pruning."""
+    while not node._is_leaf:
+        measure, params = list(node.splitter[1].items())[0]
+        params = dict(params)
+        if measure in ("dtw", "adtw"):
+            params["threshold"] = np.inf
+        exemplars = list(node.splitter[0].values())
+        x_trans = x
+        if node.splitter[2] == "first_derivative":
+            x_trans = first_order_derivative(x)
+            exemplars = [first_order_derivative(e) for e in exemplars]
+
+        distances = [distance(x_trans, e, measure, **params) for e in exemplars]
+        node = node.children[list(node.splitter[0].keys())[np.argmin(distances)]]
+    return node
+
+
+def _predict_proba_recursive(tree, X):
+    probas = np.zeros((len(X), len(tree.classes_)))
+    classes = list(tree.classes_)
+    for i in range(len(X)):
+        leaf = _classify_recursive(tree.root, X[i])
+        for label, proba in leaf.class_distribution.items():
+            probas[i, classes.index(label)] = proba
+    return probas
+
+
+def test_proximity_tree_flattened_predictions():
+    """Test the flattened pruned tree predicts the same as the recursive tree."""
+    X, y = make_example_2d_numpy_collection(
+        n_cases=40, n_timepoints=30, n_labels=3, random_state=0
+    )
+    X_test, _ = make_example_2d_numpy_collection(
+        n_cases=20, n_timepoints=30, random_state=1
+    )
+
+    tree = ProximityTree2(n_splitters=5, random_state=0).fit(X, y)
+
+    np.testing.assert_array_almost_equal(
+        tree.predict_proba(X_test), _predict_proba_recursive(tree, X_test)
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_proximity_forest_flattened_predictions(n_jobs):
+    """Test the flattened forest votes match the votes of the recursive trees."""
+    X, y = make_example_2d_numpy_collection(
+        n_cases=40, n_timepoints=30, n_labels=3, random_state=0
+    )
+    X_test, _ = make_example_2d_numpy_collection(
+        n_cases=20, n_timepoints=30, random_state=1
+    )
+
+    forest = ProximityForest2(n_trees=5, n_splitters=3, random_state=0, n_jobs=n_jobs)
+    forest.fit(X, y)
+
+    votes = np.zeros((len(X_test), len(forest.classes_)))
+    for tree in forest.trees_:
+        probas = _predict_proba_recursive(tree, X_test)
+        votes[np.arange(len(X_test)), np.argmax(probas, axis=1)] += 1
+
+    np.testing.assert_array_almost_equal(forest.predict_proba(X_test), votes / 5)
+
+
+def test_proximity_forest_backends():
+    """Test the shared memory process backend fits the same forest as threads."""
+    X, y = make_example_2d_numpy_collection(
+        n_cases=40, n_timepoints=30, n_labels=3, random_state=0
+    )
+    X_test, _ = make_example_2d_numpy_collection(
+        n_cases=20, n_timepoints=30, random_state=1
+    )
+
+    probas = [
+        ProximityForest2(
+            n_trees=5,
+            n_splitters=3,
+            random_state=0,
+            n_jobs=2,
+            parallel_backend=backend,
+        )
+        .fit(X, y)
+        .predict_proba(X_test)
+        for backend in ["threading", "loky"]
+    ]
+
+    np.testing.assert_array_equal(probas[0], probas[1])
@@ -0,0 +1,140 @@
+"""Benchmark the shapelet quality measures.
+
+For each quality measure, times scoring a batch of candidate distances with the batch
+kernel and with a loop calling the single shapelet function for each candidate, then
+times fitting the shapelet transform. The timings are written to
+``quality_measures_benchmark.csv``.
+"""
+
+import csv
+import os
+import time
+
+import numpy as np
+from aeon.datasets import load_gunpoint
+
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based import (
+    RandomShapeletTransform,
+)
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based import (
+    _quality_measures as qm,
+)
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+
+def _split(distances, y, inst_idx):
+    same_class = y == y[inst_idx]
+    same_class[inst_idx] = False
+    return distances[same_class], distances[y != y[inst_idx]]
+
+
+def _information_gain(distances, y, inst_idx):
+    row = distances.copy()
+    row[inst_idx] = 0
+    cls = np.where(y == y[inst_idx], 1, -1)
+    return qm.binary_information_gain(
+        sorted(zip(row, cls)), np.sum(cls > 0), np.sum(cls < 0)
+    )
+
+
+def _kruskal_wallis(distances, y, inst_idx):
+    ranks, tie_correction, n1, n2, n = qm.compute_pre_stats(
+        *_split(distances, y, inst_idx)
+    )
+    return qm.kruskal_wallis_test(ranks, n1, n2, n, tie_correction)
+
+
+def _wasserstein_gaussian(distances, y, inst_idx):
+    class0, class1 = _split(distances, y, inst_idx)
+    mu1, Sigma1 = qm.estimate_parameters(class0)
+    mu2, Sigma2 = qm.estimate_parameters(class1)
+    return qm.wasserstein_distance_gaussian(
+        np.array([mu1]), Sigma1, np.array([mu2]), Sigma2
+    )
+
+
+# shapelet_quality option: (batch kernel, single shapelet function)
+measures = {
+    "INFO_GAIN": (
+        lambda d, y, idx: qm.information_gain_batch(d, y, idx, np.full(len(idx), -1.0)),
+        _information_gain,
+    ),
+    "F_STAT": (
+        qm.f_stat_batch,
+        lambda d, y, idx: qm.f_stat(*_split(d, y, idx)),
+    ),
+    "Moods_Median": (
+        qm.moods_median_batch,
+        lambda d, y, idx: qm._moods_median(*_split(d, y, idx)),
+    ),
+    "Kruskal_Wallis": (qm.kruskal_wallis_batch, _kruskal_wallis),
+    "Wasser1": (qm.wasserstein_gaussian_batch, _wasserstein_gaussian),
+    "Wasser_emp": (
+        qm.wasserstein_empirical_batch,
+        lambda d, y, idx: qm.wasserstein_distance_empirical(*_split(d, y, idx)),
+    ),
+    "Kolmogorov": (
+        qm.kolmogorov_batch,
+        lambda d, y, idx: qm.kolmogorov_test(*_split(d, y, idx)),
+    ),
+}
+
+X_gp, y_gp = load_gunpoint(split="train")
+rng = np.random.RandomState(0)
+X_rw = rng.normal(size=(200, 1, 300)).cumsum(axis=2)
+y_rw = rng.randint(0, 2, size=200)
+datasets = {"GunPoint": (X_gp, y_gp), "RandomWalk": (X_rw, y_rw)}
+
+n_candidates = 1000
+rows = [
+    [
+        "dataset",
+        "n_cases",
+        "shapelet_quality",
+        "batch_score_seconds",
+        "loop_score_seconds",
+        "fit_seconds",
+    ]
+]
+for name, (X, y) in datasets.items():
+    y_int = np.unique(y, return_inverse=True)[1]
+    distances = rng.random_sample((n_candidates, len(y_int)))
+    inst_idx = np.arange(n_candidates) % len(y_int)
+
+    for measure, (batch_function, function) in measures.items():
+        # compile the numba functions before timing
+        batch_function(distances[:2], y_int, inst_idx[:2])
+        function(distances[0], y_int, inst_idx[0])
+        RandomShapeletTransform(
+            n_shapelet_samples=10, max_shapelets=5, shapelet_quality=measure
+        ).fit(X[:10], y[:10])
+
+        start = time.perf_counter()
+        batch_function(distances, y_int, inst_idx)
+        batch_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for k in range(n_candidates):
+            function(distances[k], y_int, inst_idx[k])
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        RandomShapeletTransform(
+            n_shapelet_samples=n_candidates,
+            max_shapelets=100,
+            shapelet_quality=measure,
+            random_state=0,
+        ).fit(X, y)
+        fit_seconds = time.perf_counter() - start
+
+        rows.append([name, len(y), measure, batch_seconds, loop_seconds, fit_seconds])
+        print(rows[-1])
+
+with open(
+    os.path.join(path, "quality_measures_benchmark.csv"), mode="w", newline=""
+) as file:
+    writer = csv.writer(file)
+    writer.writerows(rows)
+
+print("Finished writing data")
@@ -1,2 +1,7 @@
 """Shapelet based classifiers."""
+
 __all__ = ["ShapeletTransformClassifier"]
+
+from tsml_eval._wip.shapelets.classification.shapelet_based._stc import (
+    ShapeletTransformClassifier,
+)
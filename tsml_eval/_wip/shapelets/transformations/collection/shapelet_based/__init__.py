@@ -1,2 +1,7 @@
 """Shapelet based transformers."""
+
 __all__ = ["RandomShapeletTransform"]
+
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based._shapelet_transform import (  # noqa: E501
+    RandomShapeletTransform,
+)
@@ -0,0 +1,165 @@
+"""FFT based shapelet distance profiles.
+
+Z-normalised Euclidean distances between shapelets and every window of a series are
+found from sliding dot products computed with the FFT, along the lines of MASS [1]_.
+"""
+
+__all__ = ["DistanceProfileCache"]
+
+import numpy as np
+from aeon.utils.numba.general import AEON_NUMBA_STD_THRESHOLD
+from numba import njit
+from scipy.fft import next_fast_len
+
+
+class DistanceProfileCache:
+    """Per series values shared by the distance profiles of all shapelets.
+
+    The FFT of each channel and the cumulative sums used for the rolling window means
+    and standard deviations are computed once for a collection. Distances for a
+    batch of shapelets of the same length are then found for all series at once.
+
+    Parameters
+    ----------
+    X : np.ndarray or list of np.ndarray
+        3D numpy array of shape (n_cases, n_channels, n_timepoints) or a list of 2D
+        numpy arrays of shape (n_channels, n_timepoints_i). Unequal length series are
+        zero padded, windows past the end of a series are ignored.
+    max_batch_size : int, default=2**20
+        The maximum number of FFT coefficients held for a batch of cases, larger
+        batches are split to limit memory usage.
+
+    References
+    ----------
+    .. [1] Abdullah Mueen, Yan Zhu, Michael Yeh, Kaveh Kamgar, Krishnamurthy
+       Viswanathan, Chetan Kumar Gupta and Eamonn Keogh, "The Fastest Similarity
+       Search Algorithm for Time Series Subsequences under Euclidean Distance", 2022.
+       https://www.cs.unm.edu/~mueen/FastestSimilaritySearch.html
+    """
+
+    def __init__(self, X, max_batch_size=2**20):
+        self.max_batch_size = max_batch_size
+
+        self.n_cases = len(X)
+        self.lengths = np.array([x.shape[1] for x in X])
+        self.max_length = self.lengths.max()
+
+        self.X_pad = np.zeros((self.n_cases, X[0].shape[0], self.max_length))
+        for i, x in enumerate(X):
+            # z-normalised distances do not change with an offset of the series,
+            # centring each channel improves the precision of the sums
+            self.X_pad[i, :, : x.shape[1]] = x - np.mean(x, axis=1, keepdims=True)
+
+        self.n_fft = next_fast_len(int(self.max_length), real=True)
+        self.X_fft = np.fft.rfft(self.X_pad, n=self.n_fft, axis=2)
+
+        self.cumsum = np.zeros(self.X_pad.shape[:2] + (self.max_length + 1,))
+        np.cumsum(self.X_pad, axis=2, out=self.cumsum[:, :, 1:])
+        self.cumsum2 = np.zeros(self.cumsum.shape)
+        np.cumsum(self.X_pad**2, axis=2, out=self.cumsum2[:, :, 1:])
+
+    def distances(self, shapelets, channels, idx=None):
+        """Find the distance between each shapelet and each series.
+
+        The distance is the minimum squared Euclidean distance between a z-normalised
+        shapelet and the z-normalised windows of a series channel, divided by the
+        shapelet length. Windows with a standard deviation below the aeon numba
+        threshold are normalised to all zeros.
+
+        Parameters
+        ----------
+        shapelets : np.ndarray
+            2D array of z-normalised shapelets of shape (n_shapelets, length).
+        channels : np.ndarray
+            The channel of the series each shapelet is compared to.
+        idx : np.ndarray or None, default=None
+            The indices of the cases to find distances for. If None, all cases are
+            used.
+
+        Returns
+        -------
+        distances : np.ndarray
+            2D array of shape (len(idx), n_shapelets).
+        """
+        if idx is None:
+            idx = np.arange(self.n_cases)
+        channels = np.asarray(channels)
+        n_shapelets, length = shapelets.shape
+
+        shapelets_fft = np.conj(np.fft.rfft(shapelets, n=self.n_fft, axis=1))
+        shapelet_sums = np.sum(shapelets, axis=1)
+        shapelet_sums2 = np.sum(shapelets**2, axis=1)
+
+        distances = np.zeros((len(idx), n_shapelets))
+        batch_size = max(1, self.max_batch_size // (n_shapelets * self.X_fft.shape[2]))
+        for start in range(0, len(idx), batch_size):
+            batch = idx[start : start + batch_size]
+
+            # sliding dot products of each shapelet and every window of its channel
+            dots = np.fft.irfft(
+                self.X_fft[np.ix_(batch, channels)] * shapelets_fft,
+                n=self.n_fft,
+                axis=2,
+            )
+
+            _min_profiles(
+                dots,
+                self.X_pad,
+                self.cumsum,
+                self.cumsum2,
+                self.lengths,
+                batch,
+                channels,
+                shapelet_sums,
+                shapelet_sums2,
+                length,
+                distances[start : start + len(batch)],
+            )
+
+        return distances / length
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _min_profiles(
+    dots,
+    X,
+    cumsum,
+    cumsum2,
+    lengths,
+    batch,
+    channels,
+    shapelet_sums,
+    shapelet_sums2,
+    length,
+    out,
+):
+    for i in range(len(batch)):
+        case = batch[i]
+        n_windows = lengths[case] - length + 1
+        for k in range(len(channels)):
+            c = channels[k]
+            min_dist = np.inf
+            for j in range(n_windows):
+                mean = (cumsum[case, c, j + length] - cumsum[case, c, j]) / length
+                var = (
+                    cumsum2[case, c, j + length] - cumsum2[case, c, j]
+                ) / length - mean * mean
+
+                # the rounding error of the sums can hide constant windows, windows
+                # with a variance close to it are recomputed directly
+                if var < 1e-8 * cumsum2[case, c, j + length] / length:
+                    var = np.var(X[case, c, j : j + length])
+
+                if var > AEON_NUMBA_STD_THRESHOLD * AEON_NUMBA_STD_THRESHOLD:
+                    dist = (
+                        shapelet_sums2[k]
+                        + length
+                        - 2 * (dots[i, k, j] - mean * shapelet_sums[k]) / np.sqrt(var)
+                    )
+                else:
+                    dist = shapelet_sums2[k]
+
+                if dist < min_dist:
+                    min_dist = dist
+
+            out[i, k] = max(min_dist, 0)
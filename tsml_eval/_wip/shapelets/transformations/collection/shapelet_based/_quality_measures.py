@@ -150,19 +150,31 @@ def f_stat(class0, class1):
     return F_stat
 
 
-# Kruskal Wallis pre stat uses some methods not compatible with numba
-# The Kruskal Wallis is calculated using 2 functions:
-# one for the pre_stats values such as unique values, ranks, tie_correction, len(class0), len(class1)..this doesnt invoke the njit as it uses some functions that are incompatible with njit
-# another for the actual calculation, compatible with numba, and uses the return values from the pre_stat function
-
+@njit(fastmath=True, cache=True)
 def compute_pre_stats(class0, class1):
+    """Find the ranks and tie correction used by the Kruskal Wallis test.
+
+    Ranks are ordinal, tied values are ranked in the order they appear.
+    """
     combined_array = np.concatenate((class0, class1))
-    ranks = np.argsort(np.argsort(combined_array)) + 1
-    unique, counts = np.unique(combined_array, return_counts=True)
-    tie_correction = 1 - (
-        np.sum(counts**3 - counts) / ((len(combined_array) ** 3) - len(combined_array))
-    )
-    return ranks, tie_correction, len(class0), len(class1), len(combined_array)
+    n = len(combined_array)
+    order = np.argsort(combined_array, kind="mergesort")
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = np.arange(1, n + 1)
+
+    # sum of the cubed tie counts from the runs of equal values
+    tie_sum = 0.0
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and combined_array[order[j]] == combined_array[order[i]]:
+            j += 1
+        count = j - i
+        tie_sum += count**3 - count
+        i = j
+
+    tie_correction = 1 - tie_sum / (n**3 - n)
+    return ranks, tie_correction, len(class0), len(class1), n
 
 
 @njit(fastmath=True, cache=True)
@@ -262,17 +274,241 @@ def wasserstein_distance_empirical(dist1, dist2):
 
 @njit(fastmath=True, cache=True)
 def kolmogorov_test(distance1, distance2):
+    """Find the two sample Kolmogorov Smirnov statistic.
 
-    # Combine and sort the data
+    The empirical distribution functions are compared at every value of the
+    combined samples with a single pass over the sorted samples.
+    """
+    sorted1 = np.sort(distance1)
+    sorted2 = np.sort(distance2)
     all_data = np.sort(np.concatenate((distance1, distance2)))
     n1 = len(distance1)
     n2 = len(distance2)
 
-    # Compute EDFs
-    edf1 = np.array([np.sum(distance1 <= x) / n1 for x in all_data])
-    edf2 = np.array([np.sum(distance2 <= x) / n2 for x in all_data])
-
-    # Calculate KS Statistic
-    ks_statistic = np.max(np.abs(edf1 - edf2))
+    ks_statistic = 0.0
+    c1 = 0
+    c2 = 0
+    for x in all_data:
+        while c1 < n1 and sorted1[c1] <= x:
+            c1 += 1
+        while c2 < n2 and sorted2[c2] <= x:
+            c2 += 1
+        ks_statistic = max(ks_statistic, abs(c1 / n1 - c2 / n2))
 
     return ks_statistic
+
+
+@njit(fastmath=True, cache=True)
+def _split_classes(distances, y, inst_idx):
+    """Split the distances of a shapelet into its own class and the other classes.
+
+    The case the shapelet was extracted from is left out.
+    """
+    n1 = 0
+    for i in range(len(y)):
+        if y[i] == y[inst_idx]:
+            n1 += 1
+
+    class0 = np.empty(n1 - 1)
+    class1 = np.empty(len(y) - n1)
+    c0 = 0
+    c1 = 0
+    for i in range(len(y)):
+        if i == inst_idx:
+            continue
+        elif y[i] == y[inst_idx]:
+            class0[c0] = distances[i]
+            c0 += 1
+        else:
+            class1[c1] = distances[i]
+            c1 += 1
+
+    return class0, class1
+
+
+@njit(fastmath=True, cache=True)
+def _binary_entropy(c1, c2):
+    ent = 0
+    if c1 != 0:
+        ent -= c1 / (c1 + c2) * np.log2(c1 / (c1 + c2))
+    if c2 != 0:
+        ent -= c2 / (c1 + c2) * np.log2(c2 / (c1 + c2))
+    return ent
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def information_gain_batch(distances, y, inst_idx, worst_quality):
+    """Find the binary information gain for a batch of shapelets.
+
+    The orderline of each shapelet is sorted once, with the case the shapelet was
+    extracted from at a distance of 0. Cases with the same distance are ordered with
+    the other classes first.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        2D array of shape (n_shapelets, n_cases), the distance between each shapelet
+        and each case.
+    y : np.ndarray
+        Integer class labels of the cases.
+    inst_idx : np.ndarray
+        The case each shapelet was extracted from.
+    worst_quality : np.ndarray
+        The quality a shapelet must be above to be kept, -1 for no limit. Shapelets at
+        or below it are given a quality of -1.
+
+    Returns
+    -------
+    quality : np.ndarray
+        The quality of each shapelet.
+    """
+    n_cases = len(y)
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        row = distances[k].copy()
+        row[inst_idx[k]] = 0
+        this_cls = y == y[inst_idx[k]]
+        c1 = np.sum(this_cls)
+        c2 = n_cases - c1
+        initial_ent = _binary_entropy(c1, c2)
+
+        order = np.argsort(row, kind="mergesort")
+        bsf_ig = 0.0
+        c1_count = 0
+        c2_count = 0
+        i = 0
+        while i < n_cases:
+            j = i + 1
+            while j < n_cases and row[order[j]] == row[order[i]]:
+                j += 1
+            run_c1 = 0
+            for n in range(i, j):
+                if this_cls[order[n]]:
+                    run_c1 += 1
+
+            # evaluate each split point in the run, other classes first
+            for n in range(j - i):
+                if n < j - i - run_c1:
+                    c2_count += 1
+                else:
+                    c1_count += 1
+
+                left_prop = (c1_count + c2_count) / n_cases
+                ig = (
+                    initial_ent
+                    - left_prop * _binary_entropy(c1_count, c2_count)
+                    - (1 - left_prop) * _binary_entropy(c1 - c1_count, c2 - c2_count)
+                )
+                bsf_ig = max(ig, bsf_ig)
+            i = j
+
+        if 0 < worst_quality[k] and bsf_ig <= worst_quality[k]:
+            quality[k] = -1
+        else:
+            quality[k] = bsf_ig
+
+    return quality
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def f_stat_batch(distances, y, inst_idx):
+    """Find the F-statistic for a batch of shapelets.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        2D array of shape (n_shapelets, n_cases), the distance between each shapelet
+        and each case.
+    y : np.ndarray
+        Integer class labels of the cases.
+    inst_idx : np.ndarray
+        The case each shapelet was extracted from, left out of its class.
+
+    Returns
+    -------
+    quality : np.ndarray
+        The quality of each shapelet.
+    """
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        class0, class1 = _split_classes(distances[k], y, inst_idx[k])
+        quality[k] = f_stat(class0, class1)
+    return quality
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def moods_median_batch(distances, y, inst_idx):
+    """Find the Mood's median statistic for a batch of shapelets.
+
+    See ``f_stat_batch`` for the parameters.
+    """
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        class0, class1 = _split_classes(distances[k], y, inst_idx[k])
+        quality[k] = _moods_median(class0, class1)
+    return quality
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def kruskal_wallis_batch(distances, y, inst_idx):
+    """Find the Kruskal Wallis statistic for a batch of shapelets.
+
+    See ``f_stat_batch`` for the parameters.
+    """
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        class0, class1 = _split_classes(distances[k], y, inst_idx[k])
+        ranks, tie_correction, n1, n2, n = compute_pre_stats(class0, class1)
+        quality[k] = kruskal_wallis_test(ranks, n1, n2, n, tie_correction)
+    return quality
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def wasserstein_gaussian_batch(distances, y, inst_idx):
+    """Find the Wasserstein distance of fitted Gaussians for a batch of shapelets.
+
+    The distances of each class are univariate, the distance between the fitted
+    Gaussians is found from the means and standard deviations directly. Shapelets
+    with fewer than 2 cases in a class are given a quality of -1.
+
+    See ``f_stat_batch`` for the parameters.
+    """
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        class0, class1 = _split_classes(distances[k], y, inst_idx[k])
+        if len(class0) < 2 or len(class1) < 2:
+            quality[k] = -1
+            continue
+
+        mu0 = np.mean(class0)
+        mu1 = np.mean(class1)
+        std0 = np.sqrt(np.sum((class0 - mu0) ** 2) / (len(class0) - 1))
+        std1 = np.sqrt(np.sum((class1 - mu1) ** 2) / (len(class1) - 1))
+        quality[k] = np.sqrt((mu0 - mu1) ** 2 + (std0 - std1) ** 2)
+    return quality
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def wasserstein_empirical_batch(distances, y, inst_idx):
+    """Find the empirical Wasserstein distance for a batch of shapelets.
+
+    See ``f_stat_batch`` for the parameters.
+    """
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        class0, class1 = _split_classes(distances[k], y, inst_idx[k])
+        quality[k] = wasserstein_distance_empirical(class0, class1)
+    return quality
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def kolmogorov_batch(distances, y, inst_idx):
+    """Find the Kolmogorov Smirnov statistic for a batch of shapelets.
+
+    See ``f_stat_batch`` for the parameters.
+    """
+    quality = np.empty(len(inst_idx))
+    for k in range(len(inst_idx)):
+        class0, class1 = _split_classes(distances[k], y, inst_idx[k])
+        quality[k] = kolmogorov_test(class0, class1)
+    return quality
@@ -9,10 +9,8 @@ This is the development version
 __all__ = ["RandomShapeletTransform"]
 
 import heapq
-import math
 import time
-import os
-import sys
+
 import numpy as np
 from joblib import Parallel, delayed
 from numba import njit
@@ -21,16 +19,15 @@ from sklearn import preprocessing
 from sklearn.utils._random import check_random_state
 
 from aeon.transformations.collection.base import BaseCollectionTransformer
-from aeon.utils.numba.general import AEON_NUMBA_STD_THRESHOLD, z_normalise_series
+from aeon.utils.numba.general import z_normalise_series
 from aeon.utils.validation import check_n_jobs
 
-
-# from tsml_eval._wip.transformations.collection.shapelet_based import (
-#     _quality_measures as qm,
-# )
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__)))
-sys.path.append(parent_dir)
-import tsml_eval._wip.transformations.collection.shapelet_based._quality_measures as qm
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based import (
+    _quality_measures as qm,
+)
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based._distance_profiles import (  # noqa: E501
+    DistanceProfileCache,
+)
 
 
 class RandomShapeletTransform(BaseCollectionTransformer):
@@ -139,7 +136,7 @@ class RandomShapeletTransform(BaseCollectionTransformer):
     ...     RandomShapeletTransform
     ... )
     >>> from aeon.datasets import load_unit_test
-    >>> X_train, y_train = load_unit_test(split="train", return_X_y=True)
+    >>> X_train, y_train = load_unit_test(split="train")
     >>> t = RandomShapeletTransform(
     ...     n_shapelet_samples=500,
     ...     max_shapelets=10,
@@ -205,7 +202,6 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         self._batch_size = batch_size
         self._class_counts = []
         self._class_dictionary = {}
-        self._sorted_indicies = []
 
         super().__init__()
 
@@ -264,23 +260,23 @@ class RandomShapeletTransform(BaseCollectionTransformer):
 
         rng = check_random_state(self.random_state)
 
+        # series FFTs and window statistics shared by all candidate distances
+        distance_cache = DistanceProfileCache(X)
+
         if time_limit > 0:
             while (
                 fit_time < time_limit
                 and n_shapelets_extracted < self.contract_max_n_shapelet_samples
             ):
-                candidate_shapelets = Parallel(
-                    n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-                )(
-                    delayed(self._extract_random_shapelet)(
-                        X,
-                        y,
-                        n_shapelets_extracted + i,
-                        shapelets,
-                        max_shapelets_per_class,
-                        check_random_state(rng.randint(np.iinfo(np.int32).max)),
-                    )
-                    for i in range(self._batch_size)
+                candidate_shapelets = self._extract_random_shapelets(
+                    X,
+                    y,
+                    n_shapelets_extracted,
+                    self._batch_size,
+                    shapelets,
+                    max_shapelets_per_class,
+                    rng,
+                    distance_cache,
                 )
 
                 for i, heap in enumerate(shapelets):
@@ -307,18 +303,15 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                     else self.n_shapelet_samples - n_shapelets_extracted
                 )
 
-                candidate_shapelets = Parallel(
-                    n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-                )(
-                    delayed(self._extract_random_shapelet)(
-                        X,
-                        y,
-                        n_shapelets_extracted + i,
-                        shapelets,
-                        max_shapelets_per_class,
-                        check_random_state(rng.randint(np.iinfo(np.int32).max)),
-                    )
-                    for i in range(n_shapelets_to_extract)
+                candidate_shapelets = self._extract_random_shapelets(
+                    X,
+                    y,
+                    n_shapelets_extracted,
+                    n_shapelets_to_extract,
+                    shapelets,
+                    max_shapelets_per_class,
+                    rng,
+                    distance_cache,
                 )
 
                 for i, heap in enumerate(shapelets):
@@ -355,14 +348,6 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         to_keep = self._remove_identical_shapelets(List(self.shapelets))
         self.shapelets = [n for (n, b) in zip(self.shapelets, to_keep) if b]
 
-        self._sorted_indicies = []
-        for s in self.shapelets:
-            sabs = np.abs(s[6])
-            self._sorted_indicies.append(
-                np.array(
-                    sorted(range(s[1]), reverse=True, key=lambda j, sabs=sabs: sabs[j])
-                )
-            )
         # find max shapelet length
         self.max_shapelet_length_ = max(self.shapelets, key=lambda x: x[1])[1]
 
@@ -389,21 +374,22 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                     "calling transform."
                 )
 
-        for i, series in enumerate(X):
-            dists = Parallel(
-                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-            )(
-                delayed(_online_shapelet_distance)(
-                    series[shapelet[3]],
-                    shapelet[6],
-                    self._sorted_indicies[n],
-                    shapelet[2],
-                    shapelet[1],
-                )
-                for n, shapelet in enumerate(self.shapelets)
+        distance_cache = DistanceProfileCache(X)
+
+        # shapelets of the same length are compared to all cases in a single batch
+        lengths = np.array([s[1] for s in self.shapelets])
+        groups = [np.flatnonzero(lengths == length) for length in np.unique(lengths)]
+        dists = Parallel(
+            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(distance_cache.distances)(
+                np.array([self.shapelets[n][6] for n in group]),
+                np.array([self.shapelets[n][3] for n in group]),
             )
-
-            output[i] = dists
+            for group in groups
+        )
+        for group, group_dists in zip(groups, dists):
+            output[:, group] = group_dists
 
         return output
 
@@ -430,434 +416,94 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         else:
             return {"max_shapelets": 5, "n_shapelet_samples": 50, "batch_size": 20}
 
-    def _extract_random_shapelet(
-        self, X, y, i, shapelets, max_shapelets_per_class, rng
+    def _extract_random_shapelets(
+        self,
+        X,
+        y,
+        start,
+        n_candidates,
+        shapelets,
+        max_shapelets_per_class,
+        rng,
+        distance_cache,
     ):
-        inst_idx = i % self.n_cases_
-        cls_idx = int(y[inst_idx])
-        worst_quality = (
-            shapelets[cls_idx][0][0]
-            if len(shapelets[cls_idx]) == max_shapelets_per_class
-            else -1
-        )
-
-        length = (
-            rng.randint(0, self._max_shapelet_length - self.min_shapelet_length)
-            + self.min_shapelet_length
+        inst_idx = (start + np.arange(n_candidates)) % self.n_cases_
+        lengths = np.zeros(n_candidates, dtype=np.int64)
+        positions = np.zeros(n_candidates, dtype=np.int64)
+        channels = np.zeros(n_candidates, dtype=np.int64)
+        for i in range(n_candidates):
+            candidate_rng = check_random_state(rng.randint(np.iinfo(np.int32).max))
+            lengths[i] = (
+                candidate_rng.randint(
+                    0, self._max_shapelet_length - self.min_shapelet_length
+                )
+                + self.min_shapelet_length
+            )
+            positions[i] = candidate_rng.randint(0, self.min_n_timepoints_ - lengths[i])
+            channels[i] = candidate_rng.randint(0, self.n_channels_)
+
+        # candidates of the same length are compared to all cases in a single batch
+        groups = [np.flatnonzero(lengths == length) for length in np.unique(lengths)]
+        dists = Parallel(
+            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(distance_cache.distances)(
+                np.array(
+                    [
+                        z_normalise_series(
+                            X[inst_idx[n]][channels[n]][
+                                positions[n] : positions[n] + lengths[n]
+                            ]
+                        )
+                        for n in group
+                    ]
+                ),
+                channels[group],
+            )
+            for group in groups
         )
-        position = rng.randint(0, self.min_n_timepoints_ - length)
-        channel = rng.randint(0, self.n_channels_)
+        distances = np.zeros((n_candidates, self.n_cases_))
+        for group, group_dists in zip(groups, dists):
+            distances[group] = group_dists.T
 
-        shapelet = z_normalise_series(
-            X[inst_idx][channel][position : position + length]
-        )
-        sabs = np.abs(shapelet)
-        sorted_indicies = np.array(
-            sorted(range(length), reverse=True, key=lambda j: sabs[j])
-        )
         if self.shapelet_quality == "INFO_GAIN":
-            quality = self._info_gain_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
+            worst_quality = np.array(
+                [
+                    heap[0][0] if len(heap) == max_shapelets_per_class else -1
+                    for heap in shapelets
+                ]
             )
-
-        elif self.shapelet_quality == "F_STAT":
-            quality = self._f_stat_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
+            quality = qm.information_gain_batch(
+                distances, y, inst_idx, worst_quality[y[inst_idx]]
             )
-
+        elif self.shapelet_quality == "F_STAT":
+            quality = qm.f_stat_batch(distances, y, inst_idx)
         elif self.shapelet_quality == "Kruskal_Wallis":
-            distances1 = np.zeros(self._class_counts[cls_idx] - 1)
-            distances2 = np.zeros(self.n_cases_ - self._class_counts[cls_idx])
-            c1 = 0
-            c2 = 0
-            for j, series in enumerate(X):
-                if j != inst_idx:
-                    distance = _online_shapelet_distance(
-                        series[channel], shapelet, sorted_indicies, position, length
-                    )
-                    if y[j] == y[inst_idx]:
-                        if c1 < len(distances1):  # Protect against overflow
-                            distances1[c1] = distance
-                            c1 += 1
-                    else:
-                        if c2 < len(distances2):  # Protect against overflow
-                            distances2[c2] = distance
-                            c2 += 1
-
-            ranks, tie_correction, n1, n2, n = qm.compute_pre_stats(
-                distances1, distances2
-            )
-
-            quality = self._kruskal_wallis_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
-                ranks,
-                tie_correction,
-                n1,
-                n2,
-                n,
-            )
-
+            quality = qm.kruskal_wallis_batch(distances, y, inst_idx)
         elif self.shapelet_quality == "Wasser_emp":
-            quality = self._wasser_emp_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
-            )
+            quality = qm.wasserstein_empirical_batch(distances, y, inst_idx)
         elif self.shapelet_quality == "Kolmogorov":
-            quality = self._kolmogorov_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
-            )
+            quality = qm.kolmogorov_batch(distances, y, inst_idx)
         elif self.shapelet_quality == "Moods_Median":
-            quality = self._moods_median_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
-            )
-
+            quality = qm.moods_median_batch(distances, y, inst_idx)
         elif self.shapelet_quality == "Wasser1":
-
-            distances1 = np.zeros(self._class_counts[cls_idx] - 1)
-            distances2 = np.zeros(self.n_cases_ - self._class_counts[cls_idx])
-            c1 = 0
-            c2 = 0
-            for j, series in enumerate(X):
-                if j != inst_idx:
-                    distance = _online_shapelet_distance(
-                        series[channel], shapelet, sorted_indicies, position, length
-                    )
-                    if y[j] == y[inst_idx]:
-                        if c1 < len(distances1):  # Protect against overflow
-                            distances1[c1] = distance
-                            c1 += 1
-                    else:
-                        if c2 < len(distances2):  # Protect against overflow
-                            distances2[c2] = distance
-                            c2 += 1
-
-            mu1, Sigma1 = qm.estimate_parameters(distances1)
-            mu2, Sigma2 = qm.estimate_parameters(distances2)
-
-            quality = self._wasserstein_shapelet_quality(
-                X,
-                y,
-                shapelet,
-                sorted_indicies,
-                position,
-                length,
-                channel,
-                inst_idx,
-                self._class_counts[cls_idx],
-                self.n_cases_ - self._class_counts[cls_idx],
-                worst_quality,
-                mu1,
-                Sigma1,
-                mu2,
-                Sigma2,
-            )
-
+            quality = qm.wasserstein_gaussian_batch(distances, y, inst_idx)
         else:
             raise ValueError("Unknown shapelet quality measure")
+        quality = np.round(quality, 8)
 
-        return np.round(quality, 8), length, position, channel, inst_idx, cls_idx
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _info_gain_shapelet_quality(
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-    ):
-        # This is slow and could be optimised, we spend 99% of time here
-        orderline = []
-        this_cls_traversed = 0
-        other_cls_traversed = 0
-
-        for i, series in enumerate(X):
-            if i != inst_idx:
-                distance = _online_shapelet_distance(
-                    series[dim], shapelet, sorted_indicies, position, length
-                )
-            else:
-                distance = 0
-
-            if y[i] == y[inst_idx]:
-                cls = 1
-                this_cls_traversed += 1
-            else:
-                cls = -1
-                other_cls_traversed += 1
-
-            orderline.append((distance, cls))
-            orderline.sort()
-            if worst_quality > 0:
-                quality = _calc_early_binary_ig(
-                    orderline,
-                    this_cls_traversed,
-                    other_cls_traversed,
-                    this_cls_count - this_cls_traversed,
-                    other_cls_count - other_cls_traversed,
-                    worst_quality,
-                )
-
-                if quality <= worst_quality:
-                    return -1
-
-        quality = _calc_binary_ig(orderline, this_cls_count, other_cls_count)
-
-        return round(quality, 12)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _f_stat_shapelet_quality(
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-    ):
-        distances1 = np.zeros(this_cls_count - 1)
-        distances2 = np.zeros(other_cls_count)
-        c1 = 0
-        c2 = 0
-        for i, series in enumerate(X):
-            if i != inst_idx:
-                distance = _online_shapelet_distance(
-                    series[dim], shapelet, sorted_indicies, position, length
-                )
-                if y[i] == y[inst_idx]:
-                    distances1[c1] = distance
-                    c1 = c1 + 1
-                else:
-                    distances2[c2] = distance
-                    c2 = c2 + 1
-
-        quality = qm.f_stat(distances1, distances2)
-
-        return round(quality, 12)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _moods_median_shapelet_quality(
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-    ):
-        distances1 = np.zeros(this_cls_count - 1)
-        distances2 = np.zeros(other_cls_count)
-        c1 = 0
-        c2 = 0
-        for i, series in enumerate(X):
-            if i != inst_idx:
-                distance = _online_shapelet_distance(
-                    series[dim], shapelet, sorted_indicies, position, length
-                )
-                if y[i] == y[inst_idx]:
-                    distances1[c1] = distance
-                    c1 += 1
-                else:
-                    distances2[c2] = distance
-                    c2 += 1
-
-        quality = qm._moods_median(distances1, distances2)
-
-        return round(quality, 12)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _kruskal_wallis_shapelet_quality(
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-        ranks,
-        tie_correction,
-        n1,
-        n2,
-        n,
-    ):
-
-        quality = qm.kruskal_wallis_test(ranks, n1, n2, n, tie_correction)
-
-        return round(quality, 12)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _wasserstein_shapelet_quality(
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-        mu1,
-        Sigma1,
-        mu2,
-        Sigma2,
-    ):
-
-        mu1 = np.array([mu1])  # Make sure it's an array if it's not
-        mu2 = np.array([mu2])
-        quality = qm.wasserstein_distance_gaussian(mu1, Sigma1, mu2, Sigma2)
-
-        return round(quality, 12)
-
-    def _wasser_emp_shapelet_quality(
-        self,
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-    ):
-        distances1 = np.zeros(this_cls_count - 1)
-        distances2 = np.zeros(other_cls_count)
-        c1 = 0
-        c2 = 0
-        for i, series in enumerate(X):
-            if i != inst_idx:
-                distance = _online_shapelet_distance(
-                    series[dim], shapelet, sorted_indicies, position, length
-                )
-                if y[i] == y[inst_idx]:
-                    distances1[c1] = distance
-                    c1 = c1 + 1
-                else:
-                    distances2[c2] = distance
-                    c2 = c2 + 1
-
-        quality = qm.wasserstein_distance_empirical(distances1, distances2)
-
-        return round(quality, 12)
-
-    def _kolmogorov_shapelet_quality(
-        self,
-        X,
-        y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
-        inst_idx,
-        this_cls_count,
-        other_cls_count,
-        worst_quality,
-    ):
-        distances1 = np.zeros(this_cls_count - 1)
-        distances2 = np.zeros(other_cls_count)
-        c1 = 0
-        c2 = 0
-        for i, series in enumerate(X):
-            if i != inst_idx:
-                distance = _online_shapelet_distance(
-                    series[dim], shapelet, sorted_indicies, position, length
-                )
-                if y[i] == y[inst_idx]:
-                    distances1[c1] = distance
-                    c1 = c1 + 1
-                else:
-                    distances2[c2] = distance
-                    c2 = c2 + 1
-
-        quality = qm.kolmogorov_test(distances1, distances2)
-
-        return round(quality, 12)
+        # shapelet list content: quality, length, position, channel, inst_idx, cls_idx
+        return [
+            (
+                quality[i],
+                int(lengths[i]),
+                int(positions[i]),
+                int(channels[i]),
+                int(inst_idx[i]),
+                int(y[inst_idx[i]]),
+            )
+            for i in range(n_candidates)
+        ]
 
     @staticmethod
     @njit(fastmath=True, cache=True)
@@ -919,177 +565,6 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         return to_keep
 
 
-@njit(fastmath=True, cache=True)
-def _online_shapelet_distance(series, shapelet, sorted_indicies, position, length):
-    subseq = series[position : position + length]
-
-    sum = 0.0
-    sum2 = 0.0
-    for i in subseq:
-        sum += i
-        sum2 += i * i
-
-    mean = sum / length
-    std = math.sqrt((sum2 - mean * mean * length) / length)
-    if std > AEON_NUMBA_STD_THRESHOLD:
-        subseq = (subseq - mean) / std
-    else:
-        subseq = np.zeros(length)
-
-    best_dist = 0
-    for i, n in zip(shapelet, subseq):
-        temp = i - n
-        best_dist += temp * temp
-
-    i = 1
-    traverse = [True, True]
-    sums = [sum, sum]
-    sums2 = [sum2, sum2]
-
-    while traverse[0] or traverse[1]:
-        for n in range(2):
-            mod = -1 if n == 0 else 1
-            pos = position + mod * i
-            traverse[n] = pos >= 0 if n == 0 else pos <= len(series) - length
-
-            if not traverse[n]:
-                continue
-
-            start = series[pos - n]
-            end = series[pos - n + length]
-
-            sums[n] += mod * end - mod * start
-            sums2[n] += mod * end * end - mod * start * start
-
-            mean = sums[n] / length
-            std = math.sqrt((sums2[n] - mean * mean * length) / length)
-
-            dist = 0
-            use_std = std > AEON_NUMBA_STD_THRESHOLD
-            for j in range(length):
-                val = (series[pos + sorted_indicies[j]] - mean) / std if use_std else 0
-                temp = shapelet[sorted_indicies[j]] - val
-                dist += temp * temp
-
-                if dist > best_dist:
-                    break
-
-            if dist < best_dist:
-                best_dist = dist
-
-        i += 1
-
-    return best_dist if best_dist == 0 else 1 / length * best_dist
-
-
-@njit(fastmath=True, cache=True)
-def _calc_early_binary_ig(
-    orderline,
-    c1_traversed,
-    c2_traversed,
-    c1_to_add,
-    c2_to_add,
-    worst_quality,
-):
-    initial_ent = _binary_entropy(
-        c1_traversed + c1_to_add,
-        c2_traversed + c2_to_add,
-    )
-
-    total_all = c1_traversed + c2_traversed + c1_to_add + c2_to_add
-
-    bsf_ig = 0
-    # actual observations in orderline
-    c1_count = 0
-    c2_count = 0
-
-    # evaluate each split point
-    for split in range(len(orderline)):
-        next_class = orderline[split][1]  # +1 if this class, -1 if other
-        if next_class > 0:
-            c1_count += 1
-        else:
-            c2_count += 1
-
-        # optimistically add this class to left side first and other to right
-        left_prop = (split + 1 + c1_to_add) / total_all
-        ent_left = _binary_entropy(c1_count + c1_to_add, c2_count)
-
-        # because right side must optimistically contain everything else
-        right_prop = 1 - left_prop
-
-        ent_right = _binary_entropy(
-            c1_traversed - c1_count,
-            c2_traversed - c2_count + c2_to_add,
-        )
-
-        ig = initial_ent - left_prop * ent_left - right_prop * ent_right
-        bsf_ig = max(ig, bsf_ig)
-
-        # now optimistically add this class to right, other to left
-        left_prop = (split + 1 + c2_to_add) / total_all
-        ent_left = _binary_entropy(c1_count, c2_count + c2_to_add)
-
-        # because right side must optimistically contain everything else
-        right_prop = 1 - left_prop
-
-        ent_right = _binary_entropy(
-            c1_traversed - c1_count + c1_to_add,
-            c2_traversed - c2_count,
-        )
-
-        ig = initial_ent - left_prop * ent_left - right_prop * ent_right
-        bsf_ig = max(ig, bsf_ig)
-
-        if bsf_ig > worst_quality:
-            return bsf_ig
-
-    return bsf_ig
-
-
-@njit(fastmath=True, cache=True)
-def _calc_binary_ig(orderline, c1, c2):
-    initial_ent = _binary_entropy(c1, c2)
-
-    total_all = c1 + c2
-
-    bsf_ig = 0
-    c1_count = 0
-    c2_count = 0
-
-    # evaluate each split point
-    for split in range(len(orderline)):
-        next_class = orderline[split][1]  # +1 if this class, -1 if other
-        if next_class > 0:
-            c1_count += 1
-        else:
-            c2_count += 1
-
-        left_prop = (split + 1) / total_all
-        ent_left = _binary_entropy(c1_count, c2_count)
-
-        right_prop = 1 - left_prop
-        ent_right = _binary_entropy(
-            c1 - c1_count,
-            c2 - c2_count,
-        )
-
-        ig = initial_ent - left_prop * ent_left - right_prop * ent_right
-        bsf_ig = max(ig, bsf_ig)
-
-    return bsf_ig
-
-
-@njit(fastmath=True, cache=True)
-def _binary_entropy(c1, c2):
-    ent = 0
-    if c1 != 0:
-        ent -= c1 / (c1 + c2) * np.log2(c1 / (c1 + c2))
-    if c2 != 0:
-        ent -= c2 / (c1 + c2) * np.log2(c2 / (c1 + c2))
-    return ent
-
-
 @njit(fastmath=True, cache=True)
 def _is_self_similar(s1, s2):
     # not self similar if from different series or dimension
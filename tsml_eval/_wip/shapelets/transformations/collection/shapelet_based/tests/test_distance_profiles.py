@@ -0,0 +1,50 @@
+"""Tests for the FFT shapelet distance profiles."""
+
+import numpy as np
+import pytest
+from aeon.utils.numba.general import z_normalise_series
+
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based._distance_profiles import (  # noqa: E501
+    DistanceProfileCache,
+)
+
+
+def _brute_force_distance(series, shapelet):
+    length = len(shapelet)
+    return (
+        min(
+            np.sum((z_normalise_series(series[j : j + length]) - shapelet) ** 2)
+            for j in range(len(series) - length + 1)
+        )
+        / length
+    )
+
+
+@pytest.mark.parametrize("unequal", [False, True])
+def test_distance_profiles(unequal):
+    """Test the FFT distances against a scan of all windows."""
+    rng = np.random.RandomState(0)
+    if unequal:
+        X = [rng.normal(size=(2, n)).cumsum(axis=1) + 100 for n in [20, 35, 28]]
+    else:
+        X = list(rng.normal(size=(3, 2, 30)).cumsum(axis=2) + 100)
+    # a constant window, normalised to all zeros
+    X[0][1, :10] = 5
+
+    shapelets = np.array([z_normalise_series(X[1][0, 3:11]), np.zeros(8)])
+    channels = np.array([0, 1])
+
+    cache = DistanceProfileCache(X, max_batch_size=100)
+    distances = cache.distances(shapelets, channels)
+
+    expected = np.array(
+        [
+            [_brute_force_distance(x[c], s) for s, c in zip(shapelets, channels)]
+            for x in X
+        ]
+    )
+    np.testing.assert_allclose(distances, expected, atol=1e-8)
+    assert distances[1, 0] < 1e-8
+    np.testing.assert_allclose(
+        cache.distances(shapelets, channels, idx=np.array([2, 0])), expected[[2, 0]]
+    )
@@ -1,16 +1,7 @@
 """Tests for quality measures. Work out some test examples and check code generates
 them here."""
 
-import sys
-import os
-
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.append(parent_dir)
-
-
-# sys.path.append("tsml_eval/_wip/transformations/collection/shapelet_based")
-
-from tsml_eval._wip.transformations.collection.shapelet_based import (
+from tsml_eval._wip.shapelets.transformations.collection.shapelet_based import (
     _quality_measures as qm,
 )
 
@@ -27,13 +18,11 @@ f_statistic = qm.f_stat(class0, class1)
 print(f"F-statistic: {f_statistic}")
 
 
-
 # Testing Mood's Median
 chi_statistic = qm._moods_median(class0, class1)
 print(f"Mood's Median chi-square statistic: {chi_statistic}")
 
 
-
 # Kruskal Wallis
 
 
@@ -80,3 +69,69 @@ print("Wasserstein Distance for Empirical Distributions:", emp_wd)
 
 ks = qm.kolmogorov_test(data1_, data2_)
 print("Kolmogorov Smirnov for Empirical Distributions:", ks)
+
+
+def test_batch_quality_measures():
+    """Test the batch quality measures against the single shapelet functions."""
+    rng = np.random.RandomState(0)
+    distances = rng.random_sample((10, 12))
+    distances[:, :4] = np.round(distances[:, :4], 1)
+    y = np.array([0, 1, 2] * 4)
+    inst_idx = rng.randint(0, 12, size=10)
+
+    measures = [
+        (qm.f_stat_batch, qm.f_stat),
+        (qm.moods_median_batch, qm._moods_median),
+        (qm.wasserstein_empirical_batch, qm.wasserstein_distance_empirical),
+        (qm.kolmogorov_batch, qm.kolmogorov_test),
+    ]
+    for batch_function, function in measures:
+        quality = batch_function(distances, y, inst_idx)
+        for k in range(10):
+            same_class = y == y[inst_idx[k]]
+            same_class[inst_idx[k]] = False
+            expected = function(
+                distances[k][same_class], distances[k][y != y[inst_idx[k]]]
+            )
+            np.testing.assert_almost_equal(quality[k], expected)
+
+    quality = qm.kruskal_wallis_batch(distances, y, inst_idx)
+    for k in range(10):
+        same_class = y == y[inst_idx[k]]
+        same_class[inst_idx[k]] = False
+        ranks, tie_correction, n1, n2, n = qm.compute_pre_stats(
+            distances[k][same_class], distances[k][y != y[inst_idx[k]]]
+        )
+        np.testing.assert_almost_equal(
+            quality[k], qm.kruskal_wallis_test(ranks, n1, n2, n, tie_correction)
+        )
+
+    quality = qm.wasserstein_gaussian_batch(distances, y, inst_idx)
+    for k in range(10):
+        same_class = y == y[inst_idx[k]]
+        same_class[inst_idx[k]] = False
+        mu1, Sigma1 = qm.estimate_parameters(distances[k][same_class])
+        mu2, Sigma2 = qm.estimate_parameters(distances[k][y != y[inst_idx[k]]])
+        np.testing.assert_almost_equal(
+            quality[k],
+            qm.wasserstein_distance_gaussian(
+                np.array([mu1]), Sigma1, np.array([mu2]), Sigma2
+            ),
+        )
+
+    quality = qm.information_gain_batch(distances, y, inst_idx, np.full(10, -1.0))
+    for k in range(10):
+        row = distances[k].copy()
+        row[inst_idx[k]] = 0
+        cls = np.where(y == y[inst_idx[k]], 1, -1)
+        orderline = sorted(zip(row, cls))
+        np.testing.assert_almost_equal(
+            quality[k],
+            qm.binary_information_gain(orderline, np.sum(cls > 0), np.sum(cls < 0)),
+        )
+
+    # shapelets at or below the worst quality are discarded
+    worst_quality = np.where(np.arange(10) < 5, quality - 1e-9, quality)
+    quality2 = qm.information_gain_batch(distances, y, inst_idx, worst_quality)
+    np.testing.assert_almost_equal(quality2[:5], quality[:5])
+    assert np.all(quality2[5:] == -1)
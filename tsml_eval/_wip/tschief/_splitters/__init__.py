@@ -3,11 +3,15 @@ __all__ = [
     "generate_boss_transforms",
     "IntervalSplitter",
     "DistanceSplitter",
+    "DistanceCache",
 ]
 
 from tsml_eval._wip.tschief._splitters.dictionary_splitter import (
     DictionarySplitter,
     generate_boss_transforms,
 )
-from tsml_eval._wip.tschief._splitters.distance_splitter import DistanceSplitter
+from tsml_eval._wip.tschief._splitters.distance_splitter import (
+    DistanceCache,
+    DistanceSplitter,
+)
 from tsml_eval._wip.tschief._splitters.interval_splitter import IntervalSplitter
@@ -1,8 +1,8 @@
 from itertools import product
 
 import numpy as np
+from scipy.sparse import csr_matrix
 from sklearn.utils.validation import check_random_state
-from aeon.classification.dictionary_based._boss import boss_distance
 from aeon.transformations.collection.dictionary_based import SFAFast
 
 
@@ -10,8 +10,11 @@ class DictionarySplitter:
     """BOSS-based splitter for TS-CHIEF implementation."""
 
     @staticmethod
-    def generate(X_boss, y, sfas, random_state=None):
-        """Generate a randomized dictionary splitter candidate."""
+    def generate(X_boss, y, idx, sfas, random_state=None):
+        """Generate a randomized dictionary splitter candidate.
+
+        ``idx`` is the index of the node cases in ``X_boss`` and ``y`` their labels.
+        """
         dims, num_transforms = X_boss.shape
         rng = check_random_state(random_state)
 
@@ -20,45 +23,44 @@ class DictionarySplitter:
         splitter.transform_idx = rng.randint(num_transforms)
         splitter.sfa = sfas[splitter.dim, splitter.transform_idx]
 
-        splitter.exemplars = []
+        exemplar_idx = []
         classes = np.unique(y)
         for c in classes:
             group = np.argwhere(y == c).ravel()
-            exemplar_idx = rng.choice(group)
-            splitter.exemplars.append(
-                X_boss[splitter.dim, splitter.transform_idx][exemplar_idx, :]
-            )
+            exemplar_idx.append(idx[rng.choice(group)])
+        splitter.exemplars = X_boss[splitter.dim, splitter.transform_idx][exemplar_idx]
 
         return splitter
 
-    def split_train(self, X_boss):
-        """Split the training data without needlessly SFAing again."""
-        X_boss = X_boss[self.dim, self.transform_idx]
-        samples, _ = X_boss.shape
-
-        split_idx = np.empty(samples, dtype=int)
-        for i in range(samples):
-            distances = [
-                boss_distance(X_boss[i, :], exemplar, 0) for exemplar in self.exemplars
-            ]
-            split_idx[i] = np.argmin(distances)
-
-        return split_idx
-
-    def split(self, X):
-        """Split incoming data."""
-        X = X[:, [self.dim], :]
-        X_boss = self.sfa.transform(X)
-        samples, _ = X_boss.shape
-
-        split_idx = np.empty(samples, dtype=int)
-        for i in range(samples):
-            distances = [
-                boss_distance(X_boss[i, :], exemplar, 0) for exemplar in self.exemplars
-            ]
-            split_idx[i] = np.argmin(distances)
-
-        return split_idx
+    def split_train(self, X_boss, idx):
+        """Split the training cases in idx without needlessly SFAing again."""
+        return _closest_bags(X_boss[self.dim, self.transform_idx][idx], self.exemplars)
+
+    def split(self, X, idx):
+        """Split the incoming cases in idx."""
+        X_boss = self.sfa.transform(X[idx, self.dim][:, np.newaxis, :])
+        return _closest_bags(X_boss, self.exemplars)
+
+
+def _closest_bags(bags, exemplars):
+    """Find the closest exemplar to each bag using the BOSS distance.
+
+    The BOSS distance only counts the words present in the first bag, so the
+    distances from all bags to all exemplars are found with sparse products as
+    ``|x|^2 - 2 x.e + [x > 0].e^2``.
+    """
+    bags = csr_matrix(bags)
+    bags.eliminate_zeros()
+    exemplars = csr_matrix(exemplars)
+
+    present = bags.copy()
+    present.data = np.ones_like(present.data)
+    xx = np.asarray(bags.multiply(bags).sum(axis=1))
+    xe = (bags @ exemplars.T).toarray()
+    ee = (present @ exemplars.multiply(exemplars).T).toarray()
+
+    distances = np.maximum(xx - 2 * xe + ee, 0)
+    return np.argmin(distances, axis=1)
 
 
 def generate_boss_transforms(X, num_transforms_per_dim=1000, random_state=None):
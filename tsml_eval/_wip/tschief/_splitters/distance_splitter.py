@@ -1,18 +1,18 @@
 from math import floor
 
 import numpy as np
+from numba import njit
 from sklearn.utils.validation import check_random_state
 from aeon.distances import (
-    euclidean_pairwise_distance,
-    dtw_pairwise_distance,
-    ddtw_pairwise_distance,
-    wdtw_pairwise_distance,
-    wddtw_pairwise_distance,
-    erp_pairwise_distance,
-    lcss_pairwise_distance,
-    twe_pairwise_distance,
-    msm_pairwise_distance
+    dtw_distance,
+    erp_distance,
+    euclidean_distance,
+    lcss_distance,
+    msm_distance,
+    twe_distance,
+    wdtw_distance,
 )
+from aeon.distances.elastic._ddtw import average_of_slope
 
 DISTANCE_CANDIDATES = [
     "euclidean",
@@ -28,22 +28,73 @@ DISTANCE_CANDIDATES = [
     "msm",
 ]
 
+# the base distance id and whether it is applied to the derivative series
+_METRIC_IDS = {
+    "euclidean": (0, False),
+    "dtw": (1, False),
+    "ddtw": (1, True),
+    "dtw-r": (1, False),
+    "ddtw-r": (1, True),
+    "wdtw": (2, False),
+    "wddtw": (2, True),
+    "erp": (3, False),
+    "lcss": (4, False),
+    "twe": (5, False),
+    "msm": (6, False),
+}
+
+
+class DistanceCache:
+    """Derivatives and channel statistics shared by the distance splitters.
+
+    Created once for a collection, the derivative of every series used by the
+    derivative distances and the per-case channel sums used to find the standard
+    deviation of a channel at any node are shared by all nodes and candidates.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_cases, n_channels, n_timepoints)
+        The collection of series.
+    """
+
+    def __init__(self, X):
+        self.X = np.ascontiguousarray(X, dtype=np.float64)
+        self.X_deriv = _derivatives(self.X)
+        self.channel_sum = self.X.sum(axis=2)
+        self.channel_sum_sq = (self.X**2).sum(axis=2)
+
+    def std(self, idx, dim):
+        """Get the standard deviation of channel dim over the cases in idx."""
+        n_values = len(idx) * self.X.shape[2]
+        mean = self.channel_sum[idx, dim].sum() / n_values
+        var = self.channel_sum_sq[idx, dim].sum() / n_values - mean**2
+        return np.sqrt(max(var, 0.0))
+
 
 class DistanceSplitter:
     """EE-based splitter for TS-CHIEF implementation."""
 
     @staticmethod
-    def generate(X, y, random_state=None):
-        """Generate a randomized distance splitter candidate."""
-        _, dims, length = X.shape
+    def generate(cache, y, idx, random_state=None):
+        """Generate a randomized distance splitter candidate.
+
+        ``idx`` is the index of the node cases in the ``DistanceCache`` and ``y``
+        their labels.
+        """
+        _, dims, length = cache.X.shape
         rng = check_random_state(random_state)
 
         splitter = DistanceSplitter()
         splitter.dim = rng.randint(dims)
 
         metric = rng.choice(DISTANCE_CANDIDATES)
-        example = X[0, splitter.dim, :]
         splitter.metric = metric
+        splitter.window = 1.0
+        splitter.g = 0.0
+        splitter.epsilon = 1.0
+        splitter.nu = 0.001
+        splitter.lmbda = 1.0
+        splitter.c = 1.0
         if metric == "euclidean":
             pass
         elif metric == "dtw":
@@ -63,13 +114,13 @@ class DistanceSplitter:
         elif metric == "wddtw":
             splitter.g = rng.uniform(0, 1)
         elif metric == "erp":
-            sigma = np.std(X[:, splitter.dim, :])
+            sigma = cache.std(idx, splitter.dim)
             splitter.g = rng.uniform(sigma / 5, sigma)
         elif metric == "lcss":
-            sigma = np.std(X[:, splitter.dim, :])
+            sigma = cache.std(idx, splitter.dim)
             splitter.epsilon = rng.uniform(sigma / 5, sigma)
             max_warp = floor((length + 1) / 4)
-            splitter.window = rng.randint(0, max_warp + 1)
+            splitter.window = rng.randint(0, max_warp + 1) / length
         elif metric == "twe":
             splitter.nu = rng.choice(
                 [0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1]
@@ -181,45 +232,112 @@ class DistanceSplitter:
                 ]
             )
 
-        splitter.exemplars = []
+        splitter.metric_id, splitter.use_derivative = _METRIC_IDS[metric]
+        splitter.params = np.array(
+            [
+                splitter.window,
+                splitter.g,
+                splitter.epsilon,
+                splitter.nu,
+                splitter.lmbda,
+                splitter.c,
+            ]
+        )
+
+        exemplar_idx = []
         classes = np.unique(y)
         for c in classes:
             group = np.argwhere(y == c).ravel()
-            exemplar_idx = rng.choice(group)
-            splitter.exemplars.append(X[exemplar_idx, splitter.dim, :])
-        splitter.exemplars = np.array(splitter.exemplars)
+            exemplar_idx.append(idx[rng.choice(group)])
+        splitter.exemplar_idx = np.array(exemplar_idx)
+        # stored transformed, so prediction does not repeat the exemplar transform
+        series = cache.X_deriv if splitter.use_derivative else cache.X
+        splitter.exemplars = series[splitter.exemplar_idx, splitter.dim]
 
         return splitter
 
-    def split(self, X):
-        """Split incoming data."""
-        samples, _, _ = X.shape
-        X = X[:, self.dim, :]
-        y = self.exemplars
-
-        if self.metric == "euclidean":
-            pairwise_distances = euclidean_pairwise_distance(X, y)
-        elif self.metric == "dtw":
-            pairwise_distances = dtw_pairwise_distance(X, y)
-        elif self.metric == "ddtw":
-            pairwise_distances = ddtw_pairwise_distance(X, y)
-        elif self.metric == "dtw-r":
-            pairwise_distances = dtw_pairwise_distance(X, y, self.window)
-        elif self.metric == "ddtw-r":
-            pairwise_distances = dtw_pairwise_distance(X, y, self.window)
-        elif self.metric == "wdtw":
-            pairwise_distances = wdtw_pairwise_distance(X, y, g=self.g)
-        elif self.metric == "wddtw":
-            pairwise_distances = wddtw_pairwise_distance(X, y, g=self.g)
-        elif self.metric == "erp":
-            pairwise_distances = erp_pairwise_distance(X, y, g=self.g)
-        elif self.metric == "lcss":
-            pairwise_distances = lcss_pairwise_distance(X, y, window=self.window, epsilon=self.epsilon)
-        elif self.metric == "twe":
-            pairwise_distances = twe_pairwise_distance(X, y, lmbda=self.lmbda, nu=self.nu)
-        else:
-            pairwise_distances = msm_pairwise_distance(X, y, c=self.c)
-
-        split_idx = np.argmin(pairwise_distances, axis=1)
-
-        return split_idx
+    @staticmethod
+    def split_batch(splitters, cache, idx):
+        """Split the training cases in idx with each of the candidate splitters.
+
+        The distances of all candidates are found in a single pass over the cases,
+        using the cached series and derivatives.
+        """
+        return _batch_closest_exemplars(
+            cache.X,
+            cache.X_deriv,
+            idx,
+            np.array([s.dim for s in splitters]),
+            np.array([s.use_derivative for s in splitters]),
+            np.array([s.metric_id for s in splitters]),
+            np.array([s.params for s in splitters]),
+            np.array([s.exemplar_idx for s in splitters]),
+        )
+
+    def split(self, cache, idx):
+        """Split the incoming cases in idx of a ``DistanceCache``."""
+        series = cache.X_deriv if self.use_derivative else cache.X
+        return _closest_exemplars(
+            series, idx, self.dim, self.exemplars, self.metric_id, self.params
+        )
+
+
+def _derivatives(X):
+    X_deriv = np.zeros((X.shape[0], X.shape[1], X.shape[2] - 2))
+    for i in range(X.shape[0]):
+        X_deriv[i] = average_of_slope(X[i])
+    return X_deriv
+
+
+@njit(cache=True, fastmath=True)
+def _distance(x, y, metric_id, params):
+    if metric_id == 0:
+        return euclidean_distance(x, y)
+    elif metric_id == 1:
+        return dtw_distance(x, y, params[0])
+    elif metric_id == 2:
+        return wdtw_distance(x, y, params[0], params[1])
+    elif metric_id == 3:
+        return erp_distance(x, y, params[0], params[1])
+    elif metric_id == 4:
+        return lcss_distance(x, y, params[0], params[2])
+    elif metric_id == 5:
+        return twe_distance(x, y, params[0], params[3], params[4])
+    else:
+        return msm_distance(x, y, params[0], True, params[5])
+
+
+@njit(cache=True, fastmath=True)
+def _closest_exemplars(series, idx, dim, exemplars, metric_id, params):
+    split_idx = np.zeros(len(idx), dtype=np.int64)
+    for i in range(len(idx)):
+        min_dist = np.inf
+        for k in range(exemplars.shape[0]):
+            dist = _distance(series[idx[i], dim], exemplars[k], metric_id, params)
+            if dist < min_dist:
+                min_dist = dist
+                split_idx[i] = k
+    return split_idx
+
+
+@njit(cache=True, fastmath=True)
+def _batch_closest_exemplars(
+    X, X_deriv, idx, dims, use_derivative, metric_ids, params, exemplar_idx
+):
+    n_splitters, n_exemplars = exemplar_idx.shape
+    split_idx = np.zeros((n_splitters, len(idx)), dtype=np.int64)
+    for i in range(len(idx)):
+        for s in range(n_splitters):
+            series = X_deriv if use_derivative[s] else X
+            min_dist = np.inf
+            for k in range(n_exemplars):
+                dist = _distance(
+                    series[idx[i], dims[s]],
+                    series[exemplar_idx[s, k], dims[s]],
+                    metric_ids[s],
+                    params[s],
+                )
+                if dist < min_dist:
+                    min_dist = dist
+                    split_idx[s, i] = k
+    return split_idx
@@ -1,5 +1,5 @@
 import numpy as np
-from numba import njit, int64, prange
+from numba import njit, int64
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.utils.validation import check_random_state
 
@@ -59,7 +59,7 @@ def _round_to_nearest_power_of_two(n):
     return int64(1 << round(np.log2(n)))
 
 
-@njit(parallel=True, cache=True)
+@njit(cache=True)
 def acf(x, max_lag):
     """Autocorrelation function transform.
 
@@ -80,7 +80,7 @@ def acf(x, max_lag):
     """
     y = np.empty(max_lag)
     length = len(x)
-    for lag in prange(1, max_lag + 1):
+    for lag in range(1, max_lag + 1):
         # Do it ourselves to avoid zero variance warnings
         lag_length = length - lag
         x1, x2 = x[:-lag], x[lag:]
@@ -119,6 +119,7 @@ def acf(x, max_lag):
 
     return y
 
+
 def _acf(X, istart, iend, lag):
     n_instances, _ = X.shape
     acf_x = np.empty(shape=(n_instances, lag))
@@ -147,8 +148,11 @@ class IntervalSplitter:
     """RISE-based splitter for TS-CHIEF implementation."""
 
     @staticmethod
-    def generate(X, y, random_state=None):
-        """Generate a randomized interval splitter candidate."""
+    def generate(X, y, idx, random_state=None):
+        """Generate a randomized interval splitter candidate.
+
+        ``idx`` is the index of the node cases in ``X`` and ``y`` their labels.
+        """
         samples, dims, length = X.shape
         splitter = IntervalSplitter()
         splitter.rng = check_random_state(random_state)
@@ -169,7 +173,7 @@ class IntervalSplitter:
 
         splitter.transform = splitter.rng.choice(FEATURE_CANDIDATES)
         X_transformed = splitter.transform(
-            X[:, splitter.dim, :], splitter.istart, splitter.iend, splitter.acf_lag
+            X[idx, splitter.dim], splitter.istart, splitter.iend, splitter.acf_lag
         )
 
         splitter.tree = DecisionTreeClassifier(
@@ -178,9 +182,9 @@ class IntervalSplitter:
 
         return splitter
 
-    def split(self, X):
-        """Split incoming data."""
-        X = X[:, self.dim, :]
+    def split(self, X, idx):
+        """Split the incoming cases in idx."""
+        X = X[idx, self.dim]
         X_transformed = self.transform(X, self.istart, self.iend, self.acf_lag)
 
         return self.tree.apply(X_transformed) - 1
@@ -0,0 +1,96 @@
+"""Tests for the TS-CHIEF classifier."""
+
+import numpy as np
+import pytest
+from aeon.distances import pairwise_distance
+from aeon.testing.data_generation import make_example_3d_numpy
+
+from tsml_eval._wip.tschief import TsChief
+from tsml_eval._wip.tschief._splitters import (
+    DistanceCache,
+    DistanceSplitter,
+    generate_boss_transforms,
+)
+from tsml_eval._wip.tschief._splitters.dictionary_splitter import _closest_bags
+
+
+def _boss_distance_dict(x, y):
+    # the BOSS distance only counts the words present in the first bag
+    return sum((count - y.get(word, 0)) ** 2 for word, count in x.items())
+
+
+def test_closest_bags():
+    """Test the sparse closest bag search matches the BOSS distance of dict bags."""
+    X = make_example_3d_numpy(30, 1, 40, random_state=0, return_y=False)
+    _, X_boss = generate_boss_transforms(X, 5, random_state=0)
+
+    for bags in X_boss[0]:
+        exemplars = bags[[0, 7, 15]]
+        dict_bags = [
+            dict(zip(row.indices, row.data)) for row in (bags[i] for i in range(30))
+        ]
+        dict_exemplars = [dict_bags[i] for i in [0, 7, 15]]
+
+        expected = [
+            np.argmin([_boss_distance_dict(bag, e) for e in dict_exemplars])
+            for bag in dict_bags
+        ]
+        np.testing.assert_array_equal(_closest_bags(bags, exemplars), expected)
+
+
+@pytest.mark.parametrize("n_trees, n_jobs", [(4, 2), (2, 4)])
+def test_tschief_n_jobs(n_trees, n_jobs):
+    """Test fitting trees and node candidates in parallel does not change results."""
+    X, y = make_example_3d_numpy(30, 1, 30, n_labels=3, random_state=0)
+    X_test = make_example_3d_numpy(10, 1, 30, random_state=1, return_y=False)
+
+    params = dict(
+        n_trees=n_trees,
+        n_dictionary=2,
+        n_interval=2,
+        n_distance=2,
+        n_boss_transformations=5,
+        random_state=0,
+    )
+    serial = TsChief(**params).fit(X, y)
+    parallel = TsChief(n_jobs=n_jobs, **params).fit(X, y)
+
+    np.testing.assert_array_equal(serial.predict(X_test), parallel.predict(X_test))
+    np.testing.assert_array_equal(serial.predict(X), parallel.predict(X))
+
+
+def test_distance_split_batch():
+    """Test the batched distance candidates match splitting with each candidate."""
+    X, y = make_example_3d_numpy(20, 2, 30, n_labels=3, random_state=0)
+    cache = DistanceCache(X)
+    idx = np.arange(2, 20)
+
+    splitters = [
+        DistanceSplitter.generate(cache, y[idx], idx, random_state=i) for i in range(30)
+    ]
+    splits = DistanceSplitter.split_batch(splitters, cache, idx)
+
+    for splitter, split in zip(splitters, splits):
+        np.testing.assert_array_equal(split, splitter.split(cache, idx))
+
+        # the closest exemplar by the aeon distance of the candidate
+        series = cache.X_deriv if splitter.use_derivative else cache.X
+        name, kwargs = [
+            ("euclidean", {}),
+            ("dtw", {"window": splitter.window}),
+            ("wdtw", {"window": splitter.window, "g": splitter.g}),
+            ("erp", {"window": splitter.window, "g": splitter.g}),
+            ("lcss", {"window": splitter.window, "epsilon": splitter.epsilon}),
+            (
+                "twe",
+                {"window": splitter.window, "nu": splitter.nu, "lmbda": splitter.lmbda},
+            ),
+            ("msm", {"window": splitter.window, "c": splitter.c}),
+        ][splitter.metric_id]
+        distances = pairwise_distance(
+            series[idx, splitter.dim],
+            splitter.exemplars,
+            method=name,
+            **kwargs,
+        )
+        np.testing.assert_array_equal(split, np.argmin(distances, axis=1))
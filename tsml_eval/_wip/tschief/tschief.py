@@ -1,8 +1,9 @@
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.utils.validation import check_random_state
 from aeon.classification.base import BaseClassifier
 
-from tsml_eval._wip.tschief._splitters import generate_boss_transforms
+from tsml_eval._wip.tschief._splitters import DistanceCache, generate_boss_transforms
 from tsml_eval._wip.tschief.tschiefnode import TsChiefNode
 
 __maintainer__ = ["GuiArcencio"]
@@ -10,11 +11,17 @@ __all__ = ["TsChief"]
 
 
 class TsChief(BaseClassifier):
-    """Unfinished implementation of the TS-CHIEF classifier."""
+    """Unfinished implementation of the TS-CHIEF classifier.
+
+    Trees are built concurrently using ``n_jobs`` workers. If there are fewer trees
+    than jobs, the remaining jobs are used to evaluate the candidate splitters at
+    each node in parallel.
+    """
 
     _tags = {
         "X_inner_mtype": "numpy3D",
         "capability:multivariate": True,
+        "capability:multithreading": True,
     }
 
     def __init__(
@@ -25,6 +32,8 @@ class TsChief(BaseClassifier):
         n_distance=5,
         n_boss_transformations=1000,
         random_state=None,
+        n_jobs=1,
+        parallel_backend=None,
     ):
         self.n_trees = n_trees
         self.n_dictionary = n_dictionary
@@ -32,37 +41,56 @@ class TsChief(BaseClassifier):
         self.n_distance = n_distance
         self.n_boss_transformations = n_boss_transformations
         self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
         super().__init__()
 
     def _fit(self, X, y):
         self._class_dtype = y.dtype
-        self.random_state = check_random_state(self.random_state)
+        rng = check_random_state(self.random_state)
 
-        sfas, X_boss = generate_boss_transforms(
-            X, self.n_boss_transformations, self.random_state
-        )
-        self.trees_ = []
-        for _ in range(self.n_trees):
-            self.trees_.append(
-                TsChiefNode(
-                    n_dictionary=self.n_dictionary,
-                    n_distance=self.n_distance,
-                    n_interval=self.n_interval,
-                    random_state=self.random_state,
-                ).fit(X, y, X_boss, sfas)
+        sfas, X_boss = generate_boss_transforms(X, self.n_boss_transformations, rng)
+        distance_cache = DistanceCache(X)
+
+        tree_jobs = min(self._n_jobs, self.n_trees)
+        node_jobs = max(1, self._n_jobs // tree_jobs)
+        seeds = rng.randint(np.iinfo(np.int32).max, size=self.n_trees)
+        self.trees_ = Parallel(
+            n_jobs=tree_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(_fit_tree)(
+                X,
+                y,
+                X_boss,
+                sfas,
+                self.n_dictionary,
+                self.n_distance,
+                self.n_interval,
+                seed,
+                node_jobs,
+                distance_cache,
             )
+            for seed in seeds
+        )
 
         return self
 
     def _predict(self, X):
         samples = X.shape[0]
+        distance_cache = DistanceCache(X)
 
         votes = np.empty((samples, self.n_trees), dtype=self._class_dtype)
         preds = np.empty(samples, dtype=self._class_dtype)
 
-        for i, tree in enumerate(self.trees_):
-            votes[:, i] = tree.predict(X)
+        tree_preds = Parallel(
+            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(tree.predict)(X, distance_cache=distance_cache)
+            for tree in self.trees_
+        )
+        for i, tree_pred in enumerate(tree_preds):
+            votes[:, i] = tree_pred
 
         for i in range(samples):
             classes, counts = np.unique(votes[i], return_counts=True)
@@ -70,3 +98,24 @@ class TsChief(BaseClassifier):
             preds[i] = classes[max_idx]
 
         return preds
+
+
+def _fit_tree(
+    X,
+    y,
+    X_boss,
+    sfas,
+    n_dictionary,
+    n_distance,
+    n_interval,
+    random_state,
+    n_jobs,
+    distance_cache,
+):
+    return TsChiefNode(
+        n_dictionary=n_dictionary,
+        n_distance=n_distance,
+        n_interval=n_interval,
+        random_state=random_state,
+        n_jobs=n_jobs,
+    ).fit(X, y, X_boss, sfas, distance_cache=distance_cache)
@@ -1,104 +1,141 @@
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.utils.validation import check_random_state
 
 from tsml_eval._wip.tschief._splitters import (
     DictionarySplitter,
+    DistanceCache,
     DistanceSplitter,
     IntervalSplitter,
 )
 
 
 class TsChiefNode:
-    """Tree node for the TS-CHIEF model."""
+    """Tree node for the TS-CHIEF model.
 
-    def __init__(self, n_dictionary, n_distance, n_interval, random_state):
+    Nodes refer to the training cases which reach them by an index into the full
+    training data and BOSS bags, no subsets of the data are copied. The dictionary
+    and interval candidate splitters at a node are evaluated in parallel when
+    ``n_jobs`` is above 1, and the distance candidates are evaluated together in a
+    single pass over the cases.
+    """
+
+    def __init__(self, n_dictionary, n_distance, n_interval, random_state, n_jobs=1):
         self.rng = check_random_state(random_state)
         self.n_dictionary = n_dictionary
         self.n_distance = n_distance
         self.n_interval = n_interval
+        self.n_jobs = n_jobs
 
         self.is_leaf = False
 
-    def fit(self, X, y, X_boss, sfas):
-        """Fit the tree node with respective subset of data."""
+    def fit(self, X, y, X_boss, sfas, idx=None, distance_cache=None):
+        """Fit the tree node with the cases in idx, all cases if None."""
+        if idx is None:
+            idx = np.arange(X.shape[0])
+        if distance_cache is None:
+            distance_cache = DistanceCache(X)
+        y_node = y[idx]
         self._class_dtype = y.dtype
 
-        if len(np.unique(y)) == 1:
+        classes, counts = np.unique(y_node, return_counts=True)
+        self.label = classes[np.argmax(counts)]
+        if len(classes) == 1:
             self.is_leaf = True
-            self.label = y[0]
             return self
 
+        candidates = ["dictionary"] * self.n_dictionary + ["interval"] * self.n_interval
+        seeds = self.rng.randint(np.iinfo(np.int32).max, size=len(candidates))
+        distance_seeds = self.rng.randint(np.iinfo(np.int32).max, size=self.n_distance)
+        if self.n_jobs > 1:
+            results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(_evaluate_candidate)(
+                    candidate, X, y_node, X_boss, sfas, idx, seed
+                )
+                for candidate, seed in zip(candidates, seeds)
+            )
+        else:
+            results = [
+                _evaluate_candidate(candidate, X, y_node, X_boss, sfas, idx, seed)
+                for candidate, seed in zip(candidates, seeds)
+            ]
+
+        if self.n_distance > 0:
+            splitters = [
+                DistanceSplitter.generate(distance_cache, y_node, idx, seed)
+                for seed in distance_seeds
+            ]
+            splits = DistanceSplitter.split_batch(splitters, distance_cache, idx)
+            # keep the dictionary, distance, interval candidate order for ties
+            results[self.n_dictionary : self.n_dictionary] = [
+                (splitter, split, _gini(y_node, split))
+                for splitter, split in zip(splitters, splits)
+            ]
+
         best_splitter = None
         best_split = None
         best_gini = np.inf
-
-        for i in range(self.n_dictionary):
-            splitter = DictionarySplitter.generate(X_boss, y, sfas, self.rng)
-            split = splitter.split_train(X_boss)
-            gini = _gini(y, split)
-
-            if gini < best_gini:
-                best_splitter = splitter
-                best_split = split
-                best_gini = gini
-
-        for i in range(self.n_distance):
-            splitter = DistanceSplitter.generate(X, y, self.rng)
-            split = splitter.split(X)
-            gini = _gini(y, split)
-
+        for splitter, split, gini in results:
             if gini < best_gini:
                 best_splitter = splitter
                 best_split = split
                 best_gini = gini
 
-        for i in range(self.n_interval):
-            splitter = IntervalSplitter.generate(X, y, self.rng)
-            split = splitter.split(X)
-            gini = _gini(y, split)
-
-            if gini < best_gini:
-                best_splitter = splitter
-                best_split = split
-                best_gini = gini
+        # no candidate separates the cases, splitting again would not end
+        if len(np.unique(best_split)) == 1:
+            self.is_leaf = True
+            return self
 
         self.splitter_ = best_splitter
-        self.children_ = []
+        self.children_ = {}
         for split in np.unique(best_split):
-            down_idx = np.argwhere(best_split == split).ravel()
-            down_X = X[down_idx]
-            down_y = y[down_idx]
-            down_X_boss = np.vectorize(lambda bag, down_idx=down_idx: bag[down_idx, :])(
-                X_boss
-            )
-
-            self.children_.append(
-                TsChiefNode(
-                    n_dictionary=self.n_dictionary,
-                    n_distance=self.n_distance,
-                    n_interval=self.n_interval,
-                    random_state=self.rng,
-                ).fit(down_X, down_y, down_X_boss, sfas)
-            )
+            self.children_[split] = TsChiefNode(
+                n_dictionary=self.n_dictionary,
+                n_distance=self.n_distance,
+                n_interval=self.n_interval,
+                random_state=self.rng,
+                n_jobs=self.n_jobs,
+            ).fit(X, y, X_boss, sfas, idx[best_split == split], distance_cache)
 
         return self
 
-    def predict(self, X):
-        """Predict class labels for subset of data."""
-        samples = X.shape[0]
+    def predict(self, X, idx=None, distance_cache=None):
+        """Predict class labels for the cases in idx, all cases if None."""
+        if idx is None:
+            idx = np.arange(X.shape[0])
+        if distance_cache is None:
+            distance_cache = DistanceCache(X)
 
         if self.is_leaf:
-            return np.repeat(self.label, samples)
-
-        preds = np.empty(samples, dtype=self._class_dtype)
-        split_idx = self.splitter_.split(X)
+            return np.repeat(self.label, len(idx))
+
+        # cases reaching a branch without training cases get the node majority class
+        preds = np.full(len(idx), self.label, dtype=self._class_dtype)
+        if isinstance(self.splitter_, DistanceSplitter):
+            split_idx = self.splitter_.split(distance_cache, idx)
+        else:
+            split_idx = self.splitter_.split(X, idx)
         for split in np.unique(split_idx):
-            down_idx = np.argwhere(split_idx == split).ravel()
-            preds[down_idx] = self.children_[split].predict(X[down_idx])
+            if split in self.children_:
+                down = split_idx == split
+                preds[down] = self.children_[split].predict(
+                    X, idx[down], distance_cache
+                )
 
         return preds
 
 
+def _evaluate_candidate(candidate, X, y, X_boss, sfas, idx, seed):
+    rng = check_random_state(seed)
+    if candidate == "dictionary":
+        splitter = DictionarySplitter.generate(X_boss, y, idx, sfas, rng)
+        split = splitter.split_train(X_boss, idx)
+    else:
+        splitter = IntervalSplitter.generate(X, y, idx, rng)
+        split = splitter.split(X, idx)
+    return splitter, split, _gini(y, split)
+
+
 def _gini(y, split_idx):
     ginis = []
     splits, split_sizes = np.unique(split_idx, return_counts=True)
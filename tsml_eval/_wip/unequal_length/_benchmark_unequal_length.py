@@ -0,0 +1,97 @@
+"""Benchmark execution strategies for unequal length series.
+
+Times the unequal length Rocket and RandomIntervals transforms on the unequal test
+datasets when processing each series individually, padding all series to the max
+length and transforming the ragged collection in one call. The timings are written
+to ``unequal_length_benchmark.csv``.
+"""
+
+import csv
+import os
+import time
+
+import numpy as np
+from aeon.datasets import load_japanese_vowels, load_plaid
+from aeon.utils.numba.stats import iqr, mean, median, numba_max, numba_min, slope, std
+from tsml.datasets import (
+    load_unequal_minimal_chinatown,
+    load_unequal_minimal_gas_prices,
+)
+
+from tsml_eval._wip.unequal_length._pad import Padder
+from tsml_eval._wip.unequal_length.other._random_intervals import RandomIntervals
+from tsml_eval._wip.unequal_length.other._rocket import Rocket
+from tsml_eval.utils.ragged import RaggedCollection
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+datasets = {
+    "UnequalMinimalChinatown": load_unequal_minimal_chinatown(split="TRAIN")[0],
+    "UnequalMinimalGasPrices": load_unequal_minimal_gas_prices(split="TRAIN")[0],
+    "JapaneseVowels": load_japanese_vowels(split="train")[0],
+    "PLAID": load_plaid(split="train")[0],
+}
+
+transformers = {
+    "Rocket": lambda: Rocket(n_kernels=1000, random_state=0),
+    "RandomIntervals": lambda: RandomIntervals(
+        n_intervals=50,
+        features=[mean, std, slope, median, iqr, numba_min, numba_max],
+        random_state=0,
+    ),
+}
+
+
+def _per_series(transformer, X, max_length):
+    return np.vstack([transformer.transform([x]) for x in X])
+
+
+def _padded(transformer, X, max_length):
+    return transformer.transform(Padder(pad_length=max_length).fit_transform(X))
+
+
+def _ragged(transformer, X, max_length):
+    return transformer.transform(RaggedCollection.from_collection(X))
+
+
+methods = {
+    "per_series": _per_series,
+    "padded": _padded,
+    "ragged": _ragged,
+}
+
+rows = [
+    [
+        "dataset",
+        "n_cases",
+        "n_lengths",
+        "transformer",
+        "method",
+        "seconds",
+    ]
+]
+for name, X in datasets.items():
+    n_lengths = len(np.unique([x.shape[1] for x in X]))
+    max_length = max(x.shape[1] for x in X)
+
+    for transformer_name, make_transformer in transformers.items():
+        transformer = make_transformer().fit(X)
+
+        for method, function in methods.items():
+            # compile the numba functions before timing
+            function(transformer, X[:2], max_length)
+
+            start = time.perf_counter()
+            function(transformer, X, max_length)
+            seconds = time.perf_counter() - start
+
+            rows.append([name, len(X), n_lengths, transformer_name, method, seconds])
+            print(rows[-1])
+
+with open(
+    os.path.join(path, "unequal_length_benchmark.csv"), mode="w", newline=""
+) as file:
+    writer = csv.writer(file)
+    writer.writerows(rows)
+
+print("Finished writing data")
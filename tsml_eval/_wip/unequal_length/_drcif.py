@@ -108,6 +108,11 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
         Default of 0 means n_estimators are used.
     contract_max_n_estimators : int, default=500
         Max number of estimators when time_limit_in_minutes is set.
+    feature_cache_size : float or None, default=500
+        The maximum memory in megabytes used to store interval features shared
+        between trees. Features for an interval and feature combination drawn by
+        multiple trees are extracted once in fit and once per call to predict. If
+        None or 0, no features are stored.
     use_pycatch22 : bool, optional, default=False
         Wraps the C based pycatch22 implementation for aeon.
         (https://github.com/DynamicsAndNeuralSystems/pycatch22). This requires the
@@ -144,6 +149,9 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
         The collections of estimators trained in fit.
     intervals_ : list of shape (n_estimators) of TransformerMixin
         Stores the interval extraction transformer for all estimators.
+    feature_cache_hit_rate_ : float
+        The proportion of interval features read from the shared feature cache in
+        fit rather than extracted.
 
     See Also
     --------
@@ -195,6 +203,7 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
         att_subsample_size=10,
         time_limit_in_minutes=None,
         contract_max_n_estimators=500,
+        feature_cache_size=500,
         use_pycatch22=False,
         random_state=None,
         n_jobs=1,
@@ -237,6 +246,7 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
             replace_nan=replace_nan,
             time_limit_in_minutes=time_limit_in_minutes,
             contract_max_n_estimators=contract_max_n_estimators,
+            feature_cache_size=feature_cache_size,
             random_state=random_state,
             n_jobs=n_jobs,
             parallel_backend=parallel_backend,
@@ -8,6 +8,8 @@ import numpy as np
 from aeon.transformations.collection.base import BaseCollectionTransformer
 from sklearn.utils import check_random_state
 
+from tsml_eval.utils.ragged import RaggedCollection
+
 
 class Padder(BaseCollectionTransformer):
     """Pad unequal length time series to equal, fixed length.
@@ -101,7 +103,7 @@ class Padder(BaseCollectionTransformer):
         ----------
         X : list of [n_cases] 2D np.ndarray shape (n_channels, length_i)
             where length_i can vary between time series or 3D numpy of equal length
-            series
+            series. A RaggedCollection is padded from its buffer without conversion.
         y : ignored argument for interface compatibility
             Additional data, e.g., labels for transformation
 
@@ -124,17 +126,7 @@ class Padder(BaseCollectionTransformer):
         # Determine if fill value is a function
         func = None
         if isinstance(self.fill_value, str):
-            if self.fill_value == "mean":
-                func = np.mean
-            elif self.fill_value == "median":
-                func = np.median
-            elif self.fill_value == "min":
-                func = np.min
-            elif self.fill_value == "max":
-                func = np.max
-            elif self.fill_value == "last":
-                func = lambda x: x[-1]
-            else:
+            if self.fill_value not in ("mean", "median", "min", "max", "last"):
                 raise ValueError(
                     "Supported str values for fill_value are {mean, median, min, "
                     "max, last}."
@@ -144,32 +136,55 @@ class Padder(BaseCollectionTransformer):
 
         rng = check_random_state(self.random_state)
 
-        # Pad the series
-        Xt = []
-        for i, series in enumerate(X):
-            # Amount to pad
-            pad_width = (0, pad_length - series.shape[1])
-            padded_series = []
-            for j, channel in enumerate(series):
-                # Pad the series channel array
-                p = np.pad(
-                    channel,
-                    pad_width,
-                    mode="constant",
-                    constant_values=self.fill_value if func is None else func(channel),
-                )
-
-                if self.add_noise is not None:
-                    p[series.shape[1] :] += rng.uniform(0, self.add_noise, size=pad_length - series.shape[1])
+        # Scatter the series into the padded array in one operation
+        X = RaggedCollection.from_collection(X)
+        pad_mask = np.arange(pad_length) >= X.lengths[:, None, None]
+        if isinstance(self.fill_value, str) or func is not None:
+            # Fill value for each case channel, computed from the contiguous buffer
+            if func is None:
+                fill = _channel_statistic(X, self.fill_value)
+            else:
+                fill = np.array([func(channel) for series in X for channel in series])
+
+            Xt = X.to_numpy3d(pad_length=pad_length)
+            np.copyto(
+                Xt,
+                fill.reshape((len(X), X.n_channels, 1)),
+                casting="unsafe",
+                where=pad_mask,
+            )
+        else:
+            Xt = X.to_numpy3d(pad_length=pad_length, fill_value=self.fill_value)
 
-                padded_series.append(p)
-            Xt.append(padded_series)
-        Xt = np.array(Xt)
+        if self.add_noise:
+            pad_mask = np.broadcast_to(pad_mask, Xt.shape)
+            Xt[pad_mask] += rng.uniform(0, self.add_noise, size=np.sum(pad_mask))
 
         return Xt
 
 
+def _channel_statistic(X, statistic):
+    starts = X.channel_starts().ravel()
+    if statistic == "last":
+        return X.values[starts + np.repeat(X.lengths, X.n_channels) - 1]
+    elif statistic == "median":
+        return np.array([np.median(channel) for series in X for channel in series])
+
+    # channels are stored one after the other, so reduce over each segment
+    if statistic == "mean":
+        return np.add.reduceat(X.values, starts) / np.repeat(X.lengths, X.n_channels)
+    elif statistic == "min":
+        return np.minimum.reduceat(X.values, starts)
+    else:
+        return np.maximum.reduceat(X.values, starts)
+
+
 def _get_max_length(X):
+    if isinstance(X, RaggedCollection):
+        return X.lengths.max()
+    elif isinstance(X, np.ndarray):
+        return X.shape[2]
+
     max_length = X[0].shape[1]
     for x in X:
         if x.shape[1] > max_length:
@@ -14,8 +14,7 @@ import warnings
 from collections import defaultdict
 
 import numpy as np
-from joblib import Parallel, delayed
-from numba import njit, types
+from numba import config, get_num_threads, njit, prange, set_num_threads, types
 from numba.typed import Dict
 from sklearn import preprocessing
 from sklearn.kernel_ridge import KernelRidge
@@ -507,34 +506,16 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         correct = 0
         required_correct = int(lowest_acc * train_size)
 
-        if self._n_jobs > 1:
-            c = Parallel(n_jobs=self._n_jobs, prefer="threads")(
-                delayed(tde._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
-
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-                elif c[i] == y[i]:
-                    correct += 1
-
-                if keep_train_preds:
-                    tde._train_predictions.append(c[i])
-        else:
-            for i in range(train_size):
+        # leave-one-out predictions are found for a block of cases at a time
+        for start, preds in tde._train_predict_blocks():
+            for i in range(start, start + len(preds)):
                 if correct + train_size - i < required_correct:
                     return -1
-
-                c = tde._train_predict(i)
-
-                if c == y[i]:
+                elif preds[i - start] == y[i]:
                     correct += 1
 
                 if keep_train_preds:
-                    tde._train_predictions.append(c)
+                    tde._train_predictions.append(preds[i - start])
 
         return correct / train_size
 
@@ -723,6 +704,8 @@ class IndividualTDE(BaseClassifier):
 
         self._transformers = []
         self._transformed_data = []
+        self._train_csr = None
+        self._vocabulary = {}
         self._class_vals = []
         self._dims = []
         self._highest_dim_bit = 0
@@ -845,6 +828,9 @@ class IndividualTDE(BaseClassifier):
             sfa = self._transformers[0].transform(X, y)
             self._transformed_data = sfa[0]
 
+        # word counts of the train bags over the train word vocabulary
+        self._train_csr, self._vocabulary = _bags_to_csr(self._transformed_data)
+
     def _predict(self, X):
         """Predict class values of all instances in X.
 
@@ -896,26 +882,26 @@ class IndividualTDE(BaseClassifier):
             test_bags = self._transformers[0].transform(X)
             test_bags = test_bags[0]
 
-        classes = Parallel(n_jobs=self._n_jobs, prefer="threads")(
-            delayed(self._test_nn)(
-                test_bag,
-            )
-            for test_bag in test_bags
-        )
+        # test words missing from the train vocabulary do not add to any similarity
+        test_csr, _ = _bags_to_csr(test_bags, self._vocabulary)
+        classes = []
+        for _, sims in _histogram_intersection_blocks(
+            test_csr, self._train_csr, len(self._vocabulary), self._n_jobs
+        ):
+            classes.extend(self._test_nn(sim) for sim in sims)
 
         return np.array(classes)
 
-    def _test_nn(self, test_bag):
+    def _test_nn(self, sims):
         rng = check_random_state(self.random_state)
 
-        best_sim = -1
+        # train cases are visited in order, a case replaces the nearest neighbour if
+        # it is more similar or with a coin flip if it is equally similar. Only cases
+        # at least as similar as all cases before them can be visited
+        best_before = np.maximum.accumulate(np.concatenate(([-1], sims[:-1])))
         nn = None
-
-        for n, bag in enumerate(self._transformed_data):
-            sim = histogram_intersection(test_bag, bag)
-
-            if sim > best_sim or (sim == best_sim and rng.random() < 0.5):
-                best_sim = sim
+        for n in np.flatnonzero(sims >= best_before):
+            if sims[n] > best_before[n] or rng.random() < 0.5:
                 nn = self._class_vals[n]
 
         return nn
@@ -958,9 +944,8 @@ class IndividualTDE(BaseClassifier):
             transformers[i].binning_dft = None
 
             correct = 0
-            for i in range(self.n_cases_):
-                if self._train_predict(i, sfa[0]) == y[i]:
-                    correct = correct + 1
+            for start, preds in self._train_predict_blocks(sfa[0]):
+                correct += np.sum(preds == y[start : start + len(preds)])
 
             accs.append(correct)
 
@@ -981,25 +966,25 @@ class IndividualTDE(BaseClassifier):
 
         return dims, fin_transformers
 
-    def _train_predict(self, train_num, bags=None):
-        if bags is None:
-            bags = self._transformed_data
-
-        test_bag = bags[train_num]
-        best_sim = -1
-        nn = None
-
-        for n, bag in enumerate(bags):
-            if n == train_num:
-                continue
-
-            sim = histogram_intersection(test_bag, bag)
+    def _train_predict_blocks(self, bags=None):
+        """Find leave-one-out predictions for a block of train cases at a time.
 
-            if sim > best_sim:
-                best_sim = sim
-                nn = self._class_vals[n]
+        Yields the index of the first case in the block and the predicted classes.
+        The train bags are used if ``bags`` is None.
+        """
+        if bags is None:
+            csr = self._train_csr
+            n_words = len(self._vocabulary)
+        else:
+            csr, vocabulary = _bags_to_csr(bags)
+            n_words = len(vocabulary)
 
-        return nn
+        for start, sims in _histogram_intersection_blocks(
+            csr, csr, n_words, self._n_jobs
+        ):
+            # a case is not its own neighbour, ties go to the first case
+            sims[np.arange(len(sims)), np.arange(start, start + len(sims))] = -1
+            yield start, self._class_vals[np.argmax(sims, axis=1)]
 
 
 def histogram_intersection(first, second):
@@ -1044,3 +1029,140 @@ def _histogram_intersection_dict(first, second):
         val_b = second.get(word, types.uint32(0))
         sim += min(val_a, val_b)
     return sim
+
+
+def _bags_to_csr(bags, vocabulary=None):
+    """Convert bags of words into a CSR matrix of word counts.
+
+    Parameters
+    ----------
+    bags : list of dict or numba.Dict
+        The word counts of each case.
+    vocabulary : dict or None, default=None
+        The column of each word. If None, a vocabulary of all words in ``bags`` is
+        created. Otherwise, words missing from the vocabulary are left out.
+
+    Returns
+    -------
+    csr : tuple of np.ndarray
+        The row pointers, column indices and counts of the CSR matrix.
+    vocabulary : dict
+        The column of each word.
+    """
+    add_words = vocabulary is None
+    if add_words:
+        vocabulary = {}
+
+    indptr = np.zeros(len(bags) + 1, dtype=np.int64)
+    indices = []
+    counts = []
+    for i, bag in enumerate(bags):
+        for word, count in bag.items():
+            column = vocabulary.get(word, -1)
+            if column == -1:
+                if not add_words:
+                    continue
+                column = len(vocabulary)
+                vocabulary[word] = column
+
+            indices.append(column)
+            counts.append(count)
+        indptr[i + 1] = len(indices)
+
+    csr = (
+        indptr,
+        np.array(indices, dtype=np.int64),
+        np.array(counts, dtype=np.int64),
+    )
+    return csr, vocabulary
+
+
+def _histogram_intersection_blocks(
+    csr, train_csr, n_words, n_jobs, max_block_size=2**22
+):
+    """Find the histogram intersection of each case and each train case.
+
+    The similarities are found for a block of cases at a time, each block holds at
+    most ``max_block_size`` similarities. Yields the index of the first case in the
+    block and the similarities of shape (n_block_cases, n_train_cases).
+    """
+    n_cases = len(csr[0]) - 1
+    n_train_cases = len(train_csr[0]) - 1
+    block_size = max(1, max_block_size // max(1, n_train_cases))
+
+    for start in range(0, n_cases, block_size):
+        end = min(start + block_size, n_cases)
+        if n_jobs == 1:
+            sims = _histogram_intersection_csr(*csr, *train_csr, n_words, start, end)
+        else:
+            prev_threads = get_num_threads()
+            set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+            try:
+                sims = _histogram_intersection_csr_parallel(
+                    *csr, *train_csr, n_words, start, end
+                )
+            finally:
+                set_num_threads(prev_threads)
+
+        yield start, sims
+
+
+@njit(fastmath=True, cache=True)
+def _histogram_intersection_csr(
+    indptr,
+    indices,
+    counts,
+    train_indptr,
+    train_indices,
+    train_counts,
+    n_words,
+    start,
+    end,
+):
+    sims = np.zeros((end - start, len(train_indptr) - 1), dtype=np.int64)
+    # dense word counts of the current case
+    case_counts = np.zeros(n_words, dtype=np.int64)
+
+    for i in range(start, end):
+        for k in range(indptr[i], indptr[i + 1]):
+            case_counts[indices[k]] = counts[k]
+
+        for n in range(len(train_indptr) - 1):
+            sim = 0
+            for k in range(train_indptr[n], train_indptr[n + 1]):
+                sim += min(case_counts[train_indices[k]], train_counts[k])
+            sims[i - start, n] = sim
+
+        for k in range(indptr[i], indptr[i + 1]):
+            case_counts[indices[k]] = 0
+
+    return sims
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _histogram_intersection_csr_parallel(
+    indptr,
+    indices,
+    counts,
+    train_indptr,
+    train_indices,
+    train_counts,
+    n_words,
+    start,
+    end,
+):
+    sims = np.zeros((end - start, len(train_indptr) - 1), dtype=np.int64)
+
+    for i in prange(start, end):
+        # dense word counts of the current case
+        case_counts = np.zeros(n_words, dtype=np.int64)
+        for k in range(indptr[i], indptr[i + 1]):
+            case_counts[indices[k]] = counts[k]
+
+        for n in range(len(train_indptr) - 1):
+            sim = 0
+            for k in range(train_indptr[n], train_indptr[n + 1]):
+                sim += min(case_counts[train_indices[k]], train_counts[k])
+            sims[i - start, n] = sim
+
+    return sims
@@ -0,0 +1,89 @@
+"""Shared cache of interval feature columns."""
+
+__maintainer__ = []
+__all__ = ["IntervalFeatureCache"]
+
+import threading
+
+
+class IntervalFeatureCache:
+    """Cache of interval feature columns shared by the estimators of a forest.
+
+    Holds the feature values extracted from a single collection of series, keyed by
+    the interval and feature they were extracted with. Estimators drawing an interval
+    and feature combination already extracted by another estimator read the stored
+    column instead of recomputing it.
+
+    Columns are added until the memory budget is reached, after which new columns
+    are computed but not stored. Safe to use from multiple threads.
+
+    Parameters
+    ----------
+    max_size : float, default=500
+        The maximum memory used by stored columns in megabytes.
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests for a column which was stored.
+    misses : int
+        The number of requests for a column which was not stored.
+    size : int
+        The memory used by stored columns in bytes.
+    """
+
+    def __init__(self, max_size=500):
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+
+        self._columns = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the stored column for a key, or None if it is not stored.
+
+        Parameters
+        ----------
+        key : hashable
+            The interval and feature identifier of the column.
+
+        Returns
+        -------
+        column : np.ndarray or None
+            The stored column.
+        """
+        column = self._columns.get(key, None)
+        with self._lock:
+            if column is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return column
+
+    def put(self, key, column):
+        """Store a column if it fits in the memory budget.
+
+        Parameters
+        ----------
+        key : hashable
+            The interval and feature identifier of the column.
+        column : np.ndarray
+            The feature values for each case.
+        """
+        with self._lock:
+            if key in self._columns:
+                return
+            elif self.size + column.nbytes > self.max_size * 1024 * 1024:
+                return
+
+            self._columns[key] = column
+            self.size += column.nbytes
+
+    @property
+    def hit_rate(self):
+        """Return the proportion of requests for a stored column."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests > 0 else 0.0
@@ -14,16 +14,51 @@ from aeon.base._base import _clone_estimator
 from aeon.transformations.base import BaseTransformer
 from aeon.transformations.collection.base import BaseCollectionTransformer
 from aeon.utils.numba.stats import (
+    count_above_mean,
+    count_mean_crossing,
+    iqr,
+    mean,
+    median,
+    numba_max,
+    numba_min,
+    ppv,
+    quantile25,
+    quantile75,
+    row_count_above_mean,
+    row_count_mean_crossing,
+    row_iqr,
     row_mean,
     row_median,
     row_numba_max,
     row_numba_min,
+    row_ppv,
     row_quantile25,
     row_quantile75,
+    row_slope,
     row_std,
+    slope,
+    std,
 )
 from aeon.utils.validation import check_n_jobs
 
+from tsml_eval.utils.ragged import RaggedCollection
+
+# single series feature functions and their equivalent for rows of a 2D array
+_ROW_FUNCTIONS = {
+    mean: row_mean,
+    std: row_std,
+    slope: row_slope,
+    median: row_median,
+    iqr: row_iqr,
+    numba_min: row_numba_min,
+    numba_max: row_numba_max,
+    quantile25: row_quantile25,
+    quantile75: row_quantile75,
+    count_above_mean: row_count_above_mean,
+    count_mean_crossing: row_count_mean_crossing,
+    ppv: row_ppv,
+}
+
 
 class RandomIntervals(BaseCollectionTransformer):
     """Random interval feature transformer.
@@ -140,6 +175,11 @@ class RandomIntervals(BaseCollectionTransformer):
         super().__init__()
 
     transformer_feature_skip = ["transform_features_", "_transform_features"]
+    # the parameter names of interval feature transformers selecting the features to
+    # transform, used to store each feature in the shared feature cache separately
+    transformer_feature_selection = ["features"]
+    # an IntervalFeatureCache for the transformed data set by the owning estimator
+    _feature_cache = None
 
     def _fit_transform(self, X, y=None):
         X, rng = self._fit_setup(X)
@@ -217,6 +257,9 @@ class RandomIntervals(BaseCollectionTransformer):
         return self
 
     def _transform(self, X, y=None):
+        if isinstance(X, list):
+            X = RaggedCollection.from_collection(X)
+
         if self._transform_features is None:
             transform_features = [None] * len(self.intervals_)
         else:
@@ -255,9 +298,16 @@ class RandomIntervals(BaseCollectionTransformer):
         self.intervals_ = []
         self._transform_features = None
 
+        # unequal length series are held in a single buffer so interval values can
+        # be gathered for all cases at once
+        if isinstance(X, list):
+            X = RaggedCollection.from_collection(X)
+
         self.n_cases_ = len(X)
         self.n_channels_ = X[0].shape[0]
-        self.max_n_timepoints_ = max(x.shape[1] for x in X)
+        self.max_n_timepoints_ = (
+            X.lengths.max() if isinstance(X, RaggedCollection) else X.shape[2]
+        )
 
         self._min_interval_length = self.min_interval_length
         if self.min_interval_length < 3:
@@ -359,15 +409,8 @@ class RandomIntervals(BaseCollectionTransformer):
         Xt = np.empty((self.n_cases_, 0)) if transform else None
         intervals = []
 
-        g = [
-            np.expand_dims(x[dim, interval_start:interval_end:dilation], axis=0)
-            for x in X] if isinstance(X, list) else np.expand_dims(
-            X[:, dim, interval_start:interval_end:dilation], axis=1)
-        p = [True for _ in range(len(g))]
-        for l in range(len(g)):
-            if g[l].shape[1] < interval_length:
-                g[l] = np.zeros((1, self._min_interval_length))
-                p[l] = False
+        interval = (interval_start, interval_end, dim, dilation)
+        extracted = []
 
         for feature in self._features:
             if isinstance(feature, BaseTransformer):
@@ -377,23 +420,17 @@ class RandomIntervals(BaseCollectionTransformer):
                         seed,
                     )
 
-                    t = feature.fit_transform(g, y)
-
-                    if t.ndim == 3 and t.shape[1] == 1:
-                        t = t.reshape((t.shape[0], t.shape[2]))
-
-                    for i in range(len(t)):
-                        if not p[i]:
-                            t[i, :] = np.nan
-
+                    t = self._interval_features(
+                        X, y, interval, feature, extracted, fit=True
+                    )
                     Xt = np.hstack((Xt, t))
                 else:
-                    feature.fit(g, y)
+                    interval_values, valid = self._extract(X, interval, extracted)
+                    feature.fit(
+                        np.expand_dims(interval_values, axis=1), _valid_y(y, valid)
+                    )
             elif transform:
-                t = [
-                    [feature(f[0]) if p[i] else np.nan]
-                    for i, f in enumerate(g)
-                ]
+                t = self._interval_features(X, y, interval, feature, extracted)
                 Xt = np.hstack((Xt, t))
 
             intervals.append((interval_start, interval_end, dim, feature, dilation))
@@ -412,29 +449,93 @@ class RandomIntervals(BaseCollectionTransformer):
             elif not keep_transform:
                 return [[0] for _ in range(len(X))]
 
-        g = [
-            np.expand_dims(x[dim, interval_start:interval_end:dilation], axis=0)
-            for x in X] if isinstance(X, list) else np.expand_dims(
-            X[:, dim, interval_start:interval_end:dilation], axis=1)
-        p = [True for _ in range(len(g))]
-        for l in range(len(g)):
-            if g[l].shape[1] < interval_end - interval_start:
-                g[l] = np.zeros((1, self._min_interval_length))
-                p[l] = False
+        # transformers told to skip features cannot share their output
+        return self._interval_features(
+            X,
+            None,
+            (interval_start, interval_end, dim, dilation),
+            feature,
+            [],
+            use_cache=keep_transform is None
+            or not isinstance(feature, BaseTransformer),
+        )
 
-        if isinstance(feature, BaseTransformer):
-            Xt = feature.transform(g)
+    def _interval_features(
+        self, X, y, interval, feature, extracted, fit=False, use_cache=True
+    ):
+        # find the interval features for all cases, columns are read from and added
+        # to the shared feature cache if one is set
+        cache = self._feature_cache if use_cache else None
+
+        keys = None
+        if cache is not None:
+            if isinstance(feature, BaseTransformer):
+                names, selection = self._transformer_feature_columns(feature)
+                params = feature.get_params(deep=False)
+                for n in (selection, "n_jobs", "parallel_backend"):
+                    params.pop(n, None)
+                key = (interval, type(feature), repr(sorted(params.items())))
+
+                # transformers with selected features store a column per feature
+                keys = [key] if names is None else [key + (n,) for n in names]
+            else:
+                keys = [(interval, feature)]
 
-            for i in range(len(Xt)):
-                if not p[i]:
-                    Xt[i, :] = np.nan
+            columns = [cache.get(key) for key in keys]
+            missing = [i for i, c in enumerate(columns) if c is None]
+            if len(missing) == 0 and not fit:
+                return np.hstack(columns)
 
-            if Xt.ndim == 3:
-                Xt = Xt.reshape((Xt.shape[0], Xt.shape[2]))
-        else:
-            Xt = [[feature(f[0])] for f in g]
+        interval_values, valid = self._extract(X, interval, extracted)
 
-        return Xt
+        if isinstance(feature, BaseTransformer):
+            Xi = np.expand_dims(interval_values, axis=1)
+
+            if (keys is None or len(missing) == len(keys)) and fit:
+                t = feature.fit_transform(Xi, _valid_y(y, valid))
+            elif keys is None or len(missing) == len(keys):
+                t = feature.transform(Xi)
+            else:
+                if fit:
+                    feature.fit(Xi, _valid_y(y, valid))
+
+                # only the features missing from the cache are transformed
+                t = None
+                if len(missing) > 0:
+                    missing_feature = _clone_estimator(feature)
+                    setattr(missing_feature, selection, [names[i] for i in missing])
+                    t = missing_feature.fit_transform(Xi, _valid_y(y, valid))
+
+            if t is not None and t.ndim == 3:
+                t = t.reshape((t.shape[0], t.shape[2]))
+        else:
+            t = _apply_function(feature, interval_values).reshape((-1, 1))
+
+        if t is not None:
+            t = _scatter_valid(t, valid)
+        if keys is None:
+            return t
+
+        for n, i in enumerate(missing):
+            columns[i] = t if len(keys) == 1 else t[:, n : n + 1]
+            cache.put(keys[i], columns[i])
+
+        return np.hstack(columns)
+
+    def _transformer_feature_columns(self, feature):
+        # the output column names of a transformer with a list of selected features
+        params = feature.get_params(deep=False)
+        for n in self.transformer_feature_selection:
+            if n in params and isinstance(params[n], (list, tuple)):
+                return list(params[n]), n
+        return None, None
+
+    @staticmethod
+    def _extract(X, interval, extracted):
+        # gather the interval values once for all features of an interval
+        if len(extracted) == 0:
+            extracted.append(_interval_values(X, *interval))
+        return extracted[0]
 
     def set_features_to_transform(self, arr, raise_error=True):
         """Set transform_features to the given array.
@@ -516,3 +617,47 @@ class RandomIntervals(BaseCollectionTransformer):
             return {"n_intervals": 3}
         else:
             return {"n_intervals": 2}
+
+
+def _interval_values(X, interval_start, interval_end, dim, dilation):
+    # cases too short to contain the interval are excluded, the values of the
+    # remaining cases are gathered into a single 2D array
+    if isinstance(X, np.ndarray):
+        valid = np.full(len(X), X.shape[2] >= interval_end)
+    else:
+        valid = X.lengths >= interval_end
+
+    positions = np.arange(interval_start, interval_end, dilation)
+    if not valid.any():
+        # features are found for a placeholder series to get the output shape
+        return np.zeros((1, len(positions))), valid
+
+    if isinstance(X, np.ndarray):
+        return X[:, dim, interval_start:interval_end:dilation], valid
+
+    starts = X.channel_starts()[valid, dim]
+    return X.values[starts[:, None] + positions], valid
+
+
+def _valid_y(y, valid):
+    if y is None:
+        return None
+    return y[valid] if valid.any() else y[:1]
+
+
+def _apply_function(function, interval_values):
+    if function in _ROW_FUNCTIONS:
+        return _ROW_FUNCTIONS[function](interval_values)
+    elif function in _ROW_FUNCTIONS.values():
+        return function(interval_values)
+    else:
+        return np.array([function(x) for x in interval_values])
+
+
+def _scatter_valid(Xt, valid):
+    if valid.all():
+        return Xt
+
+    out = np.full((len(valid), Xt.shape[1]), np.nan)
+    out[valid] = Xt[: np.sum(valid)]
+    return out
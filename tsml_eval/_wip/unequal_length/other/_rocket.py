@@ -6,9 +6,11 @@ __all__ = ["Rocket"]
 import numpy as np
 from numba import get_num_threads, njit, prange, set_num_threads
 
-from aeon.transformations.collection import BaseCollectionTransformer, Normalizer
+from aeon.transformations.collection import BaseCollectionTransformer
 from aeon.utils.validation import check_n_jobs
 
+from tsml_eval.utils.ragged import RaggedCollection
+
 
 class Rocket(BaseCollectionTransformer):
     """RandOm Convolutional KErnel Transform (ROCKET).
@@ -126,15 +128,16 @@ class Rocket(BaseCollectionTransformer):
         -------
         np.ndarray (n_cases, n_kernels), transformed features
         """
+        # the kernels are applied to a single contiguous buffer of all series
+        X = RaggedCollection.from_collection(X, dtype=np.float64)
         if self.normalise:
-            norm = Normalizer()
-            X = norm.fit_transform(X)
+            X = _normalise(X)
         prev_threads = get_num_threads()
 
         n_jobs = check_n_jobs(self.n_jobs)
         set_num_threads(n_jobs)
 
-        X_ = _apply_kernels(X, self.kernels)
+        X_ = _apply_kernels(X.values, X.offsets, X.lengths, X.n_channels, self.kernels)
 
         set_num_threads(prev_threads)
         return X_
@@ -215,7 +218,21 @@ def _generate_kernels(n_timepoints, n_kernels, n_channels, seed):
     )
 
 
-def _apply_kernels(X, kernels):
+def _normalise(X):
+    # z-normalise each channel of each series, as aeon Normalizer does for a list
+    starts = X.channel_starts().ravel()
+    lengths = np.repeat(X.lengths, X.n_channels)
+
+    mean = np.add.reduceat(X.values, starts) / lengths
+    centred = X.values - np.repeat(mean, lengths)
+    std = np.sqrt(np.add.reduceat(centred * centred, starts) / lengths)
+    std[std == 0] = 1
+
+    return RaggedCollection(centred / np.repeat(std, lengths), X.lengths, X.n_channels)
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _apply_kernels(values, offsets, series_lengths, n_channels, kernels):
     (
         weights,
         lengths,
@@ -225,13 +242,14 @@ def _apply_kernels(X, kernels):
         n_channel_indices,
         channel_indices,
     ) = kernels
-    n_cases = len(X)
-    n_channels, _ = X[0].shape
+    n_cases = len(series_lengths)
     n_kernels = len(lengths)
 
     _X = np.zeros((n_cases, n_kernels * 2), dtype=np.float32)  # 2 features per kernel
 
-    for i in range(n_cases):
+    for i in prange(n_cases):
+        X = values[offsets[i] : offsets[i + 1]].reshape((n_channels, series_lengths[i]))
+
         a1 = 0  # for weights
         a2 = 0  # for channel_indices
         a3 = 0  # for features
@@ -243,8 +261,8 @@ def _apply_kernels(X, kernels):
 
             _weights = weights[a1:b1].reshape((n_channel_indices[j], lengths[j]))
 
-            _X[i][a3:b3] = _apply_kernel(
-                X[i],
+            _X[i, a3], _X[i, a3 + 1] = _apply_kernel(
+                X,
                 _weights,
                 lengths[j],
                 biases[j],
@@ -258,7 +276,7 @@ def _apply_kernels(X, kernels):
             a2 = b2
             a3 = b3
 
-    return _X.astype(np.float32)
+    return _X
 
 
 @njit(fastmath=True, cache=True)
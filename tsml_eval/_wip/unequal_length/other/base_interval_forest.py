@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 
 import numpy as np
 from joblib import Parallel, delayed
+from joblib._parallel_backends import SequentialBackend, ThreadingBackend
+from joblib.parallel import get_active_backend
 from sklearn.base import BaseEstimator, is_classifier, is_regressor
 from sklearn.preprocessing import FunctionTransformer
 from sklearn.tree import BaseDecisionTree, DecisionTreeClassifier, DecisionTreeRegressor
@@ -24,7 +26,11 @@ from aeon.transformations.collection.interval_based import (
 from aeon.utils.numba.stats import row_mean, row_slope, row_std
 from aeon.utils.validation import check_n_jobs
 
+from tsml_eval._wip.unequal_length.other._interval_feature_cache import (
+    IntervalFeatureCache,
+)
 from tsml_eval._wip.unequal_length.other._random_intervals import RandomIntervals
+from tsml_eval.utils.ragged import RaggedCollection
 
 
 class BaseIntervalForest(ABC):
@@ -127,6 +133,14 @@ class BaseIntervalForest(ABC):
         Default of 0 means n_estimators are used.
     contract_max_n_estimators : int, default=500
         Max number of estimators when time_limit_in_minutes is set.
+    feature_cache_size : float or None, default=500
+        The maximum memory in megabytes used to store interval features shared
+        between estimators. Features for an interval and feature combination drawn by
+        multiple estimators are extracted once in fit and once per call to predict.
+        The budget is split evenly between series_transformers outputs. If None or
+        0, no features are stored. Only used with the "random"
+        interval_selection_method and a thread based (or single job) parallel
+        backend, as the cache cannot be shared between processes.
     random_state : int, RandomState instance or None, default=None
         If `int`, random_state is the seed used by the random number generator;
         If `RandomState` instance, random_state is the random number generator;
@@ -155,6 +169,9 @@ class BaseIntervalForest(ABC):
         The collections of estimators trained in fit.
     intervals_ : list of shape (n_estimators) of BaseTransformer
         Stores the interval extraction transformer for all estimators.
+    feature_cache_hit_rate_ : float
+        The proportion of interval features read from the shared feature cache in
+        fit rather than extracted.
 
     References
     ----------
@@ -182,6 +199,7 @@ class BaseIntervalForest(ABC):
         replace_nan=None,
         time_limit_in_minutes=None,
         contract_max_n_estimators=500,
+        feature_cache_size=500,
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
@@ -198,6 +216,7 @@ class BaseIntervalForest(ABC):
         self.replace_nan = replace_nan
         self.time_limit_in_minutes = time_limit_in_minutes
         self.contract_max_n_estimators = contract_max_n_estimators
+        self.feature_cache_size = feature_cache_size
         self.random_state = random_state
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
@@ -229,6 +248,7 @@ class BaseIntervalForest(ABC):
     def _predict(self, X):
         if is_regressor(self):
             Xt = self._predict_setup(X)
+            feature_caches = self._create_feature_caches(len(Xt))
 
             y_preds = Parallel(
                 n_jobs=self._n_jobs,
@@ -240,6 +260,7 @@ class BaseIntervalForest(ABC):
                     self.estimators_[i],
                     self.intervals_[i],
                     predict_proba=False,
+                    feature_caches=feature_caches,
                 )
                 for i in range(self._n_estimators)
             )
@@ -252,6 +273,7 @@ class BaseIntervalForest(ABC):
 
     def _predict_proba(self, X):
         Xt = self._predict_setup(X)
+        feature_caches = self._create_feature_caches(len(Xt))
 
         y_probas = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
@@ -261,6 +283,7 @@ class BaseIntervalForest(ABC):
                 self.estimators_[i],
                 self.intervals_[i],
                 predict_proba=True,
+                feature_caches=feature_caches,
             )
             for i in range(self._n_estimators)
         )
@@ -491,7 +514,10 @@ class BaseIntervalForest(ABC):
             and self.min_interval_length <= 1
         ):
             self._min_interval_length = [
-                int(self.min_interval_length * max_series_lengths[i] for i in range(len(Xt)))
+                int(
+                    self.min_interval_length * max_series_lengths[i]
+                    for i in range(len(Xt))
+                )
             ]
         # if the input is a list, it must be the same length as the number of
         # series_transformers
@@ -506,7 +532,9 @@ class BaseIntervalForest(ABC):
             self._min_interval_length = []
             for i, length in enumerate(self.min_interval_length):
                 if isinstance(length, float) and length <= 1:
-                    self._min_interval_length.append(int(length * max_series_lengths[i]))
+                    self._min_interval_length.append(
+                        int(length * max_series_lengths[i])
+                    )
                 elif isinstance(length, int):
                     self._min_interval_length.append(length)
                 else:
@@ -540,7 +568,8 @@ class BaseIntervalForest(ABC):
             and self.max_interval_length <= 1
         ):
             self._max_interval_length = [
-                int(self.max_interval_length * max_series_lengths[i]) for i in range(len(Xt))
+                int(self.max_interval_length * max_series_lengths[i])
+                for i in range(len(Xt))
             ]
         # if the input is a list, it must be the same length as the number of
         # series_transformers
@@ -555,7 +584,9 @@ class BaseIntervalForest(ABC):
             self._max_interval_length = []
             for i, length in enumerate(self.max_interval_length):
                 if isinstance(length, float) and length <= 1:
-                    self._max_interval_length.append(int(length * max_series_lengths[i]))
+                    self._max_interval_length.append(
+                        int(length * max_series_lengths[i])
+                    )
                 elif isinstance(length, int):
                     self._max_interval_length.append(length)
                 else:
@@ -805,6 +836,10 @@ class BaseIntervalForest(ABC):
 
         self._n_jobs = check_n_jobs(self.n_jobs)
 
+        # interval features drawn by multiple estimators are only extracted once
+        Xt = [_to_ragged(t) for t in Xt]
+        feature_caches = self._create_feature_caches(len(Xt))
+
         if self.time_limit_in_minutes is not None and self.time_limit_in_minutes > 0:
             time_limit = self.time_limit_in_minutes * 60
             start_time = time.time()
@@ -829,6 +864,7 @@ class BaseIntervalForest(ABC):
                         y,
                         rng.randint(np.iinfo(np.int32).max),
                         save_transformed_data=save_transformed_data,
+                        feature_caches=feature_caches,
                     )
                     for _ in range(self._n_jobs)
                 )
@@ -858,6 +894,7 @@ class BaseIntervalForest(ABC):
                     y,
                     rng.randint(np.iinfo(np.int32).max),
                     save_transformed_data=save_transformed_data,
+                    feature_caches=feature_caches,
                 )
                 for _ in range(self._n_estimators)
             )
@@ -868,9 +905,18 @@ class BaseIntervalForest(ABC):
                 transformed_intervals,
             ) = zip(*fit)
 
+        if feature_caches is not None:
+            hits = sum(cache.hits for cache in feature_caches)
+            requests = hits + sum(cache.misses for cache in feature_caches)
+            self.feature_cache_hit_rate_ = hits / requests if requests > 0 else 0.0
+        else:
+            self.feature_cache_hit_rate_ = 0.0
+
         return transformed_intervals
 
-    def _fit_estimator(self, Xt, y, seed, save_transformed_data=False):
+    def _fit_estimator(
+        self, Xt, y, seed, save_transformed_data=False, feature_caches=None
+    ):
         # random state for this estimator
         rng = check_random_state(seed)
 
@@ -1009,7 +1055,10 @@ class BaseIntervalForest(ABC):
             # fit the interval selector, transform the current series using it and save
             # the transformer
             intervals.append(selector)
+            if feature_caches is not None:
+                selector._feature_cache = feature_caches[r]
             f = intervals[r].fit_transform(Xt[r], y)
+            selector._feature_cache = None
 
             # concatenate the data and save this transforms number of attributes
             transform_data_lengths.append(f.shape[1])
@@ -1077,13 +1126,46 @@ class BaseIntervalForest(ABC):
             elif _is_transformer(transformer):
                 Xt.append(transformer.transform(X))
 
-        return Xt
+        return [_to_ragged(t) for t in Xt]
+
+    def _create_feature_caches(self, n_series):
+        if (
+            self.feature_cache_size is None
+            or self.feature_cache_size <= 0
+            or not isinstance(self.interval_selection_method, str)
+            or self.interval_selection_method.lower() != "random"
+            or not self._thread_based_backend()
+        ):
+            return None
+
+        return [
+            IntervalFeatureCache(max_size=self.feature_cache_size / n_series)
+            for _ in range(n_series)
+        ]
+
+    def _thread_based_backend(self):
+        # the caches are only shared if all estimators run in this process
+        if self._n_jobs == 1:
+            return True
+        elif isinstance(self.parallel_backend, str):
+            return self.parallel_backend == "threading"
+        elif self.parallel_backend is None:
+            backend, _ = get_active_backend(prefer="threads")
+        else:
+            backend = self.parallel_backend
+        return isinstance(backend, (ThreadingBackend, SequentialBackend))
 
-    def _predict_for_estimator(self, Xt, estimator, intervals, predict_proba=False):
+    def _predict_for_estimator(
+        self, Xt, estimator, intervals, predict_proba=False, feature_caches=None
+    ):
         interval_features = np.empty((len(Xt[0]), 0))
 
         for r in range(len(Xt)):
+            if feature_caches is not None:
+                intervals[r]._feature_cache = feature_caches[r]
             f = intervals[r].transform(Xt[r])
+            intervals[r]._feature_cache = None
+
             interval_features = np.hstack((interval_features, f))
 
         if isinstance(self.replace_nan, str) and self.replace_nan.lower() == "nan":
@@ -1285,6 +1367,12 @@ class BaseIntervalForest(ABC):
             return names, values
 
 
+def _to_ragged(X):
+    # unequal length series are stored in a single buffer once rather than by each
+    # interval transformer
+    return RaggedCollection.from_collection(X) if isinstance(X, list) else X
+
+
 def _is_transformer(obj):
     if isinstance(obj, BaseTransformer) or isinstance(obj, FunctionTransformer):
         return True
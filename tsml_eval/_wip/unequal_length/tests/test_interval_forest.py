@@ -0,0 +1,48 @@
+"""Test the shared interval feature cache of the interval forest."""
+
+import numpy as np
+from aeon.datasets import load_japanese_vowels
+
+from tsml_eval._wip.unequal_length._drcif import DrCIFClassifier
+
+
+def test_feature_cache_predictions():
+    """Test the feature cache does not change the DrCIF predictions."""
+    X_train, y_train = load_japanese_vowels(split="train")
+    X_test, _ = load_japanese_vowels(split="test")
+    X_train, y_train, X_test = X_train[::9], y_train[::9], X_test[:10]
+
+    cached = DrCIFClassifier(n_estimators=5, n_intervals=2, random_state=0)
+    cached.fit(X_train, y_train)
+    uncached = DrCIFClassifier(
+        n_estimators=5, n_intervals=2, feature_cache_size=0, random_state=0
+    )
+    uncached.fit(X_train, y_train)
+
+    assert cached.feature_cache_hit_rate_ > 0
+    np.testing.assert_array_equal(
+        cached.predict_proba(X_test), uncached.predict_proba(X_test)
+    )
+
+
+def test_feature_cache_process_backend():
+    """Test the feature cache is disabled for a process based backend."""
+    X_train, y_train = load_japanese_vowels(split="train")
+    X_test, _ = load_japanese_vowels(split="test")
+    X_train, y_train, X_test = X_train[::9], y_train[::9], X_test[:10]
+
+    loky = DrCIFClassifier(
+        n_estimators=5,
+        n_intervals=2,
+        n_jobs=2,
+        parallel_backend="loky",
+        random_state=0,
+    )
+    loky.fit(X_train, y_train)
+    serial = DrCIFClassifier(n_estimators=5, n_intervals=2, random_state=0)
+    serial.fit(X_train, y_train)
+
+    assert loky.feature_cache_hit_rate_ == 0
+    np.testing.assert_array_almost_equal(
+        loky.predict_proba(X_test), serial.predict_proba(X_test)
+    )
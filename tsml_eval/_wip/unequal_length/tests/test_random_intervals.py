@@ -0,0 +1,39 @@
+"""Test the random interval transformer on unequal length input."""
+
+import numpy as np
+from aeon.utils.numba.stats import mean, numba_max, slope, std
+
+from tsml_eval._wip.unequal_length.other._random_intervals import RandomIntervals
+
+
+def test_random_intervals_short_cases():
+    """Test cases shorter than an interval have missing features."""
+    rng = np.random.default_rng(0)
+    X = [rng.normal(size=(2, n)) for n in (30, 8, 24, 30, 12, 19)]
+
+    transformer = RandomIntervals(
+        n_intervals=20,
+        features=[mean, std, slope, numba_max],
+        dilation=[1, 2, 3],
+        random_state=0,
+    )
+    Xt = transformer.fit_transform(X)
+    assert Xt.shape == (len(X), len(transformer.intervals_))
+
+    # every case long enough to contain the interval end has the feature of its
+    # own dilated interval values, shorter cases are missing
+    for i, (start, end, dim, feature, dilation) in enumerate(transformer.intervals_):
+        for j, x in enumerate(X):
+            if x.shape[1] >= end:
+                assert np.isclose(Xt[j, i], feature(x[dim, start:end:dilation]))
+            else:
+                assert np.isnan(Xt[j, i])
+
+    assert np.isnan(Xt).any() and not np.isnan(Xt).all(axis=0).any()
+    # some dilated intervals end inside cases shorter than the longest series
+    assert any(
+        dilation > 1 and any(end <= x.shape[1] < 30 for x in X)
+        for _, end, _, _, dilation in transformer.intervals_
+    )
+
+    np.testing.assert_array_equal(transformer.transform(X), Xt)
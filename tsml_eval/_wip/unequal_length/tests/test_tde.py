@@ -0,0 +1,38 @@
+"""Test the sparse histogram intersection used by TDE."""
+
+import numpy as np
+import pytest
+
+from tsml_eval._wip.unequal_length._tde import (
+    _bags_to_csr,
+    _histogram_intersection_blocks,
+    histogram_intersection,
+)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_histogram_intersection_blocks(n_jobs):
+    """Test the blocked CSR similarities against the dictionary distance."""
+    rng = np.random.RandomState(0)
+    train_bags = [
+        {int(w): int(c) for w, c in zip(rng.randint(0, 30, 10), rng.randint(1, 5, 10))}
+        for _ in range(7)
+    ]
+    test_bags = [
+        {int(w): int(c) for w, c in zip(rng.randint(0, 40, 10), rng.randint(1, 5, 10))}
+        for _ in range(5)
+    ]
+
+    train_csr, vocabulary = _bags_to_csr(train_bags)
+    test_csr, _ = _bags_to_csr(test_bags, vocabulary)
+
+    blocks = list(
+        _histogram_intersection_blocks(
+            test_csr, train_csr, len(vocabulary), n_jobs, max_block_size=14
+        )
+    )
+    assert [start for start, _ in blocks] == [0, 2, 4]
+
+    sims = np.concatenate([block for _, block in blocks])
+    expected = [[histogram_intersection(a, b) for b in train_bags] for a in test_bags]
+    np.testing.assert_array_equal(sims, expected)
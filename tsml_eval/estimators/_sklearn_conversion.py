@@ -0,0 +1,97 @@
+"""Conversion of time series collections for the sklearn wrappers."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = ["convert_to_sklearn_2d"]
+
+from typing import Union
+
+import numpy as np
+
+
+def convert_to_sklearn_2d(
+    X: Union[np.ndarray, list],
+    pad_unequal: bool = False,
+    concatenate_channels: bool = False,
+) -> np.ndarray:
+    """Convert a collection of time series to a 2D array for a sklearn estimator.
+
+    Equal length 3D numpy arrays are returned as a reshaped view where possible, and
+    2D numpy arrays are returned unchanged. Lists of 2D numpy arrays are written
+    into a single preallocated 2D array, with channels concatenated and unequal
+    length series zero padded at the end of each channel.
+
+    Converting the data once and passing the result to the wrappers avoids making a
+    new copy of the collection on every ``fit`` and ``predict`` call, i.e. for every
+    fold of a cross-validation.
+
+    Parameters
+    ----------
+    X : np.ndarray or list of np.ndarray
+        The collection to convert. A 2D or 3D numpy array or a list of 2D numpy
+        arrays in the ``aeon`` data format.
+    pad_unequal : bool, default=False
+        Whether to pad unequal length series with zeros. If False, an error is
+        raised for unequal length input.
+    concatenate_channels : bool, default=False
+        Whether to concatenate the channels of multivariate series. If False, an
+        error is raised for multivariate input.
+
+    Returns
+    -------
+    X : np.ndarray
+        2D numpy array of shape (n_cases, n_channels * n_timepoints).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from tsml_eval.estimators._sklearn_conversion import convert_to_sklearn_2d
+    >>> X = [np.ones((2, 3)), np.ones((2, 2))]
+    >>> convert_to_sklearn_2d(X, pad_unequal=True, concatenate_channels=True)
+    array([[1., 1., 1., 1., 1., 1.],
+           [1., 1., 0., 1., 1., 0.]])
+    """
+    if isinstance(X, np.ndarray) and X.ndim == 2:
+        return X
+    elif isinstance(X, np.ndarray) and X.ndim == 3:
+        if X.shape[1] > 1 and not concatenate_channels:
+            raise ValueError(
+                "Can only convert 3D numpy array with more than 1 channel to "
+                "2D numpy array if concatenate_channels is True, found "
+                f"{X.shape[1]} channels."
+            )
+        # a view unless the array is not contiguous
+        return X.reshape((X.shape[0], -1))
+    elif isinstance(X, list) and all(
+        isinstance(x, np.ndarray) and x.ndim == 2 for x in X
+    ):
+        n_channels = X[0].shape[0]
+        if n_channels > 1 and not concatenate_channels:
+            raise ValueError(
+                "Can only convert list of 2D numpy arrays with more than 1 "
+                "channel to 2D numpy array if concatenate_channels is True, "
+                f"found {n_channels} channels."
+            )
+
+        max_len = max(x.shape[1] for x in X)
+        if not pad_unequal and any(x.shape[1] != max_len for x in X):
+            raise ValueError(
+                "Can only convert list of 2D numpy arrays with unequal "
+                "length data to 2D numpy array if pad_unequal is True, "
+                "found different series lengths."
+            )
+
+        arr = np.zeros(
+            (len(X), n_channels * max_len), dtype=np.result_type(*X, np.float32)
+        )
+        # write each series through a 3D view of the output buffer
+        arr_3d = arr.reshape((len(X), n_channels, max_len))
+        for i, x in enumerate(X):
+            arr_3d[i, :, : x.shape[1]] = x
+
+        return arr
+    else:
+        raise ValueError(
+            "X must be a 2D/3D numpy array or a list of 2D numpy arrays, got "
+            f"{f'list of {type(X[0])}' if isinstance(X, list) else type(X)} "
+            "instead."
+        )
@@ -9,6 +9,8 @@ from sklearn.utils.multiclass import check_classification_targets
 from sklearn.utils.validation import check_is_fitted
 from tsml.base import BaseTimeSeriesEstimator, _clone_estimator
 
+from tsml_eval.estimators._sklearn_conversion import convert_to_sklearn_2d
+
 
 class SklearnToTsmlClassifier(ClassifierMixin, BaseTimeSeriesEstimator):
     """Wrapper for sklearn estimators to use the tsml base class."""
@@ -35,7 +37,7 @@ class SklearnToTsmlClassifier(ClassifierMixin, BaseTimeSeriesEstimator):
             raise ValueError("Classifier not set")
 
         X, y = self._validate_data(X=X, y=y)
-        X = self._convert_X(
+        X = convert_to_sklearn_2d(
             X,
             pad_unequal=self.pad_unequal,
             concatenate_channels=self.concatenate_channels,
@@ -58,7 +60,7 @@ class SklearnToTsmlClassifier(ClassifierMixin, BaseTimeSeriesEstimator):
         check_is_fitted(self)
 
         X = self._validate_data(X=X, reset=False)
-        X = self._convert_X(
+        X = convert_to_sklearn_2d(
             X,
             pad_unequal=self.pad_unequal,
             concatenate_channels=self.concatenate_channels,
@@ -71,7 +73,7 @@ class SklearnToTsmlClassifier(ClassifierMixin, BaseTimeSeriesEstimator):
         check_is_fitted(self)
 
         X = self._validate_data(X=X, reset=False)
-        X = self._convert_X(
+        X = convert_to_sklearn_2d(
             X,
             pad_unequal=self.pad_unequal,
             concatenate_channels=self.concatenate_channels,
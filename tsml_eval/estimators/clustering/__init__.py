@@ -3,7 +3,15 @@
 __all__ = [
     "SklearnToTsmlClusterer",
     "RClustering",
+    "CachedDistanceKMedoids",
+    "CachedDistanceCLARA",
+    "CachedDistanceCLARANS",
 ]
 
+from tsml_eval.estimators.clustering._cached_distance_medoids import (
+    CachedDistanceCLARA,
+    CachedDistanceCLARANS,
+    CachedDistanceKMedoids,
+)
 from tsml_eval.estimators.clustering._r_clustering import RClustering
 from tsml_eval.estimators.clustering._sklearn_clusterer import SklearnToTsmlClusterer
@@ -0,0 +1,388 @@
+"""Medoid based clusterers reading distances from a precomputed matrix."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "CachedDistanceKMedoids",
+    "CachedDistanceCLARA",
+    "CachedDistanceCLARANS",
+]
+
+import numpy as np
+from aeon.clustering import TimeSeriesCLARA, TimeSeriesCLARANS, TimeSeriesKMedoids
+from sklearn.utils import check_random_state
+
+
+class _CachedDistanceMixin:
+    """Replaces the distance computations of aeon k-medoids with matrix lookups.
+
+    aeon ``TimeSeriesKMedoids`` fills a per fit cache of distances between training
+    cases as they are requested. If ``distance_matrix`` is set, the cache is instead
+    set to the precomputed matrix so no distances between training cases are
+    computed in ``fit``. Distances to unseen cases in ``predict`` are still computed.
+    """
+
+    def _check_params(self, X):
+        super()._check_params(X)
+
+        self._distance_matrix = _load_distance_matrix(self.distance_matrix, X.shape[0])
+        if self._distance_matrix is not None:
+            self._distance_cache = self._distance_matrix
+
+    def _fit(self, X, y=None):
+        super()._fit(X, y)
+        self.medoid_indexes_ = _medoid_indexes(X, self.cluster_centers_)
+
+    def _compute_pairwise(self, X, first_indexes, second_indexes):
+        if self._distance_matrix is None:
+            return super()._compute_pairwise(X, first_indexes, second_indexes)
+        return np.asarray(self._distance_matrix[np.ix_(first_indexes, second_indexes)])
+
+    def _kmedoids_plus_plus_center_initializer(self, X):
+        if self._distance_matrix is None:
+            return super()._kmedoids_plus_plus_center_initializer(X)
+
+        indexes = [self._random_state.randint(X.shape[0])]
+        for _ in range(1, self.n_clusters):
+            min_distances = self._distance_matrix[:, indexes].min(axis=1)
+            probabilities = min_distances / min_distances.sum()
+            indexes.append(self._random_state.choice(X.shape[0], p=probabilities))
+        return np.array(indexes)
+
+
+class CachedDistanceKMedoids(_CachedDistanceMixin, TimeSeriesKMedoids):
+    """Time series k-medoids clustering using a precomputed distance matrix.
+
+    Extends the aeon ``TimeSeriesKMedoids`` so that the distances between training
+    cases are read from ``distance_matrix``, i.e. a matrix stored by
+    ``tsml_eval.utils.distance_cache.load_or_compute_pairwise_distances``. Both the
+    PAM and alternate methods are supported. If ``distance_matrix`` is None, this is
+    the same as ``TimeSeriesKMedoids``.
+
+    Parameters
+    ----------
+    n_clusters : int, default=8
+        The number of clusters to form as well as the number of centroids to
+        generate.
+    init : str or np.ndarray, default='random'
+        Method for initialising cluster centers, see ``TimeSeriesKMedoids``.
+    distance : str or Callable, default='msm'
+        The distance used to compute the ``distance_matrix`` and distances to new
+        cases in ``predict``.
+    method : str, default='pam'
+        The k-medoids method, either 'pam' or 'alternate'.
+    n_init : int, default=10
+        The number of times the algorithm is run with different initialisations.
+    max_iter : int, default=300
+        The maximum number of iterations of a single run.
+    tol : float, default=1e-6
+        Relative tolerance of the inertia between iterations to declare convergence.
+    verbose : bool, default=False
+        Verbosity mode.
+    random_state : int, RandomState instance or None, default=None
+        Random seed or RandomState object.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    distance_matrix : str, np.ndarray or None, default=None
+        The pairwise distance matrix of the training cases of shape
+        (n_cases, n_cases), or the path of a ``.npy`` file storing it, which is
+        memory mapped. If None, distances are computed as in ``TimeSeriesKMedoids``.
+
+    Attributes
+    ----------
+    cluster_centers_ : np.ndarray
+        The medoid series of each cluster.
+    medoid_indexes_ : np.ndarray
+        The index of the training case used as the medoid of each cluster.
+    labels_ : np.ndarray
+        The cluster of each training case.
+    inertia_ : float
+        Sum of distances of cases to their closest medoid.
+    n_iter_ : int
+        The number of iterations run.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import pairwise_distance
+    >>> from tsml_eval.estimators.clustering import CachedDistanceKMedoids
+    >>> X = np.random.default_rng(0).random((10, 1, 20))
+    >>> clst = CachedDistanceKMedoids(
+    ...     n_clusters=2,
+    ...     distance="dtw",
+    ...     distance_matrix=pairwise_distance(X, method="dtw"),
+    ...     random_state=0,
+    ... )
+    >>> clst.fit(X).labels_.shape
+    (10,)
+    """
+
+    def __init__(
+        self,
+        n_clusters=8,
+        init="random",
+        distance="msm",
+        method="pam",
+        n_init=10,
+        max_iter=300,
+        tol=1e-6,
+        verbose=False,
+        random_state=None,
+        distance_params=None,
+        distance_matrix=None,
+    ):
+        self.distance_matrix = distance_matrix
+
+        super().__init__(
+            n_clusters=n_clusters,
+            init=init,
+            distance=distance,
+            method=method,
+            n_init=n_init,
+            max_iter=max_iter,
+            tol=tol,
+            verbose=verbose,
+            random_state=random_state,
+            distance_params=distance_params,
+        )
+
+
+class CachedDistanceCLARANS(_CachedDistanceMixin, TimeSeriesCLARANS):
+    """Time series CLARANS clustering using a precomputed distance matrix.
+
+    Extends the aeon ``TimeSeriesCLARANS`` so that the distances between training
+    cases are read from ``distance_matrix``. If ``distance_matrix`` is None, this is
+    the same as ``TimeSeriesCLARANS``.
+
+    Parameters
+    ----------
+    n_clusters : int, default=8
+        The number of clusters to form as well as the number of centroids to
+        generate.
+    init : str or np.ndarray, default='random'
+        Method for initialising cluster centers, see ``TimeSeriesCLARANS``.
+    distance : str or Callable, default='msm'
+        The distance used to compute the ``distance_matrix`` and distances to new
+        cases in ``predict``.
+    max_neighbours : int or None, default=None
+        The maximum number of neighbouring solutions examined, see
+        ``TimeSeriesCLARANS``.
+    n_init : int, default=10
+        The number of times the algorithm is run with different initialisations.
+    verbose : bool, default=False
+        Verbosity mode.
+    random_state : int, RandomState instance or None, default=None
+        Random seed or RandomState object.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    distance_matrix : str, np.ndarray or None, default=None
+        The pairwise distance matrix of the training cases of shape
+        (n_cases, n_cases), or the path of a ``.npy`` file storing it, which is
+        memory mapped. If None, distances are computed as in ``TimeSeriesCLARANS``.
+
+    Attributes
+    ----------
+    cluster_centers_ : np.ndarray
+        The medoid series of each cluster.
+    medoid_indexes_ : np.ndarray
+        The index of the training case used as the medoid of each cluster.
+    labels_ : np.ndarray
+        The cluster of each training case.
+    inertia_ : float
+        Sum of distances of cases to their closest medoid.
+    """
+
+    def __init__(
+        self,
+        n_clusters=8,
+        init="random",
+        distance="msm",
+        max_neighbours=None,
+        n_init=10,
+        verbose=False,
+        random_state=None,
+        distance_params=None,
+        distance_matrix=None,
+    ):
+        self.distance_matrix = distance_matrix
+
+        super().__init__(
+            n_clusters=n_clusters,
+            init=init,
+            distance=distance,
+            max_neighbours=max_neighbours,
+            n_init=n_init,
+            verbose=verbose,
+            random_state=random_state,
+            distance_params=distance_params,
+        )
+
+
+class CachedDistanceCLARA(TimeSeriesCLARA):
+    """Time series CLARA clustering using a precomputed distance matrix.
+
+    Extends the aeon ``TimeSeriesCLARA`` so that the distances between training
+    cases are read from ``distance_matrix``. Each sample is clustered by a
+    ``CachedDistanceKMedoids`` given the sample rows and columns of the matrix, and
+    the sample medoids are evaluated on all training cases using the matrix columns
+    of the medoids. If ``distance_matrix`` is None, this is the same as
+    ``TimeSeriesCLARA``.
+
+    Parameters
+    ----------
+    n_clusters : int, default=8
+        The number of clusters to form as well as the number of centroids to
+        generate.
+    init : str or np.ndarray, default='random'
+        Method for initialising cluster centers, see ``TimeSeriesCLARA``.
+    distance : str or Callable, default='msm'
+        The distance used to compute the ``distance_matrix`` and distances to new
+        cases in ``predict``.
+    n_samples : int or None, default=None
+        The number of cases in each sample, see ``TimeSeriesCLARA``.
+    n_sampling_iters : int, default=10
+        The number of samples clustered.
+    n_init : int, default=1
+        The number of times PAM is run on each sample with different
+        initialisations.
+    max_iter : int, default=300
+        The maximum number of iterations of a single PAM run.
+    tol : float, default=1e-6
+        Relative tolerance of the inertia between iterations to declare convergence.
+    verbose : bool, default=False
+        Verbosity mode.
+    random_state : int, RandomState instance or None, default=None
+        Random seed or RandomState object.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    distance_matrix : str, np.ndarray or None, default=None
+        The pairwise distance matrix of the training cases of shape
+        (n_cases, n_cases), or the path of a ``.npy`` file storing it, which is
+        memory mapped. If None, distances are computed as in ``TimeSeriesCLARA``.
+
+    Attributes
+    ----------
+    cluster_centers_ : np.ndarray
+        The medoid series of each cluster.
+    medoid_indexes_ : np.ndarray
+        The index of the training case used as the medoid of each cluster.
+    labels_ : np.ndarray
+        The cluster of each training case.
+    inertia_ : float
+        Sum of distances of cases to their closest medoid.
+    """
+
+    def __init__(
+        self,
+        n_clusters=8,
+        init="random",
+        distance="msm",
+        n_samples=None,
+        n_sampling_iters=10,
+        n_init=1,
+        max_iter=300,
+        tol=1e-6,
+        verbose=False,
+        random_state=None,
+        distance_params=None,
+        distance_matrix=None,
+    ):
+        self.distance_matrix = distance_matrix
+
+        super().__init__(
+            n_clusters=n_clusters,
+            init=init,
+            distance=distance,
+            n_samples=n_samples,
+            n_sampling_iters=n_sampling_iters,
+            n_init=n_init,
+            max_iter=max_iter,
+            tol=tol,
+            verbose=verbose,
+            random_state=random_state,
+            distance_params=distance_params,
+        )
+
+    def _fit(self, X, y=None):
+        distance_matrix = _load_distance_matrix(self.distance_matrix, X.shape[0])
+        if distance_matrix is None:
+            super()._fit(X, y)
+            self.medoid_indexes_ = _medoid_indexes(X, self.cluster_centers_)
+            return
+
+        self._random_state = check_random_state(self.random_state)
+        n_cases = X.shape[0]
+        if self.n_samples is None:
+            n_samples = max(min(n_cases, 40 + 2 * self.n_clusters), self.n_clusters + 1)
+        else:
+            n_samples = self.n_samples
+
+        best_inertia = np.inf
+        best_pam = None
+        best_labels = None
+        best_medoids = None
+        for _ in range(self.n_sampling_iters):
+            sample_idxs = np.arange(n_samples)
+            if n_samples < n_cases:
+                sample_idxs = self._random_state.choice(
+                    sample_idxs,
+                    size=n_samples,
+                    replace=False,
+                )
+            pam = CachedDistanceKMedoids(
+                n_clusters=self.n_clusters,
+                init=self.init,
+                distance=self.distance,
+                n_init=self.n_init,
+                max_iter=self.max_iter,
+                tol=self.tol,
+                verbose=self.verbose,
+                random_state=self._random_state,
+                distance_params=self.distance_params,
+                method="pam",
+                distance_matrix=np.asarray(
+                    distance_matrix[np.ix_(sample_idxs, sample_idxs)]
+                ),
+            )
+            pam.fit(X[sample_idxs])
+
+            medoids = sample_idxs[pam.medoid_indexes_]
+            pairwise_matrix = np.asarray(distance_matrix[:, medoids])
+            curr_td = pairwise_matrix.min(axis=1).sum()
+
+            if curr_td < best_inertia:
+                best_pam = pam
+                best_inertia = curr_td
+                best_labels = pairwise_matrix.argmin(axis=1)
+                best_medoids = medoids
+
+        self.labels_ = best_labels
+        self.inertia_ = best_inertia
+        self.cluster_centers_ = best_pam.cluster_centers_
+        self.medoid_indexes_ = best_medoids
+        self.n_iter_ = best_pam.n_iter_
+        self._kmedoids_instance = best_pam
+
+
+def _load_distance_matrix(distance_matrix, n_cases):
+    """Return the precomputed distance matrix, memory mapping it if given a path."""
+    if distance_matrix is None:
+        return None
+
+    if isinstance(distance_matrix, str):
+        # copy on write, aeon writes to its distance cache for any non-finite entries
+        distance_matrix = np.load(distance_matrix, mmap_mode="c")
+
+    if distance_matrix.shape != (n_cases, n_cases):
+        raise ValueError(
+            f"distance_matrix must have shape ({n_cases}, {n_cases}) for the "
+            f"{n_cases} cases in X, found {distance_matrix.shape}."
+        )
+    return distance_matrix
+
+
+def _medoid_indexes(X, centers):
+    """Return the index of the first case in X equal to each center."""
+    axes = tuple(range(1, X.ndim))
+    return np.array(
+        [np.flatnonzero(np.all(X == center, axis=axes))[0] for center in centers]
+    )
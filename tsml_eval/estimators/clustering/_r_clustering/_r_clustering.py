@@ -6,6 +6,10 @@ Pipeline clusterer using the R-clustering transformer and an estimator.
 __maintainer__ = ["chrisholder"]
 __all__ = ["RClustering"]
 
+import os
+from contextlib import contextmanager
+from typing import Optional
+
 import numpy as np
 from aeon.base._base import _clone_estimator
 from aeon.clustering import BaseClusterer
@@ -31,6 +35,8 @@ class RClustering(BaseClusterer):
         num_features: int = 500,
         max_dilations_per_kernel: int = 32,
         pca_result: bool = True,
+        chunk_size: Optional[int] = None,
+        memmap_dir: Optional[str] = None,
         estimator=None,
         random_state=None,
         n_jobs=1,
@@ -38,6 +44,8 @@ class RClustering(BaseClusterer):
         self.num_features = num_features
         self.max_dilations_per_kernel = max_dilations_per_kernel
         self.pca_result = pca_result
+        self.chunk_size = chunk_size
+        self.memmap_dir = memmap_dir
         self.estimator = estimator
         self.random_state = random_state
         self.n_jobs = n_jobs
@@ -52,6 +60,9 @@ class RClustering(BaseClusterer):
             max_dilations_per_kernel=self.max_dilations_per_kernel,
             random_state=self.random_state,
             pca_result=self.pca_result,
+            chunk_size=self.chunk_size,
+            memmap_dir=self.memmap_dir,
+            n_jobs=self._n_jobs,
         )
 
         self._estimator = _clone_estimator(
@@ -67,28 +78,30 @@ class RClustering(BaseClusterer):
         if m is not None:
             self._estimator.n_jobs = self._n_jobs
 
-        X_t = self._transformer.fit_transform(X, y)
-
-        self._estimator.fit(X_t, y)
+        with _transformed(self._transformer.fit_transform(X, y)) as X_t:
+            self._estimator.fit(X_t, y)
 
         self.labels_ = self._estimator.labels_
 
         return self
 
     def _predict(self, X) -> np.ndarray:
-        return self._estimator.predict(self._transformer.transform(X))
+        with _transformed(self._transformer.transform(X)) as X_t:
+            return self._estimator.predict(X_t)
 
     def _predict_proba(self, X) -> np.ndarray:
         m = getattr(self._estimator, "predict_proba", None)
         if callable(m):
-            return self._estimator.predict_proba(self._transformer.transform(X))
+            with _transformed(self._transformer.transform(X)) as X_t:
+                return self._estimator.predict_proba(X_t)
         else:
-            preds = self._estimator.predict(self._transformer.transform(X))
+            with _transformed(self._transformer.transform(X)) as X_t:
+                preds = self._estimator.predict(X_t)
             unique = np.unique(preds)
             for i, u in enumerate(unique):
                 preds[preds == u] = i
             n_cases = len(preds)
-            n_clusters = self.n_clusters
+            n_clusters = getattr(self._estimator, "n_clusters", None)
             if n_clusters is None:
                 n_clusters = int(max(preds)) + 1
             dists = np.zeros((X.shape[0], n_clusters))
@@ -98,3 +111,19 @@ class RClustering(BaseClusterer):
 
     def _score(self, X, y=None):
         raise NotImplementedError("R-clustering does not support scoring.")
+
+
+@contextmanager
+def _transformed(X_t):
+    """Remove the file of a memory-mapped transformer output once it is used.
+
+    The transformer output is only used internally, so the files created when
+    ``memmap_dir`` is set are removed rather than left in the directory.
+    """
+    try:
+        yield X_t
+    finally:
+        if isinstance(X_t, np.memmap):
+            filename = X_t.filename
+            del X_t
+            os.remove(filename)
@@ -6,20 +6,67 @@ https://github.com/jorgemarcoes/R-Clustering/blob/main/R_Clustering_on_UCR_Archi
 
 __all__ = ["RClusteringTransformer"]
 
-import multiprocessing
-from typing import Union
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Optional, Union
 
 import numpy as np
 from aeon.transformations.collection import BaseCollectionTransformer
-from numba import get_num_threads, njit, prange, set_num_threads, vectorize
-from sklearn.decomposition import PCA
+from aeon.utils.validation import check_n_jobs
+from numba import config, get_num_threads, njit, prange, set_num_threads
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn.preprocessing import StandardScaler
 
 
+# the explained variance ratios sum to at most 1, so no more than 100 components
+# can explain 1% or more of the variance each
+_MAX_PCA_COMPONENTS = 101
+
+
 class RClusteringTransformer(BaseCollectionTransformer):
+    """MiniRocket based transformer for R-clustering.
+
+    Parameters
+    ----------
+    num_features : int, default=500
+        Number of MiniRocket features to extract.
+    max_dilations_per_kernel : int, default=32
+        Maximum number of dilations per kernel.
+    pca_result : bool, default=True
+        Whether to standardise the features and reduce their dimension with PCA.
+        The scaler and PCA are fit on the first call to ``transform`` after ``fit``
+        (i.e. in ``fit_transform``) and reused by later calls, so new cases are
+        projected into the same space as the cases the transformer was fit on.
+    chunk_size : int or None, default=None
+        If set, the transform is applied to batches of ``chunk_size`` cases at a
+        time. Scaling statistics are fit incrementally and an ``IncrementalPCA`` is
+        used for the dimension reduction, so the full MiniRocket feature matrix is
+        never held in memory. At most 100 components can explain 1% or more of the
+        variance, so the ``IncrementalPCA`` is limited to 101 components, or
+        ``chunk_size`` components if smaller, and memory use is bounded by
+        ``chunk_size`` rather than the number of features.
+    memmap_dir : str or None, default=None
+        Only used if ``chunk_size`` is set. If set, the raw features between passes
+        and the transformed output are written to memory-mapped arrays in this
+        directory rather than kept in memory. The returned array is a
+        ``np.memmap`` which can be consumed directly by ``KMeans`` or
+        ``MiniBatchKMeans``. Each call to ``transform`` creates a new output file,
+        the raw feature files are removed but the output files are owned by the
+        caller, who is responsible for removing them (their path is the
+        ``filename`` attribute of the returned array).
+    n_jobs : int, default=1
+        The number of threads used for fitting the biases and the MiniRocket
+        transform. ``-1`` means using all processors. If greater than one, parallel
+        kernels are used and the numba thread count is only changed for the calling
+        thread, so it does not interfere with other estimators in the same process.
+    random_state : int or None, default=None
+        Seed for random number generation.
+    """
 
     _tags = {
         "output_data_type": "Tabular",
+        "capability:multithreading": True,
         "algorithm_type": "convolution",
     }
 
@@ -28,19 +75,30 @@ class RClusteringTransformer(BaseCollectionTransformer):
         num_features: int = 500,
         max_dilations_per_kernel: int = 32,
         pca_result: bool = True,
+        chunk_size: Optional[int] = None,
+        memmap_dir: Optional[str] = None,
         n_jobs=1,
         random_state=None,
     ):
         self.num_features = num_features
         self.max_dilations_per_kernel = max_dilations_per_kernel
         self.pca_result = pca_result
+        self.chunk_size = chunk_size
+        self.memmap_dir = memmap_dir
 
         self.n_jobs = n_jobs
         self.random_state = random_state
         self._dim_reduction_transformer = None
+        self._scaler = None
+        self._n_pca_components = None
         super().__init__()
 
     def _fit(self, X, y=None):
+        # the scaler and PCA are fit on the next call to transform
+        self._dim_reduction_transformer = None
+        self._scaler = None
+        self._n_pca_components = None
+
         random_state = (
             np.int32(self.random_state) if isinstance(self.random_state, int) else None
         )
@@ -52,368 +110,140 @@ class RClusteringTransformer(BaseCollectionTransformer):
                 f"n_timepoints must be >= 9, but found {n_timepoints};"
                 " zero pad shorter series so that n_timepoints == 9"
             )
-        self.parameters = _fit(
-            X, self.num_features, self.max_dilations_per_kernel, random_state
-        )
+        with _numba_threads(self.n_jobs) as n_jobs:
+            self.parameters = _fit(
+                X,
+                self.num_features,
+                self.max_dilations_per_kernel,
+                random_state,
+                parallel=n_jobs > 1,
+            )
         return self
 
     def _transform(self, X, y=None):
-        X = X.squeeze()
-        X = X.astype(np.float32)
+        with _numba_threads(self.n_jobs) as n_jobs:
+            if self.chunk_size is not None:
+                return self._chunked_transform(X, n_jobs > 1)
 
-        # change n_jobs dependend on value and existing cores
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-
-        X_ = _transform(X, self.parameters)
+            X = X.squeeze()
+            X = X.astype(np.float32)
+            X_ = self._minirocket_transform(X, n_jobs > 1)
 
         if self.pca_result:
-            sc = StandardScaler()
-            X_std = sc.fit_transform(X_)
-
             if self._dim_reduction_transformer is None:
+                self._scaler = StandardScaler().fit(X_)
+                X_std = self._scaler.transform(X_)
+
                 pca = PCA(random_state=self.random_state).fit(X_std)
                 optimal_dimensions = np.argmax(pca.explained_variance_ratio_ < 0.01)
                 pca_optimal = PCA(n_components=optimal_dimensions)
-                self._dim_reduction_transformer = pca_optimal
-            X_t = self._dim_reduction_transformer.fit_transform(X_std)
+                self._dim_reduction_transformer = pca_optimal.fit(X_std)
+            X_t = self._dim_reduction_transformer.transform(self._scaler.transform(X_))
         else:
             X_t = X_
 
-        set_num_threads(prev_threads)
-
         return X_t
 
+    def _minirocket_transform(self, X, parallel):
+        if parallel:
+            return _transform_parallel(X, self.parameters)
+        return _transform(X, self.parameters)
+
+    def _chunked_transform(self, X, parallel):
+        n_cases = X.shape[0]
+        n_features = len(self.parameters[2])
+
+        if not self.pca_result:
+            X_t = self._create_output((n_cases, n_features), "features")
+            for start, end in self._chunks(n_cases, self.chunk_size):
+                X_t[start:end] = self._transform_chunk(X, start, end, parallel)
+            return X_t
+
+        if self._dim_reduction_transformer is None:
+            # cache the raw features between passes only if we can store them
+            # outside of memory, otherwise recompute them for each pass
+            X_raw = (
+                self._create_output((n_cases, n_features), "raw_features")
+                if self.memmap_dir is not None
+                else None
+            )
 
-@njit(
-    "float32[:](float32[:,:],int32[:],int32[:],float32[:])",
-    fastmath=True,
-    parallel=False,
-    cache=True,
-)
-def _fit_biases(X, dilations, num_features_per_dilation, quantiles):
-    num_examples, input_length = X.shape
-
-    # R-clustering specific modification
-    indices = np.array(
-        (
-            1,
-            3,
-            6,
-            1,
-            2,
-            7,
-            1,
-            2,
-            3,
-            0,
-            2,
-            3,
-            1,
-            4,
-            5,
-            0,
-            1,
-            3,
-            3,
-            5,
-            6,
-            0,
-            1,
-            2,
-            2,
-            5,
-            8,
-            1,
-            3,
-            7,
-            0,
-            1,
-            8,
-            4,
-            6,
-            7,
-            0,
-            1,
-            4,
-            3,
-            4,
-            6,
-            0,
-            4,
-            5,
-            2,
-            6,
-            7,
-            5,
-            6,
-            7,
-            0,
-            1,
-            6,
-            4,
-            5,
-            7,
-            4,
-            7,
-            8,
-            1,
-            6,
-            8,
-            0,
-            2,
-            6,
-            5,
-            6,
-            8,
-            2,
-            5,
-            7,
-            0,
-            1,
-            7,
-            0,
-            7,
-            8,
-            0,
-            3,
-            5,
-            0,
-            3,
-            7,
-            2,
-            3,
-            8,
-            2,
-            3,
-            4,
-            1,
-            4,
-            6,
-            3,
-            4,
-            5,
-            0,
-            3,
-            8,
-            4,
-            5,
-            8,
-            0,
-            4,
-            6,
-            1,
-            4,
-            8,
-            6,
-            7,
-            8,
-            4,
-            6,
-            8,
-            0,
-            3,
-            4,
-            1,
-            3,
-            4,
-            1,
-            5,
-            7,
-            1,
-            4,
-            7,
-            1,
-            2,
-            8,
-            0,
-            6,
-            7,
-            1,
-            6,
-            7,
-            1,
-            3,
-            5,
-            0,
-            1,
-            5,
-            0,
-            4,
-            8,
-            4,
-            5,
-            6,
-            0,
-            2,
-            5,
-            3,
-            5,
-            7,
-            0,
-            2,
-            4,
-            2,
-            6,
-            8,
-            2,
-            3,
-            7,
-            2,
-            5,
-            6,
-            2,
-            4,
-            8,
-            0,
-            2,
-            7,
-            3,
-            6,
-            8,
-            2,
-            3,
-            6,
-            3,
-            7,
-            8,
-            0,
-            5,
-            8,
-            1,
-            2,
-            6,
-            2,
-            3,
-            5,
-            1,
-            5,
-            8,
-            3,
-            6,
-            7,
-            3,
-            4,
-            7,
-            0,
-            4,
-            7,
-            3,
-            5,
-            8,
-            2,
-            4,
-            5,
-            1,
-            2,
-            5,
-            2,
-            7,
-            8,
-            2,
-            4,
-            6,
-            0,
-            5,
-            6,
-            3,
-            4,
-            8,
-            0,
-            6,
-            8,
-            2,
-            4,
-            7,
-            0,
-            2,
-            8,
-            0,
-            3,
-            6,
-            5,
-            7,
-            8,
-            1,
-            5,
-            6,
-            1,
-            2,
-            4,
-            0,
-            5,
-            7,
-            1,
-            3,
-            8,
-            1,
-            7,
-            8,
-        ),
-        dtype=np.int32,
-    ).reshape(84, 3)
-
-    num_kernels = len(indices)
-    num_dilations = len(dilations)
-
-    num_features = num_kernels * np.sum(num_features_per_dilation)
-
-    biases = np.zeros(num_features, dtype=np.float32)
-
-    feature_index_start = 0
-
-    for dilation_index in range(num_dilations):
-
-        dilation = dilations[dilation_index]
-        padding = ((9 - 1) * dilation) // 2
-
-        num_features_this_dilation = num_features_per_dilation[dilation_index]
-
-        for kernel_index in range(num_kernels):
-
-            feature_index_end = feature_index_start + num_features_this_dilation
-
-            _X = X[np.random.randint(num_examples)]
-
-            A = -_X  # A = alpha * X = -X
-            G = _X + _X + _X  # G = gamma * X = 3X
-
-            C_alpha = np.zeros(input_length, dtype=np.float32)
-            C_alpha[:] = A
-
-            C_gamma = np.zeros((9, input_length), dtype=np.float32)
-            C_gamma[9 // 2] = G
-
-            start = dilation
-            end = input_length - padding
-
-            for gamma_index in range(9 // 2):
-                C_alpha[-end:] = C_alpha[-end:] + A[:end]
-                C_gamma[gamma_index, -end:] = G[:end]
-
-                end += dilation
-
-            for gamma_index in range(9 // 2 + 1, 9):
-                C_alpha[:-start] = C_alpha[:-start] + A[start:]
-                C_gamma[gamma_index, :-start] = G[start:]
+            self._scaler = StandardScaler()
+            for start, end in self._chunks(n_cases, self.chunk_size):
+                X_ = self._transform_chunk(X, start, end, parallel)
+                if X_raw is not None:
+                    X_raw[start:end] = X_
+                self._scaler.partial_fit(X_)
+
+            # components are only kept while they explain at least 1% of the
+            # variance, so no more than _MAX_PCA_COMPONENTS are ever needed. every
+            # batch has at least chunk_size cases, so it can also bound the number of
+            # components
+            pca = IncrementalPCA(
+                n_components=min(
+                    _MAX_PCA_COMPONENTS, self.chunk_size, n_features, n_cases
+                )
+            )
+            for start, end in self._chunks(n_cases, self.chunk_size):
+                X_ = (
+                    X_raw[start:end]
+                    if X_raw is not None
+                    else self._transform_chunk(X, start, end, parallel)
+                )
+                pca.partial_fit(self._scaler.transform(X_))
+
+            optimal_dimensions = np.argmax(pca.explained_variance_ratio_ < 0.01)
+            if optimal_dimensions == 0:
+                optimal_dimensions = pca.n_components_
+            self._dim_reduction_transformer = pca
+            self._n_pca_components = optimal_dimensions
+        else:
+            X_raw = None
+
+        # the leading components of the full decomposition are the same as those
+        # of a decomposition with fewer components, so we can truncate
+        X_t = self._create_output((n_cases, self._n_pca_components), "features")
+        for start, end in self._chunks(n_cases, self.chunk_size):
+            X_ = (
+                X_raw[start:end]
+                if X_raw is not None
+                else self._transform_chunk(X, start, end, parallel)
+            )
+            X_t[start:end] = self._dim_reduction_transformer.transform(
+                self._scaler.transform(X_)
+            )[:, : self._n_pca_components]
 
-                start += dilation
+        if X_raw is not None:
+            filename = X_raw.filename
+            del X_raw
+            os.remove(filename)
 
-            index_0, index_1, index_2 = indices[kernel_index]
+        return X_t
 
-            C = C_alpha + C_gamma[index_0] + C_gamma[index_1] + C_gamma[index_2]
+    def _transform_chunk(self, X, start, end, parallel):
+        return self._minirocket_transform(X[start:end, 0].astype(np.float32), parallel)
 
-            biases[feature_index_start:feature_index_end] = np.quantile(
-                C, quantiles[feature_index_start:feature_index_end]
-            )
+    def _create_output(self, shape, name):
+        if self.memmap_dir is None:
+            return np.zeros(shape, dtype=np.float32)
 
-            feature_index_start = feature_index_end
+        os.makedirs(self.memmap_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(
+            prefix=f"rclustering_{name}_", suffix=".dat", dir=self.memmap_dir
+        )
+        os.close(fd)
+        return np.memmap(path, dtype=np.float32, mode="w+", shape=shape)
 
-    return biases
+    @staticmethod
+    def _chunks(n_cases, chunk_size):
+        # merge a small final chunk into the previous one so every batch has at
+        # least chunk_size cases, as required by IncrementalPCA
+        starts = list(range(0, n_cases, chunk_size))
+        if len(starts) > 1 and n_cases - starts[-1] < chunk_size:
+            starts.pop()
+        for i, start in enumerate(starts):
+            end = starts[i + 1] if i + 1 < len(starts) else n_cases
+            yield start, end
 
 
 def _fit_dilations(input_length, num_features, max_dilations_per_kernel):
@@ -454,12 +284,16 @@ def _quantiles(n):
 
 
 def _fit(
-    X, num_features=10_000, max_dilations_per_kernel=32, seed: Union[int, None] = None
+    X,
+    num_features=10_000,
+    max_dilations_per_kernel=32,
+    seed: Union[int, None] = None,
+    parallel=False,
 ):
     if seed is not None:
         np.random.seed(seed)
 
-    _, input_length = X.shape
+    num_examples, input_length = X.shape
 
     num_kernels = 84
 
@@ -474,360 +308,527 @@ def _fit(
     # R-clustering specific modifications
     quantiles = np.random.permutation(quantiles)
 
-    biases = _fit_biases(X, dilations, num_features_per_dilation, quantiles)
+    # draw the example used for each kernel/dilation combination up front so the
+    # biases are the same for the serial and parallel kernels
+    examples = np.random.randint(
+        num_examples, size=num_kernels * len(dilations)
+    ).astype(np.int32)
+
+    if parallel:
+        biases = _fit_biases_parallel(
+            X, dilations, num_features_per_dilation, quantiles, examples
+        )
+    else:
+        biases = _fit_biases(
+            X, dilations, num_features_per_dilation, quantiles, examples
+        )
 
     return dilations, num_features_per_dilation, biases
 
 
-# _PPV(C, b).mean() returns PPV for vector C (convolution output) and scalar b (bias)
-@vectorize("float32(float32,float32)", nopython=True, cache=True)
-def _PPV(a, b):
-    if a > b:
-        return 1
-    else:
-        return 0
+@contextmanager
+def _numba_threads(n_jobs):
+    """Set the numba thread count for the calling thread only.
+
+    numba stores the thread count per thread, so this does not affect other threads
+    running numba code in the same process. The previous value is always restored.
+    """
+    n_jobs = min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS)
+    prev_threads = get_num_threads()
+    set_num_threads(n_jobs)
+    try:
+        yield n_jobs
+    finally:
+        set_num_threads(prev_threads)
+
+
+# R-clustering specific modification
+_INDICES = np.array(
+    (
+        1,
+        3,
+        6,
+        1,
+        2,
+        7,
+        1,
+        2,
+        3,
+        0,
+        2,
+        3,
+        1,
+        4,
+        5,
+        0,
+        1,
+        3,
+        3,
+        5,
+        6,
+        0,
+        1,
+        2,
+        2,
+        5,
+        8,
+        1,
+        3,
+        7,
+        0,
+        1,
+        8,
+        4,
+        6,
+        7,
+        0,
+        1,
+        4,
+        3,
+        4,
+        6,
+        0,
+        4,
+        5,
+        2,
+        6,
+        7,
+        5,
+        6,
+        7,
+        0,
+        1,
+        6,
+        4,
+        5,
+        7,
+        4,
+        7,
+        8,
+        1,
+        6,
+        8,
+        0,
+        2,
+        6,
+        5,
+        6,
+        8,
+        2,
+        5,
+        7,
+        0,
+        1,
+        7,
+        0,
+        7,
+        8,
+        0,
+        3,
+        5,
+        0,
+        3,
+        7,
+        2,
+        3,
+        8,
+        2,
+        3,
+        4,
+        1,
+        4,
+        6,
+        3,
+        4,
+        5,
+        0,
+        3,
+        8,
+        4,
+        5,
+        8,
+        0,
+        4,
+        6,
+        1,
+        4,
+        8,
+        6,
+        7,
+        8,
+        4,
+        6,
+        8,
+        0,
+        3,
+        4,
+        1,
+        3,
+        4,
+        1,
+        5,
+        7,
+        1,
+        4,
+        7,
+        1,
+        2,
+        8,
+        0,
+        6,
+        7,
+        1,
+        6,
+        7,
+        1,
+        3,
+        5,
+        0,
+        1,
+        5,
+        0,
+        4,
+        8,
+        4,
+        5,
+        6,
+        0,
+        2,
+        5,
+        3,
+        5,
+        7,
+        0,
+        2,
+        4,
+        2,
+        6,
+        8,
+        2,
+        3,
+        7,
+        2,
+        5,
+        6,
+        2,
+        4,
+        8,
+        0,
+        2,
+        7,
+        3,
+        6,
+        8,
+        2,
+        3,
+        6,
+        3,
+        7,
+        8,
+        0,
+        5,
+        8,
+        1,
+        2,
+        6,
+        2,
+        3,
+        5,
+        1,
+        5,
+        8,
+        3,
+        6,
+        7,
+        3,
+        4,
+        7,
+        0,
+        4,
+        7,
+        3,
+        5,
+        8,
+        2,
+        4,
+        5,
+        1,
+        2,
+        5,
+        2,
+        7,
+        8,
+        2,
+        4,
+        6,
+        0,
+        5,
+        6,
+        3,
+        4,
+        8,
+        0,
+        6,
+        8,
+        2,
+        4,
+        7,
+        0,
+        2,
+        8,
+        0,
+        3,
+        6,
+        5,
+        7,
+        8,
+        1,
+        5,
+        6,
+        1,
+        2,
+        4,
+        0,
+        5,
+        7,
+        1,
+        3,
+        8,
+        1,
+        7,
+        8,
+    ),
+    dtype=np.int32,
+).reshape(84, 3)
+
+
+@njit(fastmath=True, cache=True)
+def _convolution_sums(_X, dilation, padding):
+    input_length = _X.shape[0]
+
+    A = -_X  # A = alpha * X = -X
+    G = _X + _X + _X  # G = gamma * X = 3X
+
+    C_alpha = np.zeros(input_length, dtype=np.float32)
+    C_alpha[:] = A
+
+    C_gamma = np.zeros((9, input_length), dtype=np.float32)
+    C_gamma[9 // 2] = G
+
+    start = dilation
+    end = input_length - padding
+
+    for gamma_index in range(9 // 2):
+        C_alpha[-end:] = C_alpha[-end:] + A[:end]
+        C_gamma[gamma_index, -end:] = G[:end]
+
+        end += dilation
+
+    for gamma_index in range(9 // 2 + 1, 9):
+        C_alpha[:-start] = C_alpha[:-start] + A[start:]
+        C_gamma[gamma_index, :-start] = G[start:]
+
+        start += dilation
+
+    return C_alpha, C_gamma
+
+
+@njit(fastmath=True, cache=True)
+def _fit_biases_kernel(
+    X,
+    dilations,
+    num_features_per_dilation,
+    quantiles,
+    examples,
+    feature_offsets,
+    biases,
+    combination_index,
+):
+    num_kernels = len(_INDICES)
+    dilation_index = combination_index // num_kernels
+    kernel_index = combination_index % num_kernels
+
+    dilation = dilations[dilation_index]
+    padding = ((9 - 1) * dilation) // 2
+
+    feature_index_start = (
+        feature_offsets[dilation_index]
+        + kernel_index * num_features_per_dilation[dilation_index]
+    )
+    feature_index_end = feature_index_start + num_features_per_dilation[dilation_index]
+
+    C_alpha, C_gamma = _convolution_sums(
+        X[examples[combination_index]], dilation, padding
+    )
+
+    index_0, index_1, index_2 = _INDICES[kernel_index]
+
+    C = C_alpha + C_gamma[index_0] + C_gamma[index_1] + C_gamma[index_2]
+
+    biases[feature_index_start:feature_index_end] = np.quantile(
+        C, quantiles[feature_index_start:feature_index_end]
+    )
+
+
+@njit(fastmath=True, cache=True)
+def _feature_offsets(num_features_per_dilation):
+    num_kernels = len(_INDICES)
+    offsets = np.zeros(len(num_features_per_dilation), dtype=np.int64)
+    for i in range(1, len(num_features_per_dilation)):
+        offsets[i] = offsets[i - 1] + num_kernels * num_features_per_dilation[i - 1]
+    return offsets
 
 
 @njit(
-    "float32[:,:](float32[:,:],Tuple((int32[:],int32[:],float32[:])))",
+    "float32[:](float32[:,:],int32[:],int32[:],float32[:],int32[:])",
+    fastmath=True,
+    parallel=False,
+    cache=True,
+)
+def _fit_biases(X, dilations, num_features_per_dilation, quantiles, examples):
+    num_features = len(_INDICES) * np.sum(num_features_per_dilation)
+    biases = np.zeros(num_features, dtype=np.float32)
+    feature_offsets = _feature_offsets(num_features_per_dilation)
+
+    for combination_index in range(len(examples)):
+        _fit_biases_kernel(
+            X,
+            dilations,
+            num_features_per_dilation,
+            quantiles,
+            examples,
+            feature_offsets,
+            biases,
+            combination_index,
+        )
+
+    return biases
+
+
+@njit(
+    "float32[:](float32[:,:],int32[:],int32[:],float32[:],int32[:])",
     fastmath=True,
     parallel=True,
     cache=True,
 )
-def _transform(X, parameters):
-    num_examples, input_length = X.shape
+def _fit_biases_parallel(X, dilations, num_features_per_dilation, quantiles, examples):
+    num_features = len(_INDICES) * np.sum(num_features_per_dilation)
+    biases = np.zeros(num_features, dtype=np.float32)
+    feature_offsets = _feature_offsets(num_features_per_dilation)
+
+    for combination_index in prange(len(examples)):
+        _fit_biases_kernel(
+            X,
+            dilations,
+            num_features_per_dilation,
+            quantiles,
+            examples,
+            feature_offsets,
+            biases,
+            combination_index,
+        )
 
-    dilations, num_features_per_dilation, biases = parameters
+    return biases
 
-    # R-clustering specific modifications
-    indices = np.array(
-        (
-            1,
-            3,
-            6,
-            1,
-            2,
-            7,
-            1,
-            2,
-            3,
-            0,
-            2,
-            3,
-            1,
-            4,
-            5,
-            0,
-            1,
-            3,
-            3,
-            5,
-            6,
-            0,
-            1,
-            2,
-            2,
-            5,
-            8,
-            1,
-            3,
-            7,
-            0,
-            1,
-            8,
-            4,
-            6,
-            7,
-            0,
-            1,
-            4,
-            3,
-            4,
-            6,
-            0,
-            4,
-            5,
-            2,
-            6,
-            7,
-            5,
-            6,
-            7,
-            0,
-            1,
-            6,
-            4,
-            5,
-            7,
-            4,
-            7,
-            8,
-            1,
-            6,
-            8,
-            0,
-            2,
-            6,
-            5,
-            6,
-            8,
-            2,
-            5,
-            7,
-            0,
-            1,
-            7,
-            0,
-            7,
-            8,
-            0,
-            3,
-            5,
-            0,
-            3,
-            7,
-            2,
-            3,
-            8,
-            2,
-            3,
-            4,
-            1,
-            4,
-            6,
-            3,
-            4,
-            5,
-            0,
-            3,
-            8,
-            4,
-            5,
-            8,
-            0,
-            4,
-            6,
-            1,
-            4,
-            8,
-            6,
-            7,
-            8,
-            4,
-            6,
-            8,
-            0,
-            3,
-            4,
-            1,
-            3,
-            4,
-            1,
-            5,
-            7,
-            1,
-            4,
-            7,
-            1,
-            2,
-            8,
-            0,
-            6,
-            7,
-            1,
-            6,
-            7,
-            1,
-            3,
-            5,
-            0,
-            1,
-            5,
-            0,
-            4,
-            8,
-            4,
-            5,
-            6,
-            0,
-            2,
-            5,
-            3,
-            5,
-            7,
-            0,
-            2,
-            4,
-            2,
-            6,
-            8,
-            2,
-            3,
-            7,
-            2,
-            5,
-            6,
-            2,
-            4,
-            8,
-            0,
-            2,
-            7,
-            3,
-            6,
-            8,
-            2,
-            3,
-            6,
-            3,
-            7,
-            8,
-            0,
-            5,
-            8,
-            1,
-            2,
-            6,
-            2,
-            3,
-            5,
-            1,
-            5,
-            8,
-            3,
-            6,
-            7,
-            3,
-            4,
-            7,
-            0,
-            4,
-            7,
-            3,
-            5,
-            8,
-            2,
-            4,
-            5,
-            1,
-            2,
-            5,
-            2,
-            7,
-            8,
-            2,
-            4,
-            6,
-            0,
-            5,
-            6,
-            3,
-            4,
-            8,
-            0,
-            6,
-            8,
-            2,
-            4,
-            7,
-            0,
-            2,
-            8,
-            0,
-            3,
-            6,
-            5,
-            7,
-            8,
-            1,
-            5,
-            6,
-            1,
-            2,
-            4,
-            0,
-            5,
-            7,
-            1,
-            3,
-            8,
-            1,
-            7,
-            8,
-        ),
-        dtype=np.int32,
-    ).reshape(84, 3)
 
-    num_kernels = len(indices)
-    num_dilations = len(dilations)
+@njit(fastmath=True, cache=True)
+def _ppv(C, start, end, bias):
+    # fused proportion of positive values, avoids allocating a temporary array
+    count = 0
+    for i in range(start, end):
+        if C[i] > bias:
+            count += 1
+    return np.float32(count / (end - start))
 
-    num_features = num_kernels * np.sum(num_features_per_dilation)
 
-    features = np.zeros((num_examples, num_features), dtype=np.float32)
+@njit(fastmath=True, cache=True)
+def _transform_case(_X, dilations, num_features_per_dilation, biases, features):
+    input_length = _X.shape[0]
 
-    for example_index in prange(num_examples):
+    num_kernels = len(_INDICES)
+    num_dilations = len(dilations)
 
-        _X = X[example_index]
+    feature_index_start = 0
 
-        A = -_X  # A = alpha * X = -X
-        G = _X + _X + _X  # G = gamma * X = 3X
+    for dilation_index in range(num_dilations):
 
-        feature_index_start = 0
+        _padding0 = dilation_index % 2
 
-        for dilation_index in range(num_dilations):
+        dilation = dilations[dilation_index]
+        padding = ((9 - 1) * dilation) // 2
 
-            _padding0 = dilation_index % 2
+        num_features_this_dilation = num_features_per_dilation[dilation_index]
 
-            dilation = dilations[dilation_index]
-            padding = ((9 - 1) * dilation) // 2
+        C_alpha, C_gamma = _convolution_sums(_X, dilation, padding)
 
-            num_features_this_dilation = num_features_per_dilation[dilation_index]
+        for kernel_index in range(num_kernels):
 
-            C_alpha = np.zeros(input_length, dtype=np.float32)
-            C_alpha[:] = A
+            feature_index_end = feature_index_start + num_features_this_dilation
 
-            C_gamma = np.zeros((9, input_length), dtype=np.float32)
-            C_gamma[9 // 2] = G
+            _padding1 = (_padding0 + kernel_index) % 2
 
-            start = dilation
-            end = input_length - padding
+            index_0, index_1, index_2 = _INDICES[kernel_index]
 
-            for gamma_index in range(9 // 2):
-                C_alpha[-end:] = C_alpha[-end:] + A[:end]
-                C_gamma[gamma_index, -end:] = G[:end]
+            C = C_alpha + C_gamma[index_0] + C_gamma[index_1] + C_gamma[index_2]
 
-                end += dilation
+            if _padding1 == 0:
+                start = 0
+                end = input_length
+            else:
+                start = padding
+                end = input_length - padding
 
-            for gamma_index in range(9 // 2 + 1, 9):
-                C_alpha[:-start] = C_alpha[:-start] + A[start:]
-                C_gamma[gamma_index, :-start] = G[start:]
+            for feature_count in range(num_features_this_dilation):
+                features[feature_index_start + feature_count] = _ppv(
+                    C, start, end, biases[feature_index_start + feature_count]
+                )
 
-                start += dilation
+            feature_index_start = feature_index_end
 
-            for kernel_index in range(num_kernels):
 
-                feature_index_end = feature_index_start + num_features_this_dilation
+@njit(
+    "float32[:,:](float32[:,:],Tuple((int32[:],int32[:],float32[:])))",
+    fastmath=True,
+    parallel=False,
+    cache=True,
+)
+def _transform(X, parameters):
+    num_examples = X.shape[0]
+    dilations, num_features_per_dilation, biases = parameters
+
+    features = np.zeros((num_examples, len(biases)), dtype=np.float32)
 
-                _padding1 = (_padding0 + kernel_index) % 2
+    for example_index in range(num_examples):
+        _transform_case(
+            X[example_index],
+            dilations,
+            num_features_per_dilation,
+            biases,
+            features[example_index],
+        )
+
+    return features
 
-                index_0, index_1, index_2 = indices[kernel_index]
 
-                C = C_alpha + C_gamma[index_0] + C_gamma[index_1] + C_gamma[index_2]
+@njit(
+    "float32[:,:](float32[:,:],Tuple((int32[:],int32[:],float32[:])))",
+    fastmath=True,
+    parallel=True,
+    cache=True,
+)
+def _transform_parallel(X, parameters):
+    num_examples = X.shape[0]
+    dilations, num_features_per_dilation, biases = parameters
 
-                if _padding1 == 0:
-                    for feature_count in range(num_features_this_dilation):
-                        features[example_index, feature_index_start + feature_count] = (
-                            _PPV(C, biases[feature_index_start + feature_count]).mean()
-                        )
-                else:
-                    for feature_count in range(num_features_this_dilation):
-                        features[example_index, feature_index_start + feature_count] = (
-                            _PPV(
-                                C[padding:-padding],
-                                biases[feature_index_start + feature_count],
-                            ).mean()
-                        )
+    features = np.zeros((num_examples, len(biases)), dtype=np.float32)
 
-                feature_index_start = feature_index_end
+    for example_index in prange(num_examples):
+        _transform_case(
+            X[example_index],
+            dilations,
+            num_features_per_dilation,
+            biases,
+            features[example_index],
+        )
 
     return features
@@ -8,6 +8,8 @@ from sklearn.base import ClusterMixin
 from sklearn.utils.validation import check_is_fitted
 from tsml.base import BaseTimeSeriesEstimator, _clone_estimator
 
+from tsml_eval.estimators._sklearn_conversion import convert_to_sklearn_2d
+
 
 class SklearnToTsmlClusterer(ClusterMixin, BaseTimeSeriesEstimator):
     """Wrapper for sklearn estimators to use the tsml base class."""
@@ -34,7 +36,7 @@ class SklearnToTsmlClusterer(ClusterMixin, BaseTimeSeriesEstimator):
             raise ValueError("Clusterer not set")
 
         X = self._validate_data(X=X)
-        X = self._convert_X(
+        X = convert_to_sklearn_2d(
             X,
             pad_unequal=self.pad_unequal,
             concatenate_channels=self.concatenate_channels,
@@ -56,7 +58,7 @@ class SklearnToTsmlClusterer(ClusterMixin, BaseTimeSeriesEstimator):
         check_is_fitted(self)
 
         X = self._validate_data(X=X, reset=False)
-        X = self._convert_X(
+        X = convert_to_sklearn_2d(
             X,
             pad_unequal=self.pad_unequal,
             concatenate_channels=self.concatenate_channels,
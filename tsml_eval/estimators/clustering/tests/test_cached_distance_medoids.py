@@ -0,0 +1,64 @@
+"""Tests for the medoid clusterers using a precomputed distance matrix."""
+
+import numpy as np
+import pytest
+from aeon.clustering import TimeSeriesCLARA, TimeSeriesCLARANS, TimeSeriesKMedoids
+from aeon.distances import pairwise_distance
+
+from tsml_eval.estimators.clustering import (
+    CachedDistanceCLARA,
+    CachedDistanceCLARANS,
+    CachedDistanceKMedoids,
+)
+
+
+@pytest.mark.parametrize(
+    "clusterer, cached_clusterer, params",
+    [
+        (TimeSeriesKMedoids, CachedDistanceKMedoids, {"method": "pam"}),
+        (TimeSeriesKMedoids, CachedDistanceKMedoids, {"method": "alternate"}),
+        (TimeSeriesKMedoids, CachedDistanceKMedoids, {"init": "build"}),
+        (TimeSeriesCLARANS, CachedDistanceCLARANS, {}),
+        (TimeSeriesCLARA, CachedDistanceCLARA, {"n_samples": 12}),
+    ],
+)
+def test_cached_distance_medoids(clusterer, cached_clusterer, params):
+    """Test the precomputed distances do not change the clustering."""
+    rng = np.random.default_rng(0)
+    X = rng.random((20, 1, 15))
+    X_test = rng.random((5, 1, 15))
+    distance_params = {"window": 0.2}
+
+    base = clusterer(
+        n_clusters=3,
+        distance="dtw",
+        distance_params=distance_params,
+        random_state=0,
+        **params,
+    )
+    base.fit(X)
+    cached = cached_clusterer(
+        n_clusters=3,
+        distance="dtw",
+        distance_params=distance_params,
+        distance_matrix=pairwise_distance(X, method="dtw", **distance_params),
+        random_state=0,
+        **params,
+    )
+    cached.fit(X)
+
+    np.testing.assert_array_equal(base.labels_, cached.labels_)
+    np.testing.assert_almost_equal(base.inertia_, cached.inertia_)
+    np.testing.assert_array_equal(X[cached.medoid_indexes_], cached.cluster_centers_)
+    np.testing.assert_array_equal(base.predict(X_test), cached.predict(X_test))
+
+
+def test_cached_distance_medoids_invalid_shape():
+    """Test a distance matrix not matching the training cases raises an error."""
+    X = np.random.default_rng(0).random((10, 1, 15))
+    clst = CachedDistanceKMedoids(
+        n_clusters=2, distance_matrix=np.zeros((5, 5)), random_state=0
+    )
+
+    with pytest.raises(ValueError, match="distance_matrix must have shape"):
+        clst.fit(X)
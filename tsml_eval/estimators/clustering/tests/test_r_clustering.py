@@ -1,11 +1,20 @@
 """Tests for RClustering."""
 
+import tracemalloc
+
 import numpy as np
+import pytest
 from aeon.testing.data_generation import make_example_3d_numpy
 from aeon.testing.estimator_checking import parametrize_with_checks
 from sklearn.cluster import KMeans
 
 from tsml_eval.estimators.clustering import RClustering
+from tsml_eval.estimators.clustering._r_clustering._r_clustering_minirocket import (
+    RClusteringTransformer,
+    _fit,
+    _transform,
+    _transform_parallel,
+)
 
 
 def test_r_clustering():
@@ -35,3 +44,71 @@ def test_r_clustering_parametrized(check):
         check()
     except Exception:
         pass
+
+
+def test_r_clustering_chunked(tmp_path):
+    """Test RClustering with a chunked transform and memory-mapped output."""
+    train_X = make_example_3d_numpy(30, 1, 20, random_state=1, return_y=False)
+    test_X = make_example_3d_numpy(10, 1, 20, random_state=2, return_y=False)
+
+    kmeans = KMeans(random_state=1, n_init=10, n_clusters=2)
+
+    r_clustering = RClustering(
+        estimator=kmeans, chunk_size=8, memmap_dir=str(tmp_path), random_state=1
+    )
+    r_clustering.fit(train_X)
+    assert len(r_clustering.labels_) == 30
+    assert r_clustering._transformer._n_pca_components > 0
+
+    predictions = r_clustering.predict(test_X)
+    assert len(predictions) == 10
+    assert r_clustering.predict_proba(test_X).shape == (10, 2)
+
+    # the memory-mapped files used internally are all removed
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_r_clustering_chunked_memory(tmp_path):
+    """Test the chunked transform memory is bounded by chunk_size, not n_cases."""
+    peaks = []
+    for n_cases in [200, 800]:
+        X = make_example_3d_numpy(n_cases, 1, 30, random_state=1, return_y=False)
+        transformer = RClusteringTransformer(
+            num_features=2000, chunk_size=16, memmap_dir=str(tmp_path), random_state=1
+        ).fit(X)
+
+        tracemalloc.start()
+        transformer.transform(X)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        assert transformer._dim_reduction_transformer.n_components_ <= 16
+
+    assert peaks[1] < peaks[0] * 1.5
+
+
+@pytest.mark.parametrize("chunk_size", [None, 8])
+def test_r_clustering_transform_reuses_pca(chunk_size):
+    """Test the scaler and PCA fit in fit_transform are reused by transform."""
+    X = make_example_3d_numpy(30, 1, 20, random_state=1, return_y=False)
+
+    transformer = RClusteringTransformer(chunk_size=chunk_size, random_state=1)
+    X_t = transformer.fit_transform(X)
+
+    np.testing.assert_array_almost_equal(
+        transformer.transform(X[:10]), X_t[:10], decimal=4
+    )
+
+
+def test_r_clustering_parallel_kernels():
+    """Test the parallel R-clustering kernels match the serial ones."""
+    X = make_example_3d_numpy(10, 1, 50, random_state=1, return_y=False)
+    X = X[:, 0].astype(np.float32)
+
+    parameters = _fit(X, seed=1)
+    parameters_parallel = _fit(X, seed=1, parallel=True)
+    np.testing.assert_array_equal(parameters[2], parameters_parallel[2])
+
+    np.testing.assert_array_almost_equal(
+        _transform(X, parameters), _transform_parallel(X, parameters)
+    )
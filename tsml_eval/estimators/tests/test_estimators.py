@@ -1,5 +1,7 @@
 """Test estimators implemented in tsml-eval."""
 
+import numpy as np
+import pytest
 from sklearn.cluster import KMeans
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from tsml.utils.testing import parametrize_with_checks
@@ -9,6 +11,7 @@ from tsml_eval.estimators import (
     SklearnToTsmlClusterer,
     SklearnToTsmlRegressor,
 )
+from tsml_eval.estimators._sklearn_conversion import convert_to_sklearn_2d
 
 
 @parametrize_with_checks(
@@ -21,3 +24,23 @@ from tsml_eval.estimators import (
 def test_tsml_wrapper_estimator(estimator, check):
     """Test that tsml wrapper estimators adhere to tsml conventions."""
     check(estimator)
+
+
+def test_convert_to_sklearn_2d():
+    """Test conversion of collections to 2D arrays for the sklearn wrappers."""
+    X = np.random.random((5, 2, 10))
+    X_2d = convert_to_sklearn_2d(X, concatenate_channels=True)
+    assert X_2d.shape == (5, 20)
+    assert np.shares_memory(X, X_2d)
+
+    with pytest.raises(ValueError, match="concatenate_channels"):
+        convert_to_sklearn_2d(X)
+
+    X_list = [np.random.random((2, 10)), np.random.random((2, 8))]
+    X_2d = convert_to_sklearn_2d(X_list, pad_unequal=True, concatenate_channels=True)
+    assert X_2d.shape == (2, 20)
+    assert np.array_equal(X_2d[1, 10:18], X_list[1][1])
+    assert np.all(X_2d[1, 18:] == 0)
+
+    with pytest.raises(ValueError, match="pad_unequal"):
+        convert_to_sklearn_2d(X_list, concatenate_channels=True)
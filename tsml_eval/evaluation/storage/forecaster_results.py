@@ -159,6 +159,7 @@ class ForecasterResults(EstimatorResults):
             predict_time=self.predict_time,
             benchmark_time=self.benchmark_time,
             memory_usage=self.memory_usage,
+            pred_times=self.pred_times,
         )
 
     def load_from_file(self, file_path, verify_values=True):
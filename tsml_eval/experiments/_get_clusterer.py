@@ -16,7 +16,13 @@ from aeon.clustering import (
 from aeon.transformations.collection import Normalizer
 from sklearn.cluster import KMeans
 
+from tsml_eval.estimators.clustering import (
+    CachedDistanceCLARA,
+    CachedDistanceCLARANS,
+    CachedDistanceKMedoids,
+)
 from tsml_eval.utils.datasets import load_experiment_data
+from tsml_eval.utils.distance_cache import cache_experiment_pairwise_distances
 from tsml_eval.utils.functions import str_in_nested_list
 
 deep_learning_clusterers = [
@@ -182,6 +188,13 @@ def get_clusterer_by_name(
         `tsml_eval.utils.experiments import load_experiment_data`.
     row_normalise: bool, default=False
         Whether to row normalise the data if it is loaded using data_vars.
+    **kwargs
+        Extra keyword arguments for the clusterer. For the k-medoids, PAM, CLARA and
+        CLARANS clusterers, ``distance_cache_path`` can be given to read distances
+        between training cases from a pairwise distance matrix cached in that
+        directory. The matrix is computed for the train split loaded using
+        data_vars if it is not already cached, so should not be used when combining
+        the train and test splits.
 
     Return
     ------
@@ -284,6 +297,8 @@ def _set_clusterer_distance_based(
     row_normalise,
     kwargs,
 ):
+    distance_cache_path = kwargs.pop("distance_cache_path", None)
+
     if "init_algorithm" in kwargs:
         init_algorithm = kwargs["init_algorithm"]
     else:
@@ -305,6 +320,19 @@ def _set_clusterer_distance_based(
             distance, data_vars, row_normalise
         )
 
+    if distance_cache_path is None:
+        kmedoids, clarans, clara = (
+            TimeSeriesKMedoids,
+            TimeSeriesCLARANS,
+            TimeSeriesCLARA,
+        )
+    else:
+        kmedoids, clarans, clara = (
+            CachedDistanceKMedoids,
+            CachedDistanceCLARANS,
+            CachedDistanceCLARA,
+        )
+
     if "kmeans" in c or "timeserieskmeans" in c:
         if "average_params" in kwargs:
             average_params = kwargs["average_params"]
@@ -352,7 +380,7 @@ def _set_clusterer_distance_based(
                 **kwargs,
             )
     elif "kmedoids" in c or "timeserieskmedoids" in c:
-        return TimeSeriesKMedoids(
+        return kmedoids(
             max_iter=50,
             n_init=10,
             init=init_algorithm,
@@ -360,10 +388,13 @@ def _set_clusterer_distance_based(
             distance_params=distance_params,
             random_state=random_state,
             method="alternate",
+            **_get_distance_matrix_kwargs(
+                distance_cache_path, distance, distance_params, data_vars, row_normalise
+            ),
             **kwargs,
         )
     elif "pam" in c or "timeseriespam" in c:
-        return TimeSeriesKMedoids(
+        return kmedoids(
             max_iter=50,
             n_init=10,
             init=init_algorithm,
@@ -371,24 +402,33 @@ def _set_clusterer_distance_based(
             distance_params=distance_params,
             random_state=random_state,
             method="pam",
+            **_get_distance_matrix_kwargs(
+                distance_cache_path, distance, distance_params, data_vars, row_normalise
+            ),
             **kwargs,
         )
     elif "clarans" in c or "timeseriesclarans" in c:
-        return TimeSeriesCLARANS(
+        return clarans(
             n_init=10,
             init=init_algorithm,
             distance=distance,
             distance_params=distance_params,
             random_state=random_state,
+            **_get_distance_matrix_kwargs(
+                distance_cache_path, distance, distance_params, data_vars, row_normalise
+            ),
             **kwargs,
         )
     elif "clara" in c or "timeseriesclara" in c:
-        return TimeSeriesCLARA(
+        return clara(
             max_iter=50,
             init=init_algorithm,
             distance=distance,
             distance_params=distance_params,
             random_state=random_state,
+            **_get_distance_matrix_kwargs(
+                distance_cache_path, distance, distance_params, data_vars, row_normalise
+            ),
             **kwargs,
         )
     elif "som" in c or "elasticsom" in c:
@@ -435,6 +475,29 @@ def _set_clusterer_distance_based(
         )
 
 
+def _get_distance_matrix_kwargs(
+    distance_cache_path, distance, distance_params, data_vars, row_normalise
+):
+    if distance_cache_path is None:
+        return {}
+    if data_vars is None:
+        raise ValueError("data_vars must be provided to use distance_cache_path.")
+
+    problem_path, dataset, resample_id, predefined_resample = data_vars
+    return {
+        "distance_matrix": cache_experiment_pairwise_distances(
+            problem_path,
+            dataset,
+            resample_id,
+            distance_cache_path,
+            distance,
+            distance_params=distance_params,
+            normalise=row_normalise,
+            predefined_resample=predefined_resample,
+        )
+    }
+
+
 def _get_distance_default_params(
     dist_name: str, data_vars: list, row_normalise: bool
 ) -> dict:
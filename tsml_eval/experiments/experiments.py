@@ -13,6 +13,7 @@ __all__ = [
     "load_and_run_clustering_experiment",
     "run_forecasting_experiment",
     "load_and_run_forecasting_experiment",
+    "load_and_run_forecasting_batch_experiment",
 ]
 
 import os
@@ -28,14 +29,18 @@ from aeon.classification import BaseClassifier
 from aeon.clustering import BaseClusterer
 from aeon.forecasting import BaseForecaster
 from aeon.regression.base import BaseRegressor
+from aeon.utils.validation import check_n_jobs
+from joblib import Parallel, delayed
+from joblib.externals.loky import get_reusable_executor
 from sklearn import preprocessing
-from sklearn.base import BaseEstimator, is_classifier, is_regressor
+from sklearn.base import BaseEstimator, clone, is_classifier, is_regressor
 from sklearn.metrics import (
     accuracy_score,
     mean_absolute_percentage_error,
     mean_squared_error,
 )
-from sklearn.model_selection import cross_val_predict
+from sklearn.model_selection import check_cv
+from sklearn.utils import _safe_indexing
 from tsml.base import BaseTimeSeriesEstimator
 from tsml.utils.validation import is_clusterer
 
@@ -44,9 +49,12 @@ from tsml_eval.estimators import (
     SklearnToTsmlClusterer,
     SklearnToTsmlRegressor,
 )
+from tsml_eval.estimators._sklearn_conversion import convert_to_sklearn_2d
+from tsml_eval.evaluation.storage import ForecasterResults, load_forecaster_results
 from tsml_eval.utils.datasets import load_experiment_data
 from tsml_eval.utils.experiments import (
     _check_existing_results,
+    _results_present,
     estimator_attributes_to_file,
     timing_benchmark,
 )
@@ -83,6 +91,8 @@ def run_classification_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    train_estimate_n_jobs=1,
+    fold_bagging=False,
 ):
     """Run a classification experiment and save the results to file.
 
@@ -137,6 +147,22 @@ def run_classification_experiment(
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
         results. This will typically take ~2 seconds, but is hardware dependent.
+    train_estimate_n_jobs : int, default=1
+        The number of cores available to the cross-validation used to build the train
+        file when the estimator does not produce its own train estimate. Folds are run
+        concurrently, with the number of concurrent folds set so that it multiplied by
+        the ``n_jobs`` of the estimator does not exceed this value. ``-1`` means using
+        all processors. Folds are run using the active ``joblib`` backend, processes
+        by default. The time and maximum memory usage of each fold is written to the
+        train file comment.
+    fold_bagging : bool, default=False
+        If True, the test predictions are produced by averaging the predictions of
+        the models fit for each cross-validation fold of the train estimate, rather
+        than fitting a final model on the full train data. Only used when both the
+        train and test files are built and the estimator does not produce its own
+        train estimate. The test file is written with a "<k>F-Bagging" train
+        estimate method, the cross-validation time as the train estimate and fit
+        and estimate times, and no fit time. No attribute file is written.
     """
     if not build_test_file and not build_train_file:
         raise ValueError(
@@ -148,6 +174,7 @@ def run_classification_experiment(
         classifier_name = type(classifier).__name__
 
     use_fit_predict = False
+    sklearn_input = False
     if isinstance(classifier, BaseClassifier):
         if not ignore_custom_train_estimate and classifier.get_tag(
             "capability:train_estimate", False, False
@@ -156,6 +183,7 @@ def run_classification_experiment(
     elif isinstance(classifier, BaseTimeSeriesEstimator) and is_classifier(classifier):
         pass
     elif isinstance(classifier, BaseEstimator) and is_classifier(classifier):
+        sklearn_input = True
         classifier = SklearnToTsmlClassifier(
             classifier=classifier,
             pad_unequal=True,
@@ -176,6 +204,16 @@ def run_classification_experiment(
             X_train = transform.fit_transform(X_train, y_train)
             X_test = transform.transform(X_test, y_test)
 
+    if sklearn_input:
+        # convert the data once so the wrapper and every cross-validation fold use
+        # the same 2D array rather than padding and concatenating on each call
+        X_train = convert_to_sklearn_2d(
+            X_train, pad_unequal=True, concatenate_channels=True
+        )
+        X_test = convert_to_sklearn_2d(
+            X_test, pad_unequal=True, concatenate_channels=True
+        )
+
     le = preprocessing.LabelEncoder()
     y_train = le.fit_transform(y_train)
     y_test = le.transform(y_test)
@@ -184,6 +222,7 @@ def run_classification_experiment(
     n_classes = len(np.unique(y_train))
 
     needs_fit = True
+    fold_bagged = False
     fit_time = -1
     mem_usage = -1
     benchmark = -1
@@ -202,6 +241,7 @@ def run_classification_experiment(
     second = str(classifier.get_params()).replace("\n", " ").replace("\r", " ")
 
     if build_train_file:
+        train_comment = first_comment
         cv_size = 10
         start = int(round(time.time() * 1000))
         if use_fit_predict:
@@ -214,10 +254,35 @@ def run_classification_experiment(
             if min_class < cv_size:
                 cv_size = min_class
 
-            train_probs = cross_val_predict(
-                classifier, X_train, y=y_train, cv=cv_size, method="predict_proba"
+            (
+                train_probs,
+                test_probs,
+                fold_times,
+                fold_mem,
+                test_time,
+            ) = _cross_validation_train_estimate(
+                classifier,
+                X_train,
+                y_train,
+                cv_size,
+                "predict_proba",
+                train_estimate_n_jobs,
+                n_classes=n_classes,
+                X_test=X_test if fold_bagging and build_test_file else None,
             )
             train_time = int(round(time.time() * 1000)) - start
+            mem_usage = max(fold_mem)
+
+            if test_probs is not None:
+                needs_fit = False
+                fold_bagged = True
+                # the test predictions of the fold models are only counted in the
+                # test predict time
+                train_time -= test_time
+                fit_and_train_time = train_time
+            train_comment += (
+                f". Fold times: {fold_times}. Fold max memory usage: {fold_mem}"
+            )
 
         train_preds = np.unique(y_train)[np.argmax(train_probs, axis=1)]
         train_acc = accuracy_score(y_train, train_preds)
@@ -236,7 +301,7 @@ def run_classification_experiment(
             split="TRAIN",
             resample_id=resample_id,
             time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
+            first_line_comment=train_comment,
             parameter_info=second,
             accuracy=train_acc,
             fit_time=fit_time,
@@ -250,29 +315,33 @@ def run_classification_experiment(
         )
 
     if build_test_file:
-        if needs_fit:
-            mem_usage, fit_time = record_max_memory(
-                classifier.fit,
-                args=(X_train, y_train),
-                interval=MEMRECORD_INTERVAL,
-                return_func_time=True,
-            )
-            fit_time += int(round(getattr(classifier, "_fit_time_milli", 0)))
+        if fold_bagged:
+            # test predictions are the average of the cross-validation fold models
+            test_preds = np.unique(y_train)[np.argmax(test_probs, axis=1)]
+        else:
+            if needs_fit:
+                mem_usage, fit_time = record_max_memory(
+                    classifier.fit,
+                    args=(X_train, y_train),
+                    interval=MEMRECORD_INTERVAL,
+                    return_func_time=True,
+                )
+                fit_time += int(round(getattr(classifier, "_fit_time_milli", 0)))
 
-        if attribute_file_path is not None:
-            estimator_attributes_to_file(
-                classifier, attribute_file_path, max_list_shape=att_max_shape
-            )
+            if attribute_file_path is not None:
+                estimator_attributes_to_file(
+                    classifier, attribute_file_path, max_list_shape=att_max_shape
+                )
 
-        start = int(round(time.time() * 1000))
-        test_probs = classifier.predict_proba(X_test)
-        test_time = (
-            int(round(time.time() * 1000))
-            - start
-            + int(round(getattr(classifier, "_predict_time_milli", 0)))
-        )
+            start = int(round(time.time() * 1000))
+            test_probs = classifier.predict_proba(X_test)
+            test_time = (
+                int(round(time.time() * 1000))
+                - start
+                + int(round(getattr(classifier, "_predict_time_milli", 0)))
+            )
 
-        test_preds = classifier.classes_[np.argmax(test_probs, axis=1)]
+            test_preds = classifier.classes_[np.argmax(test_probs, axis=1)]
         test_acc = accuracy_score(y_test, test_preds)
 
         write_classification_results(
@@ -297,8 +366,8 @@ def run_classification_experiment(
             benchmark_time=benchmark,
             memory_usage=mem_usage,
             n_classes=n_classes,
-            train_estimate_method="N/A",
-            train_estimate_time=-1,
+            train_estimate_method=f"{cv_size}F-Bagging" if fold_bagged else "N/A",
+            train_estimate_time=train_time if fold_bagged else -1,
             fit_and_estimate_time=fit_and_train_time,
         )
 
@@ -317,6 +386,8 @@ def load_and_run_classification_experiment(
     benchmark_time=True,
     overwrite=False,
     predefined_resample=False,
+    train_estimate_n_jobs=1,
+    fold_bagging=False,
 ):
     """Load a dataset and run a classification experiment.
 
@@ -360,6 +431,12 @@ def load_and_run_classification_experiment(
         Read a predefined resample from file instead of performing a resample. If True
         the file format must include the resample_id at the end of the dataset name i.e.
         <problem_path>/<dataset>/<dataset>+<resample_id>+"_TRAIN.ts".
+    train_estimate_n_jobs : int, default=1
+        The number of cores available to the cross-validation used to build the train
+        file. See ``run_classification_experiment``.
+    fold_bagging : bool, default=False
+        Whether to produce test predictions by averaging the cross-validation fold
+        models rather than fitting a final model. See ``run_classification_experiment``.
     """
     if classifier_name is None:
         classifier_name = type(classifier).__name__
@@ -408,6 +485,8 @@ def load_and_run_classification_experiment(
         attribute_file_path=attribute_file_path,
         att_max_shape=att_max_shape,
         benchmark_time=benchmark_time,
+        train_estimate_n_jobs=train_estimate_n_jobs,
+        fold_bagging=fold_bagging,
     )
 
 
@@ -428,6 +507,8 @@ def run_regression_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    train_estimate_n_jobs=1,
+    fold_bagging=False,
 ):
     """Run a regression experiment and save the results to file.
 
@@ -482,6 +563,22 @@ def run_regression_experiment(
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
         results. This will typically take ~2 seconds, but is hardware dependent.
+    train_estimate_n_jobs : int, default=1
+        The number of cores available to the cross-validation used to build the train
+        file when the estimator does not produce its own train estimate. Folds are run
+        concurrently, with the number of concurrent folds set so that it multiplied by
+        the ``n_jobs`` of the estimator does not exceed this value. ``-1`` means using
+        all processors. Folds are run using the active ``joblib`` backend, processes
+        by default. The time and maximum memory usage of each fold is written to the
+        train file comment.
+    fold_bagging : bool, default=False
+        If True, the test predictions are produced by averaging the predictions of
+        the models fit for each cross-validation fold of the train estimate, rather
+        than fitting a final model on the full train data. Only used when both the
+        train and test files are built and the estimator does not produce its own
+        train estimate. The test file is written with a "<k>F-Bagging" train
+        estimate method, the cross-validation time as the train estimate and fit
+        and estimate times, and no fit time. No attribute file is written.
     """
     if not build_test_file and not build_train_file:
         raise ValueError(
@@ -493,6 +590,7 @@ def run_regression_experiment(
         regressor_name = type(regressor).__name__
 
     use_fit_predict = False
+    sklearn_input = False
     if isinstance(regressor, BaseRegressor):
         if not ignore_custom_train_estimate and regressor.get_tag(
             "capability:train_estimate", False, False
@@ -501,6 +599,7 @@ def run_regression_experiment(
     elif isinstance(regressor, BaseTimeSeriesEstimator) and is_regressor(regressor):
         pass
     elif isinstance(regressor, BaseEstimator) and is_regressor(regressor):
+        sklearn_input = True
         regressor = SklearnToTsmlRegressor(
             regressor=regressor,
             pad_unequal=True,
@@ -521,7 +620,18 @@ def run_regression_experiment(
             X_train = transform.fit_transform(X_train, y_train)
             X_test = transform.transform(X_test, y_test)
 
+    if sklearn_input:
+        # convert the data once so the wrapper and every cross-validation fold use
+        # the same 2D array rather than padding and concatenating on each call
+        X_train = convert_to_sklearn_2d(
+            X_train, pad_unequal=True, concatenate_channels=True
+        )
+        X_test = convert_to_sklearn_2d(
+            X_test, pad_unequal=True, concatenate_channels=True
+        )
+
     needs_fit = True
+    fold_bagged = False
     fit_time = -1
     mem_usage = -1
     benchmark = -1
@@ -539,6 +649,7 @@ def run_regression_experiment(
     second = str(regressor.get_params()).replace("\n", " ").replace("\r", " ")
 
     if build_train_file:
+        train_comment = first_comment
         cv_size = min(10, len(y_train))
         start = int(round(time.time() * 1000))
         if use_fit_predict:
@@ -546,8 +657,34 @@ def run_regression_experiment(
             needs_fit = False
             fit_and_train_time = int(round(time.time() * 1000)) - start
         else:
-            train_preds = cross_val_predict(regressor, X_train, y=y_train, cv=cv_size)
+            (
+                train_preds,
+                test_preds,
+                fold_times,
+                fold_mem,
+                test_time,
+            ) = _cross_validation_train_estimate(
+                regressor,
+                X_train,
+                y_train,
+                cv_size,
+                "predict",
+                train_estimate_n_jobs,
+                X_test=X_test if fold_bagging and build_test_file else None,
+            )
             train_time = int(round(time.time() * 1000)) - start
+            mem_usage = max(fold_mem)
+
+            if test_preds is not None:
+                needs_fit = False
+                fold_bagged = True
+                # the test predictions of the fold models are only counted in the
+                # test predict time
+                train_time -= test_time
+                fit_and_train_time = train_time
+            train_comment += (
+                f". Fold times: {fold_times}. Fold max memory usage: {fold_mem}"
+            )
 
         train_mse = mean_squared_error(y_train, train_preds)
 
@@ -562,7 +699,7 @@ def run_regression_experiment(
             split="TRAIN",
             resample_id=resample_id,
             time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
+            first_line_comment=train_comment,
             parameter_info=second,
             mse=train_mse,
             fit_time=fit_time,
@@ -575,25 +712,28 @@ def run_regression_experiment(
         )
 
     if build_test_file:
-        if needs_fit:
-            mem_usage, fit_time = record_max_memory(
-                regressor.fit,
-                args=(X_train, y_train),
-                interval=MEMRECORD_INTERVAL,
-                return_func_time=True,
-            )
-            fit_time += int(round(getattr(regressor, "_fit_time_milli", 0)))
+        # if fold bagged, test predictions are the average of the cross-validation
+        # fold models
+        if not fold_bagged:
+            if needs_fit:
+                mem_usage, fit_time = record_max_memory(
+                    regressor.fit,
+                    args=(X_train, y_train),
+                    interval=MEMRECORD_INTERVAL,
+                    return_func_time=True,
+                )
+                fit_time += int(round(getattr(regressor, "_fit_time_milli", 0)))
 
-        if attribute_file_path is not None:
-            estimator_attributes_to_file(
-                regressor, attribute_file_path, max_list_shape=att_max_shape
-            )
+            if attribute_file_path is not None:
+                estimator_attributes_to_file(
+                    regressor, attribute_file_path, max_list_shape=att_max_shape
+                )
 
-        start = int(round(time.time() * 1000))
-        test_preds = regressor.predict(X_test)
-        test_time = (int(round(time.time() * 1000)) - start) + int(
-            round(getattr(regressor, "_predict_time_milli", 0))
-        )
+            start = int(round(time.time() * 1000))
+            test_preds = regressor.predict(X_test)
+            test_time = (int(round(time.time() * 1000)) - start) + int(
+                round(getattr(regressor, "_predict_time_milli", 0))
+            )
 
         test_mse = mean_squared_error(y_test, test_preds)
 
@@ -615,8 +755,8 @@ def run_regression_experiment(
             predict_time=test_time,
             benchmark_time=benchmark,
             memory_usage=mem_usage,
-            train_estimate_method="N/A",
-            train_estimate_time=-1,
+            train_estimate_method=f"{cv_size}F-Bagging" if fold_bagged else "N/A",
+            train_estimate_time=train_time if fold_bagged else -1,
             fit_and_estimate_time=fit_and_train_time,
         )
 
@@ -635,6 +775,8 @@ def load_and_run_regression_experiment(
     benchmark_time=True,
     overwrite=False,
     predefined_resample=False,
+    train_estimate_n_jobs=1,
+    fold_bagging=False,
 ):
     """Load a dataset and run a regression experiment.
 
@@ -678,6 +820,12 @@ def load_and_run_regression_experiment(
         Read a predefined resample from file instead of performing a resample. If True
         the file format must include the resample_id at the end of the dataset name i.e.
         <problem_path>/<dataset>/<dataset>+<resample_id>+"_TRAIN.ts".
+    train_estimate_n_jobs : int, default=1
+        The number of cores available to the cross-validation used to build the train
+        file. See ``run_regression_experiment``.
+    fold_bagging : bool, default=False
+        Whether to produce test predictions by averaging the cross-validation fold
+        models rather than fitting a final model. See ``run_regression_experiment``.
     """
     if regressor_name is None:
         regressor_name = type(regressor).__name__
@@ -730,6 +878,8 @@ def load_and_run_regression_experiment(
         attribute_file_path=attribute_file_path,
         att_max_shape=att_max_shape,
         benchmark_time=benchmark_time,
+        train_estimate_n_jobs=train_estimate_n_jobs,
+        fold_bagging=fold_bagging,
     )
 
 
@@ -817,11 +967,13 @@ def run_clustering_experiment(
     if clusterer_name is None:
         clusterer_name = type(clusterer).__name__
 
+    sklearn_input = False
     if isinstance(clusterer, BaseClusterer) or (
         isinstance(clusterer, BaseTimeSeriesEstimator) and is_clusterer(clusterer)
     ):
         pass
     elif isinstance(clusterer, BaseEstimator) and is_clusterer(clusterer):
+        sklearn_input = True
         clusterer = SklearnToTsmlClusterer(
             clusterer=clusterer,
             pad_unequal=True,
@@ -846,6 +998,16 @@ def run_clustering_experiment(
             if build_test_file:
                 X_test = transform.transform(X_test, y_test)
 
+    if sklearn_input:
+        # convert the data once rather than padding and concatenating on each call
+        X_train = convert_to_sklearn_2d(
+            X_train, pad_unequal=True, concatenate_channels=True
+        )
+        if build_test_file:
+            X_test = convert_to_sklearn_2d(
+                X_test, pad_unequal=True, concatenate_channels=True
+            )
+
     le = preprocessing.LabelEncoder()
     y_train = le.fit_transform(y_train)
     if build_test_file:
@@ -1130,6 +1292,8 @@ def run_forecasting_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    rolling_origin=False,
+    refit_interval=None,
 ):
     """Run a forecasting experiment and save the results to file.
 
@@ -1137,6 +1301,13 @@ def run_forecasting_experiment(
     <dataset>/<forecaster>/<resample> combination and write the results to csv file(s)
     at a given location.
 
+    By default, the forecaster is fit on the train series and predicts every test
+    value in a single call. If ``rolling_origin`` is True, one step ahead predictions
+    are made from a rolling origin instead. After each prediction the forecaster is
+    moved on to the next test value using its ``update`` method, or refit on all
+    values seen so far if it does not have one. The time taken to update and predict
+    is recorded for each test value.
+
     Parameters
     ----------
     train : pd.DataFrame or np.array
@@ -1155,9 +1326,18 @@ def run_forecasting_experiment(
     random_seed : int or None, default=None
         Indicates what random seed was used as a random_state for the forecaster. Only
         used for the results file name.
-    benchmark_time : bool, default=True
+    benchmark_time : bool or int, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. This will typically take ~2 seconds, but is hardware dependent. If an
+        int, it is written as the benchmark time without running the benchmark.
+    rolling_origin : bool, default=False
+        Whether to make one step ahead predictions from a rolling origin. The
+        forecaster should predict one step ahead when ``predict`` is called without
+        a series, only the first predicted value is used.
+    refit_interval : int or None, default=None
+        Only used if ``rolling_origin`` is True. The number of test values between
+        full refits of a forecaster with an ``update`` method. If None, the
+        forecaster is only fit on the train series and updated from then on.
     """
     if not isinstance(forecaster, BaseForecaster):
         raise TypeError("forecaster must be an aeon forecaster.")
@@ -1165,9 +1345,10 @@ def run_forecasting_experiment(
     if forecaster_name is None:
         forecaster_name = type(forecaster).__name__
 
-    benchmark = -1
-    if benchmark_time:
-        benchmark = timing_benchmark(random_state=random_seed)
+    if isinstance(benchmark_time, bool):
+        benchmark = timing_benchmark(random_state=random_seed) if benchmark_time else -1
+    else:
+        benchmark = benchmark_time
 
     first_comment = (
         "Generated by run_forecasting_experiment on "
@@ -1189,14 +1370,21 @@ def run_forecasting_experiment(
             forecaster, attribute_file_path, max_list_shape=att_max_shape
         )
 
-    start = int(round(time.time() * 1000))
-    test_preds = forecaster.predict(np.arange(1, len(test) + 1))
-    test_time = (
-        int(round(time.time() * 1000))
-        - start
-        + int(round(getattr(forecaster, "_predict_time_milli", 0)))
-    )
-    test_preds = test_preds.flatten()
+    if rolling_origin:
+        test_preds, pred_times = _rolling_origin_predictions(
+            forecaster, train, test, refit_interval
+        )
+        test_time = int(round(pred_times.sum()))
+    else:
+        start = int(round(time.time() * 1000))
+        test_preds = forecaster.predict(np.arange(1, len(test) + 1))
+        test_time = (
+            int(round(time.time() * 1000))
+            - start
+            + int(round(getattr(forecaster, "_predict_time_milli", 0)))
+        )
+        test_preds = test_preds.flatten()
+        pred_times = None
 
     test_mape = mean_absolute_percentage_error(test, test_preds)
 
@@ -1218,6 +1406,7 @@ def run_forecasting_experiment(
         predict_time=test_time,
         benchmark_time=benchmark,
         memory_usage=mem_usage,
+        pred_times=pred_times,
     )
 
 
@@ -1232,6 +1421,8 @@ def load_and_run_forecasting_experiment(
     att_max_shape=0,
     benchmark_time=True,
     overwrite=False,
+    rolling_origin=False,
+    refit_interval=None,
 ):
     """Load a dataset and run a regression experiment.
 
@@ -1256,12 +1447,19 @@ def load_and_run_forecasting_experiment(
     random_seed : int or None, default=None
         Indicates what random seed was used as a random_state for the forecaster. Only
         used for the results file name.
-    benchmark_time : bool, default=True
+    benchmark_time : bool or int, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. This will typically take ~2 seconds, but is hardware dependent. If an
+        int, it is written as the benchmark time without running the benchmark.
     overwrite : bool, default=False
         If set to False, this will only build results if there is not a result file
         already present. If True, it will overwrite anything already there.
+    rolling_origin : bool, default=False
+        Whether to make one step ahead predictions from a rolling origin, see
+        ``run_forecasting_experiment``.
+    refit_interval : int or None, default=None
+        The number of test values between full refits of the forecaster when
+        ``rolling_origin`` is True, see ``run_forecasting_experiment``.
     """
     if forecaster_name is None:
         forecaster_name = type(forecaster).__name__
@@ -1305,4 +1503,346 @@ def load_and_run_forecasting_experiment(
         attribute_file_path=attribute_file_path,
         att_max_shape=att_max_shape,
         benchmark_time=benchmark_time,
+        rolling_origin=rolling_origin,
+        refit_interval=refit_interval,
+    )
+
+
+def load_and_run_forecasting_batch_experiment(
+    problem_path,
+    results_path,
+    forecaster,
+    forecaster_name=None,
+    datasets=None,
+    random_seed=None,
+    benchmark_time=True,
+    overwrite=False,
+    rolling_origin=False,
+    refit_interval=None,
+    n_jobs=1,
+):
+    """Run a forecasting experiment for each series in a directory of many series.
+
+    Each series is loaded and run with ``load_and_run_forecasting_experiment``, which
+    writes a results file for each series in the standard tsml structure. The series
+    are run across a pool of processes. The forecaster is sent to or created in each
+    worker process once and cloned for every series the worker runs.
+
+    The hardware benchmark is run once and written to every results file. Once all
+    series are complete, the results files are combined into a single
+    ForecasterResults summary.
+
+    Parameters
+    ----------
+    problem_path : str
+        Location of problem files, full path. Each series must be in its own
+        directory, i.e. <problem_path>/<dataset>/<dataset>+"_TRAIN.csv", same for
+        "_TEST.csv".
+    results_path : str
+        Location of where to write results. Any required directories will be created.
+    forecaster : BaseForecaster or str
+        Forecaster to be used in the experiment. If a str, the forecaster is created
+        in each worker process using ``get_forecaster_by_name``.
+    forecaster_name : str or None, default=None
+        Name of forecaster used in writing results. If None, the name is taken from
+        the forecaster.
+    datasets : list of str or None, default=None
+        The names of the series to run. If None, every directory in
+        ``problem_path`` containing a train and test file for the series is run.
+    random_seed : int or None, default=None
+        Indicates what random seed was used as a random_state for the forecaster. Only
+        used for the results file name.
+    benchmark_time : bool, default=True
+        Whether to benchmark the hardware used with a simple function and write the
+        results. This will typically take ~2 seconds, but is hardware dependent.
+    overwrite : bool, default=False
+        If set to False, series with a result file already present are not run again.
+        If True, it will overwrite anything already there.
+    rolling_origin : bool, default=False
+        Whether to make one step ahead predictions from a rolling origin, see
+        ``run_forecasting_experiment``.
+    refit_interval : int or None, default=None
+        The number of test values between full refits of the forecaster when
+        ``rolling_origin`` is True, see ``run_forecasting_experiment``.
+    n_jobs : int, default=1
+        The number of processes used to run the series. ``-1`` means using all
+        processors. If 1, the series are run in the current process.
+
+    Returns
+    -------
+    summary : ForecasterResults
+        The predictions, target values and prediction times of every series joined
+        in order. Fit and predict times are the total over all series, memory usage
+        is the largest of all series.
+    """
+    if isinstance(forecaster, str):
+        if forecaster_name is None:
+            forecaster_name = forecaster
+    elif not isinstance(forecaster, BaseForecaster):
+        raise TypeError("forecaster must be an aeon forecaster or a forecaster name.")
+    elif forecaster_name is None:
+        forecaster_name = type(forecaster).__name__
+
+    if datasets is None:
+        datasets = sorted(
+            d
+            for d in os.listdir(problem_path)
+            if os.path.exists(f"{problem_path}/{d}/{d}_TRAIN.csv")
+            and os.path.exists(f"{problem_path}/{d}/{d}_TEST.csv")
+        )
+    if len(datasets) == 0:
+        raise ValueError(
+            f"No series to run, no series found in {problem_path} or datasets is "
+            "empty."
+        )
+
+    benchmark = -1
+    if benchmark_time:
+        benchmark = timing_benchmark(random_state=random_seed)
+
+    experiment_args = dict(
+        forecaster_name=forecaster_name,
+        random_seed=random_seed,
+        benchmark_time=benchmark,
+        overwrite=overwrite,
+        rolling_origin=rolling_origin,
+        refit_interval=refit_interval,
+    )
+
+    # only series without results are sent to the workers
+    to_run = [
+        dataset
+        for dataset in datasets
+        if overwrite
+        or not _results_present(
+            results_path, forecaster_name, dataset, resample_id=random_seed
+        )
+    ]
+
+    n_jobs = min(check_n_jobs(n_jobs), max(len(to_run), 1))
+    if n_jobs == 1:
+        forecaster = _create_batch_forecaster(forecaster, random_seed)
+        for dataset in to_run:
+            load_and_run_forecasting_experiment(
+                problem_path,
+                results_path,
+                dataset,
+                clone(forecaster),
+                **experiment_args,
+            )
+    else:
+        # loky starts fresh worker processes rather than forking this one, forking a
+        # process running numba threads is unsafe. the executor is reused by later
+        # calls, so it is not shut down here
+        executor = get_reusable_executor(
+            max_workers=n_jobs,
+            initializer=_init_forecasting_batch_worker,
+            initargs=(forecaster, random_seed),
+        )
+        # list forces any exception raised in a worker to be raised here
+        list(
+            executor.map(
+                _run_forecasting_batch_series,
+                [problem_path] * len(to_run),
+                [results_path] * len(to_run),
+                to_run,
+                [experiment_args] * len(to_run),
+            )
+        )
+
+    results = [
+        load_forecaster_results(
+            f"{results_path}/{forecaster_name}/Predictions/{dataset}/"
+            f"{'testResults' if random_seed is None else f'testResample{random_seed}'}"
+            ".csv",
+            verify_values=False,
+        )
+        for dataset in datasets
+    ]
+
+    pred_times = None
+    if all(r.pred_times is not None for r in results):
+        pred_times = np.concatenate([r.pred_times for r in results])
+
+    summary = ForecasterResults(
+        dataset_name=os.path.basename(os.path.normpath(problem_path)),
+        forecaster_name=forecaster_name,
+        split="TEST",
+        random_seed=random_seed,
+        time_unit="milliseconds",
+        description=f"Summary of {len(results)} series",
+        parameters=results[0].parameter_info,
+        fit_time=sum(r.fit_time for r in results),
+        predict_time=sum(r.predict_time for r in results),
+        benchmark_time=benchmark,
+        memory_usage=max(r.memory_usage for r in results),
+        target_labels=np.concatenate([r.target_labels for r in results]),
+        predictions=np.concatenate([r.predictions for r in results]),
+        pred_times=pred_times,
+    )
+    summary.calculate_statistics()
+    return summary
+
+
+# the forecaster of a batch experiment worker process, set once per process
+_batch_forecaster = None
+
+
+def _create_batch_forecaster(forecaster, random_seed):
+    if isinstance(forecaster, str):
+        from tsml_eval.experiments._get_forecaster import get_forecaster_by_name
+
+        forecaster = get_forecaster_by_name(forecaster, random_state=random_seed)
+    return forecaster
+
+
+def _init_forecasting_batch_worker(forecaster, random_seed):
+    global _batch_forecaster
+    _batch_forecaster = _create_batch_forecaster(forecaster, random_seed)
+
+
+def _run_forecasting_batch_series(problem_path, results_path, dataset, args):
+    load_and_run_forecasting_experiment(
+        problem_path,
+        results_path,
+        dataset,
+        clone(_batch_forecaster),
+        **args,
     )
+
+
+def _rolling_origin_predictions(forecaster, train, test, refit_interval):
+    """Make one step ahead predictions for each test value from a rolling origin.
+
+    The forecaster must already be fit on the train series. Before predicting each
+    test value after the first, the previous test value is passed to the forecaster
+    ``update`` method. Forecasters without an ``update`` method are refit on all
+    values seen so far, as are all forecasters every ``refit_interval`` values.
+
+    Returns
+    -------
+    predictions : np.ndarray
+        The one step ahead prediction for each test value.
+    pred_times : np.ndarray
+        The time in milliseconds taken to update the forecaster and predict each test
+        value.
+    """
+    series = np.concatenate((np.asarray(train), np.asarray(test)), axis=None)
+    n_train = len(series) - len(test)
+    can_update = callable(getattr(forecaster, "update", None))
+
+    predictions = np.zeros(len(test))
+    pred_times = np.zeros(len(test))
+    for i in range(len(test)):
+        start = time.perf_counter()
+
+        if i > 0:
+            if not can_update or (
+                refit_interval is not None and i % refit_interval == 0
+            ):
+                forecaster.fit(series[: n_train + i])
+            else:
+                forecaster.update(series[n_train + i - 1 : n_train + i])
+
+        predictions[i] = np.asarray(forecaster.predict()).ravel()[0]
+        pred_times[i] = (time.perf_counter() - start) * 1000
+
+    return predictions, pred_times
+
+
+def _cross_validation_train_estimate(
+    estimator, X, y, cv_size, method, n_jobs, n_classes=None, X_test=None
+):
+    """Produce cross-validated train predictions with folds run concurrently.
+
+    Folds are split the same as ``cross_val_predict`` with an integer ``cv``. The
+    number of concurrent folds is the core budget ``n_jobs`` divided by the
+    ``n_jobs`` of the estimator.
+
+    If ``X_test`` is provided, each fold model also predicts the test data and the
+    averaged predictions of the fold models are returned.
+
+    Returns the predictions, the averaged test predictions (or None), the time taken
+    for each fold in milliseconds, the maximum memory usage of each fold in bytes
+    and the share of the elapsed time spent predicting the test data in
+    milliseconds.
+    """
+    cv = check_cv(cv_size, y, classifier=is_classifier(estimator))
+    splits = list(cv.split(X, y))
+
+    estimator_n_jobs = estimator.get_params().get("n_jobs", 1)
+    estimator_n_jobs = 1 if estimator_n_jobs is None else check_n_jobs(estimator_n_jobs)
+    n_folds = min(len(splits), max(1, check_n_jobs(n_jobs) // estimator_n_jobs))
+
+    start = int(round(time.time() * 1000))
+    results = Parallel(n_jobs=n_folds)(
+        delayed(_fit_and_predict_fold)(
+            clone(estimator),
+            _safe_indexing(X, train),
+            y[train],
+            _safe_indexing(X, test),
+            method,
+            X_test,
+        )
+        for train, test in splits
+    )
+    elapsed = int(round(time.time() * 1000)) - start
+
+    if method == "predict_proba":
+        preds = np.zeros((len(y), n_classes))
+    else:
+        preds = np.zeros(len(y))
+
+    test_preds = None
+    if X_test is not None:
+        n_test = len(X_test)
+        if method == "predict_proba":
+            test_preds = np.zeros((n_test, n_classes))
+        else:
+            test_preds = np.zeros(n_test)
+
+    for (train, test), (fold_preds, fold_test_preds, classes, _, _, _) in zip(
+        splits, results
+    ):
+        if method == "predict_proba":
+            # classes missing from a training fold have zero probability
+            preds[np.ix_(test, classes)] = fold_preds
+            if test_preds is not None:
+                test_preds[:, classes] += fold_test_preds / len(splits)
+        else:
+            preds[test] = fold_preds
+            if test_preds is not None:
+                test_preds += fold_test_preds / len(splits)
+
+    fold_times = [r[3] for r in results]
+    fold_mem = [r[4] for r in results]
+    # folds may run concurrently, so the summed test predict time is scaled to its
+    # share of the elapsed time
+    test_time = sum(r[5] for r in results)
+    total_time = sum(fold_times) + test_time
+    test_time = int(round(elapsed * test_time / total_time)) if total_time > 0 else 0
+
+    return preds, test_preds, fold_times, fold_mem, test_time
+
+
+def _fit_and_predict_fold(estimator, X_train, y_train, X_test, method, X_bag=None):
+    mem_usage, fit_time = record_max_memory(
+        estimator.fit,
+        args=(X_train, y_train),
+        interval=MEMRECORD_INTERVAL,
+        return_func_time=True,
+    )
+
+    start = int(round(time.time() * 1000))
+    preds = getattr(estimator, method)(X_test)
+    predict_time = int(round(time.time() * 1000)) - start
+
+    bag_preds = None
+    bag_time = 0
+    if X_bag is not None:
+        start = int(round(time.time() * 1000))
+        bag_preds = getattr(estimator, method)(X_bag)
+        bag_time = int(round(time.time() * 1000)) - start
+
+    classes = getattr(estimator, "classes_", None)
+    return preds, bag_preds, classes, fit_time + predict_time, mem_usage, bag_time
@@ -30,10 +30,12 @@ def run_timing_experiment(
     input_type : str, default="collection"
         Type of input data to be generated. Options are "collection" or "series".
     dimension : str, default="n_timepoints"
-        Type of scaler to be used. Options are "n_cases", "n_channels", or
-        "n_timepoints".
+        Type of scaler to be used. Options are "n_cases", "n_channels",
+        "n_timepoints" or "n_jobs".
 
-        "n_cases" is only valid for input_type="collection".
+        "n_cases" and "n_jobs" are only valid for input_type="collection". For
+        "n_jobs" the data size is fixed and the ``n_jobs`` parameter of each estimator
+        is set to 1, 2, 4, 8, 16, 32 and 64 in turn.
     function : str, default="fit"
         Function to be timed. Options are "fit", "predict", "fit_predict",
         "predict_proba", "fit_predict_proba", "transform", or "fit_transform".
@@ -51,9 +53,18 @@ def run_timing_experiment(
     timings = {}
     rng = check_random_state(random_state)
 
-    for i in range(1, 11):
+    sizes = [2**i for i in range(7)] if dimension == "n_jobs" else range(1, 11)
+    for i in sizes:
         if input_type == "collection":
-            if dimension == "n_cases":
+            if dimension == "n_jobs":
+                size = i
+                X, y = make_example_3d_numpy(
+                    n_cases=200,
+                    n_channels=1,
+                    n_timepoints=500,
+                    random_state=rng.randint(np.iinfo(np.int32).max),
+                )
+            elif dimension == "n_cases":
                 size = 50 * i
                 X, y = make_example_3d_numpy(
                     n_cases=size,
@@ -103,6 +114,8 @@ def run_timing_experiment(
             estimator = _clone_estimator(
                 estimator, random_state=rng.randint(np.iinfo(np.int32).max)
             )
+            if dimension == "n_jobs":
+                estimator.set_params(n_jobs=size)
             key = (estimator.__class__.__name__, size)
 
             if function == "fit":
@@ -2,12 +2,16 @@
 
 import os
 import runpy
+import time
 
+import numpy as np
 import pytest
 from aeon.utils.discovery import all_estimators
+from sklearn.ensemble import RandomForestClassifier
 from tsml.dummy import DummyRegressor
 
 from tsml_eval.datasets._test_data._data_sizes import DATA_TEST_SIZES
+from tsml_eval.evaluation.storage import load_classifier_results
 from tsml_eval.experiments import (
     _get_classifier,
     classification_experiments,
@@ -21,6 +25,7 @@ from tsml_eval.testing.testing_utils import (
     _check_set_method,
     _check_set_method_results,
 )
+from tsml_eval.utils.datasets import load_experiment_data
 from tsml_eval.utils.tests.test_results_writing import _check_classification_file_format
 
 
@@ -141,6 +146,102 @@ def test_run_threaded_classification_experiment():
     os.remove(test_file)
 
 
+def test_run_classification_experiment_parallel_train_estimate():
+    """Test classification experiments with concurrent train estimate folds."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 0, False
+    )
+    train_file = (
+        f"{_CLASSIFIER_RESULTS_PATH}ParallelTrainEstimate/Predictions/"
+        "MinimalChinatown/trainResample0.csv"
+    )
+
+    train_probs = []
+    for n_jobs in [1, 2]:
+        run_classification_experiment(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            RandomForestClassifier(n_estimators=5, random_state=0),
+            _CLASSIFIER_RESULTS_PATH,
+            classifier_name="ParallelTrainEstimate",
+            dataset_name="MinimalChinatown",
+            resample_id=0,
+            build_test_file=False,
+            build_train_file=True,
+            benchmark_time=False,
+            train_estimate_n_jobs=n_jobs,
+        )
+
+        _check_classification_file_format(
+            train_file, num_results_lines=DATA_TEST_SIZES["MinimalChinatown"]
+        )
+        results = load_classifier_results(train_file)
+        assert "Fold times" in results.description
+        train_probs.append(results.probabilities)
+
+        os.remove(train_file)
+
+    assert np.allclose(train_probs[0], train_probs[1])
+
+
+class _SlowPredictClassifier(RandomForestClassifier):
+    """Random forest with a slow predict to measure the test predict time."""
+
+    def predict_proba(self, X):
+        time.sleep(0.02)
+        return super().predict_proba(X)
+
+
+def test_run_classification_experiment_fold_bagging():
+    """Test classification experiments using the fold models for test predictions."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 0, False
+    )
+    start = time.time() * 1000
+    run_classification_experiment(
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        _SlowPredictClassifier(n_estimators=5, random_state=0),
+        _CLASSIFIER_RESULTS_PATH,
+        classifier_name="FoldBagging",
+        dataset_name="MinimalChinatown",
+        resample_id=0,
+        build_train_file=True,
+        benchmark_time=False,
+        fold_bagging=True,
+    )
+
+    elapsed = time.time() * 1000 - start
+
+    path = f"{_CLASSIFIER_RESULTS_PATH}FoldBagging/Predictions/MinimalChinatown/"
+    _check_classification_file_format(
+        path + "testResample0.csv",
+        num_results_lines=DATA_TEST_SIZES["MinimalChinatown"],
+    )
+    _check_classification_file_format(
+        path + "trainResample0.csv",
+        num_results_lines=DATA_TEST_SIZES["MinimalChinatown"],
+    )
+
+    results = load_classifier_results(path + "testResample0.csv")
+    assert results.train_estimate_method.endswith("F-Bagging")
+
+    # the test predictions of the fold models are not also counted as train time
+    train_results = load_classifier_results(path + "trainResample0.csv")
+    assert results.train_estimate_time == train_results.train_estimate_time
+    assert results.fit_and_estimate_time == train_results.train_estimate_time
+    assert results.predict_time > 0
+    assert results.train_estimate_time + results.predict_time <= elapsed + 1
+    assert results.fit_time == -1
+
+    os.remove(path + "testResample0.csv")
+    os.remove(path + "trainResample0.csv")
+
+
 def test_run_classification_experiment_invalid_build_settings():
     """Test run_classification_experiment method with invalid build settings."""
     with pytest.raises(ValueError, match="Both test_file and train_file"):
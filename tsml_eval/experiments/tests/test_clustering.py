@@ -316,6 +316,44 @@ def test_combined_train_test(dataset):
     os.remove(train_file)
 
 
+@pytest.mark.parametrize("clusterer", ["PAM-dtw", "CLARA-msm"])
+def test_distance_cache_path(clusterer):
+    """Test medoid clusterers reading distances from the distance matrix cache."""
+    dataset = "MinimalChinatown"
+    cache_path = _CLUSTERER_RESULTS_PATH + "DistanceCache/"
+
+    args = [
+        _TEST_DATA_PATH,
+        _CLUSTERER_RESULTS_PATH + "DistanceCache/",
+        clusterer,
+        dataset,
+        "1",
+        "-ow",
+        "-te",
+        "--kwargs",
+        "distance_cache_path",
+        cache_path,
+        "str",
+    ]
+
+    clustering_experiments.run_experiment(args)
+
+    file_path = f"{_CLUSTERER_RESULTS_PATH}DistanceCache/{clusterer}/Predictions/"
+    assert os.path.exists(file_path + f"{dataset}/trainResample1.csv")
+    assert os.path.exists(file_path + f"{dataset}/testResample1.csv")
+    _check_clustering_file_format(
+        file_path + f"{dataset}/trainResample1.csv",
+        num_results_lines=DATA_TRAIN_SIZES[dataset],
+    )
+
+    distance = clusterer.split("-")[-1].lower()
+    cache_files = os.listdir(f"{cache_path}/{dataset}/{distance}/regular/")
+    assert any(f.startswith("resample1_") for f in cache_files)
+
+    os.remove(file_path + f"{dataset}/trainResample1.csv")
+    os.remove(file_path + f"{dataset}/testResample1.csv")
+
+
 def _check_clustering_file_n_clusters(file_path, expected):
     with open(file_path) as f:
         lines = f.readlines()
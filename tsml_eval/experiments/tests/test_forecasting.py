@@ -1,5 +1,16 @@
 """Tests for forecasting experiments."""
 
+import os
+import shutil
+
+import pytest
+from aeon.forecasting import ETSForecaster
+
+from tsml_eval.experiments.experiments import load_and_run_forecasting_batch_experiment
+from tsml_eval.experiments.tests import _FORECASTER_RESULTS_PATH
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.tests.test_results_writing import _check_forecasting_file_format
+
 # import os
 # import runpy
 #
@@ -181,3 +192,103 @@
 #             assert get_forecaster_by_name(e) is not None
 #         except ModuleNotFoundError:
 #             continue
+
+
+def test_run_forecasting_batch_experiment():
+    """Test rolling origin forecasting batch experiments with test data."""
+    forecaster = "ETSForecaster"
+    dataset = "ShampooSales"
+
+    summary = load_and_run_forecasting_batch_experiment(
+        _TEST_DATA_PATH,
+        _FORECASTER_RESULTS_PATH,
+        ETSForecaster(),
+        datasets=[dataset],
+        random_seed=0,
+        benchmark_time=False,
+        overwrite=True,
+        rolling_origin=True,
+    )
+
+    test_file = (
+        f"{_FORECASTER_RESULTS_PATH}{forecaster}/Predictions/{dataset}/"
+        "testResample0.csv"
+    )
+    assert os.path.exists(test_file)
+    _check_forecasting_file_format(test_file)
+
+    assert len(summary.predictions) == len(summary.pred_times)
+    assert summary.mean_absolute_percentage_error > 0
+
+    os.remove(test_file)
+
+
+def test_run_forecasting_batch_experiment_n_jobs():
+    """Test forecasting batch experiments over multiple series and processes."""
+    forecaster = "ETSForecaster"
+    problem_path = _TEST_OUTPUT_PATH + "/forecasting_batch_data/"
+    results_path = _FORECASTER_RESULTS_PATH + "Batch/"
+    datasets = ["ShampooSales1", "ShampooSales2", "ShampooSales3"]
+    for dataset in datasets:
+        os.makedirs(f"{problem_path}/{dataset}", exist_ok=True)
+        for split in ["TRAIN", "TEST"]:
+            shutil.copy(
+                f"{_TEST_DATA_PATH}/ShampooSales/ShampooSales_{split}.csv",
+                f"{problem_path}/{dataset}/{dataset}_{split}.csv",
+            )
+
+    test_files = [
+        f"{results_path}{forecaster}/Predictions/{dataset}/testResample0.csv"
+        for dataset in datasets
+    ]
+    for test_file in test_files:
+        if os.path.exists(test_file):
+            os.remove(test_file)
+
+    # results for the first series are present and should not be overwritten, the
+    # other two are run in separate processes
+    single = load_and_run_forecasting_batch_experiment(
+        problem_path,
+        results_path,
+        forecaster,
+        datasets=datasets[:1],
+        random_seed=0,
+        benchmark_time=False,
+        rolling_origin=True,
+    )
+    modified = os.path.getmtime(test_files[0])
+
+    summary = load_and_run_forecasting_batch_experiment(
+        problem_path,
+        results_path,
+        forecaster,
+        random_seed=0,
+        benchmark_time=False,
+        rolling_origin=True,
+        n_jobs=2,
+    )
+
+    assert os.path.getmtime(test_files[0]) == modified
+    for test_file in test_files:
+        assert os.path.exists(test_file)
+        _check_forecasting_file_format(test_file)
+
+    assert summary.description == "Summary of 3 series"
+    assert len(summary.predictions) == 3 * len(single.predictions)
+    assert (summary.predictions[: len(single.predictions)] == single.predictions).all()
+    assert summary.fit_time >= single.fit_time
+
+    for test_file in test_files:
+        os.remove(test_file)
+    shutil.rmtree(problem_path)
+
+
+def test_run_forecasting_batch_experiment_no_series():
+    """Test forecasting batch experiments without any series to run."""
+    with pytest.raises(ValueError, match="No series to run"):
+        load_and_run_forecasting_batch_experiment(
+            _TEST_DATA_PATH,
+            _FORECASTER_RESULTS_PATH,
+            ETSForecaster(),
+            datasets=[],
+        )
@@ -4,12 +4,15 @@ __maintainer__ = ["MatthewMiddlehurst"]
 
 import os
 import runpy
+import time
 
 import pytest
 from aeon.utils.discovery import all_estimators
+from sklearn.ensemble import RandomForestRegressor
 from tsml.dummy import DummyClassifier
 
 from tsml_eval.datasets._test_data._data_sizes import DATA_TEST_SIZES
+from tsml_eval.evaluation.storage import load_regressor_results
 from tsml_eval.experiments import (
     _get_regressor,
     get_regressor_by_name,
@@ -23,6 +26,7 @@ from tsml_eval.testing.testing_utils import (
     _check_set_method,
     _check_set_method_results,
 )
+from tsml_eval.utils.datasets import load_experiment_data
 from tsml_eval.utils.tests.test_results_writing import _check_regression_file_format
 
 
@@ -71,6 +75,62 @@ def test_run_regression_experiment(regressor, dataset):
     os.remove(train_file)
 
 
+class _SlowPredictRegressor(RandomForestRegressor):
+    """Random forest with a slow predict to measure the test predict time."""
+
+    def predict(self, X):
+        time.sleep(0.02)
+        return super().predict(X)
+
+
+def test_run_regression_experiment_fold_bagging():
+    """Test regression experiments using the fold models for test predictions."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalGasPrices", 0, False
+    )
+    start = time.time() * 1000
+    run_regression_experiment(
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        _SlowPredictRegressor(n_estimators=5, random_state=0),
+        _REGRESSOR_RESULTS_PATH,
+        regressor_name="FoldBagging",
+        dataset_name="MinimalGasPrices",
+        resample_id=0,
+        build_train_file=True,
+        benchmark_time=False,
+        train_estimate_n_jobs=2,
+        fold_bagging=True,
+    )
+
+    elapsed = time.time() * 1000 - start
+
+    path = f"{_REGRESSOR_RESULTS_PATH}FoldBagging/Predictions/MinimalGasPrices/"
+    _check_regression_file_format(
+        path + "testResample0.csv",
+        num_results_lines=DATA_TEST_SIZES["MinimalGasPrices"],
+    )
+    _check_regression_file_format(
+        path + "trainResample0.csv",
+        num_results_lines=DATA_TEST_SIZES["MinimalGasPrices"],
+    )
+
+    results = load_regressor_results(path + "testResample0.csv")
+    assert results.train_estimate_method.endswith("F-Bagging")
+
+    # the test predictions of the fold models are not also counted as train time
+    train_results = load_regressor_results(path + "trainResample0.csv")
+    assert results.train_estimate_time == train_results.train_estimate_time
+    assert results.fit_and_estimate_time == train_results.train_estimate_time
+    assert results.predict_time > 0
+    assert results.train_estimate_time + results.predict_time <= elapsed + 1
+
+    os.remove(path + "testResample0.csv")
+    os.remove(path + "trainResample0.csv")
+
+
 def test_run_regression_experiment_main():
     """Test regression experiments main with test data and regressor."""
     regressor = "ROCKET"
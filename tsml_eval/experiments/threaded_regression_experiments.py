@@ -79,6 +79,7 @@ def run_experiment(args):
                 benchmark_time=args.benchmark_time,
                 overwrite=args.overwrite,
                 predefined_resample=args.predefined_resample,
+                train_estimate_n_jobs=args.n_jobs,
             )
     # local run (no args)
     else:
@@ -132,6 +133,7 @@ def run_experiment(args):
             benchmark_time=benchmark_time,
             overwrite=overwrite,
             predefined_resample=predefined_resample,
+            train_estimate_n_jobs=n_jobs,
         )
 
 
@@ -22,6 +22,7 @@ from tsml_eval.publications.y2023.distance_based_clustering.tests import (
 )
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH
 from tsml_eval.utils.arguments import parse_args
+from tsml_eval.utils.distance_cache import cache_experiment_pairwise_distances
 from tsml_eval.utils.experiments import _results_present
 
 classifiers = [
@@ -58,6 +59,9 @@ def _run_experiment(args):
         normalise = False
         kwargs = {}
         overwrite = False
+        # directory to cache pairwise distance matrices for k-medoids in, None to not
+        # cache distances
+        distance_cache_path = None
     else:
         print("Input args = ", args)
         args = parse_args(args)
@@ -69,6 +73,7 @@ def _run_experiment(args):
         normalise = args.row_normalise
         kwargs = args.kwargs
         overwrite = args.overwrite
+        distance_cache_path = kwargs.pop("distance_cache_path", None)
 
     distance = clusterer.split("-")[-1]
 
@@ -100,7 +105,7 @@ def _run_experiment(args):
     kwargs["distance_params"] = distance_params
 
     cnl = clusterer.lower()
-    if cnl.find("kmeans") or cnl.find("k-means"):
+    if "kmeans" in cnl or "k-means" in cnl:
         kwargs["averaging_method"] = "mean"
         average_params = {
             **distance_params,
@@ -121,6 +126,21 @@ def _run_experiment(args):
     ):
         print("Ignoring, results already present")
     else:
+        # read distances between training cases from a matrix shared by all k-medoids
+        # runs on the dataset resample, computing it if it is not already cached
+        if distance_cache_path is not None and (
+            "kmedoids" in cnl or "k-medoids" in cnl
+        ):
+            kwargs["distance_matrix"] = cache_experiment_pairwise_distances(
+                data_path,
+                dataset_name,
+                resample_id,
+                distance_cache_path,
+                "euclidean" if distance == "ed" else distance,
+                distance_params=distance_params,
+                normalise=normalise,
+            )
+
         load_and_run_clustering_experiment(
             data_path,
             results_path,
@@ -28,6 +28,17 @@ distance_based_clusterers = [
 ]
 
 
+def _kmedoids_class(kwargs):
+    if kwargs.get("distance_matrix", None) is not None:
+        from tsml_eval.estimators.clustering import CachedDistanceKMedoids
+
+        return CachedDistanceKMedoids
+    else:
+        from aeon.clustering import TimeSeriesKMedoids
+
+        return TimeSeriesKMedoids
+
+
 def _set_distance_clusterer(
     clusterer_name,
     random_state=None,
@@ -81,44 +92,42 @@ def _set_distance_clusterer(
 
         return TimeSeriesKMeans(distance="wddtw", random_state=random_state, **kwargs)
     elif c == "timeserieskmedoids" or c == "kmedoids-dtw" or c == "k-medoids-dtw":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="dtw", random_state=random_state, **kwargs)
+        return kmedoids(distance="dtw", random_state=random_state, **kwargs)
     elif c == "kmedoids-ddtw" or c == "k-medoids-ddtw":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="ddtw", random_state=random_state, **kwargs)
+        return kmedoids(distance="ddtw", random_state=random_state, **kwargs)
     elif c == "kmedoids-ed" or c == "k-medoids-ed":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(
-            distance="euclidean", random_state=random_state, **kwargs
-        )
+        return kmedoids(distance="euclidean", random_state=random_state, **kwargs)
     elif c == "kmedoids-edr" or c == "k-medoids-edr":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="edr", random_state=random_state, **kwargs)
+        return kmedoids(distance="edr", random_state=random_state, **kwargs)
     elif c == "kmedoids-erp" or c == "k-medoids-erp":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="erp", random_state=random_state, **kwargs)
+        return kmedoids(distance="erp", random_state=random_state, **kwargs)
     elif c == "kmedoids-lcss" or c == "k-medoids-lcss":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="lcss", random_state=random_state, **kwargs)
+        return kmedoids(distance="lcss", random_state=random_state, **kwargs)
     elif c == "kmedoids-msm" or c == "k-medoids-msm":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="msm", random_state=random_state, **kwargs)
+        return kmedoids(distance="msm", random_state=random_state, **kwargs)
     elif c == "kmedoids-twe" or c == "k-medoids-twe":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="twe", random_state=random_state, **kwargs)
+        return kmedoids(distance="twe", random_state=random_state, **kwargs)
     elif c == "kmedoids-wdtw" or c == "k-medoids-wdtw":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="wdtw", random_state=random_state, **kwargs)
+        return kmedoids(distance="wdtw", random_state=random_state, **kwargs)
     elif c == "kmedoids-wddtw" or c == "k-medoids-wddtw":
-        from aeon.clustering import TimeSeriesKMedoids
+        kmedoids = _kmedoids_class(kwargs)
 
-        return TimeSeriesKMedoids(distance="wddtw", random_state=random_state, **kwargs)
+        return kmedoids(distance="wddtw", random_state=random_state, **kwargs)
@@ -54,3 +54,42 @@ def test_run_distance_based_clustering_experiment():
 
     os.remove(train_file)
     os.remove(test_file)
+
+
+def test_run_distance_based_clustering_experiment_distance_cache():
+    """Test paper k-medoids experiments reading from the distance matrix cache."""
+    clusterer = "KMedoids-msm"
+    dataset = "MinimalChinatown"
+    cache_path = f"{_DISTANCE_TEST_RESULTS_PATH}DistanceCache/"
+
+    args = [
+        _TEST_DATA_PATH,
+        _DISTANCE_TEST_RESULTS_PATH,
+        clusterer,
+        dataset,
+        "0",
+        "-ow",
+        "--kwargs",
+        "distance_cache_path",
+        cache_path,
+        "str",
+    ]
+
+    _run_experiment(args)
+
+    train_file = (
+        f"{_DISTANCE_TEST_RESULTS_PATH}{clusterer}/Predictions/{dataset}/"
+        "trainResample0.csv"
+    )
+    test_file = (
+        f"{_DISTANCE_TEST_RESULTS_PATH}{clusterer}/Predictions/{dataset}/"
+        "testResample0.csv"
+    )
+    assert os.path.exists(train_file)
+    assert os.path.exists(test_file)
+    _check_clustering_file_format(train_file)
+    _check_clustering_file_format(test_file)
+    assert os.listdir(f"{cache_path}{dataset}/msm/regular/")
+
+    os.remove(train_file)
+    os.remove(test_file)
@@ -15,12 +15,15 @@ from typing import Optional, Union
 import numpy as np
 from aeon.datasets import load_from_ts_file, write_to_ts_file
 
+from tsml_eval.utils.ragged import RaggedCollection
+
 
 def load_experiment_data(
     problem_path: str,
     dataset: str,
     resample_id: int,
     predefined_resample: bool,
+    ragged: bool = False,
 ):
     """Load data for experiments.
 
@@ -34,14 +37,18 @@ def load_experiment_data(
         Id of the data resample to use.
     predefined_resample : boolean
         If True, use the predefined resample.
+    ragged : boolean, default=False
+        If True, unequal length data is returned as a RaggedCollection, with the
+        series of each split stored in a single contiguous buffer. Equal length data
+        is returned as a 3d ndarray regardless.
 
     Returns
     -------
-    X_train : np.ndarray or list of np.ndarray
+    X_train : np.ndarray, list of np.ndarray or RaggedCollection
         Train data in a 2d or 3d ndarray or list of arrays.
     y_train : np.ndarray
         Train data labels.
-    X_test : np.ndarray or list of np.ndarray
+    X_test : np.ndarray, list of np.ndarray or RaggedCollection
         Test data in a 2d or 3d ndarray or list of arrays.
     y_test : np.ndarray
         Test data labels.
@@ -69,6 +76,10 @@ def load_experiment_data(
 
         resample_data = True if resample_id != 0 else False
 
+    if ragged and isinstance(X_train, list):
+        X_train = RaggedCollection.from_collection(X_train)
+        X_test = RaggedCollection.from_collection(X_test)
+
     return X_train, y_train, X_test, y_test, resample_data
 
 
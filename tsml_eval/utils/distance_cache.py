@@ -0,0 +1,315 @@
+"""On disk cache of pairwise distance matrices."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "blocked_pairwise_distance",
+    "pairwise_distance_cache_file",
+    "load_or_compute_pairwise_distances",
+    "cache_experiment_pairwise_distances",
+]
+
+import hashlib
+import json
+import os
+
+import numpy as np
+from aeon.distances import pairwise_distance
+from aeon.transformations.collection import Normalizer
+from aeon.utils.validation import check_n_jobs
+from joblib import Parallel, delayed
+
+from tsml_eval.utils.datasets import load_experiment_data
+from tsml_eval.utils.resampling import stratified_resample_data
+
+
+def blocked_pairwise_distance(
+    X, distance, distance_params=None, block_size=64, n_jobs=1, out=None
+):
+    """Compute the symmetric pairwise distance matrix of a collection in blocks.
+
+    The matrix is split into square blocks of ``block_size`` cases. Only the blocks
+    on or above the diagonal are computed, each block is mirrored into the lower
+    triangle once it has been computed. Blocks are computed in parallel by
+    ``n_jobs`` processes and written to ``out`` as they are completed, so ``out`` can
+    be a memory mapped array larger than the available memory.
+
+    Parameters
+    ----------
+    X : np.ndarray or list of np.ndarray
+        The collection of time series, in any format accepted by
+        ``aeon.distances.pairwise_distance``.
+    distance : str or Callable
+        The distance to use, as accepted by ``aeon.distances.pairwise_distance``.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    block_size : int, default=64
+        The number of cases in each side of a block.
+    n_jobs : int, default=1
+        The number of processes used to compute blocks. ``-1`` means using all
+        processors.
+    out : np.ndarray or None, default=None
+        Array of shape (n_cases, n_cases) to write the distances to. If None, a new
+        array is created.
+
+    Returns
+    -------
+    out : np.ndarray
+        The pairwise distance matrix of shape (n_cases, n_cases).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from tsml_eval.utils.distance_cache import blocked_pairwise_distance
+    >>> X = np.random.default_rng(0).random((10, 1, 20))
+    >>> blocked_pairwise_distance(X, "dtw", {"window": 0.2}, block_size=4).shape
+    (10, 10)
+    """
+    if distance_params is None:
+        distance_params = {}
+
+    n_cases = len(X)
+    if out is None:
+        out = np.zeros((n_cases, n_cases))
+    elif out.shape != (n_cases, n_cases):
+        raise ValueError(
+            f"out must have shape ({n_cases}, {n_cases}), found {out.shape}."
+        )
+
+    starts = range(0, n_cases, block_size)
+    blocks = [(i, j) for i in starts for j in starts if j >= i]
+
+    n_jobs = check_n_jobs(n_jobs)
+    # dispatch a few waves of blocks at a time so the finished blocks held in memory
+    # before being written to out stay small
+    wave_size = n_jobs * 4
+    with Parallel(n_jobs=n_jobs) as parallel:
+        for w in range(0, len(blocks), wave_size):
+            wave = blocks[w : w + wave_size]
+            results = parallel(
+                delayed(_block_distance)(
+                    X[i : i + block_size],
+                    None if i == j else X[j : j + block_size],
+                    distance,
+                    distance_params,
+                )
+                for i, j in wave
+            )
+
+            for (i, j), block in zip(wave, results):
+                out[i : i + block.shape[0], j : j + block.shape[1]] = block
+                out[j : j + block.shape[1], i : i + block.shape[0]] = block.T
+
+    return out
+
+
+def pairwise_distance_cache_file(
+    cache_path,
+    dataset_name,
+    resample_id,
+    distance,
+    distance_params=None,
+    normalise=False,
+):
+    """Return the file a cached pairwise distance matrix is stored in.
+
+    Files are stored under ``cache_path`` by dataset, distance and normalisation. The
+    distance parameters are hashed into the file name.
+
+    Parameters
+    ----------
+    cache_path : str
+        The directory the cache is stored in.
+    dataset_name : str
+        The name of the dataset the distances are computed for.
+    resample_id : int
+        The resample of the dataset the distances are computed for.
+    distance : str
+        The name of the distance.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    normalise : bool, default=False
+        Whether the series are normalised before computing the distances.
+
+    Returns
+    -------
+    file_path : str
+        The path of the ``.npy`` file for the matrix.
+    """
+    if distance_params is None:
+        distance_params = {}
+
+    params_hash = hashlib.md5(
+        json.dumps(distance_params, sort_keys=True, default=str).encode()
+    ).hexdigest()[:12]
+
+    return (
+        f"{cache_path}/{dataset_name}/{distance}/"
+        f"{'normalised' if normalise else 'regular'}/"
+        f"resample{resample_id}_{params_hash}.npy"
+    )
+
+
+def load_or_compute_pairwise_distances(
+    X,
+    cache_path,
+    dataset_name,
+    resample_id,
+    distance,
+    distance_params=None,
+    normalise=False,
+    block_size=64,
+    n_jobs=1,
+):
+    """Load a cached pairwise distance matrix, computing and storing it if missing.
+
+    The matrix for a dataset, resample, distance, set of distance parameters and
+    normalisation is computed once using ``blocked_pairwise_distance`` and written
+    to a ``.npy`` file, later calls memory map the stored file. The matrix is written
+    to a temporary file and moved into place when complete, so experiments running
+    at the same time never read a partially written matrix.
+
+    It is the responsibility of the caller to pass the ``X`` the key describes, the
+    cache only checks the number of cases matches the stored matrix.
+
+    Parameters
+    ----------
+    X : np.ndarray or list of np.ndarray
+        The collection of time series to compute the distances of.
+    cache_path : str
+        The directory the cache is stored in.
+    dataset_name : str
+        The name of the dataset the distances are computed for.
+    resample_id : int
+        The resample of the dataset the distances are computed for.
+    distance : str
+        The name of the distance.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    normalise : bool, default=False
+        Whether ``X`` has been normalised.
+    block_size : int, default=64
+        The number of cases in each side of a block when computing the matrix.
+    n_jobs : int, default=1
+        The number of processes used when computing the matrix. ``-1`` means using
+        all processors.
+
+    Returns
+    -------
+    distances : np.memmap
+        The read only pairwise distance matrix of shape (n_cases, n_cases).
+    """
+    file_path = pairwise_distance_cache_file(
+        cache_path, dataset_name, resample_id, distance, distance_params, normalise
+    )
+
+    if not os.path.exists(file_path):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = f"{file_path[:-4]}_{os.getpid()}.tmp.npy"
+
+        out = np.lib.format.open_memmap(
+            temp_path, mode="w+", dtype=np.float64, shape=(len(X), len(X))
+        )
+        blocked_pairwise_distance(
+            X,
+            distance,
+            distance_params=distance_params,
+            block_size=block_size,
+            n_jobs=n_jobs,
+            out=out,
+        )
+        out.flush()
+        del out
+
+        os.replace(temp_path, file_path)
+
+    distances = np.load(file_path, mmap_mode="r")
+    if distances.shape != (len(X), len(X)):
+        raise ValueError(
+            f"Cached distance matrix {file_path} has shape {distances.shape}, "
+            f"expected ({len(X)}, {len(X)})."
+        )
+    return distances
+
+
+def cache_experiment_pairwise_distances(
+    problem_path,
+    dataset_name,
+    resample_id,
+    cache_path,
+    distance,
+    distance_params=None,
+    normalise=False,
+    predefined_resample=False,
+    block_size=64,
+    n_jobs=1,
+):
+    """Cache the pairwise distance matrix of an experiment train split.
+
+    If the matrix is not already in the cache, the train split is loaded and resampled
+    as in ``load_and_run_clustering_experiment``, normalised if ``normalise`` is True
+    and stored using ``load_or_compute_pairwise_distances``. If the matrix is already
+    stored, the data is not loaded.
+
+    Parameters
+    ----------
+    problem_path : str
+        Location of problem files, full path.
+    dataset_name : str
+        The name of the dataset the distances are computed for.
+    resample_id : int
+        The resample of the dataset the distances are computed for.
+    cache_path : str
+        The directory the cache is stored in.
+    distance : str
+        The name of the distance.
+    distance_params : dict or None, default=None
+        Keyword arguments for the distance.
+    normalise : bool, default=False
+        Whether to normalise the series before computing the distances.
+    predefined_resample : bool, default=False
+        Read a predefined resample from file instead of performing a resample.
+    block_size : int, default=64
+        The number of cases in each side of a block when computing the matrix.
+    n_jobs : int, default=1
+        The number of processes used when computing the matrix. ``-1`` means using
+        all processors.
+
+    Returns
+    -------
+    file_path : str
+        The path of the ``.npy`` file the matrix is stored in.
+    """
+    file_path = pairwise_distance_cache_file(
+        cache_path, dataset_name, resample_id, distance, distance_params, normalise
+    )
+    if os.path.exists(file_path):
+        return file_path
+
+    X_train, y_train, X_test, y_test, resample = load_experiment_data(
+        problem_path, dataset_name, resample_id, predefined_resample
+    )
+    if resample:
+        X_train, _, _, _ = stratified_resample_data(
+            X_train, y_train, X_test, y_test, random_state=resample_id
+        )
+    if normalise:
+        X_train = Normalizer().fit_transform(X_train)
+
+    load_or_compute_pairwise_distances(
+        X_train,
+        cache_path,
+        dataset_name,
+        resample_id,
+        distance,
+        distance_params=distance_params,
+        normalise=normalise,
+        block_size=block_size,
+        n_jobs=n_jobs,
+    )
+    return file_path
+
+
+def _block_distance(X_block, Y_block, distance, distance_params):
+    if Y_block is None:
+        return pairwise_distance(X_block, method=distance, **distance_params)
+    return pairwise_distance(X_block, Y_block, method=distance, **distance_params)
@@ -47,7 +47,8 @@ def record_max_memory(
     max_memory = process.memory_info().rss
 
     while True:
-        time.sleep(interval)
+        # wait for the function to finish or the interval to pass, whichever is first
+        thread.join(interval)
 
         mem = process.memory_info().rss
         if mem > max_memory:
@@ -0,0 +1,238 @@
+"""Ragged array collection for unequal length time series."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = ["RaggedCollection"]
+
+from typing import Optional, Union
+
+import numpy as np
+
+
+class RaggedCollection(list):
+    """A collection of time series stored in a single contiguous buffer.
+
+    The values of every case are held in one flat array, with the channels of each
+    case stored one after the other. Offsets give the position of each case in the
+    buffer. The collection is a list of 2D numpy array views of shape
+    ``(n_channels, n_timepoints_i)`` into the buffer, so it can be used anywhere the
+    ``aeon`` list of 2D numpy arrays format is accepted.
+
+    Functions aware of the collection can work on the buffer, offsets and lengths
+    directly instead of looping over the cases. The list should not be modified in
+    place, changes to the list are not reflected in the buffer.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1D array of the series values, case by case and channel by channel within
+        each case.
+    lengths : np.ndarray
+        The number of time points of each case.
+    n_channels : int
+        The number of channels of each case.
+
+    Attributes
+    ----------
+    offsets : np.ndarray
+        The position of each case in ``values``, with the end of the buffer as the
+        last item. Of shape (n_cases + 1,).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from tsml_eval.utils.ragged import RaggedCollection
+    >>> X = RaggedCollection.from_collection([np.ones((2, 3)), np.ones((2, 2))])
+    >>> X.lengths
+    array([3, 2])
+    >>> X[1].shape
+    (2, 2)
+    >>> X.to_numpy3d().shape
+    (2, 2, 3)
+    """
+
+    def __init__(self, values: np.ndarray, lengths: np.ndarray, n_channels: int):
+        self.values = np.ascontiguousarray(values).ravel()
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.n_channels = int(n_channels)
+
+        self.offsets = np.zeros(len(self.lengths) + 1, dtype=np.int64)
+        np.cumsum(self.lengths * self.n_channels, out=self.offsets[1:])
+        if self.offsets[-1] != len(self.values):
+            raise ValueError(
+                f"The lengths and channels describe {self.offsets[-1]} values, but "
+                f"values has {len(self.values)}."
+            )
+
+        super().__init__(
+            self.values[self.offsets[i] : self.offsets[i + 1]].reshape(
+                (self.n_channels, self.lengths[i])
+            )
+            for i in range(len(self.lengths))
+        )
+
+    def __reduce__(self):
+        """Rebuild the views into a single buffer when pickled or copied."""
+        return self.__class__, (self.values, self.lengths, self.n_channels)
+
+    @classmethod
+    def from_collection(
+        cls, X: Union[np.ndarray, list], dtype: Optional[np.dtype] = None
+    ) -> "RaggedCollection":
+        """Create a collection from a 3D numpy array or list of 2D numpy arrays.
+
+        Parameters
+        ----------
+        X : np.ndarray or list of np.ndarray
+            3D numpy array of shape (n_cases, n_channels, n_timepoints) or a list of 2D
+            numpy arrays of shape (n_channels, n_timepoints_i). A RaggedCollection is
+            returned unchanged if the dtype matches.
+        dtype : np.dtype or None, default=None
+            The dtype of the buffer. If None, the dtype of the input is used.
+
+        Returns
+        -------
+        X : RaggedCollection
+            The collection in a single buffer.
+        """
+        if isinstance(X, cls) and (dtype is None or X.values.dtype == dtype):
+            return X
+        elif isinstance(X, np.ndarray) and X.ndim == 3:
+            return cls(
+                X.astype(dtype, copy=False).ravel(),
+                np.full(X.shape[0], X.shape[2]),
+                X.shape[1],
+            )
+        elif isinstance(X, list) and all(
+            isinstance(x, np.ndarray) and x.ndim == 2 for x in X
+        ):
+            n_channels = X[0].shape[0]
+            if any(x.shape[0] != n_channels for x in X):
+                raise ValueError(
+                    "All series in X must have the same number of channels."
+                )
+
+            values = np.concatenate([x.ravel() for x in X])
+            return cls(
+                values.astype(dtype, copy=False),
+                [x.shape[1] for x in X],
+                n_channels,
+            )
+        else:
+            raise ValueError(
+                "X must be a 3D numpy array or a list of 2D numpy arrays, got "
+                f"{f'list of {type(X[0])}' if isinstance(X, list) else type(X)} "
+                "instead."
+            )
+
+    @classmethod
+    def concatenate(cls, collections: list) -> "RaggedCollection":
+        """Join collections with the same number of channels into one collection.
+
+        Parameters
+        ----------
+        collections : list of RaggedCollection
+            The collections to join, in order.
+
+        Returns
+        -------
+        X : RaggedCollection
+            The cases of all collections in a single buffer.
+        """
+        if any(c.n_channels != collections[0].n_channels for c in collections):
+            raise ValueError("All collections must have the same number of channels.")
+
+        return cls(
+            np.concatenate([c.values for c in collections]),
+            np.concatenate([c.lengths for c in collections]),
+            collections[0].n_channels,
+        )
+
+    def take(self, indices: np.ndarray) -> "RaggedCollection":
+        """Select cases by index into a new collection.
+
+        The values of the selected cases are gathered into the new buffer with a
+        single indexing operation.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            The index of each case to select, in the order of the new collection.
+
+        Returns
+        -------
+        X : RaggedCollection
+            The selected cases.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[indices]
+        sizes = self.offsets[indices + 1] - starts
+
+        # position of each value in the new buffer shifted to its source position
+        new_starts = np.cumsum(sizes) - sizes
+        source = np.arange(sizes.sum()) + np.repeat(starts - new_starts, sizes)
+
+        return self.__class__(
+            self.values[source], self.lengths[indices], self.n_channels
+        )
+
+    def channel_starts(self) -> np.ndarray:
+        """Return the position of each case channel in the buffer.
+
+        Returns
+        -------
+        starts : np.ndarray
+            2D array of shape (n_cases, n_channels).
+        """
+        return (
+            self.offsets[:-1, None]
+            + np.arange(self.n_channels)[None, :] * self.lengths[:, None]
+        )
+
+    def to_numpy3d(
+        self, pad_length: Optional[int] = None, fill_value: float = 0
+    ) -> np.ndarray:
+        """Pad the collection into a 3D numpy array.
+
+        The values are written into a preallocated array in a single scatter.
+
+        Parameters
+        ----------
+        pad_length : int or None, default=None
+            The series length of the output. If None, the longest series length is
+            used.
+        fill_value : float, default=0
+            The value of time points past the end of each series.
+
+        Returns
+        -------
+        X : np.ndarray
+            3D numpy array of shape (n_cases, n_channels, pad_length).
+        """
+        max_length = self.lengths.max() if len(self.lengths) > 0 else 0
+        if pad_length is None:
+            pad_length = max_length
+        elif pad_length < max_length:
+            raise ValueError(
+                f"pad_length {pad_length} is less than the longest series length "
+                f"{max_length}."
+            )
+
+        Xt = np.full(
+            (len(self.lengths), self.n_channels, pad_length),
+            fill_value,
+            dtype=self.values.dtype,
+        )
+        Xt.ravel()[self._padded_positions(pad_length)] = self.values
+        return Xt
+
+    def _padded_positions(self, pad_length):
+        # position of each value in a flattened (n_cases, n_channels, pad_length) array
+        sizes = self.lengths * self.n_channels
+        lengths = np.repeat(self.lengths, sizes)
+        position = np.arange(len(self.values)) - np.repeat(self.offsets[:-1], sizes)
+        case = np.repeat(np.arange(len(self.lengths)), sizes)
+        return (
+            case * self.n_channels * pad_length
+            + position // lengths * pad_length
+            + position % lengths
+        )
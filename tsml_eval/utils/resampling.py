@@ -12,6 +12,8 @@ __all__ = [
 import numpy as np
 from sklearn.utils import check_random_state
 
+from tsml_eval.utils.ragged import RaggedCollection
+
 
 def resample_data(X_train, y_train, X_test, y_test, random_state=None):
     """Resample data without replacement using a random state.
@@ -21,11 +23,11 @@ def resample_data(X_train, y_train, X_test, y_test, random_state=None):
 
     Parameters
     ----------
-    X_train : np.ndarray or list of np.ndarray
+    X_train : np.ndarray, list of np.ndarray or RaggedCollection
         Train data in a 2d or 3d ndarray or list of arrays.
     y_train : np.ndarray
         Train data labels.
-    X_test : np.ndarray or list of np.ndarray
+    X_test : np.ndarray, list of np.ndarray or RaggedCollection
         Test data in a 2d or 3d ndarray or list of arrays.
     y_test : np.ndarray
         Test data labels.
@@ -37,11 +39,11 @@ def resample_data(X_train, y_train, X_test, y_test, random_state=None):
 
     Returns
     -------
-    train_X : np.ndarray or list of np.ndarray
-        New train data.
+    train_X : np.ndarray, list of np.ndarray or RaggedCollection
+        New train data. A RaggedCollection input returns a RaggedCollection.
     train_y : np.ndarray
         New train labels.
-    test_X : np.ndarray or list of np.ndarray
+    test_X : np.ndarray, list of np.ndarray or RaggedCollection
         New test data.
     test_y : np.ndarray
         New test labels.
@@ -54,12 +56,16 @@ def resample_data(X_train, y_train, X_test, y_test, random_state=None):
         raise ValueError(
             "X_train must be a np.ndarray array or list of np.ndarray arrays"
         )
+    is_ragged = isinstance(X_train, RaggedCollection)
 
     # add both train and test to a single dataset
     all_labels = np.concatenate((y_train, y_test), axis=None)
-    all_data = (
-        np.concatenate([X_train, X_test], axis=0) if is_array else X_train + X_test
-    )
+    if is_ragged:
+        all_data = RaggedCollection.concatenate([X_train, X_test])
+    else:
+        all_data = (
+            np.concatenate([X_train, X_test], axis=0) if is_array else X_train + X_test
+        )
 
     # shuffle data indices
     rng = check_random_state(random_state)
@@ -70,11 +76,19 @@ def resample_data(X_train, y_train, X_test, y_test, random_state=None):
     test_indices = indices[len(X_train) :]
 
     # split the shuffled data into train and test
-    X_train = (
-        all_data[train_indices] if is_array else [all_data[i] for i in train_indices]
-    )
+    if is_ragged:
+        X_train = all_data.take(train_indices)
+        X_test = all_data.take(test_indices)
+    else:
+        X_train = (
+            all_data[train_indices]
+            if is_array
+            else [all_data[i] for i in train_indices]
+        )
+        X_test = (
+            all_data[test_indices] if is_array else [all_data[i] for i in test_indices]
+        )
     y_train = all_labels[train_indices]
-    X_test = all_data[test_indices] if is_array else [all_data[i] for i in test_indices]
     y_test = all_labels[test_indices]
 
     return X_train, y_train, X_test, y_test
@@ -126,11 +140,11 @@ def stratified_resample_data(X_train, y_train, X_test, y_test, random_state=None
 
     Parameters
     ----------
-    X_train : np.ndarray or list of np.ndarray
+    X_train : np.ndarray, list of np.ndarray or RaggedCollection
         Train data in a 2d or 3d ndarray or list of arrays.
     y_train : np.ndarray
         Train data labels.
-    X_test : np.ndarray or list of np.ndarray
+    X_test : np.ndarray, list of np.ndarray or RaggedCollection
         Test data in a 2d or 3d ndarray or list of arrays.
     y_test : np.ndarray
         Test data labels.
@@ -142,11 +156,11 @@ def stratified_resample_data(X_train, y_train, X_test, y_test, random_state=None
 
     Returns
     -------
-    train_X : np.ndarray or list of np.ndarray
-        New train data.
+    train_X : np.ndarray, list of np.ndarray or RaggedCollection
+        New train data. A RaggedCollection input returns a RaggedCollection.
     train_y : np.ndarray
         New train labels.
-    test_X : np.ndarray or list of np.ndarray
+    test_X : np.ndarray, list of np.ndarray or RaggedCollection
         New test data.
     test_y : np.ndarray
         New test labels.
@@ -159,12 +173,16 @@ def stratified_resample_data(X_train, y_train, X_test, y_test, random_state=None
         raise ValueError(
             "X_train must be a np.ndarray array or list of np.ndarray arrays"
         )
+    is_ragged = isinstance(X_train, RaggedCollection)
 
     # add both train and test to a single dataset
     all_labels = np.concatenate((y_train, y_test), axis=None)
-    all_data = (
-        np.concatenate([X_train, X_test], axis=0) if is_array else X_train + X_test
-    )
+    if is_ragged:
+        all_data = RaggedCollection.concatenate([X_train, X_test])
+    else:
+        all_data = (
+            np.concatenate([X_train, X_test], axis=0) if is_array else X_train + X_test
+        )
 
     # shuffle data indices
     rng = check_random_state(random_state)
@@ -185,6 +203,10 @@ def stratified_resample_data(X_train, y_train, X_test, y_test, random_state=None
     X_test = np.zeros(shape) if is_array else []
     y_test = np.zeros(0)
 
+    # ragged data is gathered from the buffer once after all classes are drawn
+    all_train_indices = []
+    all_test_indices = []
+
     # for each class
     for label_index in range(len(unique_train)):
         # get the indices of all instances with this class label and shuffle them
@@ -195,17 +217,25 @@ def stratified_resample_data(X_train, y_train, X_test, y_test, random_state=None
         train_indices = indices[: counts_train[label_index]]
         test_indices = indices[counts_train[label_index] :]
 
+        train_labels = all_labels[train_indices]
+        test_labels = all_labels[test_indices]
+        y_train = np.concatenate([y_train, train_labels], axis=None)
+        y_test = np.concatenate([y_test, test_labels], axis=None)
+
+        if is_ragged:
+            all_train_indices.append(train_indices)
+            all_test_indices.append(test_indices)
+            continue
+
         # extract data from corresponding indices
         train_cases = (
             all_data[train_indices]
             if is_array
             else [all_data[i] for i in train_indices]
         )
-        train_labels = all_labels[train_indices]
         test_cases = (
             all_data[test_indices] if is_array else [all_data[i] for i in test_indices]
         )
-        test_labels = all_labels[test_indices]
 
         # concat onto current data from previous loop iterations
         X_train = (
@@ -213,13 +243,15 @@ def stratified_resample_data(X_train, y_train, X_test, y_test, random_state=None
             if is_array
             else X_train + train_cases
         )
-        y_train = np.concatenate([y_train, train_labels], axis=None)
         X_test = (
             np.concatenate([X_test, test_cases], axis=0)
             if is_array
             else X_test + test_cases
         )
-        y_test = np.concatenate([y_test, test_labels], axis=None)
+
+    if is_ragged:
+        X_train = all_data.take(np.concatenate(all_train_indices))
+        X_test = all_data.take(np.concatenate(all_test_indices))
 
     return X_train, y_train, X_test, y_test
 
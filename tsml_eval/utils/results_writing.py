@@ -398,6 +398,7 @@ def write_forecasting_results(
     predict_time=-1,
     benchmark_time=-1,
     memory_usage=-1,
+    pred_times=None,
 ):
     """Write the predictions for a forecasting experiment in the format used by tsml.
 
@@ -447,6 +448,9 @@ def write_forecasting_results(
         A benchmark time for the hardware used to scale other timings.
     memory_usage : int, default=-1
         The memory usage of the forecaster.
+    pred_times : np.array or None, default=None
+        The time taken to make each prediction. If passed, these are written after
+        the predicted value for each case.
     """
     third_line = (
         f"{mape},"
@@ -470,6 +474,7 @@ def write_forecasting_results(
         first_line_comment=first_line_comment,
         second_line=parameter_info,
         third_line=third_line,
+        pred_times=pred_times,
     )
 
 
@@ -488,6 +493,7 @@ def write_results_to_tsml_format(
     first_line_comment=None,
     second_line="No Parameter Info",
     third_line="N/A",
+    pred_times=None,
 ):
     """Write the predictions for an experiment in the standard format used by tsml.
 
@@ -534,6 +540,9 @@ def write_results_to_tsml_format(
         values from the model build.
     third_line : str, default = "N/A"
         Summary performance information, what values are written depends on the task.
+    pred_times : np.ndarray, default=None
+        The time taken to make each prediction. If passed, these are written after
+        the predicted values and probabilities for each case.
     """
     if len(predictions) != len(labels):
         raise IndexError(
@@ -601,6 +610,9 @@ def write_results_to_tsml_format(
         # if predict_proba data IS NOT provided for case i:
         #   labels[i], preds[i]
         #
+        # If prediction times are provided, the time for case i is appended to the line
+        # after an empty value, i.e. labels[i], preds[i],,pred_times[i]
+        #
         # If labels[i] is NaN (if clustering), labels[i] is replaced with ? to indicate
         # missing
         for i in range(0, len(predictions)):
@@ -611,4 +623,6 @@ def write_results_to_tsml_format(
                 file.write(",")
                 for j in predicted_probabilities[i]:
                     file.write(f",{j}")
+            if pred_times is not None:
+                file.write(f",,{pred_times[i]}")
             file.write("\n")
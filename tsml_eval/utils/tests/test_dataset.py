@@ -2,12 +2,44 @@
 
 import os
 
+import numpy as np
 import pytest
 from aeon.datasets import load_from_ts_file
 
 from tsml_eval.datasets._test_data._data_sizes import DATA_TEST_SIZES, DATA_TRAIN_SIZES
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
-from tsml_eval.utils.datasets import copy_dataset_ts_files, save_merged_dataset_splits
+from tsml_eval.utils.datasets import (
+    copy_dataset_ts_files,
+    load_experiment_data,
+    save_merged_dataset_splits,
+)
+from tsml_eval.utils.ragged import RaggedCollection
+
+
+@pytest.mark.parametrize(
+    "dataset", ["MinimalChinatown", "UnequalMinimalChinatown", "MinimalJapaneseVowels"]
+)
+def test_load_experiment_data_ragged(dataset):
+    """Test loading unequal length experiment data as a ragged collection."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, dataset, 0, False
+    )
+    X_train_r, y_train_r, X_test_r, y_test_r, _ = load_experiment_data(
+        _TEST_DATA_PATH, dataset, 0, False, ragged=True
+    )
+
+    if isinstance(X_train, np.ndarray):
+        assert isinstance(X_train_r, np.ndarray)
+    else:
+        assert isinstance(X_train_r, RaggedCollection)
+        assert isinstance(X_test_r, RaggedCollection)
+
+    for X, X_r in [(X_train, X_train_r), (X_test, X_test_r)]:
+        assert len(X) == len(X_r)
+        for x, x_r in zip(X, X_r):
+            np.testing.assert_array_equal(x, x_r)
+    np.testing.assert_array_equal(y_train, y_train_r)
+    np.testing.assert_array_equal(y_test, y_test_r)
 
 
 def test_copy_dataset_ts_files():
@@ -0,0 +1,107 @@
+"""Tests for the pairwise distance matrix cache."""
+
+import os
+
+import numpy as np
+import pytest
+from aeon.distances import pairwise_distance
+from aeon.transformations.collection import Normalizer
+
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.datasets import load_experiment_data
+from tsml_eval.utils.distance_cache import (
+    blocked_pairwise_distance,
+    cache_experiment_pairwise_distances,
+    load_or_compute_pairwise_distances,
+    pairwise_distance_cache_file,
+)
+from tsml_eval.utils.resampling import stratified_resample_data
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 7, 64])
+def test_blocked_pairwise_distance(block_size):
+    """Test the blocked pairwise distance matrix matches the aeon matrix."""
+    X = np.random.default_rng(0).random((15, 2, 12))
+
+    distances = blocked_pairwise_distance(
+        X, "msm", distance_params={"c": 0.5}, block_size=block_size
+    )
+
+    np.testing.assert_array_almost_equal(
+        distances, pairwise_distance(X, method="msm", c=0.5)
+    )
+
+
+def test_load_or_compute_pairwise_distances():
+    """Test the distance matrix is stored once and loaded from the cache."""
+    X = np.random.default_rng(0).random((10, 1, 12))
+    cache_path = _TEST_OUTPUT_PATH + "/distance_cache/"
+    file_path = pairwise_distance_cache_file(
+        cache_path, "Random", 0, "dtw", {"window": 0.2}, normalise=True
+    )
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+    distances = load_or_compute_pairwise_distances(
+        X, cache_path, "Random", 0, "dtw", {"window": 0.2}, normalise=True
+    )
+    assert os.path.exists(file_path)
+    assert isinstance(distances, np.memmap)
+    np.testing.assert_array_almost_equal(
+        distances, pairwise_distance(X, method="dtw", window=0.2)
+    )
+
+    # different keys use different files
+    assert file_path != pairwise_distance_cache_file(
+        cache_path, "Random", 0, "dtw", {"window": 0.1}, normalise=True
+    )
+    assert file_path != pairwise_distance_cache_file(
+        cache_path, "Random", 0, "dtw", {"window": 0.2}, normalise=False
+    )
+
+    # the stored matrix is loaded, not recomputed
+    cached = load_or_compute_pairwise_distances(
+        np.zeros((10, 1, 12)), cache_path, "Random", 0, "dtw", {"window": 0.2}, True
+    )
+    np.testing.assert_array_equal(distances, cached)
+
+    with pytest.raises(ValueError, match="expected"):
+        load_or_compute_pairwise_distances(
+            X[:5], cache_path, "Random", 0, "dtw", {"window": 0.2}, True
+        )
+
+    del distances, cached
+    os.remove(file_path)
+
+
+def test_cache_experiment_pairwise_distances():
+    """Test caching the distance matrix of an experiment train split."""
+    cache_path = _TEST_OUTPUT_PATH + "/distance_cache/"
+    file_path = pairwise_distance_cache_file(
+        cache_path, "MinimalChinatown", 1, "dtw", normalise=True
+    )
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+    assert file_path == cache_experiment_pairwise_distances(
+        _TEST_DATA_PATH, "MinimalChinatown", 1, cache_path, "dtw", normalise=True
+    )
+
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 1, False
+    )
+    X_train, _, _, _ = stratified_resample_data(
+        X_train, y_train, X_test, y_test, random_state=1
+    )
+    X_train = Normalizer().fit_transform(X_train)
+    distances = np.load(file_path)
+    np.testing.assert_array_almost_equal(
+        distances, pairwise_distance(X_train, method="dtw")
+    )
+
+    # the data is not loaded when the matrix is already stored
+    assert file_path == cache_experiment_pairwise_distances(
+        "invalid", "MinimalChinatown", 1, cache_path, "dtw", normalise=True
+    )
+
+    os.remove(file_path)
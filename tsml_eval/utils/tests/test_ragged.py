@@ -0,0 +1,98 @@
+"""Tests for the ragged collection."""
+
+import pickle
+
+import numpy as np
+import pytest
+from tsml.datasets import load_minimal_chinatown, load_unequal_minimal_chinatown
+
+from tsml_eval.utils.ragged import RaggedCollection
+
+
+def _unequal_collection(n_cases=6, n_channels=3):
+    rng = np.random.RandomState(0)
+    return [rng.random_sample((n_channels, 5 + i)) for i in range(n_cases)]
+
+
+def test_ragged_collection():
+    """Test the collection views match the input series."""
+    X = _unequal_collection()
+    X_ragged = RaggedCollection.from_collection(X)
+
+    assert isinstance(X_ragged, list)
+    assert X_ragged.values.ndim == 1
+    assert len(X_ragged.values) == sum(x.size for x in X)
+    np.testing.assert_array_equal(X_ragged.lengths, [x.shape[1] for x in X])
+    np.testing.assert_array_equal(X_ragged.offsets[1:], np.cumsum([x.size for x in X]))
+
+    for x, x_ragged in zip(X, X_ragged):
+        np.testing.assert_array_equal(x, x_ragged)
+        assert np.shares_memory(x_ragged, X_ragged.values)
+
+    X_pickled = pickle.loads(pickle.dumps(X_ragged))
+    assert isinstance(X_pickled, RaggedCollection)
+    np.testing.assert_array_equal(X_pickled.values, X_ragged.values)
+    assert np.shares_memory(X_pickled[-1], X_pickled.values)
+
+
+def test_ragged_collection_numpy3d():
+    """Test converting between 3D numpy arrays and the collection."""
+    X = np.random.random((4, 2, 10))
+    X_ragged = RaggedCollection.from_collection(X)
+
+    np.testing.assert_array_equal(X_ragged.lengths, np.full(4, 10))
+    np.testing.assert_array_equal(X_ragged.to_numpy3d(), X)
+
+
+def test_ragged_collection_to_numpy3d():
+    """Test padding the collection with a scatter into a 3D numpy array."""
+    X = _unequal_collection()
+    Xt = RaggedCollection.from_collection(X).to_numpy3d(pad_length=15, fill_value=-1)
+
+    assert Xt.shape == (len(X), X[0].shape[0], 15)
+    for x, xt in zip(X, Xt):
+        np.testing.assert_array_equal(xt[:, : x.shape[1]], x)
+        assert (xt[:, x.shape[1] :] == -1).all()
+
+    with pytest.raises(ValueError, match="pad_length"):
+        RaggedCollection.from_collection(X).to_numpy3d(pad_length=5)
+
+
+def test_ragged_collection_take_concatenate():
+    """Test selecting and joining cases."""
+    X = _unequal_collection()
+    X_ragged = RaggedCollection.from_collection(X)
+
+    indices = np.array([4, 0, 5, 0])
+    X_taken = X_ragged.take(indices)
+    assert len(X_taken) == len(indices)
+    for i, x in zip(indices, X_taken):
+        np.testing.assert_array_equal(X[i], x)
+
+    X_joined = RaggedCollection.concatenate([X_ragged, X_taken])
+    assert len(X_joined) == len(X) + len(indices)
+    for x, x_joined in zip(X + [X[i] for i in indices], X_joined):
+        np.testing.assert_array_equal(x, x_joined)
+
+
+def test_ragged_collection_invalid():
+    """Test the collection raises an error with invalid input."""
+    with pytest.raises(ValueError, match="same number of channels"):
+        RaggedCollection.from_collection([np.zeros((2, 5)), np.zeros((3, 5))])
+    with pytest.raises(ValueError, match="X must be a"):
+        RaggedCollection.from_collection(np.zeros((2, 5)))
+    with pytest.raises(ValueError, match="values has"):
+        RaggedCollection(np.zeros(10), [3, 3], 2)
+
+
+@pytest.mark.parametrize(
+    "loader", [load_minimal_chinatown, load_unequal_minimal_chinatown]
+)
+def test_ragged_collection_from_loader(loader):
+    """Test the collection from loaded data."""
+    X, _ = loader(split="TRAIN")
+    X_ragged = RaggedCollection.from_collection(X)
+
+    assert len(X_ragged) == len(X)
+    for x, x_ragged in zip(X, X_ragged):
+        np.testing.assert_array_equal(x, x_ragged)
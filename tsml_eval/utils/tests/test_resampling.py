@@ -13,6 +13,7 @@ from tsml.datasets import (
 )
 
 from tsml_eval.testing.testing_utils import _TEST_RESULTS_PATH
+from tsml_eval.utils.ragged import RaggedCollection
 from tsml_eval.utils.resampling import (
     resample_data,
     resample_data_indices,
@@ -159,6 +160,32 @@ def test_stratified_resample_data_unequal():
     assert list(counts_test_new) == list(counts_test)
 
 
+@pytest.mark.parametrize("resample", [resample_data, stratified_resample_data])
+def test_resample_data_ragged(resample):
+    """Test resampling ragged collections matches resampling lists of arrays."""
+    X_train, y_train = load_unequal_minimal_chinatown(split="TRAIN")
+    X_test, y_test = load_unequal_minimal_chinatown(split="TEST")
+
+    expected = resample(X_train, y_train, X_test, y_test, random_state=0)
+    resampled = resample(
+        RaggedCollection.from_collection(X_train),
+        y_train,
+        RaggedCollection.from_collection(X_test),
+        y_test,
+        random_state=0,
+    )
+
+    assert isinstance(resampled[0], RaggedCollection)
+    assert isinstance(resampled[2], RaggedCollection)
+    for X, X_expected in [(resampled[0], expected[0]), (resampled[2], expected[2])]:
+        assert len(X) == len(X_expected)
+        for x, x_expected in zip(X, X_expected):
+            np.testing.assert_array_equal(x, x_expected)
+    np.testing.assert_array_equal(resampled[1], expected[1])
+    np.testing.assert_array_equal(resampled[3], expected[3])
+    assert resampled[1].dtype == expected[1].dtype
+
+
 def test_stratified_resample_data_invalid():
     """Test stratified resampling raises an error with invalid input."""
     X = pd.DataFrame(np.random.random((10, 10)))
@@ -7,6 +7,7 @@ import os
 import numpy as np
 import pytest
 
+from tsml_eval.evaluation.storage import ForecasterResults
 from tsml_eval.experiments.tests import (
     _CLASSIFIER_RESULTS_PATH,
     _CLUSTERER_RESULTS_PATH,
@@ -145,6 +146,31 @@ def test_write_forecasting_results():
     os.remove(f"{_FORECASTER_RESULTS_PATH}/Test/Predictions/Test/results.csv")
 
 
+def test_write_forecasting_results_pred_times():
+    """Test writing of forecasting results files with prediction times."""
+    labels, predictions, _ = _generate_labels_and_predictions()
+    pred_times = np.random.random(len(predictions))
+
+    write_forecasting_results(
+        predictions,
+        labels,
+        "Test",
+        "Test",
+        _FORECASTER_RESULTS_PATH,
+        full_path=False,
+        first_line_comment="test_write_forecasting_results_pred_times",
+        pred_times=pred_times,
+    )
+
+    file_path = f"{_FORECASTER_RESULTS_PATH}/Test/Predictions/Test/results.csv"
+    _check_forecasting_file_format(file_path)
+
+    fr = ForecasterResults().load_from_file(file_path, verify_values=False)
+    assert np.allclose(fr.pred_times, pred_times)
+
+    os.remove(file_path)
+
+
 def _check_forecasting_file_format(file_path, num_results_lines=None):
     with open(file_path) as f:
         lines = f.readlines()